@@ -59,6 +59,16 @@ class CoordinationConfig:
                        When workspace/ is needed for file operations, it is created automatically.
         skills_directory: Path to the skills directory. Default is .agent/skills which is where
                          openskills installs skills. This directory is scanned for available skills.
+        share_mcp_servers: If True, MassGen's own MCP servers (workspace tools, task planning, memory)
+                           run in one shared host process per server type instead of one stdio
+                           process per agent. Each agent still gets an isolated server instance.
+        tool_result_cache: If True, results of read-only MCP tools and custom tools declared cacheable
+                           are cached and shared by all agents within one turn.
+        tool_result_cache_ttl: Seconds a cached tool result stays valid (default: 300).
+        tool_worker_threads: Size of the thread pool running synchronous custom tools
+                             (default: None, Python's default of min(32, CPUs + 4)).
+        tool_worker_processes: Size of the process pool for custom tools declared
+                               ``@run_in("process")`` (default: None, one per CPU).
     """
 
     enable_planning_mode: bool = False
@@ -73,6 +83,11 @@ class CoordinationConfig:
     use_skills: bool = False
     massgen_skills: List[str] = field(default_factory=list)
     skills_directory: str = ".agent/skills"
+    share_mcp_servers: bool = False
+    tool_result_cache: bool = False
+    tool_result_cache_ttl: float = 300.0
+    tool_worker_threads: Optional[int] = None
+    tool_worker_processes: Optional[int] = None
 
 
 @dataclass
@@ -93,6 +108,7 @@ class AgentConfig:
         voting_sensitivity: Controls how critical agents are when voting ("lenient", "balanced", "strict")
         max_new_answers_per_agent: Maximum number of new answers each agent can provide (None = unlimited)
         answer_novelty_requirement: How different new answers must be from existing ones ("lenient", "balanced", "strict")
+        status_socket_path: Optional Unix socket path that streams live coordination status deltas (None = JSONL log only)
     """
 
     # Core backend configuration (includes tool enablement)
@@ -106,6 +122,9 @@ class AgentConfig:
     max_new_answers_per_agent: Optional[int] = None
     answer_novelty_requirement: str = "lenient"
 
+    # Live status feed - coordination status deltas are also served on this Unix socket
+    status_socket_path: Optional[str] = None
+
     # Agent customization
     agent_id: Optional[str] = None
     _custom_system_instruction: Optional[str] = field(default=None, init=False)
@@ -746,6 +765,7 @@ class AgentConfig:
             "voting_sensitivity": self.voting_sensitivity,
             "max_new_answers_per_agent": self.max_new_answers_per_agent,
             "answer_novelty_requirement": self.answer_novelty_requirement,
+            "status_socket_path": self.status_socket_path,
             "timeout_config": {
                 "orchestrator_timeout_seconds": self.timeout_config.orchestrator_timeout_seconds,
             },
@@ -787,6 +807,7 @@ class AgentConfig:
         voting_sensitivity = data.get("voting_sensitivity", "lenient")
         max_new_answers_per_agent = data.get("max_new_answers_per_agent")
         answer_novelty_requirement = data.get("answer_novelty_requirement", "lenient")
+        status_socket_path = data.get("status_socket_path")
 
         # Handle timeout_config
         timeout_config = TimeoutConfig()
@@ -818,6 +839,7 @@ class AgentConfig:
             voting_sensitivity=voting_sensitivity,
             max_new_answers_per_agent=max_new_answers_per_agent,
             answer_novelty_requirement=answer_novelty_requirement,
+            status_socket_path=status_socket_path,
             timeout_config=timeout_config,
             coordination_config=coordination_config,
         )
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+Token signatures and batched Jaccard similarity for answer novelty checks.
+
+The orchestrator rejects answers that overlap too much with answers already on
+the table. Comparing raw strings meant lower-casing, splitting and building word
+sets for every existing answer on every new answer. An ``AnswerSignature`` is the
+hashed word set of one answer, computed once when the answer is recorded; a new
+answer is then scored against all prior answers in one vectorized pass.
+
+The score is the same word-level Jaccard similarity as before (exact, up to 64-bit
+hash collisions). NumPy is used when available, with a pure-Python fallback.
+"""
+
+from dataclasses import dataclass
+from typing import Any, List, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@dataclass(frozen=True)
+class AnswerSignature:
+    """Hashed, de-duplicated word tokens of one answer."""
+
+    tokens: Any  # Sorted unique int64 array with NumPy, frozenset of ints otherwise
+    size: int
+
+
+def compute_answer_signature(text: str) -> AnswerSignature:
+    """Tokenize and hash an answer the way the novelty check compares it (lower-cased words)."""
+    hashes = {hash(word) for word in text.lower().split()}
+    if np is not None:
+        tokens = np.fromiter(hashes, dtype=np.int64, count=len(hashes))
+        tokens.sort()
+    else:
+        tokens = frozenset(hashes)
+    return AnswerSignature(tokens=tokens, size=len(hashes))
+
+
+def batch_jaccard_similarity(signature: AnswerSignature, others: Sequence[AnswerSignature]) -> List[float]:
+    """Jaccard similarity of ``signature`` against every signature in ``others``.
+
+    Two empty answers count as identical (1.0); an empty and a non-empty one as disjoint (0.0).
+    """
+    if not others:
+        return []
+
+    if np is None:
+        scores = []
+        for other in others:
+            union = len(signature.tokens | other.tokens)
+            scores.append(len(signature.tokens & other.tokens) / union if union else 1.0)
+        return scores
+
+    sizes = np.fromiter((other.size for other in others), dtype=np.int64, count=len(others))
+    owners = np.repeat(np.arange(len(others)), sizes)
+    stacked = np.concatenate([other.tokens for other in others])
+    hits = np.isin(stacked, signature.tokens)
+    intersection = np.bincount(owners, weights=hits, minlength=len(others))
+    union = signature.size + sizes - intersection
+    scores = np.divide(intersection, union, out=np.ones(len(others)), where=union > 0)
+    return scores.tolist()
+
+
+def similarity_matrix(signatures: Sequence[AnswerSignature]) -> List[List[float]]:
+    """Pairwise Jaccard similarity matrix, row ``i`` comparing answer ``i`` to every answer."""
+    return [batch_jaccard_similarity(signature, signatures) for signature in signatures]
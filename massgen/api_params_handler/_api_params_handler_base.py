@@ -82,8 +82,13 @@ class APIParamsHandlerBase(ABC):
             "mcp_servers",
             # Parallelization
             "instance_id",
+            "parallel_tool_execution",
+            "max_parallel_tool_calls",
+            # Tool loop guard (handled by base class)
+            "max_tool_rounds",
             # Rate limiting (handled by rate_limiter.py)
             "enable_rate_limit",
+            "rate_limit_priority",
         }
 
     def build_base_api_params(
@@ -102,6 +107,24 @@ class APIParamsHandlerBase(ABC):
 
         return api_params
 
+    def format_workflow_tools(self, tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Convert workflow tools, reusing the conversion while the same tool dicts are passed."""
+        if not tools:
+            return []
+        return self.formatter.cached_tools("workflow", lambda: self.formatter.format_tools(tools), members=tools)
+
+    def format_custom_tools(self) -> List[Dict[str, Any]]:
+        """Convert registered custom tools once per version of the tool manager's tool set."""
+        registered_tools = self.custom_tool_manager.registered_tools
+        if not registered_tools:
+            return []
+        return self.formatter.cached_tools(
+            "custom",
+            lambda: self.formatter.format_custom_tools(registered_tools),
+            members=registered_tools.values(),
+            version=getattr(self.custom_tool_manager, "version", None),
+        )
+
     def get_mcp_tools(self) -> List[Dict[str, Any]]:
         """Get MCP tools from backend if available."""
         if hasattr(self.backend, "_mcp_functions") and self.backend._mcp_functions:
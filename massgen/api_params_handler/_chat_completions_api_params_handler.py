@@ -6,7 +6,7 @@ Handles parameter building for OpenAI Chat Completions API format.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from ._api_params_handler_base import APIParamsHandlerBase
 
@@ -127,13 +127,12 @@ class ChatCompletionsAPIParamsHandler(APIParamsHandlerBase):
 
         # Workflow tools
         if tools:
-            converted_tools = self.formatter.format_tools(tools)
+            converted_tools = self.format_workflow_tools(tools)
             combined_tools.extend(converted_tools)
 
         # Add custom tools
-        custom_tools = self.custom_tool_manager.registered_tools
-        if custom_tools:
-            converted_custom_tools = self.formatter.format_custom_tools(custom_tools)
+        converted_custom_tools = self.format_custom_tools()
+        if converted_custom_tools:
             combined_tools.extend(converted_custom_tools)
 
         # MCP tools
@@ -156,38 +155,42 @@ class ChatCompletionsAPIParamsHandler(APIParamsHandlerBase):
         This prevents 400 wrong_api_format errors.
         """
         try:
+            # Index the last tool result for each tool_call_id in one pass
+            last_result: Dict[Any, int] = {}
+            for i, msg in enumerate(messages):
+                if msg.get("role") == "tool":
+                    last_result[msg.get("tool_call_id")] = i
+
             sanitized: List[Dict[str, Any]] = []
-            len(messages)
             for i, msg in enumerate(messages):
                 if msg.get("role") == "assistant" and "tool_calls" in msg:
-                    tool_calls = msg.get("tool_calls") or []
-                    valid_tool_calls = []
-                    for tc in tool_calls:
-                        tc_id = tc.get("id")
-                        if not tc_id:
-                            continue
-                        # Does a later tool message reference this id?
-                        has_match = any((m.get("role") == "tool" and m.get("tool_call_id") == tc_id) for m in messages[i + 1 :])
-                        if has_match:
-                            # Normalize arguments to string
-                            fn = dict(tc.get("function", {}))
-                            fn["arguments"] = self.formatter._serialize_tool_arguments(fn.get("arguments"))
-                            valid_tc = dict(tc)
-                            valid_tc["function"] = fn
-                            valid_tool_calls.append(valid_tc)
-                    if valid_tool_calls:
-                        new_msg = dict(msg)
-                        new_msg["tool_calls"] = valid_tool_calls
+                    # Tool calls with a later tool message referencing their id
+                    valid_ids = tuple(tc.get("id") for tc in msg.get("tool_calls") or [] if tc.get("id") and last_result.get(tc.get("id"), -1) > i)
+                    new_msg = self.formatter.cached_message("sanitized", msg, lambda m: self._keep_tool_calls(m, valid_ids), variant=valid_ids)
+                    if new_msg is not None:
                         sanitized.append(new_msg)
-                    else:
-                        # Keep as plain assistant if it has content; otherwise drop
-                        if msg.get("content"):
-                            new_msg = {k: v for k, v in msg.items() if k != "tool_calls"}
-                            sanitized.append(new_msg)
-                        else:
-                            continue
                 else:
                     sanitized.append(msg)
             return sanitized
         except Exception:
             return messages
+
+    def _keep_tool_calls(self, msg: Dict[str, Any], valid_ids: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+        """Copy an assistant message keeping only the given tool calls (None if nothing is left)."""
+        valid_tool_calls = []
+        for tc in msg.get("tool_calls") or []:
+            if tc.get("id") in valid_ids:
+                # Normalize arguments to string
+                fn = dict(tc.get("function", {}))
+                fn["arguments"] = self.formatter._serialize_tool_arguments(fn.get("arguments"))
+                valid_tc = dict(tc)
+                valid_tc["function"] = fn
+                valid_tool_calls.append(valid_tc)
+        if valid_tool_calls:
+            new_msg = dict(msg)
+            new_msg["tool_calls"] = valid_tool_calls
+            return new_msg
+        # Keep as plain assistant if it has content; otherwise drop
+        if msg.get("content"):
+            return {k: v for k, v in msg.items() if k != "tool_calls"}
+        return None
@@ -104,13 +104,12 @@ class ClaudeAPIParamsHandler(APIParamsHandlerBase):
 
         # Workflow tools
         if tools:
-            converted_tools = self.formatter.format_tools(tools)
+            converted_tools = self.format_workflow_tools(tools)
             combined_tools.extend(converted_tools)
 
         # Add custom tools
-        custom_tools = self.custom_tool_manager.registered_tools
-        if custom_tools:
-            converted_custom_tools = self.formatter.format_custom_tools(custom_tools)
+        converted_custom_tools = self.format_custom_tools()
+        if converted_custom_tools:
             combined_tools.extend(converted_custom_tools)
 
         # MCP tools
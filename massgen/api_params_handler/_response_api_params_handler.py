@@ -53,11 +53,12 @@ class ResponseAPIParamsHandler(APIParamsHandlerBase):
         if not hasattr(self.backend, "_mcp_functions") or not self.backend._mcp_functions:
             return []
 
-        converted_tools = []
-        for function in self.backend._mcp_functions.values():
-            converted_tools.append(function.to_openai_format())
-
-        return converted_tools
+        mcp_functions = self.backend._mcp_functions
+        return self.formatter.cached_tools(
+            "mcp_openai",
+            lambda: [function.to_openai_format() for function in mcp_functions.values()],
+            members=mcp_functions.values(),
+        )
 
     async def build_api_params(
         self,
@@ -95,13 +96,12 @@ class ResponseAPIParamsHandler(APIParamsHandlerBase):
 
         # Add workflow tools
         if tools:
-            converted_tools = self.formatter.format_tools(tools)
+            converted_tools = self.format_workflow_tools(tools)
             combined_tools.extend(converted_tools)
 
         # Add custom tools
-        custom_tools = self.custom_tool_manager.registered_tools
-        if custom_tools:
-            converted_custom_tools = self.formatter.format_custom_tools(custom_tools)
+        converted_custom_tools = self.format_custom_tools()
+        if converted_custom_tools:
             combined_tools.extend(converted_custom_tools)
 
         # Add MCP tools (use OpenAI format)
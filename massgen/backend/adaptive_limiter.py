@@ -0,0 +1,431 @@
+# -*- coding: utf-8 -*-
+"""
+Adaptive concurrency limiting driven by provider rate-limit feedback.
+
+Static RPM/TPM tables go stale and cannot see quota shared with other processes, but
+every provider tells its callers how close they are to the limit:
+
+- ``retry-after`` / ``retry-after-ms`` on 429 (and 503) responses
+- OpenAI ``x-ratelimit-remaining-*`` / ``x-ratelimit-reset-*`` headers ("6m0s", "20ms")
+- Anthropic ``anthropic-ratelimit-*-remaining`` / ``-reset`` headers (RFC 3339 times)
+- Gemini ``RetryInfo.retryDelay`` ("37s") in the body of RESOURCE_EXHAUSTED errors
+
+AdaptiveLimiter turns these signals into an AIMD limit on in-flight requests per
+provider/model and API key: every request that completes without being throttled
+raises the limit by ``1/limit`` while the limit is actually in use, and a 429 halves
+it (once per congestion event) and blocks new requests until the provider's
+retry-after (or an exponential backoff) has passed. A reported exhausted budget
+blocks new requests until its reset without shrinking the limit.
+
+The pooled httpx clients (see client_pool.py) report every response, including the
+429s the provider SDKs retry internally, to the limiter of the request being made.
+
+Example:
+    limiter = GlobalRateLimiter.get_adaptive_limiter_sync("OpenAI", "gpt-4o", api_key=key)
+    stream = await limiter.run(lambda: client.responses.create(**api_params))
+    async for chunk in stream:  # The slot is held until the stream ends
+        ...
+"""
+
+import asyncio
+import contextvars
+import email.utils
+import re
+import threading
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Deque, Dict, Mapping, Optional, Tuple
+
+from ..logger_config import logger
+
+DEFAULT_INITIAL_LIMIT = 8
+DEFAULT_MAX_LIMIT = 64
+MIN_LIMIT = 1
+DECREASE_FACTOR = 0.5
+# Backoff after a 429 that carries no retry-after: 1s, 2s, 4s, ... up to MAX_BACKOFF
+BASE_BACKOFF = 1.0
+MAX_BACKOFF = 60.0
+# Throttled requests are retried this many times when the provider asks for a short wait
+RATE_LIMIT_RETRIES = 2
+MAX_RETRY_WAIT = 60.0
+# Waits shorter than this are not worth an info log line
+LOG_WAIT_THRESHOLD = 1.0
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_UNIT_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_reset(value: Any) -> Optional[float]:
+    """
+    Parse a retry/reset header value into seconds from now.
+
+    Accepts plain seconds ("20", "1.5"), Go-style durations ("6m0s", "20ms"), RFC 3339
+    timestamps ("2025-01-01T00:00:30Z") and HTTP dates. Returns None if unparseable.
+    """
+    if value is None:
+        return None
+    text = str(value).strip()
+    if not text:
+        return None
+    try:
+        return max(float(text), 0.0)
+    except ValueError:
+        pass
+
+    parts = _DURATION_PART.findall(text)
+    if parts and "".join(number + unit for number, unit in parts) == text:
+        return sum(float(number) * _UNIT_SECONDS[unit] for number, unit in parts)
+
+    try:
+        when = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            when = email.utils.parsedate_to_datetime(text)
+        except (TypeError, ValueError):
+            return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def _parse_int(value: Any) -> Optional[int]:
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class RateLimitSignal:
+    """Rate-limit state reported by one provider response."""
+
+    retry_after: Optional[float] = None
+    remaining_requests: Optional[int] = None
+    remaining_tokens: Optional[int] = None
+    # Seconds until an exhausted budget (remaining == 0) refills
+    reset_after: Optional[float] = None
+
+    @property
+    def exhausted(self) -> bool:
+        return self.remaining_requests == 0 or self.remaining_tokens == 0
+
+
+def parse_rate_limit_headers(headers: Optional[Mapping[str, str]]) -> RateLimitSignal:
+    """Extract retry-after and remaining/reset budgets from OpenAI- and Anthropic-style headers."""
+    signal = RateLimitSignal()
+    if not headers:
+        return signal
+    lowered = {str(name).lower(): value for name, value in headers.items()}
+
+    if "retry-after-ms" in lowered:
+        milliseconds = parse_reset(lowered["retry-after-ms"])
+        signal.retry_after = milliseconds / 1000 if milliseconds is not None else None
+    if signal.retry_after is None:
+        signal.retry_after = parse_reset(lowered.get("retry-after"))
+
+    # (remaining header, reset header) per budget; several token budgets keep the tightest
+    budgets = {
+        "requests": [
+            ("x-ratelimit-remaining-requests", "x-ratelimit-reset-requests"),
+            ("anthropic-ratelimit-requests-remaining", "anthropic-ratelimit-requests-reset"),
+        ],
+        "tokens": [
+            ("x-ratelimit-remaining-tokens", "x-ratelimit-reset-tokens"),
+            ("anthropic-ratelimit-tokens-remaining", "anthropic-ratelimit-tokens-reset"),
+            ("anthropic-ratelimit-input-tokens-remaining", "anthropic-ratelimit-input-tokens-reset"),
+            ("anthropic-ratelimit-output-tokens-remaining", "anthropic-ratelimit-output-tokens-reset"),
+        ],
+    }
+    for budget, header_pairs in budgets.items():
+        for remaining_header, reset_header in header_pairs:
+            remaining = _parse_int(lowered.get(remaining_header))
+            if remaining is None:
+                continue
+            current = getattr(signal, f"remaining_{budget}")
+            if current is None or remaining < current:
+                setattr(signal, f"remaining_{budget}", remaining)
+            if remaining == 0:
+                reset = parse_reset(lowered.get(reset_header))
+                if reset is not None:
+                    signal.reset_after = max(signal.reset_after or 0.0, reset)
+    return signal
+
+
+def _find_retry_delay(details: Any) -> Optional[float]:
+    """Find a google.rpc.RetryInfo ``retryDelay`` anywhere in an error body."""
+    if isinstance(details, dict):
+        if "retryDelay" in details:
+            return parse_reset(details["retryDelay"])
+        items = details.values()
+    elif isinstance(details, (list, tuple)):
+        items = details
+    else:
+        return None
+    for item in items:
+        delay = _find_retry_delay(item)
+        if delay is not None:
+            return delay
+    return None
+
+
+def rate_limit_error(exc: BaseException) -> Tuple[bool, Optional[float]]:
+    """
+    Classify a provider SDK exception.
+
+    Returns:
+        (is_rate_limit, retry_after seconds or None) for OpenAI/Anthropic status errors
+        and Gemini RESOURCE_EXHAUSTED errors
+    """
+    status = getattr(exc, "status_code", None) or getattr(exc, "code", None)
+    if status != 429 and getattr(exc, "status", None) != "RESOURCE_EXHAUSTED":
+        return False, None
+    response = getattr(exc, "response", None)
+    retry_after = parse_rate_limit_headers(getattr(response, "headers", None)).retry_after
+    if retry_after is None:
+        retry_after = _find_retry_delay(getattr(exc, "details", None))
+    return True, retry_after
+
+
+@dataclass
+class _RequestContext:
+    limiter: "AdaptiveLimiter"
+    throttled: bool = False
+
+
+# Request currently being sent by this task, read by the pooled httpx clients' response hook
+_current_request: "contextvars.ContextVar[Optional[_RequestContext]]" = contextvars.ContextVar("massgen_adaptive_request", default=None)
+
+
+async def observe_response(response: Any) -> None:
+    """httpx response hook: report the response's rate-limit headers to the current request's limiter."""
+    context = _current_request.get()
+    if context is None:
+        return
+    signal = parse_rate_limit_headers(response.headers)
+    if response.status_code == 429:
+        context.throttled = True
+        context.limiter.throttled(signal.retry_after)
+    elif response.status_code == 503 and signal.retry_after is not None:
+        context.limiter.throttled(signal.retry_after)
+    else:
+        context.limiter.observe(signal)
+
+
+@dataclass
+class _Waiter:
+    loop: asyncio.AbstractEventLoop
+    event: asyncio.Event
+
+
+class AdaptiveLimiter:
+    """AIMD limit on in-flight requests for one provider/model and API key."""
+
+    def __init__(self, name: str, initial_limit: int = DEFAULT_INITIAL_LIMIT, max_limit: int = DEFAULT_MAX_LIMIT):
+        self.name = name
+        self.max_limit = max(max_limit, MIN_LIMIT)
+        self.limit = float(min(max(initial_limit, MIN_LIMIT), self.max_limit))
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        self._decrease_blocked_until = 0.0
+        self._consecutive_throttles = 0
+        self._low_headroom = False
+        self._lock = threading.Lock()
+        self._waiters: Deque[_Waiter] = deque()
+
+        # Metrics
+        self.requests = 0
+        self.waited_requests = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.throttles = 0
+        self.decreases = 0
+
+    async def acquire(self) -> float:
+        """Wait for an in-flight slot (FIFO); returns the seconds waited."""
+        waiter = _Waiter(asyncio.get_running_loop(), asyncio.Event())
+        start = time.monotonic()
+        logged = False
+        with self._lock:
+            self._waiters.append(waiter)
+        try:
+            while True:
+                delay = None
+                with self._lock:
+                    if self._waiters[0] is waiter:
+                        now = time.monotonic()
+                        if now < self.blocked_until:
+                            delay = self.blocked_until - now
+                        elif self.in_flight < int(self.limit):
+                            self._waiters.popleft()
+                            self.in_flight += 1
+                            self._wake_head()  # The limit may admit the next waiter too
+                            return self._record(now - start)
+                    waiter.event.clear()
+
+                if delay is not None and delay >= LOG_WAIT_THRESHOLD and not logged:
+                    logger.info(f"[AdaptiveLimiter] {self.name}: backing off for {delay:.1f}s after rate limiting")
+                    logged = True
+                try:
+                    await asyncio.wait_for(waiter.event.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+        except BaseException:
+            with self._lock:
+                was_head = bool(self._waiters) and self._waiters[0] is waiter
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+                if was_head:
+                    self._wake_head()
+            raise
+
+    def release(self, success: bool = True) -> None:
+        """Free a slot; a request that completed normally grows the limit additively."""
+        with self._lock:
+            self.in_flight = max(self.in_flight - 1, 0)
+            if success:
+                self._consecutive_throttles = 0
+                # Only grow while the limit is the bottleneck and the provider reports headroom
+                if self.in_flight + 1 >= int(self.limit) and not self._low_headroom:
+                    self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self._wake_head()
+
+    def throttled(self, retry_after: Optional[float] = None) -> None:
+        """Record a 429: halve the limit and block new requests until retry-after (or a backoff)."""
+        with self._lock:
+            now = time.monotonic()
+            self.throttles += 1
+            self._consecutive_throttles += 1
+            if retry_after is None:
+                retry_after = min(MAX_BACKOFF, BASE_BACKOFF * 2 ** (self._consecutive_throttles - 1))
+            self.blocked_until = max(self.blocked_until, now + retry_after)
+            # Requests rejected by the same burst share one decrease
+            decreased = now >= self._decrease_blocked_until
+            if decreased:
+                self.limit = max(MIN_LIMIT, min(self.limit, max(self.in_flight, MIN_LIMIT)) * DECREASE_FACTOR)
+                self.decreases += 1
+                self._decrease_blocked_until = self.blocked_until
+            limit = int(self.limit)
+        if decreased:
+            logger.info(f"[AdaptiveLimiter] {self.name}: rate limited, concurrency limit now {limit}, retrying after {retry_after:.1f}s")
+
+    def observe(self, signal: RateLimitSignal) -> None:
+        """Record the budgets reported by a successful response."""
+        with self._lock:
+            self._low_headroom = signal.remaining_requests is not None and signal.remaining_requests <= self.in_flight
+            if signal.exhausted and signal.reset_after:
+                self.blocked_until = max(self.blocked_until, time.monotonic() + signal.reset_after)
+
+    async def run(self, create: Callable[[], Awaitable[Any]], retries: int = RATE_LIMIT_RETRIES) -> Any:
+        """
+        Start a provider request under the limiter.
+
+        Args:
+            create: Coroutine factory sending the request (e.g. ``client.messages.create(...)``)
+            retries: Retries for throttled requests whose retry-after is short
+
+        Returns:
+            The request's result. Async-iterable results (streams) keep their slot until
+            they are exhausted, fail or are closed.
+        """
+        attempt = 0
+        while True:
+            await self.acquire()
+            context = _RequestContext(self)
+            token = _current_request.set(context)
+            try:
+                result = await create()
+            except BaseException as exc:
+                is_rate_limit, retry_after = rate_limit_error(exc)
+                if is_rate_limit and not context.throttled:  # Not already seen by the response hook
+                    self.throttled(retry_after)
+                self.release(success=False)
+                if not is_rate_limit or attempt >= retries or (retry_after or 0.0) > MAX_RETRY_WAIT:
+                    raise
+                attempt += 1
+                continue
+            finally:
+                _current_request.reset(token)
+
+            if hasattr(result, "__aiter__"):
+                return _HeldStream(result, self)
+            self.release(success=True)
+            return result
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "waited_requests": self.waited_requests,
+                "total_wait": round(self.total_wait, 3),
+                "max_wait": round(self.max_wait, 3),
+                "limit": int(self.limit),
+                "in_flight": self.in_flight,
+                "queued": len(self._waiters),
+                "throttles": self.throttles,
+                "decreases": self.decreases,
+            }
+
+    def _wake_head(self) -> None:
+        if self._waiters:
+            head = self._waiters[0]
+            try:
+                head.loop.call_soon_threadsafe(head.event.set)
+            except RuntimeError:
+                pass  # The waiter's loop is closed
+
+    def _record(self, waited: float) -> float:
+        self.requests += 1
+        if waited >= 0.001:
+            self.waited_requests += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+        return waited
+
+
+class _HeldStream:
+    """Async-iterable wrapper that holds a limiter slot until the wrapped stream ends."""
+
+    def __init__(self, stream: Any, limiter: AdaptiveLimiter):
+        self._stream = stream
+        self._iterator = None
+        released = []
+
+        def release(success: bool) -> None:
+            if not released:
+                released.append(success)
+                limiter.release(success)
+
+        self._release = release
+        # Streams abandoned without being exhausted or closed give their slot back when collected
+        weakref.finalize(self, release, True)
+
+    def __aiter__(self) -> "_HeldStream":
+        return self
+
+    async def __anext__(self) -> Any:
+        if self._iterator is None:
+            self._iterator = self._stream.__aiter__()
+        try:
+            return await self._iterator.__anext__()
+        except StopAsyncIteration:
+            self._release(True)
+            raise
+        except BaseException:
+            self._release(False)
+            raise
+
+    async def close(self) -> None:
+        self._release(True)
+        close = getattr(self._stream, "close", None) or getattr(self._stream, "aclose", None)
+        if close is not None:
+            result = close()
+            if asyncio.iscoroutine(result):
+                await result
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
@@ -14,6 +14,7 @@ from ..logger_config import (
     log_backend_agent_message,
     log_stream_chunk,
 )
+from ..stream_chunk import ChunkAccumulator
 from .base import LLMBackend, StreamChunk
 
 
@@ -138,11 +139,11 @@ class AzureOpenAIBackend(LLMBackend):
                     api_params[key] = value
 
             # Create streaming response (now properly async)
-            stream = await self.client.chat.completions.create(**api_params)
+            stream = await self._start_request(lambda: self.client.chat.completions.create(**api_params), api_params.get("model"))
 
             # Process streaming response with content accumulation
             accumulated_content = ""
-            complete_response = ""  # Keep track of the complete response
+            complete_response = ChunkAccumulator()  # Keep track of the complete response
             last_yield_type = None
 
             async for chunk in stream:
@@ -151,7 +152,7 @@ class AzureOpenAIBackend(LLMBackend):
                 # Accumulate content chunks
                 if converted.type == "content" and converted.content:
                     accumulated_content += converted.content
-                    complete_response += converted.content  # Add to complete response
+                    complete_response.append(converted.content)  # Add to complete response
                     # Only yield content when we have meaningful chunks (words, not single characters)
                     if len(accumulated_content) >= 10 or " " in accumulated_content:
                         log_backend_agent_message(
@@ -191,7 +192,7 @@ class AzureOpenAIBackend(LLMBackend):
 
             # After streaming is complete, check if we have workflow tool calls
             if has_workflow_tools:
-                workflow_tool_calls = self._extract_workflow_tool_calls(complete_response)
+                workflow_tool_calls = self._extract_workflow_tool_calls(complete_response.getvalue())
                 if workflow_tool_calls:
                     log_stream_chunk(
                         "backend.azure_openai",
@@ -8,12 +8,14 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, AsyncGenerator, Dict, List, Optional, Union
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Optional, Union
 
 from ..filesystem_manager import FilesystemManager, PathPermissionManagerHook
 from ..mcp_tools.hooks import FunctionHookManager, HookType
 from ..token_manager import TokenCostCalculator, TokenUsage
 from ..utils import CoordinationStage
+from .client_pool import ClientPool
+from .rate_limiter import GlobalRateLimiter
 
 
 class FilesystemSupport(Enum):
@@ -81,6 +83,9 @@ class LLMBackend(ABC):
 
         self.token_calculator = TokenCostCalculator()
 
+        # Adapt request concurrency to the provider's rate-limit feedback (see adaptive_limiter.py)
+        self._adaptive_rate_limit: bool = bool(kwargs.get("enable_rate_limit", False))
+
         # Filesystem manager integration
         self.filesystem_manager = None
         cwd = kwargs.get("cwd")
@@ -534,13 +539,34 @@ class LLMBackend(ABC):
         return tool_name in self._planning_mode_blocked_tools
 
     async def _cleanup_client(self, client: Any) -> None:
-        """Clean up OpenAI client resources."""
+        """Clean up OpenAI client resources.
+
+        Clients owned by ClientPool are kept open so later streams reuse their connections.
+        """
         try:
+            if ClientPool.is_pooled(client):
+                return
             if client is not None and hasattr(client, "aclose"):
                 await client.aclose()
         except Exception:
             pass
 
+    async def _start_request(self, create: Callable[[], Awaitable[Any]], model: Optional[str] = None) -> Any:
+        """
+        Send a provider request, under the adaptive rate limiter when rate limiting is enabled.
+
+        Args:
+            create: Coroutine factory sending the request (e.g. ``lambda: client.responses.create(**api_params)``)
+            model: Model the request targets (defaults to the configured model)
+
+        Returns:
+            The request's result; a returned stream holds its limiter slot until it ends
+        """
+        if not self._adaptive_rate_limit:
+            return await create()
+        limiter = GlobalRateLimiter.get_adaptive_limiter_sync(self.get_provider_name(), model or self.config.get("model"), api_key=self.api_key)
+        return await limiter.run(create)
+
     def set_stage(self, stage: CoordinationStage) -> None:
         """
         Set the current coordination stage for the backend.
@@ -29,9 +29,12 @@ import httpx
 from pydantic import BaseModel
 
 from ..logger_config import log_backend_activity, logger
+from ..stream_chunk import ChunkAccumulator
 from ..tool import ToolManager
 from ..utils import CoordinationStage
 from .base import LLMBackend, StreamChunk
+from .client_pool import ClientPool
+from .media_cache import MediaEncodingCache
 
 
 @dataclass
@@ -54,6 +57,17 @@ class ToolExecutionConfig:
     execution_callback: Callable  # reference to _execute_custom_tool or _execute_mcp_function_with_retry
 
 
+@dataclass
+class ToolRoundOutcome:
+    """Outcome of a single tool-loop round.
+
+    A round sets ``next_messages`` when it executed tools and the conversation
+    must continue with another model request; leaving it as None ends the loop.
+    """
+
+    next_messages: Optional[List[Dict[str, Any]]] = None
+
+
 class UploadFileError(Exception):
     """Raised when an upload specified in configuration fails to process."""
 
@@ -242,6 +256,12 @@ class CustomToolAndMCPBackend(LLMBackend):
         # Store execution context for custom tool execution
         self._execution_context = None
 
+        # Result cache for cacheable tools, shared across agents by the orchestrator
+        self.tool_result_cache = None
+
+        # Base64 cache for upload_files media, shared across agents by the orchestrator
+        self.media_cache: Optional[MediaEncodingCache] = None
+
         # Register custom tools if provided
         custom_tools = kwargs.get("custom_tools", [])
         if custom_tools:
@@ -290,6 +310,13 @@ class CustomToolAndMCPBackend(LLMBackend):
         # Limit for message history growth within MCP execution loop
         self._max_mcp_message_history = kwargs.pop("max_mcp_message_history", 200)
 
+        # Upper bound on model requests per stream_with_tools call in the tool loop
+        self._max_tool_rounds = max(1, int(kwargs.pop("max_tool_rounds", 100)))
+
+        # Concurrent execution of independent tool calls emitted in one model turn
+        self._parallel_tool_execution = kwargs.pop("parallel_tool_execution", True)
+        self._max_parallel_tool_calls = max(1, int(kwargs.pop("max_parallel_tool_calls", 4)))
+
         # Initialize backend name and agent ID for MCP operations
         self.backend_name = self.get_provider_name()
         self.agent_id = kwargs.get("agent_id", None)
@@ -298,6 +325,17 @@ class CustomToolAndMCPBackend(LLMBackend):
         """Return True if the backend supports `upload_files` preprocessing."""
         return False
 
+    def set_tool_result_cache(self, cache) -> None:
+        """Serve cacheable MCP and custom tool calls from a shared ToolResultCache (None disables)."""
+        self.tool_result_cache = cache
+        self.custom_tool_manager.result_cache = cache
+        if self._mcp_client is not None:
+            self._mcp_client.result_cache = cache
+
+    def set_media_cache(self, cache: Optional[MediaEncodingCache]) -> None:
+        """Encode upload_files media through a shared MediaEncodingCache (None: a private one)."""
+        self.media_cache = cache
+
     @abstractmethod
     async def _process_stream(self, stream, all_params, agent_id: Optional[str] = None) -> AsyncGenerator[StreamChunk, None]:
         """Process stream."""
@@ -406,6 +444,29 @@ class CustomToolAndMCPBackend(LLMBackend):
                     if preset_args_list is None:
                         continue  # Validation error, skip this tool
 
+                    # Process cacheable field (can be bool or List[bool])
+                    cacheable_list = self._process_field_for_functions(
+                        tool_config.get("cacheable"),
+                        num_functions,
+                        "cacheable",
+                    )
+                    if cacheable_list is None:
+                        continue  # Validation error, skip this tool
+
+                    # Process executor and timeout fields (can be scalar or list)
+                    executor_list = self._process_field_for_functions(
+                        tool_config.get("executor"),
+                        num_functions,
+                        "executor",
+                    )
+                    timeout_list = self._process_field_for_functions(
+                        tool_config.get("timeout"),
+                        num_functions,
+                        "timeout",
+                    )
+                    if executor_list is None or timeout_list is None:
+                        continue  # Validation error, skip this tool
+
                     # Register each function with its corresponding values
                     for i, func in enumerate(functions):
                         # Inject agent_cwd into preset_args if filesystem_manager is available
@@ -439,6 +500,9 @@ class CustomToolAndMCPBackend(LLMBackend):
                                 category=category,
                                 preset_args=final_preset_args,
                                 description=descriptions[i],
+                                cacheable=cacheable_list[i],
+                                executor=executor_list[i],
+                                timeout=timeout_list[i],
                             )
                         else:
                             # No custom name or same as function name, use normal registration
@@ -448,6 +512,9 @@ class CustomToolAndMCPBackend(LLMBackend):
                                 category=category,
                                 preset_args=final_preset_args,
                                 description=descriptions[i],
+                                cacheable=cacheable_list[i],
+                                executor=executor_list[i],
+                                timeout=timeout_list[i],
                             )
 
                         # Use custom name for logging and tracking if provided
@@ -593,7 +660,7 @@ class CustomToolAndMCPBackend(LLMBackend):
             "input": arguments,
         }
 
-        accumulated_result = ""
+        accumulated_result = ChunkAccumulator()
 
         # Stream all results and accumulate only is_log=True
         async for data, is_log in self._stream_execution_results(tool_request):
@@ -606,13 +673,13 @@ class CustomToolAndMCPBackend(LLMBackend):
 
             # Accumulate only final results for message history
             if not is_log:
-                accumulated_result += data
+                accumulated_result.append(data)
 
         # Yield final chunk with accumulated result
         yield CustomToolChunk(
             data="",
             completed=True,
-            accumulated_result=accumulated_result or "Tool executed successfully",
+            accumulated_result=accumulated_result.getvalue() or "Tool executed successfully",
         )
 
     def _get_custom_tools_schemas(self) -> List[Dict[str, Any]]:
@@ -857,6 +924,97 @@ class CustomToolAndMCPBackend(LLMBackend):
 
             processed_call_ids.add(call.get("call_id", ""))
 
+    def _build_tool_execution_plan(
+        self,
+        custom_calls: List[Dict[str, Any]],
+        mcp_calls: List[Dict[str, Any]],
+        custom_config: ToolExecutionConfig,
+        mcp_config: ToolExecutionConfig,
+        call_order: Optional[List[str]] = None,
+    ) -> List[Tuple[Dict[str, Any], ToolExecutionConfig]]:
+        """Pair categorized tool calls with their execution config.
+
+        Args:
+            custom_calls: Custom tool calls to execute
+            mcp_calls: MCP tool calls to execute
+            custom_config: ToolExecutionConfig for custom tools
+            mcp_config: ToolExecutionConfig for MCP tools
+            call_order: Call IDs in the order the model emitted them; when given,
+                the plan follows this order instead of custom-then-MCP
+
+        Returns:
+            List of (call, config) pairs ready for _execute_tool_calls
+        """
+        plan = [(call, custom_config) for call in custom_calls] + [(call, mcp_config) for call in mcp_calls]
+        if call_order:
+            position = {call_id: index for index, call_id in enumerate(call_order)}
+            plan.sort(key=lambda item: position.get(item[0].get("call_id"), len(position)))
+        return plan
+
+    async def _execute_tool_calls(
+        self,
+        calls: List[Tuple[Dict[str, Any], ToolExecutionConfig]],
+        updated_messages: List[Dict[str, Any]],
+        processed_call_ids: Set[str],
+    ) -> AsyncGenerator[StreamChunk, None]:
+        """Execute all tool calls from one model turn, concurrently when enabled.
+
+        Calls run through _execute_tool_with_logging with at most
+        ``max_parallel_tool_calls`` in flight. Status chunks are yielded as soon as
+        any call produces them, while result messages are buffered per call and
+        appended to updated_messages in the original call order once all calls finish.
+
+        Args:
+            calls: (call, config) pairs in the order the model emitted them
+            updated_messages: Message list to append results to
+            processed_call_ids: Set to track processed call IDs
+
+        Yields:
+            StreamChunk objects from every call, interleaved
+        """
+        if not self._parallel_tool_execution or len(calls) <= 1:
+            for call, config in calls:
+                async for chunk in self._execute_tool_with_logging(call, config, updated_messages, processed_call_ids):
+                    yield chunk
+            return
+
+        semaphore = asyncio.Semaphore(self._max_parallel_tool_calls)
+        queue: asyncio.Queue = asyncio.Queue()
+        call_finished = object()
+        call_messages: List[List[Dict[str, Any]]] = [[] for _ in calls]
+
+        async def run_call(index: int, call: Dict[str, Any], config: ToolExecutionConfig) -> None:
+            try:
+                async with semaphore:
+                    async for chunk in self._execute_tool_with_logging(call, config, call_messages[index], processed_call_ids):
+                        await queue.put(chunk)
+            finally:
+                queue.put_nowait(call_finished)
+
+        logger.info(f"Executing {len(calls)} tool calls concurrently (max {self._max_parallel_tool_calls} in flight)")
+        tasks = [asyncio.create_task(run_call(index, call, config)) for index, (call, config) in enumerate(calls)]
+
+        try:
+            pending = len(tasks)
+            while pending:
+                item = await queue.get()
+                if item is call_finished:
+                    pending -= 1
+                    continue
+                yield item
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        for messages in call_messages:
+            updated_messages.extend(messages)
+
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+
     # MCP support methods
     async def _setup_mcp_tools(self) -> None:
         """Initialize MCP client for mcp_tools-based servers (stdio + streamable-http)."""
@@ -926,6 +1084,7 @@ class CustomToolAndMCPBackend(LLMBackend):
                 self._mcp_initialized = False
                 logger.warning("MCP client setup failed, falling back to no-MCP streaming")
                 return
+            self._mcp_client.result_cache = self.tool_result_cache
 
             # Convert tools to functions using consolidated utility
             self._mcp_functions.update(
@@ -1119,7 +1278,7 @@ class CustomToolAndMCPBackend(LLMBackend):
                     limit_mb = all_params.get("media_max_file_size_mb") or self.config.get("media_max_file_size_mb") or MEDIA_MAX_FILE_SIZE_MB
                     self._validate_media_size(resolved, int(limit_mb))
 
-                    encoded, mime_type = self._read_base64(resolved)
+                    encoded, mime_type = await self._read_base64(resolved)
                     if not mime_type:
                         mime_type = "image/jpeg"
 
@@ -1163,7 +1322,7 @@ class CustomToolAndMCPBackend(LLMBackend):
 
                     self._validate_media_size(resolved, int(limit_mb))
 
-                    encoded, mime_type = self._read_base64(resolved)
+                    encoded, mime_type = await self._read_base64(resolved)
 
                     # Validate audio format (wav and mp3 only)
                     mime_lower = (mime_type or "").split(";")[0].strip().lower()
@@ -1214,7 +1373,7 @@ class CustomToolAndMCPBackend(LLMBackend):
 
                     self._validate_media_size(resolved, int(limit_mb))
 
-                    encoded, mime_type = self._read_base64(resolved)
+                    encoded, mime_type = await self._read_base64(resolved)
                     if not mime_type:
                         mime_type = "video/mp4"
                     extra_content.append(
@@ -1355,15 +1514,14 @@ class CustomToolAndMCPBackend(LLMBackend):
                 f"Media file size {file_size / (1024 * 1024):.2f} MB exceeds limit of {limit_mb:.0f} MB: {path}",
             )
 
-    def _read_base64(self, path: Path) -> Tuple[str, str]:
-        """Read file bytes and return (base64, guessed_mime_type)."""
-        mime_type, _ = mimetypes.guess_type(path.as_posix())
+    async def _read_base64(self, path: Path) -> Tuple[str, str]:
+        """Return (base64, guessed_mime_type) for a file, encoded off the event loop and cached."""
+        if self.media_cache is None:
+            self.media_cache = MediaEncodingCache()
         try:
-            data = path.read_bytes()
+            return await self.media_cache.encode(path)
         except OSError as exc:
             raise UploadFileError(f"Failed to read file {path}: {exc}") from exc
-        encoded = base64.b64encode(data).decode("utf-8")
-        return encoded, (mime_type or "")
 
     async def _fetch_audio_url_as_base64(
         self,
@@ -1389,57 +1547,58 @@ class CustomToolAndMCPBackend(LLMBackend):
         limit_mb = all_params.get("media_max_file_size_mb") or self.config.get("media_max_file_size_mb") or MEDIA_MAX_FILE_SIZE_MB
         max_size_bytes = int(limit_mb) * 1024 * 1024
 
-        async with httpx.AsyncClient() as http_client:
-            try:
-                response = await http_client.get(url, timeout=30.0)
-                response.raise_for_status()
-            except httpx.TimeoutException as exc:
-                raise UploadFileError(
-                    f"Timeout (30s) while fetching audio from {url}",
-                ) from exc
-            except httpx.HTTPError as exc:
+        # Shared keep-alive client from the pool; not closed here
+        http_client = ClientPool.get_http_client()
+        try:
+            response = await http_client.get(url, timeout=30.0)
+            response.raise_for_status()
+        except httpx.TimeoutException as exc:
+            raise UploadFileError(
+                f"Timeout (30s) while fetching audio from {url}",
+            ) from exc
+        except httpx.HTTPError as exc:
+            raise UploadFileError(
+                f"Failed to fetch audio from {url}: {exc}",
+            ) from exc
+
+        # Validate Content-Type
+        content_type = response.headers.get("Content-Type", "")
+        mime_type = content_type.split(";")[0].strip().lower()
+
+        # Simple format validation (wav and mp3 only)
+        if mime_type not in SUPPORTED_AUDIO_MIME_TYPES:
+            # Try to guess from URL extension
+            guessed_mime, _ = mimetypes.guess_type(url)
+            if guessed_mime and guessed_mime.lower() in SUPPORTED_AUDIO_MIME_TYPES:
+                mime_type = guessed_mime.lower()
+            else:
                 raise UploadFileError(
-                    f"Failed to fetch audio from {url}: {exc}",
-                ) from exc
-
-            # Validate Content-Type
-            content_type = response.headers.get("Content-Type", "")
-            mime_type = content_type.split(";")[0].strip().lower()
-
-            # Simple format validation (wav and mp3 only)
-            if mime_type not in SUPPORTED_AUDIO_MIME_TYPES:
-                # Try to guess from URL extension
-                guessed_mime, _ = mimetypes.guess_type(url)
-                if guessed_mime and guessed_mime.lower() in SUPPORTED_AUDIO_MIME_TYPES:
-                    mime_type = guessed_mime.lower()
-                else:
-                    raise UploadFileError(
-                        f"Unsupported audio format for {url}. " f"Supported formats: {', '.join(sorted(SUPPORTED_AUDIO_FORMATS))}",
-                    )
+                    f"Unsupported audio format for {url}. " f"Supported formats: {', '.join(sorted(SUPPORTED_AUDIO_FORMATS))}",
+                )
 
-            # Normalize MIME type
-            if mime_type in {"audio/wav", "audio/wave", "audio/x-wav"}:
-                mime_type = "audio/wav"
-            elif mime_type in {"audio/mpeg", "audio/mp3"}:
-                mime_type = "audio/mpeg"
+        # Normalize MIME type
+        if mime_type in {"audio/wav", "audio/wave", "audio/x-wav"}:
+            mime_type = "audio/wav"
+        elif mime_type in {"audio/mpeg", "audio/mp3"}:
+            mime_type = "audio/mpeg"
 
-            # Get audio bytes
-            audio_bytes = response.content
+        # Get audio bytes
+        audio_bytes = response.content
 
-            # Validate size
-            if len(audio_bytes) > max_size_bytes:
-                raise UploadFileError(
-                    f"Audio file size {len(audio_bytes) / (1024 * 1024):.2f} MB exceeds limit of {limit_mb} MB: {url}",
-                )
+        # Validate size
+        if len(audio_bytes) > max_size_bytes:
+            raise UploadFileError(
+                f"Audio file size {len(audio_bytes) / (1024 * 1024):.2f} MB exceeds limit of {limit_mb} MB: {url}",
+            )
 
-            # Encode to base64
-            encoded = base64.b64encode(audio_bytes).decode("utf-8")
+        # Encode to base64
+        encoded = base64.b64encode(audio_bytes).decode("utf-8")
 
-            logger.info(
-                f"Fetched and encoded audio from URL: {url} " f"({len(audio_bytes) / (1024 * 1024):.2f} MB, {mime_type})",
-            )
+        logger.info(
+            f"Fetched and encoded audio from URL: {url} " f"({len(audio_bytes) / (1024 * 1024):.2f} MB, {mime_type})",
+        )
 
-            return encoded, mime_type
+        return encoded, mime_type
 
     async def stream_with_tools(
         self,
@@ -1547,7 +1706,6 @@ class CustomToolAndMCPBackend(LLMBackend):
             finally:
                 await self._cleanup_client(client)
 
-    @abstractmethod
     async def _stream_with_custom_and_mcp_tools(
         self,
         current_messages: List[Dict[str, Any]],
@@ -1555,6 +1713,46 @@ class CustomToolAndMCPBackend(LLMBackend):
         client,
         **kwargs,
     ) -> AsyncGenerator[StreamChunk, None]:
+        """Run the tool loop iteratively, one _stream_tool_round call per model request.
+
+        Each round streams a model response and executes any custom/MCP tool calls.
+        When a round needs another model request it hands back the updated message
+        list through ToolRoundOutcome instead of recursing, so generator depth stays
+        constant no matter how many rounds an agent runs.
+        """
+        messages = current_messages
+
+        for _ in range(self._max_tool_rounds):
+            outcome = ToolRoundOutcome()
+            async for chunk in self._stream_tool_round(messages, tools, client, outcome, **kwargs):
+                yield chunk
+
+            if outcome.next_messages is None:
+                return
+            messages = outcome.next_messages
+
+        logger.warning(f"Tool loop reached max_tool_rounds ({self._max_tool_rounds}); stopping tool execution")
+        yield StreamChunk(
+            type="mcp_status",
+            status="max_tool_rounds_reached",
+            content=f"⚠️ [Tools] Reached the limit of {self._max_tool_rounds} tool rounds; stopping",
+            source="tool_loop",
+        )
+        yield StreamChunk(type="done")
+
+    async def _stream_tool_round(
+        self,
+        current_messages: List[Dict[str, Any]],
+        tools: List[Dict[str, Any]],
+        client,
+        outcome: ToolRoundOutcome,
+        **kwargs,
+    ) -> AsyncGenerator[StreamChunk, None]:
+        """Stream one model request and execute its tool calls.
+
+        Backends using the shared tool loop override this. Set
+        ``outcome.next_messages`` to request another round.
+        """
         yield StreamChunk(type="error", error="Not implemented")
 
     @abstractmethod
@@ -1590,14 +1788,14 @@ class CustomToolAndMCPBackend(LLMBackend):
             api_params["tools"] = non_mcp_tools
 
         if "openai" in self.get_provider_name().lower():
-            stream = await client.responses.create(**api_params)
+            stream = await self._start_request(lambda: client.responses.create(**api_params), api_params.get("model"))
         elif "claude" in self.get_provider_name().lower():
             if "betas" in api_params:
-                stream = await client.beta.messages.create(**api_params)
+                stream = await self._start_request(lambda: client.beta.messages.create(**api_params), api_params.get("model"))
             else:
-                stream = await client.messages.create(**api_params)
+                stream = await self._start_request(lambda: client.messages.create(**api_params), api_params.get("model"))
         else:
-            stream = await client.chat.completions.create(**api_params)
+            stream = await self._start_request(lambda: client.chat.completions.create(**api_params), api_params.get("model"))
 
         async for chunk in self._process_stream(stream, all_params, agent_id):
             yield chunk
@@ -1813,9 +2011,9 @@ class CustomToolAndMCPBackend(LLMBackend):
         if not self._mcp_functions:
             return []
 
-        # Determine format based on backend type
-        mcp_tools = []
-        mcp_tools = self.formatter.format_mcp_tools(self._mcp_functions)
+        # Determine format based on backend type (converted once per set of MCP functions)
+        mcp_functions = self._mcp_functions
+        mcp_tools = self.formatter.cached_tools("mcp", lambda: self.formatter.format_mcp_tools(mcp_functions), members=mcp_functions.values())
 
         # Track function names for fallback filtering
         self._track_mcp_function_names(mcp_tools)
@@ -27,7 +27,8 @@ from openai import AsyncOpenAI
 
 from ..api_params_handler import ChatCompletionsAPIParamsHandler
 from ..formatter import ChatCompletionsFormatter
-from ..logger_config import log_backend_agent_message, log_stream_chunk, logger
+from ..logger_config import log_stream_chunk, logger
+from ..stream_chunk import ChunkAccumulator
 
 # Local imports
 from .base import FilesystemSupport, StreamChunk
@@ -35,7 +36,9 @@ from .base_with_custom_tool_and_mcp import (
     CustomToolAndMCPBackend,
     CustomToolChunk,
     ToolExecutionConfig,
+    ToolRoundOutcome,
 )
+from .client_pool import ClientPool
 
 
 class ChatCompletionsBackend(CustomToolAndMCPBackend):
@@ -136,14 +139,15 @@ class ChatCompletionsBackend(CustomToolAndMCPBackend):
         async for chunk in self.stream_custom_tool_execution(call):
             yield chunk
 
-    async def _stream_with_custom_and_mcp_tools(
+    async def _stream_tool_round(
         self,
         current_messages: List[Dict[str, Any]],
         tools: List[Dict[str, Any]],
         client,
+        outcome: ToolRoundOutcome,
         **kwargs,
     ) -> AsyncGenerator[StreamChunk, None]:
-        """Recursively stream responses, executing custom and MCP tool calls as needed."""
+        """Stream one response, executing custom and MCP tool calls as needed."""
 
         # Build API params for this iteration
         all_params = {**self.config, **kwargs}
@@ -158,13 +162,13 @@ class ChatCompletionsBackend(CustomToolAndMCPBackend):
             api_params["tools"].extend(provider_tools)
 
         # Start streaming
-        stream = await client.chat.completions.create(**api_params)
+        stream = await self._start_request(lambda: client.chat.completions.create(**api_params), api_params.get("model"))
 
         # Track function calls in this iteration
         captured_function_calls = []
         current_tool_calls = {}
         response_completed = False
-        content = ""
+        content = ChunkAccumulator()
 
         async for chunk in stream:
             try:
@@ -178,7 +182,7 @@ class ChatCompletionsBackend(CustomToolAndMCPBackend):
                         # Plain text content
                         if getattr(delta, "content", None):
                             content_chunk = delta.content
-                            content += content_chunk
+                            content.append(content_chunk)
                             yield StreamChunk(type="content", content=content_chunk)
 
                         # Tool calls streaming (OpenAI-style)
@@ -327,7 +331,7 @@ class ChatCompletionsBackend(CustomToolAndMCPBackend):
                 if all_tool_calls:
                     assistant_message = {
                         "role": "assistant",
-                        "content": content.strip() if content.strip() else None,
+                        "content": content.getvalue().strip() or None,
                         "tool_calls": all_tool_calls,
                     }
                     updated_messages.append(assistant_message)
@@ -359,16 +363,17 @@ class ChatCompletionsBackend(CustomToolAndMCPBackend):
                 execution_callback=self._execute_mcp_function_with_retry,
             )
 
-            # Execute custom tools using unified method
-            for call in custom_calls:
-                async for chunk in self._execute_tool_with_logging(call, custom_tool_config, updated_messages, processed_call_ids):
-                    yield chunk
-                functions_executed = True
-
-            # Execute MCP tools using unified method
-            for call in mcp_calls:
-                async for chunk in self._execute_tool_with_logging(call, mcp_tool_config, updated_messages, processed_call_ids):
-                    yield chunk
+            # Execute custom and MCP tools using unified method (concurrently when enabled)
+            tool_calls_to_execute = self._build_tool_execution_plan(
+                custom_calls,
+                mcp_calls,
+                custom_tool_config,
+                mcp_tool_config,
+                call_order=[call["call_id"] for call in captured_function_calls],
+            )
+            async for chunk in self._execute_tool_calls(tool_calls_to_execute, updated_messages, processed_call_ids):
+                yield chunk
+            if tool_calls_to_execute:
                 functions_executed = True
 
             # Ensure all captured function calls have results to prevent hanging
@@ -387,11 +392,8 @@ class ChatCompletionsBackend(CustomToolAndMCPBackend):
 
             # Trim history after function executions to bound memory usage
             if functions_executed:
-                updated_messages = self._trim_message_history(updated_messages)
-
-                # Recursive call with updated messages
-                async for chunk in self._stream_with_custom_and_mcp_tools(updated_messages, tools, client, **kwargs):
-                    yield chunk
+                # Continue the tool loop with updated messages
+                outcome.next_messages = self._trim_message_history(updated_messages)
             else:
                 # No functions were executed, we're done
                 yield StreamChunk(type="done")
@@ -411,7 +413,7 @@ class ChatCompletionsBackend(CustomToolAndMCPBackend):
     async def _process_stream(self, stream, all_params, agent_id) -> AsyncGenerator[StreamChunk, None]:
         """Handle standard Chat Completions API streaming format with logging."""
 
-        content = ""
+        content = ChunkAccumulator()
         current_tool_calls = {}
         search_sources_used = 0
         provider_name = self.get_provider_name()
@@ -434,13 +436,7 @@ class ChatCompletionsBackend(CustomToolAndMCPBackend):
                             if reasoning_chunk:
                                 yield reasoning_chunk
                             content_chunk = delta.content
-                            content += content_chunk
-                            log_backend_agent_message(
-                                agent_id or "default",
-                                "RECV",
-                                {"content": content_chunk},
-                                backend_name=provider_name,
-                            )
+                            content.append(content_chunk)
                             log_stream_chunk(log_prefix, "content", content_chunk, agent_id)
                             yield StreamChunk(type="content", content=content_chunk)
 
@@ -523,7 +519,7 @@ class ChatCompletionsBackend(CustomToolAndMCPBackend):
 
                             complete_message = {
                                 "role": "assistant",
-                                "content": content.strip(),
+                                "content": content.getvalue().strip(),
                                 "tool_calls": final_tool_calls,
                             }
 
@@ -556,7 +552,7 @@ class ChatCompletionsBackend(CustomToolAndMCPBackend):
                             # Return final message
                             complete_message = {
                                 "role": "assistant",
-                                "content": content.strip(),
+                                "content": content.getvalue().strip(),
                             }
                             yield StreamChunk(
                                 type="complete_message",
@@ -673,7 +669,12 @@ class ChatCompletionsBackend(CustomToolAndMCPBackend):
 
         all_params = {**self.config, **kwargs}
         base_url = all_params.get("base_url", "https://api.openai.com/v1")
-        return openai.AsyncOpenAI(api_key=self.api_key, base_url=base_url)
+        return ClientPool.get_client(
+            provider="openai",
+            base_url=base_url,
+            api_key=self.api_key,
+            factory=lambda http_client: openai.AsyncOpenAI(api_key=self.api_key, base_url=base_url, http_client=http_client),
+        )
 
     def _handle_reasoning_transition(self, log_prefix: str, agent_id: Optional[str]) -> Optional[StreamChunk]:
         """Handle reasoning state transition and return StreamChunk if transition occurred."""
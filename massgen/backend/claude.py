@@ -30,19 +30,21 @@ from pathlib import Path
 from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Tuple
 
 import anthropic
-import httpx
 
 from ..api_params_handler import ClaudeAPIParamsHandler
 from ..formatter import ClaudeFormatter
-from ..logger_config import log_backend_agent_message, log_stream_chunk, logger
+from ..logger_config import log_stream_chunk, logger
 from ..mcp_tools.backend_utils import MCPErrorHandler
+from ..stream_chunk import ChunkAccumulator
 from .base import FilesystemSupport, StreamChunk
 from .base_with_custom_tool_and_mcp import (
     CustomToolAndMCPBackend,
     CustomToolChunk,
     ToolExecutionConfig,
+    ToolRoundOutcome,
     UploadFileError,
 )
+from .client_pool import ClientPool
 
 
 class ClaudeBackend(CustomToolAndMCPBackend):
@@ -218,9 +220,9 @@ class ClaudeBackend(CustomToolAndMCPBackend):
         if not file_locations:
             return messages
 
-        httpx_client = None
         try:
-            httpx_client = httpx.AsyncClient()
+            # Shared keep-alive client from the pool; not closed here
+            httpx_client = ClientPool.get_http_client()
 
             # Track uploaded file IDs, skipped files, failed uploads, and their corresponding locations
             uploaded_files: List[Tuple[int, int, str]] = []  # (msg_idx, item_idx, file_id)
@@ -373,9 +375,6 @@ class ClaudeBackend(CustomToolAndMCPBackend):
         except Exception as e:
             logger.warning(f"[Agent {agent_id or 'default'}] Files API upload error: {e}")
             raise UploadFileError(f"Files API upload failed: {e}") from e
-        finally:
-            if httpx_client:
-                await httpx_client.aclose()
 
         # Clone messages and replace markers with document blocks or text notes
         updated_messages = [msg.copy() for msg in messages]
@@ -455,8 +454,7 @@ class ClaudeBackend(CustomToolAndMCPBackend):
         except Exception as e:
             logger.warning(f"[Agent {agent_id or 'default'}] Files API cleanup error: {e}")
         finally:
-            if client and hasattr(client, "aclose"):
-                await client.aclose()
+            await self._cleanup_client(client)
 
     def _ensure_no_pending_upload_markers(self, messages: List[Dict[str, Any]]) -> None:
         """Raise UploadFileError if any file_pending_upload markers remain."""
@@ -518,9 +516,9 @@ class ClaudeBackend(CustomToolAndMCPBackend):
 
         # Create stream (handle betas)
         if "betas" in api_params:
-            stream = await client.beta.messages.create(**api_params)
+            stream = await self._start_request(lambda: client.beta.messages.create(**api_params), api_params.get("model"))
         else:
-            stream = await client.messages.create(**api_params)
+            stream = await self._start_request(lambda: client.messages.create(**api_params), api_params.get("model"))
 
         # Process stream chunks
         async for chunk in self._process_stream(stream, all_params, agent_id):
@@ -607,14 +605,15 @@ class ClaudeBackend(CustomToolAndMCPBackend):
         async for chunk in self.stream_custom_tool_execution(call):
             yield chunk
 
-    async def _stream_with_custom_and_mcp_tools(
+    async def _stream_tool_round(
         self,
         current_messages: List[Dict[str, Any]],
         tools: List[Dict[str, Any]],
         client,
+        outcome: ToolRoundOutcome,
         **kwargs,
     ) -> AsyncGenerator[StreamChunk, None]:
-        """Recursively stream responses, executing MCP and custom tool function calls when detected."""
+        """Stream one response, executing MCP and custom tool function calls when detected."""
 
         # Build API params for this iteration
         all_params = {**self.config, **kwargs}
@@ -635,11 +634,11 @@ class ClaudeBackend(CustomToolAndMCPBackend):
 
         # Create stream (handle code execution beta)
         if "betas" in api_params:
-            stream = await client.beta.messages.create(**api_params)
+            stream = await self._start_request(lambda: client.beta.messages.create(**api_params), api_params.get("model"))
         else:
-            stream = await client.messages.create(**api_params)
+            stream = await self._start_request(lambda: client.messages.create(**api_params), api_params.get("model"))
 
-        content = ""
+        content = ChunkAccumulator()
         current_tool_uses: Dict[str, Dict[str, Any]] = {}
         mcp_tool_calls: List[Dict[str, Any]] = []
         custom_tool_calls: List[Dict[str, Any]] = []
@@ -696,13 +695,7 @@ class ClaudeBackend(CustomToolAndMCPBackend):
                     if hasattr(event, "delta"):
                         if event.delta.type == "text_delta":
                             text_chunk = event.delta.text
-                            content += text_chunk
-                            log_backend_agent_message(
-                                agent_id or "default",
-                                "RECV",
-                                {"content": text_chunk},
-                                backend_name="claude",
-                            )
+                            content.append(text_chunk)
                             log_stream_chunk("backend.claude", "content", text_chunk, agent_id)
                             yield StreamChunk(type="content", content=text_chunk)
                         elif event.delta.type == "input_json_delta":
@@ -854,7 +847,7 @@ class ClaudeBackend(CustomToolAndMCPBackend):
             # Build assistant message with tool_use blocks for all MCP and custom tool calls
             assistant_content = []
             if content:  # Add text content if any
-                assistant_content.append({"type": "text", "text": content})
+                assistant_content.append({"type": "text", "text": content.getvalue()})
 
             # Add tool_use blocks for MCP tools
             for tool_call in mcp_tool_calls:
@@ -925,45 +918,26 @@ class ClaudeBackend(CustomToolAndMCPBackend):
                     "call_id": tool_call["id"],  # Normalize "id" to "call_id"
                 }
 
-            # Execute custom tools using unified method
-            for tool_call in custom_tool_calls:
-                # Normalize Claude tool call format to unified format
-                normalized_call = normalize_tool_call(tool_call)
-
-                # Use unified execution method
-                async for chunk in self._execute_tool_with_logging(
-                    normalized_call,
-                    CUSTOM_TOOL_CONFIG,
-                    updated_messages,
-                    set(),
-                ):
-                    yield chunk
-
-            # Execute MCP tools using unified method
-            for tool_call in mcp_tool_calls:
-                # Normalize Claude tool call format to unified format
-                normalized_call = normalize_tool_call(tool_call)
-
-                # Use unified execution method
-                async for chunk in self._execute_tool_with_logging(
-                    normalized_call,
-                    MCP_TOOL_CONFIG,
-                    updated_messages,
-                    set(),
-                ):
-                    yield chunk
-
-            updated_messages = self._trim_message_history(updated_messages)
-
-            async for chunk in self._stream_with_custom_and_mcp_tools(updated_messages, tools, client, **kwargs):
+            # Execute custom and MCP tools using unified method (concurrently when enabled)
+            tool_calls_to_execute = self._build_tool_execution_plan(
+                [normalize_tool_call(tool_call) for tool_call in custom_tool_calls],
+                [normalize_tool_call(tool_call) for tool_call in mcp_tool_calls],
+                CUSTOM_TOOL_CONFIG,
+                MCP_TOOL_CONFIG,
+                call_order=list(current_tool_uses.keys()),
+            )
+            async for chunk in self._execute_tool_calls(tool_calls_to_execute, updated_messages, set()):
                 yield chunk
+
+            # Continue the tool loop with updated messages
+            outcome.next_messages = self._trim_message_history(updated_messages)
             return
         else:
             # No MCP function calls; finalize this turn
             # Ensure termination with a done chunk when no further tool calls
             complete_message = {
                 "role": "assistant",
-                "content": content.strip(),
+                "content": content.getvalue().strip(),
             }
             log_stream_chunk("backend.claude", "complete_message", complete_message, agent_id)
             yield StreamChunk(type="complete_message", complete_message=complete_message)
@@ -983,7 +957,7 @@ class ClaudeBackend(CustomToolAndMCPBackend):
         agent_id: Optional[str],
     ) -> AsyncGenerator[StreamChunk, None]:
         """Process stream events and yield StreamChunks."""
-        content_local = ""
+        content_local = ChunkAccumulator()
         current_tool_uses_local: Dict[str, Dict[str, Any]] = {}
 
         async for chunk in stream:
@@ -1040,13 +1014,7 @@ class ClaudeBackend(CustomToolAndMCPBackend):
                     if hasattr(chunk, "delta"):
                         if chunk.delta.type == "text_delta":
                             text_chunk = chunk.delta.text
-                            content_local += text_chunk
-                            log_backend_agent_message(
-                                agent_id or "default",
-                                "RECV",
-                                {"content": text_chunk},
-                                backend_name="claude",
-                            )
+                            content_local.append(text_chunk)
                             log_stream_chunk(
                                 "backend.claude",
                                 "content",
@@ -1144,7 +1112,7 @@ class ClaudeBackend(CustomToolAndMCPBackend):
 
                     complete_message = {
                         "role": "assistant",
-                        "content": content_local.strip(),
+                        "content": content_local.getvalue().strip(),
                     }
                     if user_tool_calls:
                         complete_message["tool_calls"] = user_tool_calls
@@ -1268,7 +1236,12 @@ class ClaudeBackend(CustomToolAndMCPBackend):
         super().reset_token_usage()
 
     def _create_client(self, **kwargs):
-        return anthropic.AsyncAnthropic(api_key=self.api_key)
+        return ClientPool.get_client(
+            provider="anthropic",
+            base_url=None,
+            api_key=self.api_key,
+            factory=lambda http_client: anthropic.AsyncAnthropic(api_key=self.api_key, http_client=http_client),
+        )
 
     def get_provider_name(self) -> str:
         """Get the provider name."""
@@ -75,6 +75,7 @@ from ..logger_config import (
     log_stream_chunk,
     logger,
 )
+from ..stream_chunk import ChunkAccumulator
 from ..tool import ToolManager
 from .base import FilesystemSupport, LLMBackend, StreamChunk
 
@@ -1072,6 +1073,7 @@ class ClaudeCodeBackend(LLMBackend):
             "custom_tools",  # Handled separately via SDK MCP server conversion
             "instance_id",  # Used for Docker container naming, not for ClaudeAgentOptions
             "enable_rate_limit",  # Rate limiting parameter (handled at orchestrator level, not backend)
+            "rate_limit_priority",
             # Note: system_prompt is NOT excluded - it's needed for internal workflow prompt injection
             # Validation prevents it from being set in YAML backend config
         }
@@ -1363,14 +1365,14 @@ class ClaudeCodeBackend(LLMBackend):
             return
 
         # Stream response and convert to MassGen StreamChunks
-        accumulated_content = ""
+        accumulated_content = ChunkAccumulator()
         try:
             async for message in client.receive_response():
                 if isinstance(message, (AssistantMessage, UserMessage)):
                     # Process assistant message content
                     for block in message.content:
                         if isinstance(block, TextBlock):
-                            accumulated_content += block.text
+                            accumulated_content.append(block.text)
 
                             # Yield content chunk
                             log_backend_agent_message(
@@ -1420,7 +1422,7 @@ class ClaudeCodeBackend(LLMBackend):
                             )
 
                     # Parse workflow tool calls from accumulated content
-                    workflow_tool_calls = self._parse_workflow_tool_calls(accumulated_content)
+                    workflow_tool_calls = self._parse_workflow_tool_calls(accumulated_content.getvalue())
                     if workflow_tool_calls:
                         log_stream_chunk(
                             "backend.claude_code",
@@ -1438,14 +1440,14 @@ class ClaudeCodeBackend(LLMBackend):
                     log_stream_chunk(
                         "backend.claude_code",
                         "complete_message",
-                        accumulated_content[:200] if len(accumulated_content) > 200 else accumulated_content,
+                        accumulated_content.getvalue()[:200],
                         agent_id,
                     )
                     yield StreamChunk(
                         type="complete_message",
                         complete_message={
                             "role": "assistant",
-                            "content": accumulated_content,
+                            "content": accumulated_content.getvalue(),
                         },
                         source="claude_code",
                     )
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""
+Process-wide pool of long-lived provider clients.
+
+Backends used to build a fresh ``AsyncOpenAI``/``AsyncAnthropic`` client (and a
+throwaway ``httpx.AsyncClient`` for downloads) for every stream, so every agent
+restart paid a new TCP+TLS handshake. The pool keeps one client per
+(provider, base_url, api_key) on top of a shared keep-alive ``httpx`` transport
+(HTTP/2 when the ``h2`` package is installed) and hands the same instance to
+every backend that asks for it. Pooled clients report every response's rate-limit
+headers to the adaptive limiter (see adaptive_limiter.py) of the request being sent.
+
+httpx clients are bound to the event loop they were first used on, so entries
+are additionally keyed by the running loop; entries whose loop has closed are
+dropped on the next lookup.
+
+Example:
+    client = ClientPool.get_client(
+        provider="openai",
+        base_url=base_url,
+        api_key=api_key,
+        factory=lambda http_client: openai.AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=http_client),
+    )
+"""
+
+import asyncio
+import hashlib
+import importlib.util
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import httpx
+
+from ..logger_config import logger
+from .adaptive_limiter import observe_response
+
+# Connection limits shared by every pooled transport
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 60.0
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _fingerprint(api_key: Optional[str]) -> str:
+    """Hash the API key so raw secrets are never kept as dictionary keys."""
+    if not api_key:
+        return ""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class ClientPool:
+    """
+    Registry of pooled provider clients shared by all backend instances.
+
+    Clients handed out by the pool must not be closed by callers; use
+    ``is_pooled`` to tell them apart and ``aclose`` to shut the pool down.
+    """
+
+    _clients: Dict[Tuple[str, str, str, int], Tuple[Any, httpx.AsyncClient, asyncio.AbstractEventLoop]] = {}
+    _http_clients: Dict[int, Tuple[httpx.AsyncClient, asyncio.AbstractEventLoop]] = {}
+    _pooled_ids: Dict[int, Any] = {}
+
+    @classmethod
+    def create_http_client(cls) -> httpx.AsyncClient:
+        """Create a keep-alive httpx client with the pool's connection limits."""
+        return httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=DEFAULT_MAX_CONNECTIONS,
+                max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+            ),
+            follow_redirects=True,
+            # Feeds rate-limit headers to the adaptive limiter of the request being sent
+            event_hooks={"response": [observe_response]},
+        )
+
+    @classmethod
+    def get_client(
+        cls,
+        provider: str,
+        base_url: Optional[str],
+        api_key: Optional[str],
+        factory: Callable[[httpx.AsyncClient], Any],
+    ) -> Any:
+        """
+        Get or create the pooled client for a provider endpoint.
+
+        Args:
+            provider: Provider identifier (e.g., "openai", "anthropic")
+            base_url: API base URL ("" for the SDK default)
+            api_key: API key the client authenticates with
+            factory: Builds the SDK client on top of the given httpx client
+
+        Returns:
+            SDK client instance. Outside a running event loop a fresh, unpooled
+            client is returned because there is no loop to bind it to.
+        """
+        loop = _running_loop()
+        if loop is None:
+            return factory(cls.create_http_client())
+
+        cls._evict_closed_loops()
+        key = (provider, base_url or "", _fingerprint(api_key), id(loop))
+        entry = cls._clients.get(key)
+        if entry is not None:
+            return entry[0]
+
+        http_client = cls.create_http_client()
+        client = factory(http_client)
+        cls._clients[key] = (client, http_client, loop)
+        cls._pooled_ids[id(client)] = client
+        logger.debug(f"[ClientPool] Created pooled {provider} client for {base_url or 'default endpoint'}")
+        return client
+
+    @classmethod
+    def get_http_client(cls) -> httpx.AsyncClient:
+        """
+        Get the shared httpx client for plain downloads (file uploads from URLs, etc.).
+
+        Returns:
+            Pooled httpx.AsyncClient bound to the running loop
+        """
+        loop = _running_loop()
+        if loop is None:
+            return cls.create_http_client()
+
+        cls._evict_closed_loops()
+        entry = cls._http_clients.get(id(loop))
+        if entry is not None:
+            return entry[0]
+
+        http_client = cls.create_http_client()
+        cls._http_clients[id(loop)] = (http_client, loop)
+        cls._pooled_ids[id(http_client)] = http_client
+        return http_client
+
+    @classmethod
+    def is_pooled(cls, client: Any) -> bool:
+        """Return True if the client is owned by the pool and must not be closed by callers."""
+        return client is not None and cls._pooled_ids.get(id(client)) is client
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close every pooled client bound to the running loop."""
+        loop = _running_loop()
+        for key, (client, http_client, client_loop) in list(cls._clients.items()):
+            if client_loop is not loop:
+                continue
+            del cls._clients[key]
+            cls._pooled_ids.pop(id(client), None)
+            await cls._close_quietly(client)
+            await cls._close_quietly(http_client)
+
+        for loop_id, (http_client, client_loop) in list(cls._http_clients.items()):
+            if client_loop is not loop:
+                continue
+            del cls._http_clients[loop_id]
+            cls._pooled_ids.pop(id(http_client), None)
+            await cls._close_quietly(http_client)
+
+        cls._evict_closed_loops()
+
+    @classmethod
+    def clear(cls) -> None:
+        """Forget all pooled clients without closing them (useful for testing)."""
+        cls._clients.clear()
+        cls._http_clients.clear()
+        cls._pooled_ids.clear()
+
+    @classmethod
+    def _evict_closed_loops(cls) -> None:
+        """Drop entries whose event loop is gone; their connections cannot be reused."""
+        for key, (client, http_client, loop) in list(cls._clients.items()):
+            if loop.is_closed():
+                del cls._clients[key]
+                cls._pooled_ids.pop(id(client), None)
+                cls._pooled_ids.pop(id(http_client), None)
+        for loop_id, (http_client, loop) in list(cls._http_clients.items()):
+            if loop.is_closed():
+                del cls._http_clients[loop_id]
+                cls._pooled_ids.pop(id(http_client), None)
+
+    @staticmethod
+    async def _close_quietly(client: Any) -> None:
+        try:
+            close = getattr(client, "aclose", None) or getattr(client, "close", None)
+            if close is not None:
+                result = close()
+                if asyncio.iscoroutine(result):
+                    await result
+        except Exception as e:
+            logger.debug(f"[ClientPool] Error closing pooled client: {e}")
@@ -36,6 +36,7 @@ from ..logger_config import (
     log_tool_call,
     logger,
 )
+from ..stream_chunk import ChunkAccumulator
 from .base import FilesystemSupport, StreamChunk
 from .base_with_custom_tool_and_mcp import (
     CustomToolAndMCPBackend,
@@ -45,6 +46,9 @@ from .base_with_custom_tool_and_mcp import (
 from .gemini_utils import CoordinationResponse, PostEvaluationResponse
 from .rate_limiter import GlobalRateLimiter
 
+# Output tokens reserved against the TPM limit when a request sets no max_output_tokens
+RATE_LIMIT_OUTPUT_RESERVATION = 1024
+
 
 # Suppress Gemini SDK logger warning about non-text parts in response
 # Using custom filter per https://github.com/googleapis/python-genai/issues/850
@@ -115,6 +119,7 @@ class GeminiBackend(CustomToolAndMCPBackend):
         # Extract and remove enable_rate_limit BEFORE calling parent init
         # This prevents it from being stored in self.config and passed to Gemini SDK
         enable_rate_limit = kwargs.pop("enable_rate_limit", False)
+        self._rate_limit_priority = kwargs.pop("rate_limit_priority", 0) or 0
         model_name = kwargs.get("model", "")
 
         # Call parent class __init__ - this initializes custom_tool_manager and MCP-related attributes
@@ -122,6 +127,8 @@ class GeminiBackend(CustomToolAndMCPBackend):
 
         # Override API key with Gemini-specific value
         self.api_key = gemini_api_key
+        # The flag was popped above, so the base class could not see it
+        self._adaptive_rate_limit = enable_rate_limit
 
         # Gemini-specific counters for builtin tools
         self.search_count = 0
@@ -141,7 +148,7 @@ class GeminiBackend(CustomToolAndMCPBackend):
         # Initialize multi-dimensional rate limiter for Gemini API
         # Supports RPM (Requests Per Minute), TPM (Tokens Per Minute), RPD (Requests Per Day)
         # Configuration loaded from massgen/config/rate_limits.yaml
-        # This is shared across ALL instances of the SAME MODEL
+        # This is shared across ALL instances of the SAME MODEL and API key
 
         if enable_rate_limit:
             # Load rate limits from configuration
@@ -158,6 +165,7 @@ class GeminiBackend(CustomToolAndMCPBackend):
                 rpm=limits.get("rpm"),
                 tpm=limits.get("tpm"),
                 rpd=limits.get("rpd"),
+                api_key=gemini_api_key,
             )
 
             # Log the active rate limits
@@ -180,12 +188,33 @@ class GeminiBackend(CustomToolAndMCPBackend):
             self.rate_limiter = None
             logger.info(f"[Gemini] Rate limiting disabled for '{model_name}'")
 
-    def _get_rate_limiter_context(self):
-        """Get rate limiter context manager (or nullcontext if rate limiting is disabled)."""
-        if self.rate_limiter is not None:
-            return self.rate_limiter
-        else:
+    def _rate_limit_slot(self, contents: Any, config: Dict[str, Any]):
+        """
+        Reserve rate limit capacity for one request, including its estimated tokens.
+
+        Returns an async context manager yielding a RateLimitReservation to reconcile with
+        the actual usage, or yielding None if rate limiting is disabled.
+        """
+        if self.rate_limiter is None:
             return contextlib.nullcontext()
+        return self.rate_limiter.reserve(
+            estimated_tokens=self._estimate_request_tokens(contents, config),
+            priority=self._rate_limit_priority,
+        )
+
+    def _estimate_request_tokens(self, contents: Any, config: Dict[str, Any]) -> int:
+        """Estimate a request's prompt tokens plus its output allowance."""
+        if self.rate_limiter is None or not self.rate_limiter.tpm:
+            return 0
+        items = contents if isinstance(contents, list) else [contents]
+        texts = [item if isinstance(item, str) else item.model_dump_json(exclude_none=True) if hasattr(item, "model_dump_json") else str(item) for item in items]
+        return sum(self.token_calculator.estimate_tokens_many(texts)) + (config.get("max_output_tokens") or RATE_LIMIT_OUTPUT_RESERVATION)
+
+    @staticmethod
+    def _reconcile_rate_limit(reservation: Any, usage_metadata: Any) -> None:
+        """Replace a reservation's token estimate with the usage Gemini reported."""
+        if reservation is not None and usage_metadata is not None:
+            reservation.reconcile(getattr(usage_metadata, "total_token_count", None))
 
     def _setup_permission_hooks(self):
         """Override base class - Gemini uses session-based permissions, not function hooks."""
@@ -348,28 +377,29 @@ class GeminiBackend(CustomToolAndMCPBackend):
             # Add custom tools if available
             if using_custom_tools:
                 try:
-                    # Get custom tools schemas (in OpenAI format)
-                    custom_tools_schemas = self._get_custom_tools_schemas()
-                    if custom_tools_schemas:
-                        # Convert to Gemini SDK format using formatter
-                        custom_tools_functions = self.formatter.format_custom_tools(
-                            custom_tools_schemas,
+                    # Get custom tools schemas (in OpenAI format) and convert them to Gemini SDK
+                    # format once per version of the tool set
+                    custom_tools_functions = self.formatter.cached_tools(
+                        "custom_sdk",
+                        lambda: self.formatter.format_custom_tools(
+                            self._get_custom_tools_schemas(),
                             return_sdk_objects=True,
-                        )
-
-                        if custom_tools_functions:
-                            # Wrap FunctionDeclarations in a Tool object for Gemini SDK
-                            custom_tool = types.Tool(function_declarations=custom_tools_functions)
-                            tools_to_apply.append(custom_tool)
+                        ),
+                        version=self.custom_tool_manager.version,
+                    )
+                    if custom_tools_functions:
+                        # Wrap FunctionDeclarations in a Tool object for Gemini SDK
+                        custom_tool = types.Tool(function_declarations=custom_tools_functions)
+                        tools_to_apply.append(custom_tool)
 
-                            logger.debug(f"[Gemini] Registered {len(custom_tools_functions)} custom tools for manual execution")
+                        logger.debug(f"[Gemini] Registered {len(custom_tools_functions)} custom tools for manual execution")
 
-                            yield StreamChunk(
-                                type="custom_tool_status",
-                                status="custom_tools_registered",
-                                content=f"🔧 [Custom Tools] Registered {len(custom_tools_functions)} tools",
-                                source="custom_tools",
-                            )
+                        yield StreamChunk(
+                            type="custom_tool_status",
+                            status="custom_tools_registered",
+                            content=f"🔧 [Custom Tools] Registered {len(custom_tools_functions)} tools",
+                            source="custom_tools",
+                        )
                 except Exception as e:
                     logger.warning(f"[Gemini] Failed to register custom tools: {e}")
 
@@ -394,7 +424,7 @@ class GeminiBackend(CustomToolAndMCPBackend):
                         logger.info(f"[Gemini] Planning mode enabled - registering all MCP tools, will block {len(blocked_tools)} at execution")
                         try:
                             # Convert MCP tools using formatter
-                            mcp_tools_functions = self.formatter.format_mcp_tools(self._mcp_functions, return_sdk_objects=True)
+                            mcp_tools_functions = self._format_mcp_tools_sdk()
 
                             if mcp_tools_functions:
                                 # Wrap in Tool object
@@ -418,7 +448,7 @@ class GeminiBackend(CustomToolAndMCPBackend):
                     # No planning mode - register all MCP tools
                     try:
                         # Convert MCP tools using formatter
-                        mcp_tools_functions = self.formatter.format_mcp_tools(self._mcp_functions, return_sdk_objects=True)
+                        mcp_tools_functions = self._format_mcp_tools_sdk()
 
                         if mcp_tools_functions:
                             # Wrap in Tool object
@@ -474,20 +504,25 @@ class GeminiBackend(CustomToolAndMCPBackend):
             # Streaming Phase: Stream with simple function call detection
             # ====================================================================
             # Use async streaming call with sessions/tools (with rate limiting if enabled)
-            async with self._get_rate_limiter_context():
-                stream = await client.aio.models.generate_content_stream(
-                    model=model_name,
-                    contents=full_content,
-                    config=config,
+            async with self._rate_limit_slot(full_content, config) as rate_reservation:
+                stream = await self._start_request(
+                    lambda: client.aio.models.generate_content_stream(
+                        model=model_name,
+                        contents=full_content,
+                        config=config,
+                    ),
+                    model_name,
                 )
 
             # Simple list accumulation for function calls (no trackers)
             captured_function_calls = []
-            full_content_text = ""
+            full_content_text = ChunkAccumulator()
             last_response_with_candidates = None
+            usage_metadata = None
 
             # Stream chunks and capture function calls
             async for chunk in stream:
+                usage_metadata = getattr(chunk, "usage_metadata", None) or usage_metadata
                 # Detect function calls in candidates
                 if hasattr(chunk, "candidates") and chunk.candidates:
                     for candidate in chunk.candidates:
@@ -515,13 +550,7 @@ class GeminiBackend(CustomToolAndMCPBackend):
                 # Process text content
                 if hasattr(chunk, "text") and chunk.text:
                     chunk_text = chunk.text
-                    full_content_text += chunk_text
-                    log_backend_agent_message(
-                        agent_id,
-                        "RECV",
-                        {"content": chunk_text},
-                        backend_name="gemini",
-                    )
+                    full_content_text.append(chunk_text)
                     log_stream_chunk("backend.gemini", "content", chunk_text, agent_id)
                     yield StreamChunk(type="content", content=chunk_text)
 
@@ -529,13 +558,15 @@ class GeminiBackend(CustomToolAndMCPBackend):
                 if hasattr(chunk, "candidates") and chunk.candidates:
                     last_response_with_candidates = chunk
 
+            self._reconcile_rate_limit(rate_reservation, usage_metadata)
+
             # ====================================================================
             # Structured Coordination Output Parsing
             # ====================================================================
             # Check for structured coordination output when no function calls captured
             if is_coordination and not captured_function_calls and full_content_text:
                 # Try to parse structured response from text content
-                parsed = self.formatter.extract_structured_response(full_content_text)
+                parsed = self.formatter.extract_structured_response(full_content_text.getvalue())
 
                 if parsed and isinstance(parsed, dict):
                     # Convert structured response to tool calls
@@ -714,16 +745,6 @@ class GeminiBackend(CustomToolAndMCPBackend):
                 self._active_tool_result_store = tool_results
 
                 try:
-                    # Execute custom tools
-                    for call in custom_calls:
-                        async for chunk in self._execute_tool_with_logging(
-                            call,
-                            CUSTOM_TOOL_CONFIG,
-                            updated_messages,
-                            processed_call_ids,
-                        ):
-                            yield chunk
-
                     # Check circuit breaker before MCP tool execution
                     if mcp_calls and not await self._check_circuit_breaker_before_execution():
                         logger.warning("[Gemini] All MCP servers blocked by circuit breaker")
@@ -736,18 +757,17 @@ class GeminiBackend(CustomToolAndMCPBackend):
                         # Clear mcp_calls to skip execution
                         mcp_calls = []
 
-                    # Execute MCP tools
-                    for call in mcp_calls:
-                        # Mark MCP as used when at least one MCP call is about to be executed
+                    # Mark MCP as used when at least one MCP call is about to be executed
+                    if mcp_calls:
                         mcp_used = True
 
-                        async for chunk in self._execute_tool_with_logging(
-                            call,
-                            MCP_TOOL_CONFIG,
-                            updated_messages,
-                            processed_call_ids,
-                        ):
-                            yield chunk
+                    # Execute custom and MCP tools (concurrently when enabled)
+                    async for chunk in self._execute_tool_calls(
+                        self._build_tool_execution_plan(custom_calls, mcp_calls, CUSTOM_TOOL_CONFIG, MCP_TOOL_CONFIG),
+                        updated_messages,
+                        processed_call_ids,
+                    ):
+                        yield chunk
                 finally:
                     self._active_tool_result_store = None
 
@@ -792,21 +812,38 @@ class GeminiBackend(CustomToolAndMCPBackend):
                         conversation_history.append(types.Content(parts=response_parts, role="user"))
 
                 last_continuation_chunk = None
+                continuation_rounds = 0
 
                 while True:
+                    continuation_rounds += 1
+                    if continuation_rounds > self._max_tool_rounds:
+                        logger.warning(f"[Gemini] Tool loop reached max_tool_rounds ({self._max_tool_rounds}); stopping tool execution")
+                        yield StreamChunk(
+                            type="mcp_status",
+                            status="max_tool_rounds_reached",
+                            content=f"⚠️ [Tools] Reached the limit of {self._max_tool_rounds} tool rounds; stopping",
+                            source="tool_loop",
+                        )
+                        break
+
                     # Use same config as before (with rate limiting if enabled)
-                    async with self._get_rate_limiter_context():
-                        continuation_stream = await client.aio.models.generate_content_stream(
-                            model=model_name,
-                            contents=conversation_history,
-                            config=config,
+                    async with self._rate_limit_slot(conversation_history, config) as rate_reservation:
+                        continuation_stream = await self._start_request(
+                            lambda: client.aio.models.generate_content_stream(
+                                model=model_name,
+                                contents=conversation_history,
+                                config=config,
+                            ),
+                            model_name,
                         )
                     stream = continuation_stream
 
                     new_function_calls = []
-                    continuation_text = ""
+                    continuation_text = ChunkAccumulator()
+                    usage_metadata = None
 
                     async for chunk in continuation_stream:
+                        usage_metadata = getattr(chunk, "usage_metadata", None) or usage_metadata
                         if hasattr(chunk, "candidates") and chunk.candidates:
                             last_continuation_chunk = chunk
                             for candidate in chunk.candidates:
@@ -827,21 +864,17 @@ class GeminiBackend(CustomToolAndMCPBackend):
 
                         if hasattr(chunk, "text") and chunk.text:
                             chunk_text = chunk.text
-                            continuation_text += chunk_text
-                            log_backend_agent_message(
-                                agent_id,
-                                "RECV",
-                                {"content": chunk_text},
-                                backend_name="gemini",
-                            )
+                            continuation_text.append(chunk_text)
                             log_stream_chunk("backend.gemini", "content", chunk_text, agent_id)
                             yield StreamChunk(type="content", content=chunk_text)
 
+                    self._reconcile_rate_limit(rate_reservation, usage_metadata)
+
                     if continuation_text:
                         conversation_history.append(
-                            types.Content(parts=[types.Part(text=continuation_text)], role="model"),
+                            types.Content(parts=[types.Part(text=continuation_text.getvalue())], role="model"),
                         )
-                        full_content_text += continuation_text
+                        full_content_text.append(continuation_text.getvalue())
 
                     if last_continuation_chunk:
                         last_response_with_candidates = last_continuation_chunk
@@ -853,7 +886,7 @@ class GeminiBackend(CustomToolAndMCPBackend):
                         # Check for structured coordination output when no function calls in continuation
                         if is_coordination and full_content_text:
                             # Try to parse structured response from accumulated text content
-                            parsed = self.formatter.extract_structured_response(full_content_text)
+                            parsed = self.formatter.extract_structured_response(full_content_text.getvalue())
 
                             if parsed and isinstance(parsed, dict):
                                 # Convert structured response to tool calls
@@ -984,15 +1017,6 @@ class GeminiBackend(CustomToolAndMCPBackend):
                     self._active_tool_result_store = new_tool_results
 
                     try:
-                        for call in next_custom_calls:
-                            async for chunk in self._execute_tool_with_logging(
-                                call,
-                                CUSTOM_TOOL_CONFIG,
-                                updated_messages,
-                                processed_call_ids,
-                            ):
-                                yield chunk
-
                         if next_mcp_calls and not await self._check_circuit_breaker_before_execution():
                             logger.warning("[Gemini] All MCP servers blocked by circuit breaker during continuation")
                             yield StreamChunk(
@@ -1003,16 +1027,15 @@ class GeminiBackend(CustomToolAndMCPBackend):
                             )
                             next_mcp_calls = []
 
-                        for call in next_mcp_calls:
+                        if next_mcp_calls:
                             mcp_used = True
 
-                            async for chunk in self._execute_tool_with_logging(
-                                call,
-                                MCP_TOOL_CONFIG,
-                                updated_messages,
-                                processed_call_ids,
-                            ):
-                                yield chunk
+                        async for chunk in self._execute_tool_calls(
+                            self._build_tool_execution_plan(next_custom_calls, next_mcp_calls, CUSTOM_TOOL_CONFIG, MCP_TOOL_CONFIG),
+                            updated_messages,
+                            processed_call_ids,
+                        ):
+                            yield chunk
                     finally:
                         self._active_tool_result_store = None
 
@@ -1061,8 +1084,8 @@ class GeminiBackend(CustomToolAndMCPBackend):
 
             tool_calls_detected: List[Dict[str, Any]] = []
 
-            if (is_coordination or is_post_evaluation) and full_content_text.strip():
-                content = full_content_text
+            if (is_coordination or is_post_evaluation) and full_content_text.getvalue().strip():
+                content = full_content_text.getvalue()
                 structured_response = None
 
                 try:
@@ -1418,6 +1441,15 @@ class GeminiBackend(CustomToolAndMCPBackend):
         async for chunk in self.stream_custom_tool_execution(call):
             yield chunk
 
+    def _format_mcp_tools_sdk(self) -> List[Any]:
+        """Convert MCP tools to Gemini SDK FunctionDeclarations once per set of MCP functions."""
+        mcp_functions = self._mcp_functions
+        return self.formatter.cached_tools(
+            "mcp_sdk",
+            lambda: self.formatter.format_mcp_tools(mcp_functions, return_sdk_objects=True),
+            members=mcp_functions.values(),
+        )
+
     def get_provider_name(self) -> str:
         """Get the provider name."""
         return "Gemini"
@@ -27,6 +27,7 @@ from openai import AsyncOpenAI
 from ..logger_config import log_stream_chunk
 from .base import StreamChunk
 from .chat_completions import ChatCompletionsBackend
+from .client_pool import ClientPool
 
 logger = logging.getLogger(__name__)
 
@@ -43,7 +44,12 @@ class GrokBackend(ChatCompletionsBackend):
         """Create OpenAI client configured for xAI's Grok API."""
         import openai
 
-        return openai.AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
+        return ClientPool.get_client(
+            provider="grok",
+            base_url=self.base_url,
+            api_key=self.api_key,
+            factory=lambda http_client: openai.AsyncOpenAI(api_key=self.api_key, base_url=self.base_url, http_client=http_client),
+        )
 
     def _add_grok_search_params(self, api_params: Dict[str, Any], all_params: Dict[str, Any]) -> Dict[str, Any]:
         """Add Grok Live Search parameters to API params if web search is enabled."""
@@ -90,7 +96,7 @@ class GrokBackend(ChatCompletionsBackend):
         api_params = self._add_grok_search_params(api_params, all_params)
 
         # Start streaming
-        stream = await client.chat.completions.create(**api_params)
+        stream = await self._start_request(lambda: client.chat.completions.create(**api_params), api_params.get("model"))
 
         # Delegate to parent's stream processing
         async for chunk in super()._process_stream(stream, all_params, self.agent_id):
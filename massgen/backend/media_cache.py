@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""
+Base64 encoding cache for ``upload_files`` media.
+
+Local images, audio and video attached via ``upload_files`` are sent inline as base64,
+and every agent (and every restart of every agent) used to read and encode the same
+files again on the event loop. A MediaEncodingCache encodes each file once, in a worker
+thread and in fixed-size chunks, and hands every later request the same string. The
+orchestrator shares one cache between all of its agents' backends; a backend used on its
+own creates a private one.
+
+Entries are keyed by (absolute path, size, mtime), so a file changed on disk is encoded
+again. Encoded data is kept in memory up to ``max_memory_mb``; beyond that the least
+recently used entries are spilled to a temporary directory (bounded by ``max_disk_mb``)
+and read back from there, which is cheaper than re-encoding. Concurrent requests for a
+file that is being encoded wait for that encoding instead of starting another.
+
+Example:
+    cache = MediaEncodingCache(max_memory_mb=256)
+    encoded, mime_type = await cache.encode(Path("diagram.png"))
+"""
+
+import asyncio
+import base64
+import mimetypes
+import os
+import shutil
+import tempfile
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from ..logger_config import logger
+
+DEFAULT_MAX_MEMORY_MB = 256
+DEFAULT_MAX_DISK_MB = 2048
+# Multiple of 3 so the base64 of consecutive chunks concatenates without padding
+ENCODE_CHUNK_SIZE = 3 * 1024 * 1024
+
+CacheKey = Tuple[str, int, int]
+
+
+@dataclass
+class _Entry:
+    mime_type: str
+    size: int
+    data: Optional[str] = None
+    spill_path: Optional[str] = None
+    spilling: bool = False
+
+
+def _encode_file(path: str) -> str:
+    """Base64-encode a file chunk by chunk (runs in a worker thread)."""
+    parts = []
+    with open(path, "rb") as handle:
+        while chunk := handle.read(ENCODE_CHUNK_SIZE):
+            parts.append(base64.b64encode(chunk).decode("ascii"))
+    return "".join(parts)
+
+
+def _write_spill(path: str, data: str) -> None:
+    with open(path, "w", encoding="ascii") as handle:
+        handle.write(data)
+
+
+def _read_spill(path: str) -> str:
+    with open(path, "r", encoding="ascii") as handle:
+        return handle.read()
+
+
+def _remove(path: Optional[str]) -> None:
+    if path:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class MediaEncodingCache:
+    """LRU cache of base64-encoded media files with a memory budget and spill-to-disk."""
+
+    def __init__(self, max_memory_mb: float = DEFAULT_MAX_MEMORY_MB, max_disk_mb: float = DEFAULT_MAX_DISK_MB):
+        self.max_memory_bytes = int(max_memory_mb * 1024 * 1024)
+        self.max_disk_bytes = int(max_disk_mb * 1024 * 1024)
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._inflight: Dict[CacheKey, asyncio.Future] = {}
+        self._spill_dir: Optional[str] = None
+        self.memory_bytes = 0
+        self.disk_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.spills = 0
+
+    async def encode(self, path: Path) -> Tuple[str, str]:
+        """
+        Return ``(base64 data, guessed MIME type)`` for a local file.
+
+        Args:
+            path: File to encode
+
+        Returns:
+            The encoded file and its MIME type guessed from the name ("" if unknown)
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        absolute = os.path.abspath(path)
+        info = os.stat(absolute)
+        key = (absolute, info.st_size, info.st_mtime_ns)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            if entry.data is not None:
+                return entry.data, entry.mime_type
+            try:
+                return await asyncio.to_thread(_read_spill, entry.spill_path), entry.mime_type
+            except OSError:
+                # Spill file vanished; fall through and encode again
+                self._drop(key)
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            await asyncio.wait([pending])
+            if not pending.cancelled():
+                self.hits += 1
+                return pending.result()
+            # The shared encoding failed; encode again rather than inherit its error
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        mime_type = mimetypes.guess_type(Path(absolute).as_posix())[0] or ""
+        try:
+            data = await asyncio.to_thread(_encode_file, absolute)
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+        future.set_result((data, mime_type))
+
+        self._store(key, _Entry(mime_type=mime_type, size=len(data), data=data))
+        await self._enforce_budget()
+        return data, mime_type
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and the memory and disk currently used."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "memory_mb": round(self.memory_bytes / (1024 * 1024), 1),
+            "disk_mb": round(self.disk_bytes / (1024 * 1024), 1),
+            "spills": self.spills,
+        }
+
+    def _store(self, key: CacheKey, entry: _Entry) -> None:
+        # Older versions of the same file will not be asked for again, and an entry
+        # re-stored under the same key (concurrent re-encodes) replaces the old one
+        for stale in [other for other in self._entries if other[0] == key[0]]:
+            self._drop(stale)
+        self._entries[key] = entry
+        self.memory_bytes += entry.size
+
+    def _drop(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        if entry.data is not None:
+            self.memory_bytes -= entry.size
+        if entry.spill_path is not None:
+            self.disk_bytes -= entry.size
+            _remove(entry.spill_path)
+
+    async def _enforce_budget(self) -> None:
+        """Spill least recently used entries to disk until memory fits the budget."""
+        while self.memory_bytes > self.max_memory_bytes:
+            candidates = [(key, entry) for key, entry in self._entries.items() if entry.data is not None and not entry.spilling]
+            if not candidates:
+                return
+            key, entry = candidates[0]
+            if entry.size > self.max_disk_bytes:
+                self._drop(key)
+                continue
+            self._evict_disk(entry.size)
+            entry.spilling = True
+            path = os.path.join(self._spill_directory(), f"{abs(hash(key)):x}-{id(entry):x}.b64")
+            try:
+                await asyncio.to_thread(_write_spill, path, entry.data)
+            except OSError as exc:
+                logger.warning(f"[MediaEncodingCache] Could not spill encoded media to {path}: {exc}")
+                _remove(path)
+                self._drop(key)
+                continue
+            finally:
+                entry.spilling = False
+            if self._entries.get(key) is not entry:
+                # Dropped while it was being written
+                _remove(path)
+                continue
+            entry.data = None
+            entry.spill_path = path
+            self.memory_bytes -= entry.size
+            self.disk_bytes += entry.size
+            self.spills += 1
+
+    def _evict_disk(self, incoming: int) -> None:
+        """Delete the least recently used spilled entries to make room for ``incoming`` bytes."""
+        for key in [key for key, entry in self._entries.items() if entry.spill_path is not None]:
+            if self.disk_bytes + incoming <= self.max_disk_bytes:
+                return
+            self._drop(key)
+
+    def _spill_directory(self) -> str:
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix="massgen_media_")
+            weakref.finalize(self, shutil.rmtree, self._spill_dir, True)
+        return self._spill_dir
@@ -2,91 +2,102 @@
 """
 Rate limiter for API requests to respect provider rate limits.
 
-Provides a simple async rate limiter that ensures no more than N requests
-are made within a given time window.
+Limits are enforced with token buckets: each limit (requests per minute, tokens per
+minute, requests per day) is a bucket that holds up to the limit and refills
+continuously over its window. A request waits until every bucket can cover it.
+
+- Token usage is reserved up front from an estimate and reconciled against the actual
+  usage once the response reports it, so concurrent requests cannot overshoot TPM
+- Waiters are served strictly in order (highest priority first, FIFO within a
+  priority); nobody sleeps while holding the limiter's lock, and later requests never
+  overtake a waiting one
+- GlobalRateLimiter shares one limiter per provider/model and API key across all
+  backends of the process, so agents using the same key share its quota
+- ``stats()`` reports wait-time metrics
+- ``get_adaptive_limiter_sync`` returns the AIMD concurrency limiter fed by provider
+  rate-limit headers (see adaptive_limiter.py), registered alongside the static ones
+
+Example:
+    limiter = GlobalRateLimiter.get_multi_limiter_sync("gemini-2.5-flash", rpm=10, tpm=250000, api_key=key)
+
+    async with limiter.reserve(estimated_tokens=3000) as reservation:
+        response = await api_call()
+    reservation.reconcile(response.usage.total_tokens)
 """
 
 import asyncio
+import contextlib
+import hashlib
+import heapq
+import itertools
+import threading
 import time
-from collections import deque
-from typing import Any, Dict, Optional
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from ..logger_config import logger
+from .adaptive_limiter import AdaptiveLimiter
 
+# Waits shorter than this are not worth an info log line
+LOG_WAIT_THRESHOLD = 1.0
 
-class RateLimiter:
-    """
-    Async rate limiter using a sliding window approach.
 
-    Ensures that no more than `max_requests` requests are made
-    within any `time_window` second period.
+class TokenBucket:
+    """Bucket holding up to ``capacity`` units, refilled at ``capacity / period`` units per second."""
 
-    Example:
-        # Allow 7 requests per minute (60 seconds)
-        limiter = RateLimiter(max_requests=7, time_window=60)
+    def __init__(self, capacity: float, period: float, name: str):
+        self.capacity = float(capacity)
+        self.rate = self.capacity / period
+        self.name = name
+        self.level = self.capacity
+        self._updated = time.monotonic()
 
-        async def make_request():
-            async with limiter:
-                # Make your API call here
-                response = await api_call()
-            return response
-    """
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
 
-    def __init__(self, max_requests: int, time_window: float):
-        """
-        Initialize the rate limiter.
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` units are available (amounts beyond capacity need a full bucket)."""
+        self._refill(now)
+        deficit = min(amount, self.capacity) - self.level
+        return deficit / self.rate if deficit > 0 else 0.0
 
-        Args:
-            max_requests: Maximum number of requests allowed in the time window
-            time_window: Time window in seconds
-        """
-        self.max_requests = max_requests
-        self.time_window = time_window
-        self.request_times: deque = deque()
-        self._lock = asyncio.Lock()
+    def take(self, amount: float, now: float) -> None:
+        # May go negative when actual usage exceeds the reservation; later requests wait out the debt
+        self._refill(now)
+        self.level -= amount
 
-    async def __aenter__(self):
-        """Context manager entry - waits until request is allowed."""
-        await self.acquire()
-        return self
+    def give(self, amount: float, now: float) -> None:
+        self._refill(now)
+        self.level = min(self.capacity, self.level + amount)
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
-        return False
-
-    async def acquire(self):
-        """
-        Wait until a request slot is available within the rate limit.
 
-        This method blocks until it's safe to make a request without
-        exceeding the rate limit.
-        """
-        async with self._lock:
-            current_time = time.time()
+@dataclass(order=True)
+class _Waiter:
+    sort_key: tuple
+    tokens: int = field(compare=False)
+    loop: asyncio.AbstractEventLoop = field(compare=False)
+    event: asyncio.Event = field(compare=False)
 
-            # Remove timestamps outside the current window
-            while self.request_times and self.request_times[0] <= current_time - self.time_window:
-                self.request_times.popleft()
 
-            # If we've hit the limit, wait until the oldest request falls outside the window
-            if len(self.request_times) >= self.max_requests:
-                oldest_time = self.request_times[0]
-                wait_time = (oldest_time + self.time_window) - current_time
+class RateLimitReservation:
+    """Capacity granted to one request; reconcile it once the actual token usage is known."""
 
-                if wait_time > 0:
-                    # Log waiting information
-                    logger.info(
-                        f"[RateLimiter] Rate limit reached ({len(self.request_times)}/{self.max_requests} " f"requests in {self.time_window}s window). Waiting {wait_time:.2f}s...",
-                    )
-                    await asyncio.sleep(wait_time)
+    def __init__(self, limiter: "MultiRateLimiter", tokens: int, waited: float):
+        self._limiter = limiter
+        self.tokens = tokens
+        self.waited = waited
 
-                    # After waiting, remove the oldest request
-                    current_time = time.time()
-                    while self.request_times and self.request_times[0] <= current_time - self.time_window:
-                        self.request_times.popleft()
+    def reconcile(self, actual_tokens: Optional[int]) -> None:
+        """Replace the reserved token estimate with the actual usage (None keeps the estimate)."""
+        if actual_tokens is None:
+            return
+        self._limiter._adjust_tokens(actual_tokens - self.tokens, reconciled=True)
+        self.tokens = actual_tokens
 
-            # Record this request
-            self.request_times.append(time.time())
+    def release(self) -> None:
+        """Return the reserved tokens (the request failed before using any). The request still counts."""
+        self.reconcile(0)
 
 
 class MultiRateLimiter:
@@ -98,8 +109,6 @@ class MultiRateLimiter:
     - TPM (Tokens Per Minute)
     - RPD (Requests Per Day)
 
-    All limits are enforced concurrently using sliding windows.
-
     Example:
         limiter = MultiRateLimiter(
             rpm=10,      # 10 requests per minute
@@ -108,11 +117,9 @@ class MultiRateLimiter:
         )
 
         async def make_request():
-            async with limiter:
-                # Before making request
+            async with limiter.reserve(estimated_tokens=2000, priority=1) as reservation:
                 response = await api_call()
-                # After request, record tokens used
-                await limiter.record_tokens(response.usage.total_tokens)
+            reservation.reconcile(response.usage.total_tokens)
             return response
     """
 
@@ -133,14 +140,28 @@ class MultiRateLimiter:
         self.rpm = rpm
         self.tpm = tpm
         self.rpd = rpd
-
-        # Sliding window trackers
-        self.request_times_minute: deque = deque()  # For RPM
-        self.request_times_day: deque = deque()  # For RPD
-        self.token_usage: deque = deque()  # For TPM: (timestamp, tokens)
-
-        # Lazy initialization of lock to ensure it's created in the correct event loop
-        self._lock: Optional[asyncio.Lock] = None
+        request_buckets = []
+        if rpm:
+            request_buckets.append(TokenBucket(rpm, 60, "RPM"))
+        if rpd:
+            request_buckets.append(TokenBucket(rpd, 86400, "RPD"))
+        self._setup(request_buckets, TokenBucket(tpm, 60, "TPM") if tpm else None)
+
+    def _setup(self, request_buckets: List[TokenBucket], token_bucket: Optional[TokenBucket]) -> None:
+        self._request_buckets = request_buckets
+        self._token_bucket = token_bucket
+        # A threading lock: it is never held across an await, and limiters are shared by
+        # backends that may run on different event loops
+        self._lock = threading.Lock()
+        self._waiters: List[_Waiter] = []
+        self._sequence = itertools.count()
+
+        self.requests = 0
+        self.waited_requests = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.reserved_tokens = 0
+        self.reconciled_tokens = 0
 
     async def __aenter__(self):
         """Context manager entry - waits until request is allowed."""
@@ -151,127 +172,203 @@ class MultiRateLimiter:
         """Context manager exit."""
         return False
 
-    def _get_lock(self) -> asyncio.Lock:
+    async def acquire(self, estimated_tokens: int = 0, priority: int = 0) -> RateLimitReservation:
         """
-        Lazily initialize and return the asyncio lock.
+        Wait until a request is allowed under all rate limits and reserve its capacity.
 
-        This ensures the lock is created in the correct event loop context.
-        """
-        if self._lock is None:
-            self._lock = asyncio.Lock()
-        return self._lock
+        Args:
+            estimated_tokens: Tokens to reserve against the TPM limit until reconciled
+            priority: Waiters with a higher priority are served first; FIFO within a priority
 
-    async def acquire(self):
+        Returns:
+            RateLimitReservation for reconciling the token estimate
         """
-        Wait until a request is allowed under all rate limits.
-
-        Checks RPM, TPM, and RPD limits and waits for the most restrictive one.
+        tokens = max(int(estimated_tokens or 0), 0) if self._token_bucket is not None else 0
+        waiter = _Waiter(
+            sort_key=(-priority, next(self._sequence)),
+            tokens=tokens,
+            loop=asyncio.get_running_loop(),
+            event=asyncio.Event(),
+        )
+        start = time.monotonic()
+        logged = False
+        with self._lock:
+            heapq.heappush(self._waiters, waiter)
+
+        try:
+            while True:
+                with self._lock:
+                    delay, reason = None, ""
+                    if self._waiters[0] is waiter:
+                        now = time.monotonic()
+                        delay, reason = self._wait_time(tokens, now)
+                        if delay <= 0:
+                            heapq.heappop(self._waiters)
+                            self._grant(tokens, now)
+                            self._wake_head()
+                            return self._record(tokens, time.monotonic() - start)
+                    waiter.event.clear()
+
+                if delay is not None and delay >= LOG_WAIT_THRESHOLD and not logged:
+                    logged = True
+                    logger.info(f"[MultiRateLimiter] Rate limit reached: {reason}. Waiting {delay:.2f}s...")
+                # Woken early when capacity is returned or this waiter reaches the head
+                try:
+                    await asyncio.wait_for(waiter.event.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+        except BaseException:
+            with self._lock:
+                if waiter in self._waiters:
+                    was_head = self._waiters[0] is waiter
+                    self._waiters.remove(waiter)
+                    heapq.heapify(self._waiters)
+                    if was_head:
+                        self._wake_head()
+            raise
+
+    @contextlib.asynccontextmanager
+    async def reserve(self, estimated_tokens: int = 0, priority: int = 0) -> AsyncIterator[RateLimitReservation]:
+        """
+        Async context manager around ``acquire``; the reserved tokens are returned if the
+        body raises (the request itself still counts against the request limits).
         """
-        async with self._get_lock():
-            max_wait_time = 0.0
-            wait_reasons = []
-
-            current_time = time.time()
-
-            # Check RPM (60 second window)
-            if self.rpm is not None:
-                while self.request_times_minute and self.request_times_minute[0] <= current_time - 60:
-                    self.request_times_minute.popleft()
-
-                if len(self.request_times_minute) >= self.rpm:
-                    oldest_time = self.request_times_minute[0]
-                    wait_time = (oldest_time + 60) - current_time
-                    if wait_time > max_wait_time:
-                        max_wait_time = wait_time
-                        wait_reasons.append(
-                            f"RPM limit ({len(self.request_times_minute)}/{self.rpm})",
-                        )
-
-            # Check RPD (86400 second window = 24 hours)
-            if self.rpd is not None:
-                while self.request_times_day and self.request_times_day[0] <= current_time - 86400:
-                    self.request_times_day.popleft()
-
-                if len(self.request_times_day) >= self.rpd:
-                    oldest_time = self.request_times_day[0]
-                    wait_time = (oldest_time + 86400) - current_time
-                    if wait_time > max_wait_time:
-                        max_wait_time = wait_time
-                        wait_reasons.append(
-                            f"RPD limit ({len(self.request_times_day)}/{self.rpd})",
-                        )
-
-            # Check TPM (60 second window)
-            if self.tpm is not None:
-                # Remove old token usage records
-                while self.token_usage and self.token_usage[0][0] <= current_time - 60:
-                    self.token_usage.popleft()
-
-                # Calculate current token usage in the window
-                current_tokens = sum(tokens for _, tokens in self.token_usage)
-
-                if current_tokens >= self.tpm:
-                    # Find when the oldest tokens will expire
-                    if self.token_usage:
-                        oldest_time = self.token_usage[0][0]
-                        wait_time = (oldest_time + 60) - current_time
-                        if wait_time > max_wait_time:
-                            max_wait_time = wait_time
-                            wait_reasons.append(
-                                f"TPM limit ({current_tokens}/{self.tpm} tokens)",
-                            )
-
-            # If we need to wait, do it
-            if max_wait_time > 0:
-                reason_str = " and ".join(wait_reasons)
-                logger.info(
-                    f"[MultiRateLimiter] Rate limit reached: {reason_str}. " f"Waiting {max_wait_time:.2f}s...",
-                )
-                await asyncio.sleep(max_wait_time)
-
-                # After waiting, clean up old records
-                current_time = time.time()
-                while self.request_times_minute and self.request_times_minute[0] <= current_time - 60:
-                    self.request_times_minute.popleft()
-                while self.request_times_day and self.request_times_day[0] <= current_time - 86400:
-                    self.request_times_day.popleft()
-                while self.token_usage and self.token_usage[0][0] <= current_time - 60:
-                    self.token_usage.popleft()
-
-            # Record this request
-            current_time = time.time()
-            if self.rpm is not None:
-                self.request_times_minute.append(current_time)
-            if self.rpd is not None:
-                self.request_times_day.append(current_time)
+        reservation = await self.acquire(estimated_tokens, priority)
+        try:
+            yield reservation
+        except BaseException:
+            reservation.release()
+            raise
 
     async def record_tokens(self, tokens: int):
         """
         Record token usage for TPM tracking.
 
-        Call this after receiving a response to track tokens used.
+        Call this after receiving a response to charge tokens that were not reserved.
 
         Args:
             tokens: Number of tokens used in the request
         """
-        if self.tpm is not None:
-            async with self._get_lock():
-                self.token_usage.append((time.time(), tokens))
+        self._adjust_tokens(tokens)
+
+    def stats(self) -> Dict[str, Any]:
+        """Request counts, wait-time metrics and remaining bucket capacity."""
+        with self._lock:
+            now = time.monotonic()
+            buckets = self._request_buckets + ([self._token_bucket] if self._token_bucket else [])
+            levels = {}
+            for bucket in buckets:
+                bucket._refill(now)
+                levels[bucket.name] = round(bucket.level, 2)
+            return {
+                "requests": self.requests,
+                "waited_requests": self.waited_requests,
+                "total_wait": round(self.total_wait, 3),
+                "max_wait": round(self.max_wait, 3),
+                "avg_wait": round(self.total_wait / self.requests, 3) if self.requests else 0.0,
+                "queued": len(self._waiters),
+                "reserved_tokens": self.reserved_tokens,
+                "reconciled_tokens": self.reconciled_tokens,
+                "available": levels,
+            }
+
+    def _wait_time(self, tokens: int, now: float) -> tuple:
+        delay, reason = 0.0, ""
+        demands = [(bucket, 1) for bucket in self._request_buckets]
+        if self._token_bucket is not None:
+            demands.append((self._token_bucket, tokens))
+        for bucket, amount in demands:
+            wait = bucket.wait_time(amount, now)
+            if wait > delay:
+                delay, reason = wait, f"{bucket.name} limit ({bucket.capacity:g})"
+        return delay, reason
+
+    def _grant(self, tokens: int, now: float) -> None:
+        for bucket in self._request_buckets:
+            bucket.take(1, now)
+        if self._token_bucket is not None and tokens:
+            self._token_bucket.take(tokens, now)
+
+    def _adjust_tokens(self, delta: int, reconciled: bool = False) -> None:
+        if self._token_bucket is None or not delta:
+            return
+        with self._lock:
+            now = time.monotonic()
+            if delta > 0:
+                self._token_bucket.take(delta, now)
+            else:
+                self._token_bucket.give(-delta, now)
+                self._wake_head()
+            if reconciled:
+                self.reconciled_tokens += delta
+
+    def _wake_head(self) -> None:
+        if self._waiters:
+            head = self._waiters[0]
+            try:
+                head.loop.call_soon_threadsafe(head.event.set)
+            except RuntimeError:
+                pass  # The waiter's loop is closed
+
+    def _record(self, tokens: int, waited: float) -> RateLimitReservation:
+        self.requests += 1
+        self.reserved_tokens += tokens
+        if waited >= 0.001:
+            self.waited_requests += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+        return RateLimitReservation(self, tokens, waited)
+
+
+class RateLimiter(MultiRateLimiter):
+    """
+    Async rate limiter allowing ``max_requests`` requests per ``time_window`` seconds.
+
+    Example:
+        # Allow 7 requests per minute (60 seconds)
+        limiter = RateLimiter(max_requests=7, time_window=60)
+
+        async def make_request():
+            async with limiter:
+                # Make your API call here
+                response = await api_call()
+            return response
+    """
+
+    def __init__(self, max_requests: int, time_window: float):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            max_requests: Maximum number of requests allowed in the time window
+            time_window: Time window in seconds
+        """
+        self.max_requests = max_requests
+        self.time_window = time_window
+        self.rpm = self.tpm = self.rpd = None
+        self._setup([TokenBucket(max_requests, time_window, f"{max_requests} requests/{time_window:g}s")], None)
 
 
 class GlobalRateLimiter:
     """
     Global rate limiter registry for managing rate limits across different providers.
 
-    Allows sharing a single rate limiter instance across multiple backend instances
-    for the same provider.
+    Limiters are keyed by provider (or provider and model) and API key, so every backend
+    instance of the process using the same key shares one quota, while different keys
+    get their own. Keys are stored as hashes, never in clear text.
     """
 
     _limiters: Dict[str, Any] = {}
-    _lock = asyncio.Lock()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _registry_key(provider: str, api_key: Optional[str]) -> str:
+        if not api_key:
+            return provider
+        return f"{provider}:{hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:16]}"
 
     @classmethod
-    def get_limiter_sync(cls, provider: str, max_requests: int, time_window: float) -> RateLimiter:
+    def get_limiter_sync(cls, provider: str, max_requests: int, time_window: float, api_key: Optional[str] = None) -> RateLimiter:
         """
         Synchronous version - get or create a rate limiter for a specific provider.
         Use this in __init__ methods.
@@ -280,13 +377,16 @@ class GlobalRateLimiter:
             provider: Provider name (e.g., "gemini")
             max_requests: Maximum requests per time window
             time_window: Time window in seconds
+            api_key: API key the limit applies to (None = shared by all keys)
 
         Returns:
             RateLimiter instance for the provider
         """
-        if provider not in cls._limiters:
-            cls._limiters[provider] = RateLimiter(max_requests, time_window)
-        return cls._limiters[provider]
+        key = cls._registry_key(provider, api_key)
+        with cls._lock:
+            if key not in cls._limiters:
+                cls._limiters[key] = RateLimiter(max_requests, time_window)
+            return cls._limiters[key]
 
     @classmethod
     def get_multi_limiter_sync(
@@ -295,6 +395,7 @@ class GlobalRateLimiter:
         rpm: Optional[int] = None,
         tpm: Optional[int] = None,
         rpd: Optional[int] = None,
+        api_key: Optional[str] = None,
     ) -> MultiRateLimiter:
         """
         Get or create a multi-dimensional rate limiter for a specific provider.
@@ -305,15 +406,46 @@ class GlobalRateLimiter:
             rpm: Requests Per Minute limit
             tpm: Tokens Per Minute limit
             rpd: Requests Per Day limit
+            api_key: API key the limits apply to (None = shared by all keys)
 
         Returns:
             MultiRateLimiter instance for the provider
         """
-        if provider not in cls._limiters:
-            cls._limiters[provider] = MultiRateLimiter(rpm=rpm, tpm=tpm, rpd=rpd)
-        return cls._limiters[provider]
+        key = cls._registry_key(provider, api_key)
+        with cls._lock:
+            if key not in cls._limiters:
+                cls._limiters[key] = MultiRateLimiter(rpm=rpm, tpm=tpm, rpd=rpd)
+            return cls._limiters[key]
+
+    @classmethod
+    def get_adaptive_limiter_sync(cls, provider: str, model: Optional[str] = None, api_key: Optional[str] = None) -> AdaptiveLimiter:
+        """
+        Get or create the adaptive concurrency limiter for a provider/model.
+
+        Args:
+            provider: Provider name (e.g., "OpenAI")
+            model: Model name (None = one limiter for the whole provider)
+            api_key: API key the provider's limits apply to
+
+        Returns:
+            AdaptiveLimiter shared by every backend using the same provider, model and key
+        """
+        name = f"{provider}/{model}" if model else provider
+        key = cls._registry_key(f"adaptive-{name}", api_key)
+        with cls._lock:
+            if key not in cls._limiters:
+                cls._limiters[key] = AdaptiveLimiter(name)
+            return cls._limiters[key]
+
+    @classmethod
+    def stats(cls) -> Dict[str, Dict[str, Any]]:
+        """Metrics of every limiter that has served a request, by registry key."""
+        with cls._lock:
+            limiters = dict(cls._limiters)
+        return {key: stats for key, limiter in limiters.items() if (stats := limiter.stats())["requests"]}
 
     @classmethod
     def clear_limiters(cls):
         """Clear all rate limiters (useful for testing)."""
-        cls._limiters.clear()
+        with cls._lock:
+            cls._limiters.clear()
@@ -30,8 +30,10 @@ from .base_with_custom_tool_and_mcp import (
     CustomToolAndMCPBackend,
     CustomToolChunk,
     ToolExecutionConfig,
+    ToolRoundOutcome,
     UploadFileError,
 )
+from .client_pool import ClientPool
 
 
 class ResponseBackend(CustomToolAndMCPBackend):
@@ -97,12 +99,7 @@ class ResponseBackend(CustomToolAndMCPBackend):
                 extra={"agent_id": agent_id},
             )
         finally:
-            # Close the client if it has an aclose method
-            if client and hasattr(client, "aclose"):
-                try:
-                    await client.aclose()
-                except Exception:
-                    pass
+            await self._cleanup_client(client)
 
     async def _stream_without_custom_and_mcp_tools(
         self,
@@ -146,7 +143,7 @@ class ResponseBackend(CustomToolAndMCPBackend):
                 non_mcp_tools.append(tool)
             api_params["tools"] = non_mcp_tools
 
-        stream = await client.responses.create(**api_params)
+        stream = await self._start_request(lambda: client.responses.create(**api_params), api_params.get("model"))
 
         async for chunk in self._process_stream(stream, all_params, agent_id):
             yield chunk
@@ -242,14 +239,15 @@ class ResponseBackend(CustomToolAndMCPBackend):
         async for chunk in self.stream_custom_tool_execution(call):
             yield chunk
 
-    async def _stream_with_custom_and_mcp_tools(
+    async def _stream_tool_round(
         self,
         current_messages: List[Dict[str, Any]],
         tools: List[Dict[str, Any]],
         client,
+        outcome: ToolRoundOutcome,
         **kwargs,
     ) -> AsyncGenerator[StreamChunk, None]:
-        """Recursively stream MCP responses, executing function calls as needed."""
+        """Stream one MCP response, executing function calls as needed."""
 
         agent_id = kwargs.get("agent_id")
 
@@ -273,7 +271,7 @@ class ResponseBackend(CustomToolAndMCPBackend):
         api_params = await self.api_params_handler.build_api_params(current_messages, tools, all_params)
 
         # Start streaming
-        stream = await client.responses.create(**api_params)
+        stream = await self._start_request(lambda: client.responses.create(**api_params), api_params.get("model"))
 
         # Track function calls in this iteration
         captured_function_calls = []
@@ -375,22 +373,6 @@ class ResponseBackend(CustomToolAndMCPBackend):
                 "mcp_status": ChunkType.MCP_STATUS,
             }
 
-            # Execute custom tools using unified method
-            for call in custom_calls:
-                async for chunk in self._execute_tool_with_logging(
-                    call,
-                    CUSTOM_TOOL_CONFIG,
-                    updated_messages,
-                    processed_call_ids,
-                ):
-                    yield TextStreamChunk(
-                        type=chunk_type_map.get(chunk.type, chunk.type),
-                        status=getattr(chunk, "status", None),
-                        content=getattr(chunk, "content", None),
-                        source=getattr(chunk, "source", None),
-                    )
-                functions_executed = True
-
             # Check circuit breaker status before executing MCP functions
             if mcp_calls and not await super()._check_circuit_breaker_before_execution():
                 logger.warning("All MCP servers blocked by circuit breaker")
@@ -400,7 +382,7 @@ class ResponseBackend(CustomToolAndMCPBackend):
                     content="⚠️ [MCP] All servers blocked by circuit breaker",
                     source="circuit_breaker",
                 )
-                # Skip MCP tool execution but continue with custom tool results
+                # Skip MCP tool execution but continue with custom tools
                 mcp_calls = []
 
             # Check if planning mode is enabled - selectively block MCP tool execution during planning
@@ -422,20 +404,22 @@ class ResponseBackend(CustomToolAndMCPBackend):
                     # Selective blocking - log but continue to check each tool individually
                     logger.info(f"[Response] Planning mode enabled - selective blocking of {len(blocked_tools)} tools")
 
-            # Execute MCP tools using unified method
-            for call in mcp_calls:
-                async for chunk in self._execute_tool_with_logging(
-                    call,
-                    MCP_TOOL_CONFIG,
-                    updated_messages,
-                    processed_call_ids,
-                ):
-                    yield TextStreamChunk(
-                        type=chunk_type_map.get(chunk.type, chunk.type),
-                        status=getattr(chunk, "status", None),
-                        content=getattr(chunk, "content", None),
-                        source=getattr(chunk, "source", None),
-                    )
+            # Execute custom and MCP tools using unified method (concurrently when enabled)
+            tool_calls_to_execute = self._build_tool_execution_plan(
+                custom_calls,
+                mcp_calls,
+                CUSTOM_TOOL_CONFIG,
+                MCP_TOOL_CONFIG,
+                call_order=[call["call_id"] for call in captured_function_calls],
+            )
+            async for chunk in self._execute_tool_calls(tool_calls_to_execute, updated_messages, processed_call_ids):
+                yield TextStreamChunk(
+                    type=chunk_type_map.get(chunk.type, chunk.type),
+                    status=getattr(chunk, "status", None),
+                    content=getattr(chunk, "content", None),
+                    source=getattr(chunk, "source", None),
+                )
+            if tool_calls_to_execute:
                 functions_executed = True
 
             # Ensure all captured function calls have results to prevent hanging
@@ -462,11 +446,8 @@ class ResponseBackend(CustomToolAndMCPBackend):
 
             # Trim history after function executions to bound memory usage
             if functions_executed:
-                updated_messages = super()._trim_message_history(updated_messages)
-
-                # Recursive call with updated messages
-                async for chunk in self._stream_with_custom_and_mcp_tools(updated_messages, tools, client, **kwargs):
-                    yield chunk
+                # Continue the tool loop with updated messages
+                outcome.next_messages = super()._trim_message_history(updated_messages)
             else:
                 # No functions were executed, we're done
                 yield TextStreamChunk(type=ChunkType.DONE, source="response_api")
@@ -511,75 +492,71 @@ class ResponseBackend(CustomToolAndMCPBackend):
 
             uploaded_file_ids: List[str] = []
 
+            # Shared keep-alive client from the pool, fetched lazily and not closed here
             http_client: Optional[httpx.AsyncClient] = None
 
-            try:
-                for pending in pending_files:
-                    source = pending.get("source")
-
-                    if source == "local":
-                        path_str = pending.get("path")
-                        if not path_str:
-                            logger.warning("Missing local path for file_pending_upload entry")
-                            continue
-
-                        file_path = Path(path_str)
-                        if not file_path.exists():
-                            raise UploadFileError(f"File not found for upload: {file_path}")
-
-                        try:
-                            with file_path.open("rb") as file_handle:
-                                uploaded_file = await client.files.create(
-                                    purpose="assistants",
-                                    file=file_handle,
-                                )
-                        except Exception as exc:
-                            raise UploadFileError(f"Failed to upload file {file_path}: {exc}") from exc
-
-                    elif source == "url":
-                        file_url = pending.get("url")
-                        if not file_url:
-                            logger.warning("Missing URL for file_pending_upload entry")
-                            continue
-
-                        parsed = urlparse(file_url)
-                        if parsed.scheme not in {"http", "https"}:
-                            raise UploadFileError(f"Unsupported URL scheme for file upload: {file_url}")
+            for pending in pending_files:
+                source = pending.get("source")
 
-                        if http_client is None:
-                            http_client = httpx.AsyncClient()
-
-                        try:
-                            response = await http_client.get(file_url, timeout=30.0)
-                            response.raise_for_status()
-                        except httpx.HTTPError as exc:
-                            raise UploadFileError(f"Failed to download file from URL {file_url}: {exc}") from exc
+                if source == "local":
+                    path_str = pending.get("path")
+                    if not path_str:
+                        logger.warning("Missing local path for file_pending_upload entry")
+                        continue
 
-                        filename = Path(parsed.path).name or "remote_file"
-                        file_bytes = BytesIO(response.content)
+                    file_path = Path(path_str)
+                    if not file_path.exists():
+                        raise UploadFileError(f"File not found for upload: {file_path}")
 
-                        try:
+                    try:
+                        with file_path.open("rb") as file_handle:
                             uploaded_file = await client.files.create(
                                 purpose="assistants",
-                                file=(filename, file_bytes),
+                                file=file_handle,
                             )
-                        except Exception as exc:
-                            raise UploadFileError(f"Failed to upload file from URL {file_url}: {exc}") from exc
+                    except Exception as exc:
+                        raise UploadFileError(f"Failed to upload file {file_path}: {exc}") from exc
 
-                    else:
-                        raise UploadFileError(f"Unknown file_pending_upload source: {source}")
+                elif source == "url":
+                    file_url = pending.get("url")
+                    if not file_url:
+                        logger.warning("Missing URL for file_pending_upload entry")
+                        continue
+
+                    parsed = urlparse(file_url)
+                    if parsed.scheme not in {"http", "https"}:
+                        raise UploadFileError(f"Unsupported URL scheme for file upload: {file_url}")
 
-                    file_id = getattr(uploaded_file, "id", None)
-                    if not file_id:
-                        raise UploadFileError("Uploaded file response missing ID")
+                    if http_client is None:
+                        http_client = ClientPool.get_http_client()
 
-                    uploaded_file_ids.append(file_id)
-                    self._uploaded_file_ids.append(file_id)
-                    logger.info(f"Uploaded file for File Search (file_id={file_id})")
+                    try:
+                        response = await http_client.get(file_url, timeout=30.0)
+                        response.raise_for_status()
+                    except httpx.HTTPError as exc:
+                        raise UploadFileError(f"Failed to download file from URL {file_url}: {exc}") from exc
 
-            finally:
-                if http_client is not None:
-                    await http_client.aclose()
+                    filename = Path(parsed.path).name or "remote_file"
+                    file_bytes = BytesIO(response.content)
+
+                    try:
+                        uploaded_file = await client.files.create(
+                            purpose="assistants",
+                            file=(filename, file_bytes),
+                        )
+                    except Exception as exc:
+                        raise UploadFileError(f"Failed to upload file from URL {file_url}: {exc}") from exc
+
+                else:
+                    raise UploadFileError(f"Unknown file_pending_upload source: {source}")
+
+                file_id = getattr(uploaded_file, "id", None)
+                if not file_id:
+                    raise UploadFileError("Uploaded file response missing ID")
+
+                uploaded_file_ids.append(file_id)
+                self._uploaded_file_ids.append(file_id)
+                logger.info(f"Uploaded file for File Search (file_id={file_id})")
 
             timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
             vector_store_name = f"massgen_file_search_{agent_id or 'default'}_{timestamp}"
@@ -1158,7 +1135,12 @@ class ResponseBackend(CustomToolAndMCPBackend):
         return tool_result_message.get("output", "")
 
     def _create_client(self, **kwargs) -> AsyncOpenAI:
-        return openai.AsyncOpenAI(api_key=self.api_key)
+        return ClientPool.get_client(
+            provider="openai_response",
+            base_url=None,
+            api_key=self.api_key,
+            factory=lambda http_client: openai.AsyncOpenAI(api_key=self.api_key, http_client=http_client),
+        )
 
     def _convert_to_dict(self, obj) -> Dict[str, Any]:
         """Convert any object to dictionary with multiple fallback methods."""
@@ -0,0 +1,15 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks for MassGen's orchestration overhead, independent of provider latency.
+
+No API keys are needed: agents run on MockStreamingBackend, a deterministic fake backend
+that streams at a configurable token rate and makes scripted coordination decisions.
+
+Example:
+    $ python -m massgen.benchmarks --agents 5 --rounds 2
+"""
+
+from .coordination import BenchmarkResult, LoopLagMonitor, run_coordination_benchmark
+from .mock_backend import MockStreamingBackend
+
+__all__ = ["BenchmarkResult", "LoopLagMonitor", "MockStreamingBackend", "run_coordination_benchmark"]
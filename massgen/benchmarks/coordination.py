@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+"""
+End-to-end coordination benchmark.
+
+Runs ``Orchestrator.chat`` for N agents backed by MockStreamingBackend, each giving M
+answers before voting, and measures the orchestration overhead that provider latency
+normally hides:
+
+- time to first chunk, overall and per agent
+- chunks per second through ``_stream_coordination_with_agents``
+- time spent saving and restoring workspace snapshots
+- memory high-water mark (process RSS; Python allocations with ``trace_memory``)
+- event-loop lag, sampled by a ticker task
+
+Example:
+    $ python -m massgen.benchmarks --agents 5 --rounds 2 --json
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from ..chat_agent import SingleAgent
+from ..orchestrator import Orchestrator
+from .mock_backend import MockStreamingBackend
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore
+
+
+@dataclass
+class BenchmarkResult:
+    """Metrics of one coordination benchmark run (times in seconds)."""
+
+    agents: int
+    rounds: int
+    wall_time: float
+    time_to_first_chunk: Optional[float]
+    agent_time_to_first_chunk: Dict[str, float]
+    coordination_time: float
+    coordination_chunks: int
+    chunks_per_second: float
+    snapshot_io_time: float
+    snapshot_operations: int
+    answers: int
+    votes: int
+    peak_rss_mb: Optional[float]
+    peak_traced_mb: Optional[float]
+    loop_lag_mean_ms: float
+    loop_lag_p95_ms: float
+    loop_lag_max_ms: float
+    settings: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class LoopLagMonitor:
+    """Measures how late a periodic ticker wakes up, i.e. how long the loop was blocked."""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.samples: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(loop.time() - expected, 0.0))
+
+    def summary_ms(self) -> Dict[str, float]:
+        if not self.samples:
+            return {"mean": 0.0, "p95": 0.0, "max": 0.0}
+        ordered = sorted(self.samples)
+        return {
+            "mean": round(statistics.fmean(ordered) * 1000, 3),
+            "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 3),
+            "max": round(ordered[-1] * 1000, 3),
+        }
+
+
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _time_calls(method: Callable, totals: Dict[str, float]) -> Callable:
+    async def timed(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            totals["time"] += time.perf_counter() - start
+            totals["count"] += 1
+
+    return timed
+
+
+def _count_chunks(method: Callable, totals: Dict[str, float]) -> Callable:
+    async def counted(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            async for chunk in method(*args, **kwargs):
+                totals["count"] += 1
+                yield chunk
+        finally:
+            totals["time"] += time.perf_counter() - start
+
+    return counted
+
+
+async def run_coordination_benchmark(
+    num_agents: int = 3,
+    rounds: int = 1,
+    tokens_per_second: float = 200.0,
+    tokens_per_chunk: int = 4,
+    response_tokens: int = 64,
+    first_token_latency: float = 0.0,
+    tool_calls: int = 0,
+    tool_latency: float = 0.0,
+    workspace_files: int = 2,
+    file_size: int = 4096,
+    trace_memory: bool = False,
+    workspace_root: Optional[str] = None,
+) -> BenchmarkResult:
+    """
+    Run one coordination end to end on mock backends.
+
+    Args:
+        num_agents: Number of agents (N)
+        rounds: Answers each agent gives before voting (M)
+        tokens_per_second, tokens_per_chunk, response_tokens, first_token_latency, tool_calls,
+        tool_latency, workspace_files, file_size: MockStreamingBackend settings
+        trace_memory: Also record the Python allocation peak (slows the run down)
+        workspace_root: Directory for workspaces and snapshots (default: a temporary directory)
+
+    Returns:
+        BenchmarkResult with the run's metrics
+    """
+    settings = {key: value for key, value in locals().items() if key != "workspace_root"}
+    with tempfile.TemporaryDirectory(prefix="massgen_bench_") as temp_dir:
+        root = Path(workspace_root or temp_dir)
+        backends = {
+            f"agent_{index}": MockStreamingBackend(
+                tokens_per_second=tokens_per_second,
+                tokens_per_chunk=tokens_per_chunk,
+                response_tokens=response_tokens,
+                first_token_latency=first_token_latency,
+                answer_rounds=rounds,
+                tool_calls=tool_calls,
+                tool_latency=tool_latency,
+                workspace_files=workspace_files,
+                file_size=file_size,
+                model=f"mock-{index}",
+                cwd=str(root / "workspaces" / f"agent_{index}"),
+                agent_temporary_workspace=str(root / "temp_workspaces"),
+            )
+            for index in range(num_agents)
+        }
+        agents = {agent_id: SingleAgent(backend=backend, agent_id=agent_id) for agent_id, backend in backends.items()}
+        orchestrator = Orchestrator(
+            agents=agents,
+            snapshot_storage=str(root / "snapshots"),
+            agent_temporary_workspace=str(root / "temp_workspaces"),
+        )
+
+        snapshot_io = {"time": 0.0, "count": 0}
+        coordination = {"time": 0.0, "count": 0}
+        orchestrator._save_agent_snapshot = _time_calls(orchestrator._save_agent_snapshot, snapshot_io)
+        orchestrator._copy_all_snapshots_to_temp_workspace = _time_calls(orchestrator._copy_all_snapshots_to_temp_workspace, snapshot_io)
+        orchestrator._stream_coordination_with_agents = _count_chunks(orchestrator._stream_coordination_with_agents, coordination)
+
+        if trace_memory:
+            tracemalloc.start()
+        monitor = LoopLagMonitor()
+        monitor.start()
+        first_chunk: Dict[str, float] = {}
+        start = time.perf_counter()
+        try:
+            async for chunk in orchestrator.chat([{"role": "user", "content": "Benchmark task"}]):
+                source = getattr(chunk, "source", None)
+                if chunk.type == "content" and source in agents and source not in first_chunk:
+                    first_chunk[source] = time.perf_counter() - start
+            wall_time = time.perf_counter() - start
+        finally:
+            await monitor.stop()
+            peak_traced = None
+            if trace_memory:
+                peak_traced = round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 1)
+                tracemalloc.stop()
+
+    lag = monitor.summary_ms()
+    return BenchmarkResult(
+        agents=num_agents,
+        rounds=rounds,
+        wall_time=round(wall_time, 4),
+        time_to_first_chunk=round(min(first_chunk.values()), 4) if first_chunk else None,
+        agent_time_to_first_chunk={agent_id: round(value, 4) for agent_id, value in sorted(first_chunk.items())},
+        coordination_time=round(coordination["time"], 4),
+        coordination_chunks=int(coordination["count"]),
+        chunks_per_second=round(coordination["count"] / coordination["time"], 1) if coordination["time"] else 0.0,
+        snapshot_io_time=round(snapshot_io["time"], 4),
+        snapshot_operations=int(snapshot_io["count"]),
+        answers=sum(backend.answers_given for backend in backends.values()),
+        votes=sum(backend.votes_cast for backend in backends.values()),
+        peak_rss_mb=_peak_rss_mb(),
+        peak_traced_mb=peak_traced,
+        loop_lag_mean_ms=lag["mean"],
+        loop_lag_p95_ms=lag["p95"],
+        loop_lag_max_ms=lag["max"],
+        settings=settings,
+    )
+
+
+def _format_result(result: BenchmarkResult) -> str:
+    ttfc = f"{result.time_to_first_chunk * 1000:.1f} ms" if result.time_to_first_chunk is not None else "n/a"
+    slowest = max(result.agent_time_to_first_chunk.values(), default=None)
+    lines = [
+        f"Coordination benchmark: {result.agents} agents x {result.rounds} rounds",
+        f"  wall time              {result.wall_time:.3f} s",
+        f"  time to first chunk    {ttfc} (slowest agent {slowest * 1000:.1f} ms)" if slowest is not None else f"  time to first chunk    {ttfc}",
+        f"  coordination chunks    {result.coordination_chunks} in {result.coordination_time:.3f} s ({result.chunks_per_second:.1f}/s)",
+        f"  snapshot I/O           {result.snapshot_io_time * 1000:.1f} ms over {result.snapshot_operations} operations",
+        f"  answers / votes        {result.answers} / {result.votes}",
+        f"  event-loop lag         mean {result.loop_lag_mean_ms:.2f} ms, p95 {result.loop_lag_p95_ms:.2f} ms, max {result.loop_lag_max_ms:.2f} ms",
+    ]
+    if result.peak_rss_mb is not None:
+        lines.append(f"  peak RSS               {result.peak_rss_mb:.1f} MB")
+    if result.peak_traced_mb is not None:
+        lines.append(f"  peak Python allocs     {result.peak_traced_mb:.1f} MB")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark MassGen coordination overhead with mock streaming backends")
+    parser.add_argument("--agents", type=int, default=3, help="Number of agents")
+    parser.add_argument("--rounds", type=int, default=1, help="Answers per agent before voting")
+    parser.add_argument("--tokens-per-second", type=float, default=200.0, help="Streaming rate per agent (0 = unthrottled)")
+    parser.add_argument("--tokens-per-chunk", type=int, default=4)
+    parser.add_argument("--response-tokens", type=int, default=64, help="Content tokens per response")
+    parser.add_argument("--first-token-latency", type=float, default=0.0, help="Simulated provider latency in seconds")
+    parser.add_argument("--tool-calls", type=int, default=0, help="Simulated tool rounds per response")
+    parser.add_argument("--tool-latency", type=float, default=0.0, help="Seconds per simulated tool round")
+    parser.add_argument("--workspace-files", type=int, default=2, help="Files written per answer")
+    parser.add_argument("--file-size", type=int, default=4096, help="Bytes per written file")
+    parser.add_argument("--trace-memory", action="store_true", help="Record the Python allocation peak (slower)")
+    parser.add_argument("--repeat", type=int, default=1, help="Number of runs")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON lines")
+    args = parser.parse_args(argv)
+
+    for _ in range(args.repeat):
+        result = asyncio.run(
+            run_coordination_benchmark(
+                num_agents=args.agents,
+                rounds=args.rounds,
+                tokens_per_second=args.tokens_per_second,
+                tokens_per_chunk=args.tokens_per_chunk,
+                response_tokens=args.response_tokens,
+                first_token_latency=args.first_token_latency,
+                tool_calls=args.tool_calls,
+                tool_latency=args.tool_latency,
+                workspace_files=args.workspace_files,
+                file_size=args.file_size,
+                trace_memory=args.trace_memory,
+            ),
+        )
+        print(json.dumps(result.to_dict()) if args.json else _format_result(result))
+
+
+if __name__ == "__main__":
+    main()
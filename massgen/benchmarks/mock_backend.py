@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+Deterministic streaming backend for benchmarks.
+
+MockStreamingBackend behaves like a provider backend without a provider: it streams
+content at a fixed token rate, simulates backend-side tool rounds, writes files into its
+workspace and makes the coordination decisions (``new_answer`` for its first
+``answer_rounds`` calls, then ``vote``) through the same tool-call chunks the real
+backends emit. Everything it does is a function of its parameters, so two runs with the
+same settings do the same work.
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Any, AsyncGenerator, Dict, List, Optional
+
+from ..backend.base import FilesystemSupport, LLMBackend, StreamChunk
+
+
+class MockStreamingBackend(LLMBackend):
+    """
+    Fake LLMBackend streaming scripted responses.
+
+    Args:
+        tokens_per_second: Streaming rate (0 = as fast as the loop allows)
+        tokens_per_chunk: Tokens per content chunk
+        response_tokens: Content tokens streamed per response
+        first_token_latency: Delay before the first chunk of each response
+        answer_rounds: Coordination calls answered with ``new_answer`` before voting
+        tool_calls: Simulated backend-side tool rounds per response
+        tool_latency: Duration of each simulated tool round
+        workspace_files: Files written to the workspace before each answer
+        file_size: Size of each written file in bytes
+        vote_for: Anonymous agent ID to vote for
+        **kwargs: Regular backend configuration (e.g. ``cwd`` for a workspace)
+    """
+
+    def __init__(
+        self,
+        tokens_per_second: float = 200.0,
+        tokens_per_chunk: int = 4,
+        response_tokens: int = 64,
+        first_token_latency: float = 0.0,
+        answer_rounds: int = 1,
+        tool_calls: int = 0,
+        tool_latency: float = 0.0,
+        workspace_files: int = 0,
+        file_size: int = 1024,
+        vote_for: str = "agent1",
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.tokens_per_second = tokens_per_second
+        self.tokens_per_chunk = max(1, tokens_per_chunk)
+        self.response_tokens = response_tokens
+        self.first_token_latency = first_token_latency
+        self.answer_rounds = answer_rounds
+        self.tool_calls = tool_calls
+        self.tool_latency = tool_latency
+        self.workspace_files = workspace_files
+        self.file_size = file_size
+        self.vote_for = vote_for
+
+        self.calls = 0
+        self.answers_given = 0
+        self.votes_cast = 0
+
+    def get_provider_name(self) -> str:
+        return "Mock"
+
+    def get_filesystem_support(self) -> FilesystemSupport:
+        # Native: a workspace is set up without injecting MCP filesystem servers
+        return FilesystemSupport.NATIVE
+
+    async def stream_with_tools(self, messages: List[Dict[str, Any]], tools: List[Dict[str, Any]], **kwargs) -> AsyncGenerator[StreamChunk, None]:
+        self.calls += 1
+        tool_names = {self._tool_name(tool) for tool in tools or []}
+
+        if self.first_token_latency:
+            await asyncio.sleep(self.first_token_latency)
+        async for chunk in self._stream_tokens(self.response_tokens):
+            yield chunk
+
+        for round_index in range(self.tool_calls):
+            yield StreamChunk(type="custom_tool_status", content=f"Calling mock_tool (round {round_index + 1})", source="mock_tool")
+            await asyncio.sleep(self.tool_latency)
+            yield StreamChunk(type="custom_tool_status", content=f"mock_tool returned {self.tokens_per_chunk * 8} bytes", source="mock_tool")
+
+        if "new_answer" in tool_names and self.answers_given < self.answer_rounds:
+            self.answers_given += 1
+            await self._write_workspace_files()
+            yield self._tool_call("new_answer", {"content": f"Answer {self.answers_given} from {self.config.get('model', 'mock')}"})
+        elif "vote" in tool_names:
+            self.votes_cast += 1
+            yield self._tool_call("vote", {"agent_id": self.vote_for, "reason": "Most complete answer"})
+        elif "submit" in tool_names:
+            yield self._tool_call("submit", {"confirmed": True})
+
+        yield StreamChunk(type="done")
+
+    async def _stream_tokens(self, count: int) -> AsyncGenerator[StreamChunk, None]:
+        delay = self.tokens_per_chunk / self.tokens_per_second if self.tokens_per_second > 0 else 0.0
+        for start in range(0, count, self.tokens_per_chunk):
+            await asyncio.sleep(delay)
+            words = " ".join(f"w{index}" for index in range(start, min(start + self.tokens_per_chunk, count)))
+            yield StreamChunk(type="content", content=words + " ")
+
+    async def _write_workspace_files(self) -> None:
+        if not self.workspace_files or self.filesystem_manager is None:
+            return
+        workspace = Path(self.filesystem_manager.get_current_workspace())
+        payload = b"x" * self.file_size
+        answer = self.answers_given
+
+        def write() -> None:
+            for index in range(self.workspace_files):
+                (workspace / f"answer_{answer}_file_{index}.txt").write_bytes(payload)
+
+        await asyncio.to_thread(write)
+
+    def _tool_call(self, name: str, arguments: Dict[str, Any]) -> StreamChunk:
+        call = {"id": f"call_{self.calls}", "type": "function", "function": {"name": name, "arguments": arguments}}
+        return StreamChunk(type="tool_calls", tool_calls=[call])
+
+    @staticmethod
+    def _tool_name(tool: Dict[str, Any]) -> Optional[str]:
+        return tool.get("function", {}).get("name") if "function" in tool else tool.get("name")
@@ -16,7 +16,7 @@ from typing import Any, AsyncGenerator, Dict, List, Optional
 from .backend.base import LLMBackend, StreamChunk
 from .logger_config import logger
 from .memory import ConversationMemory, PersistentMemoryBase
-from .stream_chunk import ChunkType
+from .stream_chunk import ChunkAccumulator, ChunkType
 from .utils import CoordinationStage
 
 
@@ -225,7 +225,7 @@ class SingleAgent(ChatAgent):
 
     async def _process_stream(self, backend_stream, tools: List[Dict[str, Any]] = None) -> AsyncGenerator[StreamChunk, None]:
         """Common streaming logic for processing backend responses."""
-        assistant_response = ""
+        assistant_response = ChunkAccumulator()
         tool_calls = []
         complete_message = None
         messages_to_record = []
@@ -239,7 +239,7 @@ class SingleAgent(ChatAgent):
             async for chunk in backend_stream:
                 chunk_type = self._get_chunk_type_value(chunk)
                 if chunk_type == "content":
-                    assistant_response += chunk.content
+                    assistant_response.append(chunk.content)
                     yield chunk
                 elif chunk_type == "tool_calls":
                     chunk_tool_calls = getattr(chunk, "tool_calls", []) or []
@@ -364,11 +364,12 @@ class SingleAgent(ChatAgent):
                         logger.debug(f"   ✅ Added reasoning summary ({len(combined_summary)} chars)")
 
                     # 3. Add main response text (accumulated from all content chunks)
-                    if assistant_response.strip():
+                    response_text = assistant_response.getvalue().strip()
+                    if response_text:
                         messages_to_record.append(
                             {
                                 "role": "assistant",
-                                "content": assistant_response.strip(),
+                                "content": response_text,
                             },
                         )
                         logger.debug(f"   ✅ Added main response ({len(assistant_response)} chars)")
@@ -511,7 +512,8 @@ class SingleAgent(ChatAgent):
                             # Update conversation_history if compression occurred
                             if compression_stats and self.conversation_memory:
                                 # Reload from conversation memory (it was updated by compressor)
-                                self.conversation_history = await self.conversation_memory.get_messages()
+                                # Mutable copies: backends may edit the history they are given
+                                self.conversation_history = [message.copy() for message in await self.conversation_memory.get_messages()]
                                 # Mark that compression has occurred
                                 self._compression_has_occurred = True
                                 logger.info(
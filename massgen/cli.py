@@ -45,6 +45,7 @@ from .backend.azure_openai import AzureOpenAIBackend
 from .backend.chat_completions import ChatCompletionsBackend
 from .backend.claude import ClaudeBackend
 from .backend.claude_code import ClaudeCodeBackend
+from .backend.client_pool import ClientPool
 from .backend.gemini import GeminiBackend
 from .backend.grok import GrokBackend
 from .backend.inference import InferenceBackend
@@ -785,8 +786,15 @@ def create_agents_from_config(
             from .memory import ConversationMemory
 
             # Create conversation memory for this agent
-            if memory_config.get("conversation_memory", {}).get("enabled", True):
-                conversation_memory = ConversationMemory()
+            conv_config = memory_config.get("conversation_memory", {})
+            if conv_config.get("enabled", True):
+                storage_path = None
+                if conv_config.get("on_disk", False):
+                    # Keep the history in a JSONL file in the session's log directory
+                    from .logger_config import get_log_session_dir
+
+                    storage_path = get_log_session_dir() / f"conversation_memory_{agent_config.agent_id}.jsonl"
+                conversation_memory = ConversationMemory(storage_path=storage_path)
                 logger.info(f"💾 Conversation memory created for {agent_config.agent_id}")
 
             # Create persistent memory for this agent (if enabled)
@@ -863,6 +871,7 @@ def create_agents_from_config(
                             embedding_config=embedding_cfg,  # Use native mem0 embedder
                             qdrant_client=shared_qdrant_client,  # Share ONE client from server
                             debug=debug,  # Enable memory debug mode if --debug flag used
+                            background_recording=pm_config.get("background_recording", True),
                             on_disk=on_disk,
                         )
                         logger.info(
@@ -890,6 +899,7 @@ def create_agents_from_config(
                             embedding_config=embedding_cfg,  # Use native mem0 embedder
                             vector_store_config=vector_store_config,
                             debug=debug,  # Enable memory debug mode if --debug flag used
+                            background_recording=pm_config.get("background_recording", True),
                             on_disk=on_disk,
                         )
                         logger.info(
@@ -1282,6 +1292,10 @@ async def run_question_with_history(
     if "answer_novelty_requirement" in orchestrator_cfg:
         orchestrator_config.answer_novelty_requirement = orchestrator_cfg["answer_novelty_requirement"]
 
+    # Serve live status deltas on a Unix socket if specified
+    if orchestrator_cfg.get("status_socket"):
+        orchestrator_config.status_socket_path = orchestrator_cfg["status_socket"]
+
     # Get context sharing parameters
     snapshot_storage = orchestrator_cfg.get("snapshot_storage")
     agent_temporary_workspace = orchestrator_cfg.get("agent_temporary_workspace")
@@ -1312,6 +1326,11 @@ async def run_question_with_history(
             use_skills=coord_cfg.get("use_skills", False),
             massgen_skills=coord_cfg.get("massgen_skills", []),
             skills_directory=coord_cfg.get("skills_directory", ".agent/skills"),
+            share_mcp_servers=coord_cfg.get("share_mcp_servers", False),
+            tool_result_cache=coord_cfg.get("tool_result_cache", False),
+            tool_result_cache_ttl=coord_cfg.get("tool_result_cache_ttl", 300.0),
+            tool_worker_threads=coord_cfg.get("tool_worker_threads"),
+            tool_worker_processes=coord_cfg.get("tool_worker_processes"),
         )
 
     # Get previous turns and winning agents history from session_info if already loaded,
@@ -1375,6 +1394,11 @@ async def run_question_with_history(
                 use_skills=coordination_settings.get("use_skills", False),
                 massgen_skills=coordination_settings.get("massgen_skills", []),
                 skills_directory=coordination_settings.get("skills_directory", ".agent/skills"),
+                share_mcp_servers=coordination_settings.get("share_mcp_servers", False),
+                tool_result_cache=coordination_settings.get("tool_result_cache", False),
+                tool_result_cache_ttl=coordination_settings.get("tool_result_cache_ttl", 300.0),
+                tool_worker_threads=coordination_settings.get("tool_worker_threads"),
+                tool_worker_processes=coordination_settings.get("tool_worker_processes"),
             )
 
     print(f"\n🤖 {BRIGHT_CYAN}{mode_text}{RESET}", flush=True)
@@ -1611,6 +1635,11 @@ async def run_single_question(
                 use_skills=coordination_settings.get("use_skills", False),
                 massgen_skills=coordination_settings.get("massgen_skills", []),
                 skills_directory=coordination_settings.get("skills_directory", ".agent/skills"),
+                share_mcp_servers=coordination_settings.get("share_mcp_servers", False),
+                tool_result_cache=coordination_settings.get("tool_result_cache", False),
+                tool_result_cache_ttl=coordination_settings.get("tool_result_cache_ttl", 300.0),
+                tool_worker_threads=coordination_settings.get("tool_worker_threads"),
+                tool_worker_processes=coordination_settings.get("tool_worker_processes"),
             )
 
         # Get orchestrator parameters from config
@@ -1628,6 +1657,10 @@ async def run_single_question(
         if "answer_novelty_requirement" in orchestrator_cfg:
             orchestrator_config.answer_novelty_requirement = orchestrator_cfg["answer_novelty_requirement"]
 
+        # Serve live status deltas on a Unix socket if specified
+        if orchestrator_cfg.get("status_socket"):
+            orchestrator_config.status_socket_path = orchestrator_cfg["status_socket"]
+
         # Get context sharing parameters
         snapshot_storage = orchestrator_cfg.get("snapshot_storage")
         agent_temporary_workspace = orchestrator_cfg.get("agent_temporary_workspace")
@@ -1658,6 +1691,11 @@ async def run_single_question(
                 use_skills=coord_cfg.get("use_skills", False),
                 massgen_skills=coord_cfg.get("massgen_skills", []),
                 skills_directory=coord_cfg.get("skills_directory", ".agent/skills"),
+                share_mcp_servers=coord_cfg.get("share_mcp_servers", False),
+                tool_result_cache=coord_cfg.get("tool_result_cache", False),
+                tool_result_cache_ttl=coord_cfg.get("tool_result_cache_ttl", 300.0),
+                tool_worker_threads=coord_cfg.get("tool_worker_threads"),
+                tool_worker_processes=coord_cfg.get("tool_worker_processes"),
             )
 
         orchestrator = Orchestrator(
@@ -3171,6 +3209,18 @@ async def main(args):
                 if args.debug:
                     logger.debug(f"Marked session as completed: {memory_session_id}")
 
+            # Write persistent memory records still queued in the background
+            for agent_id, agent in agents.items():
+                persistent_memory = getattr(agent, "persistent_memory", None)
+                if hasattr(persistent_memory, "close"):
+                    try:
+                        await persistent_memory.close()
+                        stats = persistent_memory.recording_stats()
+                        if stats.get("records"):
+                            logger.info(f"[CLI] Persistent memory recording for {agent_id}: {stats}")
+                    except Exception as e:
+                        logger.warning(f"[CLI] Flushing persistent memory failed for agent {agent_id}: {e}")
+
             # Cleanup all agents' filesystem managers (including Docker containers)
             for agent_id, agent in agents.items():
                 if hasattr(agent, "backend") and hasattr(agent.backend, "filesystem_manager"):
@@ -3180,6 +3230,9 @@ async def main(args):
                         except Exception as e:
                             logger.warning(f"[CLI] Cleanup failed for agent {agent_id}: {e}")
 
+            # Close pooled provider connections now that no agent uses them
+            await ClientPool.aclose()
+
     except ConfigurationError as e:
         print(f"❌ Configuration error: {e}", flush=True)
         sys.exit(EXIT_CONFIG_ERROR)
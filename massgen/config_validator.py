@@ -580,7 +580,7 @@ class ConfigValidator:
                 )
             else:
                 # Validate boolean fields
-                boolean_fields = ["enable_planning_mode"]
+                boolean_fields = ["enable_planning_mode", "share_mcp_servers", "tool_result_cache"]
                 for field_name in boolean_fields:
                     if field_name in coordination:
                         value = coordination[field_name]
@@ -591,6 +591,25 @@ class ConfigValidator:
                                 "Use 'true' or 'false'",
                             )
 
+                # Validate positive number fields
+                if "tool_result_cache_ttl" in coordination:
+                    value = coordination["tool_result_cache_ttl"]
+                    if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+                        result.add_error(
+                            "'tool_result_cache_ttl' must be a positive number of seconds",
+                            f"{location}.coordination.tool_result_cache_ttl",
+                            "Use a value like 60 or 300",
+                        )
+
+                for field_name in ("tool_worker_threads", "tool_worker_processes"):
+                    value = coordination.get(field_name)
+                    if value is not None and (isinstance(value, bool) or not isinstance(value, int) or value < 1):
+                        result.add_error(
+                            f"'{field_name}' must be a positive integer",
+                            f"{location}.coordination.{field_name}",
+                            "Use a value like 4 or 8",
+                        )
+
                 # Validate integer fields
                 if "max_orchestration_restarts" in coordination:
                     value = coordination["max_orchestration_restarts"]
@@ -623,6 +642,16 @@ class ConfigValidator:
                     f"Use one of: {valid_values}",
                 )
 
+        # Validate status_socket if present
+        if "status_socket" in orchestrator_config:
+            status_socket = orchestrator_config["status_socket"]
+            if not isinstance(status_socket, str) or not status_socket:
+                result.add_error(
+                    f"'status_socket' must be a non-empty path string, got {type(status_socket).__name__}",
+                    f"{location}.status_socket",
+                    "Use a socket path like '/tmp/massgen-status.sock'",
+                )
+
         # Validate timeout if present
         if "timeout" in orchestrator_config:
             timeout = orchestrator_config["timeout"]
@@ -726,14 +755,15 @@ class ConfigValidator:
                     f"{location}.conversation_memory",
                     "Use 'enabled: true/false'",
                 )
-            elif "enabled" in conv_memory:
-                enabled = conv_memory["enabled"]
-                if not isinstance(enabled, bool):
-                    result.add_error(
-                        f"'enabled' must be a boolean, got {type(enabled).__name__}",
-                        f"{location}.conversation_memory.enabled",
-                        "Use 'true' or 'false'",
-                    )
+            else:
+                for field_name in ("enabled", "on_disk"):
+                    value = conv_memory.get(field_name)
+                    if field_name in conv_memory and not isinstance(value, bool):
+                        result.add_error(
+                            f"'{field_name}' must be a boolean, got {type(value).__name__}",
+                            f"{location}.conversation_memory.{field_name}",
+                            "Use 'true' or 'false'",
+                        )
 
         # Validate persistent_memory if present
         if "persistent_memory" in memory_config:
@@ -746,7 +776,7 @@ class ConfigValidator:
                 )
             else:
                 # Validate boolean fields
-                boolean_fields = ["enabled", "on_disk"]
+                boolean_fields = ["enabled", "on_disk", "background_recording"]
                 for field_name in boolean_fields:
                     if field_name in persist_memory:
                         value = persist_memory[field_name]
@@ -152,6 +152,22 @@ class RateLimitConfig:
         provider_config = self._config.get(provider, {})
         return [k for k in provider_config.keys() if k != "default"]
 
+    def resolve_provider(self, provider_name: str) -> Optional[str]:
+        """
+        Map a backend's provider name to its section of the configuration.
+
+        Args:
+            provider_name: Backend provider name (e.g., 'Gemini', 'Azure OpenAI', 'Claude Code')
+
+        Returns:
+            Configured provider key contained in the name (e.g., 'openai'), or None
+        """
+        name = provider_name.lower().replace("anthropic", "claude")
+        for provider in self._config:
+            if provider in name:
+                return provider
+        return None
+
     def has_config(self) -> bool:
         """Check if configuration was successfully loaded."""
         return bool(self._config)
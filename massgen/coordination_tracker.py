@@ -16,8 +16,14 @@ import time
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .answer_similarity import (
+    AnswerSignature,
+    batch_jaccard_similarity,
+    compute_answer_signature,
+    similarity_matrix,
+)
 from .logger_config import logger
 from .utils import ActionType, AgentStatus
 
@@ -119,10 +125,22 @@ class CoordinationTracker:
         # Answer tracking
         self.answers_by_agent: Dict[str, List[AgentAnswer]] = {}  # agent_id -> list of regular answers
         self.final_answers: Dict[str, AgentAnswer] = {}  # agent_id -> final answer
+        self.answer_signatures: Dict[str, AnswerSignature] = {}  # answer content -> token signature for novelty checks
 
         # Vote tracking
         self.votes: List[AgentVote] = []
 
+        # Incrementally maintained status state (keeps status.json and deltas O(agents))
+        self._first_vote_by_voter: Dict[str, AgentVote] = {}  # voter_id -> first vote cast
+        self._votes_per_voter: Dict[str, int] = {}  # voter_id -> number of votes cast
+        self._vote_counts: Dict[str, int] = {}  # answer label -> votes received
+        self._answer_total: int = 0
+
+        # Live status feed - every recorded event bumps the version and is published as a delta
+        self.status_version: int = 0
+        self.status_subscribers: List[Callable[[Dict[str, Any]], None]] = []
+        self.status_orchestrator: Optional[Any] = None  # Orchestrator whose agent_states enrich deltas
+
         # Coordination iteration tracking
         self.current_iteration: int = 0
         self.agent_rounds: Dict[str, int] = {}  # Per-agent round tracking - increments when restart completed
@@ -173,6 +191,13 @@ class CoordinationTracker:
         self.answers_by_agent = {aid: [] for aid in agent_ids}
         self.user_prompt = user_prompt
 
+        # Reset votes and the incrementally tracked status state so a new turn does not inherit the previous one's counts
+        self.votes = []
+        self._first_vote_by_voter = {}
+        self._votes_per_voter = {}
+        self._vote_counts = {}
+        self._answer_total = 0
+
         # Initialize per-agent round tracking
         self.agent_rounds = {aid: 0 for aid in agent_ids}
         self.agent_round_context = {aid: {0: []} for aid in agent_ids}  # Each agent starts in round 0 with empty context
@@ -372,8 +397,10 @@ class CoordinationTracker:
         label = f"agent{agent_num}.{answer_num}"
         agent_answer.label = label
 
-        # Store the answer
+        # Store the answer and its token signature (computed once, reused by every novelty check)
         self.answers_by_agent[agent_id].append(agent_answer)
+        self._answer_total += 1
+        self.get_answer_signature(answer)
 
         # Track snapshot mapping if provided
         if snapshot_timestamp:
@@ -391,6 +418,39 @@ class CoordinationTracker:
         context = {"label": label}
         self._add_event(EventType.NEW_ANSWER, agent_id, f"Provided answer {label}", context)
 
+    def get_answer_signature(self, content: str) -> AnswerSignature:
+        """Return the cached token signature of an answer, computing it on first use."""
+        signature = self.answer_signatures.get(content)
+        if signature is None:
+            signature = compute_answer_signature(content)
+            self.answer_signatures[content] = signature
+        return signature
+
+    def score_answer_similarity(self, new_answer: str, existing_answers: Dict[str, str]) -> Dict[str, float]:
+        """Jaccard similarity of a proposed answer against existing answers in one batched comparison.
+
+        Args:
+            new_answer: The proposed answer content
+            existing_answers: Dictionary of existing answers {agent_id: answer_content}
+
+        Returns:
+            Dictionary of {agent_id: similarity} in the order of existing_answers
+        """
+        agent_ids = list(existing_answers)
+        signatures = [self.get_answer_signature(existing_answers[aid]) for aid in agent_ids]
+        scores = batch_jaccard_similarity(compute_answer_signature(new_answer), signatures)
+        return dict(zip(agent_ids, scores))
+
+    def get_answer_similarity_matrix(self) -> Tuple[List[str], List[List[float]]]:
+        """Pairwise similarity of every recorded answer, for logging.
+
+        Returns:
+            Tuple of (answer labels, matrix) where matrix[i][j] compares labels[i] to labels[j]
+        """
+        answers = [answer for aid in self.agent_ids for answer in self.answers_by_agent.get(aid, [])]
+        labels = [answer.label for answer in answers]
+        return labels, similarity_matrix([self.get_answer_signature(answer.content) for answer in answers])
+
     def add_agent_vote(
         self,
         agent_id: str,
@@ -433,12 +493,15 @@ class CoordinationTracker:
             available_answers=self.iteration_available_labels.copy(),
         )
         self.votes.append(vote)
+        self._first_vote_by_voter.setdefault(agent_id, vote)
+        self._votes_per_voter[agent_id] = self._votes_per_voter.get(agent_id, 0) + 1
+        self._vote_counts[voted_for_label] = self._vote_counts.get(voted_for_label, 0) + 1
 
         # Track snapshot mapping if provided
         if snapshot_timestamp:
             # Create a meaningful vote label similar to answer labels
             agent_num = self._get_agent_number(agent_id) or 0
-            vote_num = len([v for v in self.votes if v.voter_id == agent_id])
+            vote_num = self._votes_per_voter[agent_id]
             vote_label = f"agent{agent_num}.vote{vote_num}"
 
             self.snapshot_mappings[vote_label] = {
@@ -590,6 +653,41 @@ class CoordinationTracker:
             context=context,
         )
         self.events.append(event)
+        self.status_version += 1
+        if self.status_subscribers:
+            self._publish_status_delta(event)
+
+    # Live status feed
+    def add_status_subscriber(self, subscriber: Callable[[Dict[str, Any]], None]):
+        """Register a callable that receives a status delta for every recorded event."""
+        self.status_subscribers.append(subscriber)
+
+    def remove_status_subscriber(self, subscriber: Callable[[Dict[str, Any]], None]):
+        """Stop publishing status deltas to a subscriber."""
+        if subscriber in self.status_subscribers:
+            self.status_subscribers.remove(subscriber)
+
+    def _publish_status_delta(self, event: CoordinationEvent):
+        """Publish what changed with this event: the event itself plus the affected status fragments."""
+        delta: Dict[str, Any] = {
+            "type": "delta",
+            "seq": self.status_version,
+            "event": event.to_dict(),
+            "coordination": {"phase": self._coordination_phase(), "is_final_presentation": self.is_final_round},
+        }
+        if event.agent_id in self.answers_by_agent:
+            delta["agents"] = {event.agent_id: self._agent_status(event.agent_id, self.status_orchestrator)}
+        if event.event_type == EventType.VOTE_CAST:
+            delta["results"] = {"votes": dict(self._vote_counts)}
+        elif event.event_type in (EventType.FINAL_AGENT_SELECTED, EventType.FINAL_ANSWER):
+            delta["results"] = {"winner": self.final_winner, "final_answer_preview": self._final_answer_preview()}
+
+        for subscriber in list(self.status_subscribers):
+            try:
+                subscriber(delta)
+            except Exception as e:
+                logger.warning(f"Status subscriber failed, removing it: {e}")
+                self.remove_status_subscriber(subscriber)
 
     def _end_session(self):
         """Mark the end of the coordination session."""
@@ -624,171 +722,144 @@ class CoordinationTracker:
             "agent_count": len(self.agent_ids),
         }
 
+    def _coordination_phase(self) -> str:
+        """Current coordination phase: initial_answer, enforcement or presentation."""
+        if self.is_final_round:
+            return "presentation"
+        if self.votes:
+            return "enforcement"
+        return "initial_answer"
+
+    def _active_agent(self, orchestrator=None) -> Optional[str]:
+        """Agent currently expected to act: first without a vote while voting, else first without an answer."""
+        if not orchestrator or not hasattr(orchestrator, "agent_states"):
+            return None
+        any_answered = self._answer_total > 0
+        for agent_id in self.agent_ids:
+            agent_state = orchestrator.agent_states.get(agent_id)
+            if not agent_state:
+                continue
+            # In voting phase, active agent is one without a vote
+            if self.votes and not agent_state.has_voted:
+                return agent_id
+            # In answer phase, active agent is one without an answer (the first agent if no one has answered yet)
+            if not self.answers_by_agent.get(agent_id):
+                return agent_id if any_answered else self.agent_ids[0]
+        return None
+
+    def _agent_status(self, agent_id: str, orchestrator=None) -> Dict[str, Any]:
+        """Build the status.json entry of one agent from incrementally tracked state."""
+        answers = self.answers_by_agent.get(agent_id, [])
+        first_vote = self._first_vote_by_voter.get(agent_id)
+        agent_vote = None
+        if first_vote:
+            agent_vote = {
+                "voted_for_agent": first_vote.voted_for,
+                "voted_for_label": first_vote.voted_for_label,
+                "reason_preview": first_vote.reason[:100] if first_vote.reason else None,
+            }
+
+        # Determine agent status from orchestrator if available
+        status = "waiting"  # Default
+        error = None
+        agent_state = orchestrator.agent_states.get(agent_id) if orchestrator and hasattr(orchestrator, "agent_states") else None
+        if agent_state:
+            # Infer status from AgentState attributes
+            if agent_state.is_killed:
+                status = "error" if not agent_state.timeout_reason else "timeout"
+                error = {
+                    "type": "timeout" if agent_state.timeout_reason else "error",
+                    "message": agent_state.timeout_reason or "Agent was killed",
+                    "timestamp": time.time(),
+                }
+            elif agent_state.has_voted:
+                status = "voted"
+            elif agent_state.answer:
+                status = "answered"
+            elif agent_state.restart_pending:
+                status = "restarting"
+            elif answers:
+                # Answered before but working on a new one
+                status = "streaming"
+
+        # Get last activity timestamp
+        last_activity = self.start_time
+        if answers:
+            last_activity = answers[-1].timestamp
+        elif first_vote:
+            last_activity = first_vote.timestamp
+
+        return {
+            "status": status,
+            "answer_count": len(answers),
+            "latest_answer_label": answers[-1].label if answers else None,
+            "vote_cast": agent_vote,
+            "times_restarted": self.agent_rounds.get(agent_id, 0),
+            "last_activity": last_activity,
+            "error": error,
+        }
+
+    def _final_answer_preview(self) -> Optional[str]:
+        if self.final_winner and self.final_winner in self.final_answers:
+            final_content = self.final_answers[self.final_winner].content
+            return final_content[:200] if final_content else None
+        return None
+
+    def build_status(self, log_dir: Path, orchestrator=None) -> Dict[str, Any]:
+        """Build the full coordination status snapshot written to status.json.
+
+        Runs in O(agents): vote lookups and counts come from incrementally maintained state.
+
+        Args:
+            log_dir: Session log directory (used for session metadata)
+            orchestrator: Optional orchestrator reference for accessing agent states
+        """
+        log_dir = Path(log_dir)
+        elapsed = (time.time() - self.start_time) if self.start_time else 0
+
+        # Calculate completion percentage estimate
+        # Each agent needs to: (1) provide answer, (2) cast vote
+        total_steps = len(self.agent_ids) * 2
+        completed_steps = self._answer_total + len(self.votes)
+        completion_pct = min(100, int((completed_steps / total_steps) * 100)) if total_steps > 0 else 0
+
+        return {
+            "meta": {
+                "last_updated": time.time(),
+                "session_id": log_dir.name,
+                "log_dir": str(log_dir),
+                "question": self.user_prompt,
+                "start_time": self.start_time,
+                "elapsed_seconds": round(elapsed, 3),
+                "version": self.status_version,
+            },
+            "coordination": {
+                "phase": self._coordination_phase(),
+                "active_agent": self._active_agent(orchestrator),
+                "completion_percentage": completion_pct,
+                "is_final_presentation": self.is_final_round,
+            },
+            "agents": {agent_id: self._agent_status(agent_id, orchestrator) for agent_id in self.agent_ids},
+            "results": {
+                "votes": dict(self._vote_counts),
+                "winner": self.final_winner,
+                "final_answer_preview": self._final_answer_preview(),
+            },
+        }
+
     def save_status_file(self, log_dir: Path, orchestrator=None):
         """Save current coordination status to status.json for real-time monitoring.
 
-        This file is continuously updated during coordination to provide real-time
-        status monitoring for automation tools and LLM agents.
+        The snapshot is rewritten when coordination state changes; consumers that need
+        every change as it happens should follow the status feed (status_events.jsonl).
 
         Args:
             log_dir: Directory to save the status file
             orchestrator: Optional orchestrator reference for accessing agent states
         """
         try:
-            log_dir = Path(log_dir)
-            status_file = log_dir / "status.json"
-
-            # Calculate elapsed time
-            elapsed = (time.time() - self.start_time) if self.start_time else 0
-
-            # Determine current coordination phase
-            phase = "initial_answer"
-            if self.is_final_round:
-                phase = "presentation"
-            elif len(self.votes) > 0:
-                phase = "enforcement"
-
-            # Determine which agent is currently active (streaming)
-            # An agent is active if it hasn't answered yet and others have, or if it's in voting phase without a vote
-            active_agent = None
-            if orchestrator and hasattr(orchestrator, "agent_states"):
-                for agent_id in self.agent_ids:
-                    agent_state = orchestrator.agent_states.get(agent_id)
-                    if agent_state:
-                        # Agent is active if it hasn't completed its current task
-                        # Check if agent is waiting to answer or vote
-                        answers = self.answers_by_agent.get(agent_id, [])
-                        has_answer = len(answers) > 0
-
-                        # In voting phase, active agent is one without a vote
-                        if len(self.votes) > 0 and not agent_state.has_voted:
-                            active_agent = agent_id
-                            break
-                        # In answer phase, active agent is one without an answer (if others have answered)
-                        elif not has_answer and any(len(self.answers_by_agent.get(aid, [])) > 0 for aid in self.agent_ids if aid != agent_id):
-                            active_agent = agent_id
-                            break
-                        # If no one has answered yet, first agent is active
-                        elif not has_answer and not any(len(self.answers_by_agent.get(aid, [])) > 0 for aid in self.agent_ids):
-                            active_agent = self.agent_ids[0]
-                            break
-
-            # Build agent status entries with per-agent details
-            agent_statuses = {}
-            for agent_id in self.agent_ids:
-                answers = self.answers_by_agent.get(agent_id, [])
-                latest_answer_label = answers[-1].label if answers else None
-
-                # Find vote cast by this agent
-                agent_vote = None
-                for vote in self.votes:
-                    if vote.voter_id == agent_id:
-                        agent_vote = {
-                            "voted_for_agent": vote.voted_for,
-                            "voted_for_label": vote.voted_for_label,
-                            "reason_preview": vote.reason[:100] if vote.reason else None,
-                        }
-                        break
-
-                # Determine agent status from orchestrator if available
-                status = "waiting"  # Default
-                error = None
-                if orchestrator and hasattr(orchestrator, "agent_states"):
-                    agent_state = orchestrator.agent_states.get(agent_id)
-                    if agent_state:
-                        # Infer status from AgentState attributes
-                        if agent_state.is_killed:
-                            status = "error" if not agent_state.timeout_reason else "timeout"
-                        elif agent_state.has_voted:
-                            status = "voted"
-                        elif agent_state.answer:
-                            status = "answered"
-                        elif agent_state.restart_pending:
-                            status = "restarting"
-                        else:
-                            # Check if agent is currently streaming by looking at coordination phase
-                            # If we have answers from other agents but not this one, it's likely streaming
-                            if answers:
-                                status = "streaming"
-                            else:
-                                status = "waiting"
-
-                        # Check for error conditions
-                        if agent_state.is_killed:
-                            if agent_state.timeout_reason:
-                                error = {
-                                    "type": "timeout",
-                                    "message": agent_state.timeout_reason,
-                                    "timestamp": time.time(),
-                                }
-                            else:
-                                error = {
-                                    "type": "error",
-                                    "message": "Agent was killed",
-                                    "timestamp": time.time(),
-                                }
-
-                # Get last activity timestamp
-                last_activity = self.start_time
-                if answers:
-                    last_activity = answers[-1].timestamp
-                elif agent_vote and hasattr(self.votes[-1], "timestamp"):
-                    for vote in self.votes:
-                        if vote.voter_id == agent_id:
-                            last_activity = vote.timestamp
-                            break
-
-                agent_statuses[agent_id] = {
-                    "status": status,
-                    "answer_count": len(answers),
-                    "latest_answer_label": latest_answer_label,
-                    "vote_cast": agent_vote,
-                    "times_restarted": self.agent_rounds.get(agent_id, 0),
-                    "last_activity": last_activity,
-                    "error": error,
-                }
-
-            # Aggregate vote counts by answer label
-            vote_counts = {}
-            for vote in self.votes:
-                label = vote.voted_for_label
-                vote_counts[label] = vote_counts.get(label, 0) + 1
-
-            # Calculate completion percentage estimate
-            # Each agent needs to: (1) provide answer, (2) cast vote
-            total_steps = len(self.agent_ids) * 2
-            completed_steps = sum(len(answers) for answers in self.answers_by_agent.values()) + len(self.votes)
-            completion_pct = min(100, int((completed_steps / total_steps) * 100)) if total_steps > 0 else 0
-
-            # Get final answer preview if available
-            final_answer_preview = None
-            if self.final_winner and self.final_winner in self.final_answers:
-                final_content = self.final_answers[self.final_winner].content
-                final_answer_preview = final_content[:200] if final_content else None
-
-            # Build complete status data structure
-            status_data = {
-                "meta": {
-                    "last_updated": time.time(),
-                    "session_id": log_dir.name,
-                    "log_dir": str(log_dir),
-                    "question": self.user_prompt,
-                    "start_time": self.start_time,
-                    "elapsed_seconds": round(elapsed, 3),
-                },
-                "coordination": {
-                    "phase": phase,
-                    "active_agent": active_agent,
-                    "completion_percentage": completion_pct,
-                    "is_final_presentation": self.is_final_round,
-                },
-                "agents": agent_statuses,
-                "results": {
-                    "votes": vote_counts,
-                    "winner": self.final_winner,
-                    "final_answer_preview": final_answer_preview,
-                },
-            }
+            status_file = Path(log_dir) / "status.json"
+            status_data = self.build_status(log_dir, orchestrator)
 
             # Write atomically: write to temp file, then rename
             temp_file = status_file.with_suffix(".json.tmp")
@@ -836,6 +907,13 @@ class CoordinationTracker:
                 with open(snapshot_mappings_file, "w", encoding="utf-8") as f:
                     json.dump(self.snapshot_mappings, f, indent=2, default=str)
 
+            # Save pairwise answer similarity (same scores the novelty check uses)
+            labels, matrix = self.get_answer_similarity_matrix()
+            if labels:
+                similarity_file = log_dir / "answer_similarity.json"
+                with open(similarity_file, "w", encoding="utf-8") as f:
+                    json.dump({"labels": labels, "matrix": matrix}, f, indent=2)
+
             # Generate coordination table using the new table generator
             try:
                 self._generate_coordination_table(log_dir, session_data)
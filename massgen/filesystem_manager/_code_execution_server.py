@@ -9,13 +9,17 @@ them to run tests, execute scripts, and perform other command-line operations.
 Tools provided:
 - execute_command: Execute any command line command with timeout and working directory control
 
+Commands run asynchronously (see _command_runner.py): output is streamed and reported as
+MCP progress, capped with head/tail retention, and timeouts stop the whole process group,
+so several commands from the same agent can run at once without tying up server threads.
+
 Inspired by AG2's LocalCommandLineCodeExecutor sanitization patterns.
 """
 
 import argparse
+import asyncio
 import os
 import re
-import subprocess
 import sys
 import time
 from pathlib import Path
@@ -23,6 +27,11 @@ from typing import Any, Dict, List, Optional
 
 import fastmcp
 
+from massgen.filesystem_manager._command_runner import (
+    run_command,
+    run_container_command_async,
+)
+
 # Background shell execution (absolute import for fastmcp compatibility)
 from massgen.filesystem_manager.background_shell import (
     get_shell_output,
@@ -291,6 +300,12 @@ async def create_server() -> fastmcp.FastMCP:
         default=None,
         help="Path to merged skills directory for local mode (contains built-in and external skills)",
     )
+    parser.add_argument(
+        "--max-concurrent-commands",
+        type=int,
+        default=4,
+        help="Maximum number of execute_command calls running at once (default: 4)",
+    )
     args = parser.parse_args()
 
     # Create the FastMCP server
@@ -307,6 +322,7 @@ async def create_server() -> fastmcp.FastMCP:
     mcp.instance_id = args.instance_id
     mcp.enable_sudo = args.enable_sudo
     mcp.local_skills_directory = args.local_skills_directory
+    mcp.command_slots = asyncio.Semaphore(max(args.max_concurrent_commands, 1))
 
     # Initialize Docker client if Docker mode
     mcp.docker_client = None
@@ -324,10 +340,11 @@ async def create_server() -> fastmcp.FastMCP:
             raise RuntimeError(f"Failed to connect to Docker: {e}")
 
     @mcp.tool()
-    def execute_command(
+    async def execute_command(
         command: str,
         timeout: Optional[int] = None,
         work_dir: Optional[str] = None,
+        ctx: Optional[fastmcp.Context] = None,
     ) -> Dict[str, Any]:
         """
         Execute a command line command.
@@ -360,9 +377,13 @@ async def create_server() -> fastmcp.FastMCP:
             - command: str - The command that was executed
             - work_dir: str - The working directory used
 
+        Output larger than the configured limit keeps its beginning and end with a
+        truncation marker in between. Partial output is reported as progress while
+        the command runs.
+
         Security:
             - Execution is confined to allowed paths
-            - Timeout enforced to prevent infinite loops
+            - Timeout enforced to prevent infinite loops (stops the command and its children)
             - Output size limited to prevent memory exhaustion
             - Basic sanitization against dangerous commands
 
@@ -452,7 +473,14 @@ async def create_server() -> fastmcp.FastMCP:
                     "work_dir": str(work_path),
                 }
 
+            # Stream partial output to the client as progress while the command runs
+            async def report_progress(elapsed: float, output_bytes: int, last_line: str) -> None:
+                if ctx is not None:
+                    message = f"{elapsed:.0f}s, {output_bytes} bytes of output" + (f": {last_line}" if last_line else "")
+                    await ctx.report_progress(progress=elapsed, total=timeout, message=message)
+
             # Execute command based on execution mode
+            start_time = time.monotonic()
             if mcp.execution_mode == "docker":
                 # Docker mode: execute in container via Docker client
                 if not mcp.docker_client:
@@ -489,35 +517,15 @@ async def create_server() -> fastmcp.FastMCP:
                     # IMPORTANT: Use host paths directly in container
                     # Container mounts are configured to use the SAME paths as host
                     # This makes Docker completely transparent to the LLM
-
-                    # Execute command via docker exec
-                    exec_config = {
-                        "cmd": ["/bin/sh", "-c", command],
-                        "workdir": str(work_path),  # Use host path directly
-                        "stdout": True,
-                        "stderr": True,
-                    }
-
-                    start_time = time.time()
-                    exit_code, output = container.exec_run(**exec_config)
-                    execution_time = time.time() - start_time
-
-                    # Docker exec_run combines stdout and stderr
-                    output_str = output.decode("utf-8") if isinstance(output, bytes) else output
-
-                    # Truncate output if too large
-                    if len(output_str) > mcp.max_output_size:
-                        output_str = output_str[: mcp.max_output_size] + f"\n... (truncated, exceeded {mcp.max_output_size} bytes)"
-
-                    return {
-                        "success": exit_code == 0,
-                        "exit_code": exit_code,
-                        "stdout": output_str,
-                        "stderr": "",  # Docker exec_run combines stdout/stderr
-                        "execution_time": execution_time,
-                        "command": command,
-                        "work_dir": str(work_path),  # Return host path
-                    }
+                    async with mcp.command_slots:
+                        result = await run_container_command_async(
+                            container,
+                            command,
+                            workdir=str(work_path),  # Use host path directly
+                            timeout=timeout,
+                            max_output_size=mcp.max_output_size,
+                            on_progress=report_progress,
+                        )
 
                 except DockerException as e:
                     return {
@@ -525,7 +533,7 @@ async def create_server() -> fastmcp.FastMCP:
                         "exit_code": -1,
                         "stdout": "",
                         "stderr": f"Docker container error: {str(e)}",
-                        "execution_time": 0.0,
+                        "execution_time": time.monotonic() - start_time,
                         "command": command,
                         "work_dir": str(work_path),
                     }
@@ -535,76 +543,54 @@ async def create_server() -> fastmcp.FastMCP:
                         "exit_code": -1,
                         "stdout": "",
                         "stderr": f"Docker execution error: {str(e)}",
-                        "execution_time": 0.0,
+                        "execution_time": time.monotonic() - start_time,
                         "command": command,
                         "work_dir": str(work_path),
                     }
 
             else:
-                # Local mode: execute using subprocess (existing logic)
+                # Local mode: execute as an asyncio subprocess in its own process group
                 # Prepare environment (auto-detects .venv in work_dir and sets up skills)
                 env = _prepare_environment(work_path, mcp.local_skills_directory)
 
-                # Execute command
-                start_time = time.time()
-
                 try:
-                    result = subprocess.run(
-                        command,
-                        shell=True,
-                        cwd=str(work_path),
-                        timeout=timeout,
-                        capture_output=True,
-                        text=True,
-                        env=env,
-                    )
-
-                    execution_time = time.time() - start_time
-
-                    # Truncate output if too large
-                    stdout = result.stdout
-                    stderr = result.stderr
-
-                    if len(stdout) > mcp.max_output_size:
-                        stdout = stdout[: mcp.max_output_size] + f"\n... (truncated, exceeded {mcp.max_output_size} bytes)"
-
-                    if len(stderr) > mcp.max_output_size:
-                        stderr = stderr[: mcp.max_output_size] + f"\n... (truncated, exceeded {mcp.max_output_size} bytes)"
-
-                    return {
-                        "success": result.returncode == 0,
-                        "exit_code": result.returncode,
-                        "stdout": stdout,
-                        "stderr": stderr,
-                        "execution_time": execution_time,
-                        "command": command,
-                        "work_dir": str(work_path),
-                    }
-
-                except subprocess.TimeoutExpired:
-                    execution_time = time.time() - start_time
-                    return {
-                        "success": False,
-                        "exit_code": -1,
-                        "stdout": "",
-                        "stderr": f"Command timed out after {timeout} seconds",
-                        "execution_time": execution_time,
-                        "command": command,
-                        "work_dir": str(work_path),
-                    }
+                    async with mcp.command_slots:
+                        result = await run_command(
+                            command,
+                            cwd=str(work_path),
+                            env=env,
+                            timeout=timeout,
+                            max_output_size=mcp.max_output_size,
+                            on_progress=report_progress,
+                        )
 
                 except Exception as e:
-                    execution_time = time.time() - start_time
                     return {
                         "success": False,
                         "exit_code": -1,
                         "stdout": "",
                         "stderr": f"Execution error: {str(e)}",
-                        "execution_time": execution_time,
+                        "execution_time": time.monotonic() - start_time,
                         "command": command,
                         "work_dir": str(work_path),
                     }
 
+            stderr = result.stderr
+            if result.timed_out:
+                # Keep whatever the command printed before it was stopped
+                stderr = f"{stderr}\n" if stderr else ""
+                stderr += f"Command timed out after {timeout} seconds"
+
+            return {
+                "success": result.exit_code == 0,
+                "exit_code": result.exit_code,
+                "stdout": result.stdout,
+                "stderr": stderr,  # Empty in Docker mode: docker exec combines stdout/stderr
+                "execution_time": result.execution_time,
+                "command": command,
+                "work_dir": str(work_path),  # Return host path
+            }
+
         except ValueError as e:
             # Path validation error
             return {
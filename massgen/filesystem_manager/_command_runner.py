@@ -0,0 +1,365 @@
+# -*- coding: utf-8 -*-
+"""
+Asynchronous command execution with streamed, size-capped output.
+
+Shared by the code execution MCP server and DockerManager so long-running commands
+(builds, test suites) neither block a server thread nor buffer unbounded output:
+
+- Local commands run as asyncio subprocesses in their own process group; on timeout
+  or cancellation the whole group is terminated, then killed after a grace period
+- stdout/stderr are read incrementally into OutputBuffer, which keeps the first and
+  last bytes of a stream once its cap is exceeded (failures usually sit at the end)
+- An optional progress callback receives the elapsed time, bytes seen so far and the
+  latest output line at a fixed interval while the command runs
+- Container commands stream from ``docker exec`` and are bounded by coreutils
+  ``timeout`` inside the container, which signals the command's whole process group;
+  a host-side deadline stops waiting if the container does not enforce it (no
+  ``timeout`` in the image, or a stalled ``docker exec``)
+"""
+
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, List, Optional
+
+from massgen.logger_config import logger
+
+WIN32 = sys.platform == "win32"
+
+READ_CHUNK_SIZE = 64 * 1024
+DEFAULT_MAX_OUTPUT_SIZE = 1024 * 1024
+PROGRESS_INTERVAL = 2.0
+KILL_GRACE_PERIOD = 2.0
+# Background children can inherit the output pipes and keep them open after the shell exits
+DRAIN_TIMEOUT = 2.0
+MAX_PROGRESS_LINE = 200
+
+# Exit statuses of coreutils timeout: the command was signalled / had to be killed
+CONTAINER_TIMEOUT_EXIT_CODES = (124, 137)
+
+# progress(elapsed_seconds, output_bytes, last_output_line)
+ProgressCallback = Callable[[float, int, str], Awaitable[None]]
+
+
+class OutputBuffer:
+    """Capture of one output stream that keeps its head and tail once ``limit`` bytes are exceeded."""
+
+    def __init__(self, limit: int = DEFAULT_MAX_OUTPUT_SIZE):
+        self.limit = max(int(limit), 0)
+        self._head_limit = self.limit // 2
+        self._tail_limit = self.limit - self._head_limit
+        self._head = bytearray()
+        self._tail = bytearray()
+        self.total_bytes = 0
+        self.last_line = ""
+        self.updated_at = 0.0
+
+    @property
+    def truncated(self) -> bool:
+        return self.total_bytes > self.limit
+
+    def append(self, data: bytes) -> None:
+        if not data:
+            return
+        self.total_bytes += len(data)
+        self.updated_at = time.monotonic()
+        self._note_last_line(data)
+
+        room = self._head_limit - len(self._head)
+        if room > 0:
+            self._head += data[:room]
+            data = data[room:]
+        if data and self._tail_limit:
+            self._tail += data
+            # Trim lazily so a stream of small chunks does not shift the buffer on every read
+            if len(self._tail) > 2 * self._tail_limit:
+                del self._tail[: len(self._tail) - self._tail_limit]
+
+    def text(self) -> str:
+        tail = bytes(self._tail[-self._tail_limit :]) if self._tail_limit else b""
+        if not self.truncated:
+            return (bytes(self._head) + tail).decode("utf-8", errors="replace")
+        omitted = self.total_bytes - len(self._head) - len(tail)
+        marker = f"\n... (truncated, exceeded {self.limit} bytes: {omitted} of {self.total_bytes} bytes omitted) ...\n"
+        return bytes(self._head).decode("utf-8", errors="replace") + marker + tail.decode("utf-8", errors="replace")
+
+    def _note_last_line(self, data: bytes) -> None:
+        # Progress bars redraw with \r, so treat it as a line break too
+        lines = data.decode("utf-8", errors="replace").replace("\r", "\n").strip().rsplit("\n", 1)
+        if lines[-1].strip():
+            self.last_line = lines[-1].strip()[-MAX_PROGRESS_LINE:]
+
+
+@dataclass
+class CommandResult:
+    """Outcome of a command run through this module."""
+
+    exit_code: int
+    stdout: str
+    stderr: str
+    execution_time: float
+    timed_out: bool = False
+    truncated: bool = False
+
+
+def _latest_line(buffers: List[OutputBuffer]) -> str:
+    return max(buffers, key=lambda buffer: buffer.updated_at).last_line
+
+
+async def _report_progress(on_progress: ProgressCallback, interval: float, start_time: float, buffers: List[OutputBuffer]) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await on_progress(time.monotonic() - start_time, sum(buffer.total_bytes for buffer in buffers), _latest_line(buffers))
+        except Exception as e:
+            logger.debug(f"[CommandRunner] Progress callback failed: {e}")
+
+
+async def _pump(stream: asyncio.StreamReader, buffer: OutputBuffer) -> None:
+    while True:
+        chunk = await stream.read(READ_CHUNK_SIZE)
+        if not chunk:
+            return
+        buffer.append(chunk)
+
+
+def _signal_group(pid: int, sig: int) -> None:
+    try:
+        os.killpg(pid, sig)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+async def terminate_process_group(process: asyncio.subprocess.Process) -> None:
+    """Stop a process started by ``run_command`` together with everything it spawned."""
+    if process.returncode is not None:
+        return
+    if WIN32:
+        # /T ends the whole tree started by cmd.exe
+        killer = await asyncio.create_subprocess_exec(
+            "taskkill",
+            "/F",
+            "/T",
+            "/PID",
+            str(process.pid),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        await killer.wait()
+    else:
+        # The shell leads its own session, so its pid is also the process group id
+        _signal_group(process.pid, signal.SIGTERM)
+        try:
+            await asyncio.wait_for(process.wait(), KILL_GRACE_PERIOD)
+        except asyncio.TimeoutError:
+            pass
+        _signal_group(process.pid, signal.SIGKILL)
+    await process.wait()
+
+
+async def run_command(
+    command: str,
+    cwd: Optional[str] = None,
+    env: Optional[dict] = None,
+    timeout: Optional[float] = None,
+    max_output_size: int = DEFAULT_MAX_OUTPUT_SIZE,
+    on_progress: Optional[ProgressCallback] = None,
+    progress_interval: float = PROGRESS_INTERVAL,
+) -> CommandResult:
+    """
+    Run a shell command without blocking the event loop.
+
+    Args:
+        command: Shell command line
+        cwd: Working directory
+        env: Environment for the command (defaults to the current environment)
+        timeout: Seconds before the command's process group is terminated (None = no limit)
+        max_output_size: Byte cap per stream; beyond it only the head and tail are kept
+        on_progress: Awaitable callback invoked every ``progress_interval`` seconds
+        progress_interval: Seconds between progress callbacks
+
+    Returns:
+        CommandResult; ``exit_code`` is -1 when the command timed out
+    """
+    start_time = time.monotonic()
+    stdout, stderr = OutputBuffer(max_output_size), OutputBuffer(max_output_size)
+    group_kwargs = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP} if WIN32 else {"start_new_session": True}
+
+    process = await asyncio.create_subprocess_shell(
+        command,
+        cwd=cwd,
+        env=env,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        **group_kwargs,
+    )
+    readers = [asyncio.create_task(_pump(process.stdout, stdout)), asyncio.create_task(_pump(process.stderr, stderr))]
+    ticker = asyncio.create_task(_report_progress(on_progress, progress_interval, start_time, [stdout, stderr])) if on_progress else None
+
+    timed_out = False
+    try:
+        await asyncio.wait_for(process.wait(), timeout)
+    except asyncio.TimeoutError:
+        timed_out = True
+        await terminate_process_group(process)
+    except asyncio.CancelledError:
+        await asyncio.shield(terminate_process_group(process))
+        for reader in readers:
+            reader.cancel()
+        raise
+    finally:
+        if ticker is not None:
+            ticker.cancel()
+
+    _, pending = await asyncio.wait(readers, timeout=DRAIN_TIMEOUT)
+    for reader in pending:
+        reader.cancel()
+
+    return CommandResult(
+        exit_code=-1 if timed_out else process.returncode,
+        stdout=stdout.text(),
+        stderr=stderr.text(),
+        execution_time=time.monotonic() - start_time,
+        timed_out=timed_out,
+        truncated=stdout.truncated or stderr.truncated,
+    )
+
+
+def container_exec_argv(command: str, timeout: Optional[float] = None) -> List[str]:
+    """
+    Build the ``docker exec`` argv for a shell command.
+
+    With a timeout the command runs under coreutils ``timeout``, which puts it in its
+    own process group and signals the whole group when the limit is hit. Images without
+    a GNU-compatible ``timeout`` run the command unbounded rather than failing.
+    """
+    if not timeout:
+        return ["/bin/sh", "-c", command]
+    limit = format(float(timeout), "g")
+    script = f'if timeout -k 1 1 true 2>/dev/null; then exec timeout -k {KILL_GRACE_PERIOD:g} {limit} /bin/sh -c "$1"; else exec /bin/sh -c "$1"; fi'
+    return ["/bin/sh", "-c", script, "massgen-exec", command]
+
+
+def container_host_deadline(timeout: Optional[float]) -> Optional[float]:
+    """Seconds the host waits for a container command before giving up on the in-container timeout."""
+    return timeout + 2 * KILL_GRACE_PERIOD + 5 if timeout else None
+
+
+def _host_timeout_result(output: OutputBuffer, start_time: float) -> CommandResult:
+    return CommandResult(
+        exit_code=-1,
+        stdout=output.text(),
+        stderr="",
+        execution_time=time.monotonic() - start_time,
+        timed_out=True,
+        truncated=output.truncated,
+    )
+
+
+def _exec_in_container(container: Any, command: str, workdir: Optional[str], timeout: Optional[float], output: OutputBuffer) -> CommandResult:
+    """Consume one ``docker exec`` stream to completion (blocking, no host-side deadline)."""
+    api = container.client.api
+    start_time = time.monotonic()
+
+    exec_id = api.exec_create(container.id, container_exec_argv(command, timeout), stdout=True, stderr=True, workdir=workdir)["Id"]
+    for chunk in api.exec_start(exec_id, stream=True):
+        output.append(chunk)
+    exit_code = api.exec_inspect(exec_id).get("ExitCode")
+
+    execution_time = time.monotonic() - start_time
+    timed_out = bool(timeout) and exit_code in CONTAINER_TIMEOUT_EXIT_CODES and execution_time >= timeout
+    return CommandResult(
+        exit_code=-1 if timed_out else exit_code,
+        stdout=output.text(),
+        stderr="",
+        execution_time=execution_time,
+        timed_out=timed_out,
+        truncated=output.truncated,
+    )
+
+
+def run_container_command(
+    container: Any,
+    command: str,
+    workdir: Optional[str] = None,
+    timeout: Optional[float] = None,
+    max_output_size: int = DEFAULT_MAX_OUTPUT_SIZE,
+    output: Optional[OutputBuffer] = None,
+) -> CommandResult:
+    """
+    Run a shell command in a Docker container, streaming its output (blocking).
+
+    Docker exec combines stdout and stderr, so everything is returned as stdout.
+    With a timeout the stream is consumed in a daemon thread and the caller waits
+    at most ``container_host_deadline(timeout)`` seconds for it.
+
+    Args:
+        container: docker-py Container
+        command: Shell command line
+        workdir: Working directory inside the container
+        timeout: Seconds before the command is stopped inside the container
+        max_output_size: Byte cap; beyond it only the head and tail are kept
+        output: Buffer to stream into (lets callers observe progress from another task)
+
+    Returns:
+        CommandResult; ``exit_code`` is -1 when the command timed out
+    """
+    output = output if output is not None else OutputBuffer(max_output_size)
+    if not timeout:
+        return _exec_in_container(container, command, workdir, timeout, output)
+
+    start_time = time.monotonic()
+    outcome: dict = {}
+
+    def consume() -> None:
+        try:
+            outcome["result"] = _exec_in_container(container, command, workdir, timeout, output)
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=consume, name="massgen-docker-exec", daemon=True)
+    thread.start()
+    thread.join(container_host_deadline(timeout))
+    if thread.is_alive():
+        logger.warning(f"[CommandRunner] Container did not stop the command within {timeout}s; no longer waiting for it")
+        return _host_timeout_result(output, start_time)
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
+async def run_container_command_async(
+    container: Any,
+    command: str,
+    workdir: Optional[str] = None,
+    timeout: Optional[float] = None,
+    max_output_size: int = DEFAULT_MAX_OUTPUT_SIZE,
+    on_progress: Optional[ProgressCallback] = None,
+    progress_interval: float = PROGRESS_INTERVAL,
+) -> CommandResult:
+    """
+    Async wrapper around ``run_container_command`` with progress reporting.
+
+    docker-py streams are blocking, so the exec is consumed in a worker thread. The
+    in-container timeout ends that thread; the host only stops waiting if the container
+    fails to enforce it.
+    """
+    start_time = time.monotonic()
+    output = OutputBuffer(max_output_size)
+    ticker = asyncio.create_task(_report_progress(on_progress, progress_interval, start_time, [output])) if on_progress else None
+    try:
+        return await asyncio.wait_for(
+            asyncio.to_thread(_exec_in_container, container, command, workdir, timeout, output),
+            container_host_deadline(timeout),
+        )
+    except asyncio.TimeoutError:
+        return _host_timeout_result(output, start_time)
+    finally:
+        if ticker is not None:
+            ticker.cancel()
@@ -8,11 +8,11 @@ while keeping MCP servers on the host.
 """
 
 import os
-import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from ..logger_config import logger
+from ._command_runner import run_container_command
 
 # Check if docker is available
 try:
@@ -715,7 +715,7 @@ class DockerManager:
             agent_id: Agent identifier
             command: Command to execute (as string, will be run in shell)
             workdir: Working directory (uses host path - same path is mounted in container)
-            timeout: Command timeout in seconds (implemented using threading)
+            timeout: Command timeout in seconds (enforced inside the container)
 
         Returns:
             Dictionary with:
@@ -739,77 +739,23 @@ class DockerManager:
         effective_workdir = workdir if workdir else None
 
         try:
-            # Run command through shell to support pipes, redirects, etc.
-            exec_config = {
-                "cmd": ["/bin/sh", "-c", command],
-                "stdout": True,
-                "stderr": True,
-            }
-
-            if effective_workdir:
-                exec_config["workdir"] = effective_workdir
-
             logger.debug(f"🔧 [Docker] Executing in container {container.short_id}: {command}")
 
-            start_time = time.time()
-
-            # Handle timeout using threading
-            if timeout:
-                import threading
-
-                result_container = {}
-                exception_container = {}
-
-                def run_exec():
-                    try:
-                        result_container["data"] = container.exec_run(**exec_config)
-                    except Exception as e:
-                        exception_container["error"] = e
-
-                thread = threading.Thread(target=run_exec)
-                thread.daemon = True
-                thread.start()
-                thread.join(timeout=timeout)
-
-                execution_time = time.time() - start_time
-
-                if thread.is_alive():
-                    # Thread is still running - timeout occurred
-                    logger.warning(f"⚠️ [Docker] Command timed out after {timeout} seconds")
-                    return {
-                        "success": False,
-                        "exit_code": -1,
-                        "stdout": "",
-                        "stderr": f"Command timed out after {timeout} seconds",
-                        "execution_time": execution_time,
-                        "command": command,
-                        "work_dir": effective_workdir or "(container default)",
-                    }
-
-                if "error" in exception_container:
-                    raise exception_container["error"]
-
-                if "data" not in result_container:
-                    raise RuntimeError("Command execution failed - no result data")
-
-                exit_code, output = result_container["data"]
-            else:
-                # No timeout - execute directly
-                exit_code, output = container.exec_run(**exec_config)
-                execution_time = time.time() - start_time
-
-            # Docker exec_run combines stdout and stderr
-            output_str = output.decode("utf-8") if isinstance(output, bytes) else output
+            # Output is streamed and capped; the timeout is enforced inside the container, which stops
+            # the command's whole process group, with a host-side deadline in case the container does not
+            result = run_container_command(container, command, workdir=effective_workdir, timeout=timeout)
 
-            if exit_code != 0:
-                logger.debug(f"⚠️ [Docker] Command exited with code {exit_code}")
+            if result.timed_out:
+                logger.warning(f"⚠️ [Docker] Command timed out after {timeout} seconds")
+            elif result.exit_code != 0:
+                logger.debug(f"⚠️ [Docker] Command exited with code {result.exit_code}")
 
             return {
-                "success": exit_code == 0,
-                "exit_code": exit_code,
-                "stdout": output_str,
-                "stderr": "",  # Docker exec_run combines stdout/stderr
-                "execution_time": execution_time,
+                "success": result.exit_code == 0,
+                "exit_code": result.exit_code,
+                "stdout": result.stdout,
+                "stderr": f"Command timed out after {timeout} seconds" if result.timed_out else "",  # Docker exec combines stdout/stderr
+                "execution_time": result.execution_time,
                 "command": command,
                 "work_dir": effective_workdir or "(container default)",
             }
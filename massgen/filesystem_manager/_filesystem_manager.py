@@ -15,11 +15,12 @@ The manager is backend-agnostic and works with any backend that has filesystem
 MCP tools configured.
 """
 
+import asyncio
 import os
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..logger_config import get_log_session_dir, logger
 from ..mcp_tools.client import HookType
@@ -27,6 +28,11 @@ from . import _code_execution_server as ce_module
 from . import _workspace_tools_server as wc_module
 from ._base import Permission
 from ._path_permission_manager import PathPermissionManager
+from ._snapshot_store import SnapshotStore
+from ._snapshot_sync import sync_tree
+
+# Directory under snapshot_storage holding the content-addressed blob store
+SNAPSHOT_STORE_DIRNAME = ".store"
 
 
 class FilesystemManager:
@@ -155,6 +161,8 @@ class FilesystemManager:
 
         # Orchestration-specific paths (set by setup_orchestration_paths)
         self.snapshot_storage = None  # Path for storing workspace snapshots
+        self.snapshot_store: Optional[SnapshotStore] = None  # Content-addressed blobs shared by all agents' snapshots
+        self._last_log_snapshot_dir: Optional[Path] = None  # Previous log snapshot, source of hard links
         self.agent_temporary_workspace = None  # Full path for this specific agent's temporary workspace
 
         # Track whether we're using a temporary workspace
@@ -189,6 +197,7 @@ class FilesystemManager:
         if snapshot_storage and self.agent_id:
             self.snapshot_storage = Path(snapshot_storage) / self.agent_id
             self.snapshot_storage.mkdir(parents=True, exist_ok=True)
+            self.snapshot_store = SnapshotStore(Path(snapshot_storage) / SNAPSHOT_STORE_DIRNAME)
 
         # Setup temporary workspace for context sharing
         if agent_temporary_workspace and self.agent_id:
@@ -743,16 +752,22 @@ class FilesystemManager:
         """
         Save a snapshot of the workspace. Always saves to snapshot_storage if available (keeping only most recent).
         Additionally saves to log directories if logging is enabled.
-        Then, clear the workspace so it is ready for next execution.
+
+        File contents are added to the content-addressed snapshot store (when snapshot_storage is
+        configured) and the snapshot directories are hard links into it, so identical files are
+        stored once across agents and rounds. Without a store, snapshots are incremental copies.
+        The filesystem work runs in a worker thread so other agents keep streaming while a large
+        workspace is being saved.
 
         Args:
             timestamp: Optional timestamp to use for the snapshot directory (if not provided, generates one)
             is_final: If True, save as final snapshot for presentation
-
-        TODO: reimplement without 'shutil' and 'os' operations for true async, though we may not need to worry about race conditions here since only one agent writes at a time
         """
         logger.info(f"[FilesystemManager.save_snapshot] Called for agent_id={self.agent_id}, is_final={is_final}, snapshot_storage={self.snapshot_storage}")
+        await asyncio.to_thread(self._save_snapshot_sync, timestamp, is_final)
 
+    def _save_snapshot_sync(self, timestamp: Optional[str], is_final: bool) -> None:
+        """Blocking part of save_snapshot, run off the event loop."""
         # Use current workspace as source
         source_dir = self.cwd
         source_path = Path(source_dir)
@@ -766,24 +781,19 @@ class FilesystemManager:
             return
 
         try:
+            # Store unique file contents once; snapshot directories become hard links into the store
+            manifest = self.snapshot_store.put_tree(source_path) if self.snapshot_store else None
+
             # --- 1. Save to snapshot_storage ---
             if self.snapshot_storage:
-                if self.snapshot_storage.exists():
-                    shutil.rmtree(self.snapshot_storage)
-                self.snapshot_storage.mkdir(parents=True, exist_ok=True)
-
-                items_copied = 0
-                for item in source_path.iterdir():
-                    if item.is_symlink():
-                        logger.warning(f"[FilesystemManager.save_snapshot] Skipping symlink: {item}")
-                        continue
-                    if item.is_file():
-                        shutil.copy2(item, self.snapshot_storage / item.name)
-                    elif item.is_dir():
-                        shutil.copytree(item, self.snapshot_storage / item.name)
-                    items_copied += 1
-
-                logger.info(f"[FilesystemManager] Saved snapshot with {items_copied} items to {self.snapshot_storage}")
+                if manifest is not None:
+                    stats = self.snapshot_store.materialize(manifest, self.snapshot_storage)
+                    self.snapshot_store.save_manifest(f"latest/{self.agent_id}", manifest)
+                else:
+                    stats = sync_tree(source_path, self.snapshot_storage)
+                logger.info(
+                    f"[FilesystemManager] Saved snapshot with {stats.total_files} files to {self.snapshot_storage} (copied={stats.copied}, unchanged={stats.unchanged}, removed={stats.removed})",
+                )
 
             # --- 2. Save to log directories ---
             log_session_dir = get_log_session_dir()
@@ -792,27 +802,27 @@ class FilesystemManager:
                     dest_dir = log_session_dir / "final" / self.agent_id / "workspace"
                     if dest_dir.exists():
                         shutil.rmtree(dest_dir)
-                    dest_dir.mkdir(parents=True, exist_ok=True)
                     logger.info(f"[FilesystemManager.save_snapshot] Final log snapshot dest_dir: {dest_dir}")
                 else:
                     if not timestamp:
                         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
                     dest_dir = log_session_dir / self.agent_id / timestamp / "workspace"
-                    dest_dir.mkdir(parents=True, exist_ok=True)
                     logger.info(f"[FilesystemManager.save_snapshot] Regular log snapshot dest_dir: {dest_dir}")
 
-                items_copied = 0
-                for item in source_path.iterdir():
-                    if item.is_symlink():
-                        logger.warning(f"[FilesystemManager.save_snapshot] Skipping symlink: {item}")
-                        continue
-                    if item.is_file():
-                        shutil.copy2(item, dest_dir / item.name)
-                    elif item.is_dir():
-                        shutil.copytree(item, dest_dir / item.name, dirs_exist_ok=True)
-                    items_copied += 1
+                if manifest is not None:
+                    stats = self.snapshot_store.materialize(manifest, dest_dir)
+                    self.snapshot_store.save_manifest(f"{self.agent_id}/{'final' if is_final else timestamp}", manifest)
+                else:
+                    previous_dir = self._last_log_snapshot_dir
+                    if previous_dir is not None and (previous_dir == dest_dir or not previous_dir.is_dir()):
+                        previous_dir = None
+                    stats = sync_tree(source_path, dest_dir, link_from=previous_dir)
+                self._last_log_snapshot_dir = dest_dir
 
-                logger.info(f"[FilesystemManager] Saved {'final' if is_final else 'regular'} " f"log snapshot with {items_copied} items to {dest_dir}")
+                logger.info(
+                    f"[FilesystemManager] Saved {'final' if is_final else 'regular'} log snapshot with {stats.total_files} files to {dest_dir} "
+                    f"(copied={stats.copied}, linked={stats.linked}, unchanged={stats.unchanged})",
+                )
 
         except Exception as e:
             logger.exception(f"[FilesystemManager.save_snapshot] Snapshot failed: {e}")
@@ -903,7 +913,9 @@ class FilesystemManager:
         Copy snapshots from multiple agents to temporary workspace for context sharing.
 
         This method is called by the orchestrator before starting an agent that needs context from others.
-        It copies the latest snapshots from log directories to a temporary workspace.
+        It copies the latest snapshots from log directories to a temporary workspace. Snapshots recorded
+        in the snapshot store are copied from its blobs as writable files; in both cases only files that
+        changed since the previous restore are rewritten. The work runs in a worker thread.
 
         Args:
             all_snapshots: Dictionary mapping agent_id to snapshot path (from log directories)
@@ -911,29 +923,44 @@ class FilesystemManager:
 
         Returns:
             Path to the temporary workspace with restored snapshots
-
-        TODO: reimplement without 'shutil' and 'os' operations for true async
         """
         if not self.agent_temporary_workspace:
             return None
 
-        # Clear existing temporary workspace
-        if self.agent_temporary_workspace.exists():
-            shutil.rmtree(self.agent_temporary_workspace)
+        await asyncio.to_thread(self._copy_snapshots_to_temp_workspace_sync, all_snapshots, agent_mapping)
+        return self.agent_temporary_workspace
+
+    def _copy_snapshots_to_temp_workspace_sync(self, all_snapshots: Dict[str, Path], agent_mapping: Dict[str, str]) -> None:
+        """Blocking part of copy_snapshots_to_temp_workspace, run off the event loop."""
         self.agent_temporary_workspace.mkdir(parents=True, exist_ok=True)
 
-        # Copy all snapshots using anonymous IDs
+        # Work out which anonymous directories the temp workspace should contain
+        expected: Dict[str, Tuple[str, Path]] = {}
         for agent_id, snapshot_path in all_snapshots.items():
-            if snapshot_path.exists() and snapshot_path.is_dir():
+            if snapshot_path.exists() and snapshot_path.is_dir() and any(snapshot_path.iterdir()):
                 # Use anonymous ID for destination directory
-                anon_id = agent_mapping.get(agent_id, agent_id)
-                dest_dir = self.agent_temporary_workspace / anon_id
-
-                # Copy snapshot content if not empty
-                if any(snapshot_path.iterdir()):
-                    shutil.copytree(snapshot_path, dest_dir, dirs_exist_ok=True)
-
-        return self.agent_temporary_workspace
+                expected[agent_mapping.get(agent_id, agent_id)] = (agent_id, snapshot_path)
+
+        # Drop anything left over from a previous restore
+        for item in self.agent_temporary_workspace.iterdir():
+            if item.name in expected and item.is_dir() and not item.is_symlink():
+                continue
+            if item.is_dir() and not item.is_symlink():
+                shutil.rmtree(item)
+            else:
+                item.unlink()
+
+        # Restore snapshot content from the store when a manifest describes it, otherwise sync a copy
+        for anon_id, (agent_id, snapshot_path) in expected.items():
+            dest_dir = self.agent_temporary_workspace / anon_id
+            manifest = None
+            if self.snapshot_store and snapshot_path.parent == self.snapshot_store.root.parent:
+                manifest = self.snapshot_store.load_manifest(f"latest/{agent_id}")
+            if manifest is not None:
+                # Writable copies: agents can write to their temporary workspace, so it must not share blobs
+                self.snapshot_store.materialize(manifest, dest_dir, link=False)
+            else:
+                sync_tree(snapshot_path, dest_dir)
 
     def _log_workspace_contents(self, workspace_path: Path, workspace_name: str, context: str = "") -> None:
         """
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+Compiled lookup index for PathPermissionManager.
+
+The permission hook runs before every filesystem tool call. Resolving a path used
+to scan every ManagedPath several times (exclusions, protected paths, file paths,
+then directory paths re-sorted by depth), which is O(n log n) per call for agents
+with many context paths. ``PathIndex`` compiles the managed paths into a trie over
+path parts once, so a lookup walks the parts of the queried path a single time and
+costs O(depth) regardless of how many paths are managed.
+
+The index holds references to the ManagedPath objects, not copies of their
+permissions, but callers still rebuild it whenever paths are added or permissions
+change so that cached results never outlive the configuration they came from.
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, Optional
+
+from ._base import Permission
+
+if TYPE_CHECKING:
+    from ._path_permission_manager import ManagedPath
+
+
+class _TrieNode:
+    """One path component in the index."""
+
+    __slots__ = ("children", "dir_entry", "file_entry", "is_workspace", "is_protected")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.dir_entry: Optional["ManagedPath"] = None  # Directory managed path rooted here
+        self.file_entry: Optional["ManagedPath"] = None  # File-specific managed path at exactly this path
+        self.is_workspace = False  # A workspace root (overrides default exclusions below it)
+        self.is_protected = False  # A protected path (read-only for itself and everything below it)
+
+
+class PathIndex:
+    """
+    Trie over the parts of all managed paths.
+
+    Lookup rules mirror the original linear scan:
+    1. Paths containing an excluded part are read-only unless inside a workspace.
+    2. Protected paths are read-only.
+    3. File-specific context paths match only their exact path and win over directories.
+    4. Otherwise the deepest containing directory wins; file_context_parent entries
+       never grant access. Ties go to the path that was added first.
+    """
+
+    def __init__(self, managed_paths: Iterable["ManagedPath"], excluded_parts: Iterable[str]):
+        self._root = _TrieNode()
+        self._excluded_parts = frozenset(excluded_parts)
+
+        for managed_path in managed_paths:
+            node = self._node_for(managed_path.path)
+            if managed_path.is_file:
+                if node.file_entry is None:
+                    node.file_entry = managed_path
+                # A file context is only protected if the file itself falls under one of its
+                # protected paths, since contains() never matches its siblings.
+                if any(_is_within(managed_path.path, protected) for protected in managed_path.protected_paths):
+                    node.is_protected = True
+                continue
+
+            if managed_path.path_type == "workspace":
+                node.is_workspace = True
+            if managed_path.path_type != "file_context_parent" and node.dir_entry is None:
+                node.dir_entry = managed_path
+            for protected in managed_path.protected_paths:
+                if _is_within(protected, managed_path.path):
+                    self._node_for(protected).is_protected = True
+
+    def _node_for(self, path: Path) -> _TrieNode:
+        node = self._root
+        for part in path.parts:
+            child = node.children.get(part)
+            if child is None:
+                child = node.children[part] = _TrieNode()
+            node = child
+        return node
+
+    def _walk(self, resolved_path: Path):
+        """Return (deepest dir entry, exact file entry, in_workspace, is_protected) for a path."""
+        node = self._root
+        dir_entry = None
+        in_workspace = False
+        is_protected = False
+        for part in resolved_path.parts:
+            node = node.children.get(part)
+            if node is None:
+                return dir_entry, None, in_workspace, is_protected
+            if node.dir_entry is not None:
+                dir_entry = node.dir_entry
+            in_workspace = in_workspace or node.is_workspace
+            is_protected = is_protected or node.is_protected
+        return dir_entry, node.file_entry, in_workspace, is_protected
+
+    def lookup(self, resolved_path: Path) -> Optional["ManagedPath"]:
+        """Return the managed path that grants access to ``resolved_path``, if any."""
+        dir_entry, file_entry, _, _ = self._walk(resolved_path)
+        return file_entry or dir_entry
+
+    def is_excluded(self, resolved_path: Path) -> bool:
+        """Check whether a path hits a default exclusion outside of any workspace."""
+        if self._excluded_parts.isdisjoint(resolved_path.parts):
+            return False
+        return not self._walk(resolved_path)[2]
+
+    def get_permission(self, resolved_path: Path) -> Optional[Permission]:
+        """Return the effective permission for ``resolved_path``, or None if it is unmanaged."""
+        dir_entry, file_entry, in_workspace, is_protected = self._walk(resolved_path)
+        if not in_workspace and not self._excluded_parts.isdisjoint(resolved_path.parts):
+            return Permission.READ
+        if is_protected:
+            return Permission.READ
+        entry = file_entry or dir_entry
+        return entry.permission if entry is not None else None
+
+
+class PermissionLRU:
+    """Bounded least-recently-used cache of resolved path -> permission."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Path, Optional[Permission]]" = OrderedDict()
+
+    def __contains__(self, path: Path) -> bool:
+        return path in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, path: Path) -> Optional[Permission]:
+        self._data.move_to_end(path)
+        return self._data[path]
+
+    def put(self, path: Path, permission: Optional[Permission]) -> None:
+        self._data[path] = permission
+        self._data.move_to_end(path)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+def _is_within(path: Path, root: Path) -> bool:
+    return path == root or root in path.parents
@@ -10,6 +10,7 @@ from ..logger_config import logger
 from ..mcp_tools.hooks import HookResult
 from ._base import Permission
 from ._file_operation_tracker import FileOperationTracker
+from ._path_index import PathIndex, PermissionLRU
 from ._workspace_tools_server import get_copy_file_pairs
 
 
@@ -90,6 +91,9 @@ class PathPermissionManager:
         "massgen_logs",
     ]
 
+    # Maximum number of resolved paths kept in the permission lookup cache
+    PERMISSION_CACHE_SIZE = 4096
+
     # Binary file extensions that should not be read by text-based tools
     # These files should be handled by specialized tools (understand_image, understand_video, etc.)
     BINARY_FILE_EXTENSIONS = {
@@ -170,8 +174,9 @@ class PathPermissionManager:
         self.managed_paths: List[ManagedPath] = []
         self.context_write_access_enabled = context_write_access_enabled
 
-        # Cache for quick permission lookups
-        self._permission_cache: Dict[Path, Permission] = {}
+        # Compiled path index (rebuilt lazily after managed paths change) and bounded lookup cache
+        self._path_index: Optional[PathIndex] = None
+        self._permission_cache = PermissionLRU(self.PERMISSION_CACHE_SIZE)
 
         # File operation tracker for read-before-delete enforcement
         self.file_operation_tracker = FileOperationTracker(enforce_read_before_delete=enforce_read_before_delete)
@@ -201,8 +206,7 @@ class PathPermissionManager:
         managed_path = ManagedPath(path=path.resolve(), permission=permission, path_type=path_type)
 
         self.managed_paths.append(managed_path)
-        # Clear cache when adding new paths
-        self._permission_cache.clear()
+        self._invalidate_path_index()
 
         logger.info(f"[PathPermissionManager] Added {path_type} path: {path} ({permission.value})")
 
@@ -253,8 +257,7 @@ class PathPermissionManager:
 
         logger.info(f"[PathPermissionManager] Updated context path permissions based on context_write_access_enabled={enabled}, now is {self.managed_paths=}")
 
-        # Clear permission cache to force recalculation
-        self._permission_cache.clear()
+        self._invalidate_path_index()
 
     def add_context_paths(self, context_paths: List[Dict[str, Any]]) -> None:
         """
@@ -363,7 +366,7 @@ class PathPermissionManager:
                 protected_paths=protected_paths,
             )
             self.managed_paths.append(managed_path)
-            self._permission_cache.clear()
+            self._invalidate_path_index()
 
             path_type_str = "file" if is_file else "directory"
             protected_count = len(protected_paths)
@@ -387,9 +390,20 @@ class PathPermissionManager:
             # Previous turn paths are always read-only
             managed_path = ManagedPath(path=path, permission=Permission.READ, path_type="previous_turn", will_be_writable=False)
             self.managed_paths.append(managed_path)
-            self._permission_cache.clear()
+            self._invalidate_path_index()
             logger.info(f"[PathPermissionManager] Added previous turn path: {path} (read-only)")
 
+    def _invalidate_path_index(self) -> None:
+        """Drop the compiled path index and cached lookups after managed paths change."""
+        self._path_index = None
+        self._permission_cache.clear()
+
+    def _get_path_index(self) -> PathIndex:
+        """Return the compiled path index, building it on first use after a change."""
+        if self._path_index is None:
+            self._path_index = PathIndex(self.managed_paths, self.DEFAULT_EXCLUDED_PATTERNS)
+        return self._path_index
+
     def _is_excluded_path(self, path: Path) -> bool:
         """
         Check if a path matches any default excluded patterns.
@@ -403,23 +417,14 @@ class PathPermissionManager:
         Returns:
             True if path should be excluded from write access
         """
-        # First check if this path is inside a workspace - workspaces override exclusions
-        for managed_path in self.managed_paths:
-            if managed_path.path_type == "workspace" and managed_path.contains(path):
-                return False
-
-        # Now check if path contains any excluded patterns
-        parts = path.parts
-        for part in parts:
-            if part in self.DEFAULT_EXCLUDED_PATTERNS:
-                return True
-        return False
+        return self._get_path_index().is_excluded(path.resolve())
 
     def get_permission(self, path: Path) -> Optional[Permission]:
         """
         Get permission level for a path.
 
-        Now handles file-specific context paths correctly.
+        Now handles file-specific context paths correctly. Lookups go through a compiled
+        trie of the managed paths (O(depth)) and a bounded LRU cache.
 
         Args:
             path: Path to check
@@ -431,60 +436,19 @@ class PathPermissionManager:
 
         # Check cache first
         if resolved_path in self._permission_cache:
-            logger.debug(f"[PathPermissionManager] Permission cache hit for {resolved_path}: {self._permission_cache[resolved_path].value}")
-            return self._permission_cache[resolved_path]
-
-        # Check if this is an excluded path (always read-only)
-        if self._is_excluded_path(resolved_path):
-            logger.info(f"[PathPermissionManager] Path {resolved_path} matches excluded pattern, forcing read-only")
-            self._permission_cache[resolved_path] = Permission.READ
-            return Permission.READ
-
-        # Check if this path is protected (always read-only, takes precedence over context permissions)
-        for managed_path in self.managed_paths:
-            if managed_path.contains(resolved_path) and managed_path.is_protected(resolved_path):
-                logger.info(f"[PathPermissionManager] Path {resolved_path} is protected, forcing read-only")
-                self._permission_cache[resolved_path] = Permission.READ
-                return Permission.READ
-
-        # Find containing managed path with priority system:
-        # 1. File-specific paths (is_file=True) get highest priority - exact match only
-        # 2. Deeper directory paths get higher priority than shallow ones
-        # 3. file_context_parent type is lowest priority (used only for MCP access, not direct access)
-
-        # Separate file-specific and directory paths
-        file_paths = [mp for mp in self.managed_paths if mp.is_file]
-        dir_paths = [mp for mp in self.managed_paths if not mp.is_file and mp.path_type != "file_context_parent"]
-        # parent_paths are not used in permission checks - they're only for MCP allowed paths
-
-        # Check file-specific paths first (highest priority, exact match only)
-        for managed_path in file_paths:
-            if managed_path.contains(resolved_path):  # contains() handles exact match for files
-                logger.info(
-                    f"[PathPermissionManager] Found file-specific permission for {resolved_path}: {managed_path.permission.value} "
-                    f"(from {managed_path.path}, type: {managed_path.path_type}, "
-                    f"will_be_writable: {managed_path.will_be_writable})",
-                )
-                self._permission_cache[resolved_path] = managed_path.permission
-                return managed_path.permission
-
-        # Check directory paths (sorted by depth, deeper = higher priority)
-        sorted_dir_paths = sorted(dir_paths, key=lambda mp: len(mp.path.parts), reverse=True)
-        for managed_path in sorted_dir_paths:
-            if managed_path.contains(resolved_path) or managed_path.path == resolved_path:
-                logger.info(
-                    f"[PathPermissionManager] Found permission for {resolved_path}: {managed_path.permission.value} "
-                    f"(from {managed_path.path}, type: {managed_path.path_type}, "
-                    f"will_be_writable: {managed_path.will_be_writable})",
-                )
-                self._permission_cache[resolved_path] = managed_path.permission
-                return managed_path.permission
+            return self._permission_cache.get(resolved_path)
 
-        # Don't check parent_paths - they're only for MCP allowed paths, not for granting access
-        # If we reach here, the path is either in a file_context_parent (denied) or not in any context path
+        # Priority (see PathIndex): excluded and protected paths are read-only, then file-specific
+        # paths (exact match), then the deepest containing directory. file_context_parent entries
+        # are only for MCP allowed paths and never grant access.
+        permission = self._get_path_index().get_permission(resolved_path)
+        self._permission_cache.put(resolved_path, permission)
 
-        logger.debug(f"[PathPermissionManager] No permission found for {resolved_path} in managed paths: {[(str(mp.path), mp.permission.value, mp.path_type) for mp in self.managed_paths]}")
-        return None
+        if permission is None:
+            logger.debug(f"[PathPermissionManager] No permission found for {resolved_path} in {len(self.managed_paths)} managed paths")
+        else:
+            logger.debug(f"[PathPermissionManager] Resolved permission for {resolved_path}: {permission.value}")
+        return permission
 
     async def pre_tool_use_hook(self, tool_name: str, tool_args: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
         """
@@ -883,18 +847,8 @@ class PathPermissionManager:
         Returns:
             True if path is within allowed directories, False otherwise
         """
-        resolved_path = path.resolve()
-
-        # Check if path is within any managed path (excluding file_context_parent)
-        for managed_path in self.managed_paths:
-            # file_context_parent paths don't grant access, only their specific files do
-            if managed_path.path_type == "file_context_parent":
-                continue
-
-            if managed_path.contains(resolved_path) or managed_path.path == resolved_path:
-                return True
-
-        return False
+        # File-specific paths match exactly, directories by prefix; file_context_parent never grants access
+        return self._get_path_index().lookup(path.resolve()) is not None
 
     def _validate_file_context_access(self, tool_name: str, tool_args: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
         """
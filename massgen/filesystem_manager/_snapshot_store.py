@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""
+Content-addressed storage for workspace snapshots.
+
+Every agent snapshot used to be a full copy of the workspace, and every temporary
+workspace a full copy of every other agent's snapshot, so a large file that never
+changed was stored once per agent per round. ``SnapshotStore`` keeps each unique
+file once as a blob named by its SHA-256 digest and describes a snapshot as a
+manifest (relative path -> digest). Snapshot directories and log snapshots are
+materialized from the manifest with hard links into the store, so disk use and
+copy time are proportional to unique content.
+
+Blobs are read-only (0444), and so are the hard links sharing their inode, so an
+in-place write cannot corrupt every snapshot holding the same content. Directories
+agents can write to, such as temporary workspaces, get writable copies instead
+(``materialize(..., link=False)``).
+
+Layout:
+    <root>/blobs/<first two hex chars>/<digest>
+    <root>/manifests/<name>.json
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from ..logger_config import logger
+from ._snapshot_sync import SyncStats, file_digest, prune_tree, scan_tree
+
+# Blobs and the hard links sharing their inode are read-only
+_BLOB_MODE = 0o444
+
+
+class SnapshotStore:
+    """
+    Blob store plus named manifests shared by all agents of an orchestration.
+
+    Several FilesystemManagers may point at the same root from different worker
+    threads; blobs are published with an atomic rename so concurrent writers of the
+    same content are harmless.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.blobs_dir = self.root / "blobs"
+        self.manifests_dir = self.root / "manifests"
+        # tree root -> {(relative path, size, mtime_ns) -> digest} for the tree's current files,
+        # so unchanged files are not re-hashed; replaced on every scan of the tree
+        self._digest_cache: Dict[str, Dict[Tuple[str, int, int], str]] = {}
+        self._lock = threading.Lock()
+
+    def blob_path(self, digest: str) -> Path:
+        """Return the path of the blob holding the given content digest."""
+        return self.blobs_dir / digest[:2] / digest
+
+    def put_tree(self, source: Path) -> Dict[str, str]:
+        """
+        Add every file under ``source`` to the store.
+
+        Args:
+            source: Directory to snapshot (symlinks are skipped)
+
+        Returns:
+            Manifest mapping relative file paths to content digests. Empty
+            directories are recorded with an empty digest.
+        """
+        files, dirs = scan_tree(source)
+        manifest: Dict[str, str] = {rel: "" for rel in dirs}
+        new_blobs = 0
+        with self._lock:
+            known = self._digest_cache.get(str(source), {})
+        current: Dict[Tuple[str, int, int], str] = {}
+        for rel, signature in files.items():
+            source_file = source / rel
+            cache_key = (rel, signature.size, signature.mtime_ns)
+            digest = known.get(cache_key)
+            if digest is None:
+                digest = file_digest(source_file)
+            current[cache_key] = digest
+            if self._add_blob(source_file, digest):
+                new_blobs += 1
+            manifest[rel] = digest
+        with self._lock:
+            self._digest_cache[str(source)] = current
+        logger.debug(f"[SnapshotStore] Stored {len(files)} files from {source} ({new_blobs} new blobs)")
+        return manifest
+
+    def materialize(self, manifest: Dict[str, str], dest: Path, link: bool = True) -> SyncStats:
+        """
+        Make ``dest`` match ``manifest`` using hard links into the store.
+
+        Files already holding the right blob are left alone and entries not in the
+        manifest are removed. When hard links are not possible (e.g. the destination is
+        on another filesystem) blobs are copied instead.
+
+        Args:
+            manifest: Manifest produced by ``put_tree``
+            dest: Destination directory
+            link: Hard-link read-only blobs. Pass False for directories agents may
+                write to; files are then written as independent, writable copies
+
+        Returns:
+            SyncStats describing the work done
+        """
+        stats = SyncStats()
+        dest_files, dest_dirs = scan_tree(dest)
+        keep_dirs = {rel for rel, digest in manifest.items() if not digest}
+        keep_files = {rel: digest for rel, digest in manifest.items() if digest}
+        stats.removed = prune_tree(dest, dest_files, dest_dirs, keep_files.keys(), keep_dirs)
+
+        # Copies are recognised by the digest recorded when they were written
+        with self._lock:
+            known = {} if link else self._digest_cache.get(str(dest), {})
+        current: Dict[Tuple[str, int, int], str] = {}
+        for rel, digest in keep_files.items():
+            blob = self.blob_path(digest)
+            dest_file = dest / rel
+            if rel in dest_files:
+                signature = dest_files[rel]
+                cache_key = (rel, signature.size, signature.mtime_ns)
+                unchanged = self._is_same_file(blob, dest_file) if link else known.get(cache_key) == digest
+                if unchanged:
+                    current[cache_key] = digest
+                    stats.unchanged += 1
+                    continue
+                dest_file.unlink()
+            dest_file.parent.mkdir(parents=True, exist_ok=True)
+            if link:
+                try:
+                    os.link(blob, dest_file)
+                    stats.linked += 1
+                    continue
+                except OSError:
+                    pass
+                shutil.copy2(blob, dest_file)
+            else:
+                # copyfile leaves the blob's read-only mode behind
+                shutil.copyfile(blob, dest_file)
+                stat = dest_file.stat()
+                current[(rel, stat.st_size, stat.st_mtime_ns)] = digest
+            stats.copied += 1
+        if not link:
+            with self._lock:
+                self._digest_cache[str(dest)] = current
+        return stats
+
+    def save_manifest(self, name: str, manifest: Dict[str, str]) -> None:
+        """Persist a manifest under a name such as ``latest/agent_a``."""
+        path = self.manifests_dir / f"{name}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._atomic_write(path, json.dumps(manifest, sort_keys=True).encode("utf-8"))
+
+    def load_manifest(self, name: str) -> Optional[Dict[str, str]]:
+        """Load a manifest saved with ``save_manifest``, or None if it does not exist."""
+        path = self.manifests_dir / f"{name}.json"
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"[SnapshotStore] Ignoring unreadable manifest {path}: {e}")
+            return None
+
+    def _add_blob(self, source_file: Path, digest: str) -> bool:
+        """Copy a file into the store unless its content is already there."""
+        blob = self.blob_path(digest)
+        if blob.exists():
+            return False
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=blob.parent, prefix=".tmp-")
+        os.close(fd)
+        try:
+            shutil.copy2(source_file, tmp_name)
+            os.chmod(tmp_name, _BLOB_MODE)
+            os.replace(tmp_name, blob)
+        finally:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+        return True
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes) -> None:
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_name, path)
+        finally:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+
+    @staticmethod
+    def _is_same_file(blob: Path, dest_file: Path) -> bool:
+        try:
+            return os.path.samefile(blob, dest_file)
+        except OSError:
+            return False
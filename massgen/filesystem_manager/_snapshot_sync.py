@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+Incremental directory synchronization for workspace snapshots.
+
+Snapshots used to be taken by deleting the destination and copying the whole
+workspace again. ``sync_tree`` instead compares the source against the last
+snapshot and only writes files whose size, mtime or content hash changed:
+
+- When the destination already holds the previous snapshot (``snapshot_storage``,
+  the temporary workspace), unchanged files are left in place and stale ones removed.
+- When the destination is a fresh directory (timestamped log snapshots), unchanged
+  files are hard-linked from the previous snapshot, falling back to a copy when
+  linking is not possible (e.g. across filesystems).
+
+All functions here are blocking and are meant to run in a worker thread
+(``asyncio.to_thread``) so large workspaces never stall the event loop.
+"""
+
+import hashlib
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Collection, Dict, Optional, Set, Tuple
+
+from ..logger_config import logger
+
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+@dataclass
+class FileSignature:
+    """Size and modification time of a file in a snapshot tree."""
+
+    size: int
+    mtime_ns: int
+
+
+@dataclass
+class SyncStats:
+    """Counts of what a ``sync_tree`` call did."""
+
+    copied: int = 0
+    linked: int = 0
+    unchanged: int = 0
+    removed: int = 0
+
+    @property
+    def total_files(self) -> int:
+        return self.copied + self.linked + self.unchanged
+
+
+def file_digest(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def scan_tree(root: Path) -> Tuple[Dict[str, FileSignature], Set[str]]:
+    """
+    Collect file signatures and directories under ``root``.
+
+    Symlinks are skipped so snapshots never follow links out of the workspace.
+
+    Returns:
+        Tuple of (relative file path -> FileSignature, set of relative directory paths)
+    """
+    files: Dict[str, FileSignature] = {}
+    dirs: Set[str] = set()
+    if not root.is_dir():
+        return files, dirs
+
+    stack = [(root, "")]
+    while stack:
+        current, prefix = stack.pop()
+        try:
+            entries = list(os.scandir(current))
+        except OSError as e:
+            logger.warning(f"[snapshot_sync] Cannot scan {current}: {e}")
+            continue
+        for entry in entries:
+            rel = f"{prefix}{entry.name}"
+            if entry.is_symlink():
+                logger.warning(f"[snapshot_sync] Skipping symlink: {entry.path}")
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                dirs.add(rel)
+                stack.append((Path(entry.path), f"{rel}/"))
+            elif entry.is_file(follow_symlinks=False):
+                stat = entry.stat(follow_symlinks=False)
+                files[rel] = FileSignature(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+    return files, dirs
+
+
+def _is_unchanged(source_file: Path, signature: FileSignature, reference_file: Path, reference: Optional[FileSignature]) -> bool:
+    """Check whether ``source_file`` matches the file from the previous snapshot."""
+    if reference is None or reference.size != signature.size:
+        return False
+    if reference.mtime_ns == signature.mtime_ns:
+        return True
+    # Same size but touched since the last snapshot: compare contents
+    try:
+        return file_digest(source_file) == file_digest(reference_file)
+    except OSError:
+        return False
+
+
+def _replace_with_copy(source_file: Path, dest_file: Path) -> None:
+    # Unlink first so a hard-linked destination never writes through to older snapshots
+    if dest_file.exists() or dest_file.is_symlink():
+        dest_file.unlink()
+    shutil.copy2(source_file, dest_file)
+
+
+def prune_tree(dest: Path, dest_files: Dict[str, FileSignature], dest_dirs: Set[str], keep_files: Collection[str], keep_dirs: Set[str]) -> int:
+    """
+    Remove everything under ``dest`` that is not in ``keep_files``/``keep_dirs`` and create missing directories.
+
+    Entries removed from disk are also dropped from ``dest_files``.
+
+    Returns:
+        Number of files and directories removed
+    """
+    removed = 0
+    dest.mkdir(parents=True, exist_ok=True)
+
+    # Remove files and directories that disappeared from the source (deepest first)
+    for rel in dest_files.keys() - keep_files:
+        (dest / rel).unlink()
+        dest_files.pop(rel)
+        removed += 1
+    for rel in sorted(dest_dirs - keep_dirs, key=len, reverse=True):
+        shutil.rmtree(dest / rel, ignore_errors=True)
+        removed += 1
+    # A path that changed kind (file <-> directory) must be cleared before syncing
+    for rel in keep_dirs & dest_files.keys():
+        (dest / rel).unlink()
+        dest_files.pop(rel)
+    for rel in sorted(dest_dirs & set(keep_files), key=len, reverse=True):
+        shutil.rmtree(dest / rel, ignore_errors=True)
+
+    for rel in sorted(keep_dirs, key=len):
+        (dest / rel).mkdir(parents=True, exist_ok=True)
+    return removed
+
+
+def sync_tree(source: Path, dest: Path, link_from: Optional[Path] = None) -> SyncStats:
+    """
+    Make ``dest`` an exact copy of ``source``, writing only what changed.
+
+    Args:
+        source: Directory to snapshot
+        dest: Destination directory; its current contents are treated as the previous snapshot
+        link_from: Optional previous snapshot directory to hard-link unchanged files from
+            (used when ``dest`` is a new, empty directory)
+
+    Returns:
+        SyncStats describing the work done
+    """
+    stats = SyncStats()
+    source_files, source_dirs = scan_tree(source)
+    dest_files, dest_dirs = scan_tree(dest)
+    link_files = scan_tree(link_from)[0] if link_from is not None and link_from != dest else {}
+
+    stats.removed = prune_tree(dest, dest_files, dest_dirs, source_files.keys(), source_dirs)
+
+    for rel, signature in source_files.items():
+        source_file = source / rel
+        dest_file = dest / rel
+
+        if _is_unchanged(source_file, signature, dest_file, dest_files.get(rel)):
+            # Keep the destination's mtime in step so the next sync short-circuits
+            if dest_files[rel].mtime_ns != signature.mtime_ns:
+                shutil.copystat(source_file, dest_file)
+            stats.unchanged += 1
+            continue
+
+        link_file = link_from / rel if link_from is not None else None
+        if link_file is not None and _is_unchanged(source_file, signature, link_file, link_files.get(rel)):
+            try:
+                if dest_file.exists():
+                    dest_file.unlink()
+                os.link(link_file, dest_file)
+                stats.linked += 1
+                continue
+            except OSError:
+                pass
+
+        _replace_with_copy(source_file, dest_file)
+        stats.copied += 1
+
+    return stats
@@ -30,6 +30,15 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import fastmcp
 
+# Base directory for relative tool paths. Unset when the server runs as its own process
+# (whose cwd is the agent workspace); the shared MCP server pool sets it per agent scope.
+WORKING_DIRECTORY: Optional[Path] = None
+
+
+def _working_directory() -> Path:
+    """Directory that relative tool paths resolve against."""
+    return WORKING_DIRECTORY or Path.cwd()
+
 
 def get_copy_file_pairs(
     allowed_paths: List[Path],
@@ -62,7 +71,7 @@ def get_copy_file_pairs(
         exclude_patterns = []
 
     # Validate source base path
-    source_base = Path(source_base_path).resolve()
+    source_base = (_working_directory() / source_base_path).resolve()
     if not source_base.exists():
         raise ValueError(f"Source base path does not exist: {source_base}")
 
@@ -74,7 +83,7 @@ def get_copy_file_pairs(
             dest_base = Path(destination_base_path).resolve()
         else:
             # Relative path should be resolved relative to workspace (current working directory)
-            dest_base = (Path.cwd() / destination_base_path).resolve()
+            dest_base = (_working_directory() / destination_base_path).resolve()
     else:
         # No destination specified - this shouldn't happen for batch operations
         raise ValueError("destination_base_path is required for copy_files_batch")
@@ -296,7 +305,7 @@ def _validate_and_resolve_paths(allowed_paths: List[Path], source_path: str, des
     """
     try:
         # Validate and resolve source
-        source = Path(source_path).resolve()
+        source = (_working_directory() / source_path).resolve()
         if not source.exists():
             raise ValueError(f"Source path does not exist: {source}")
 
@@ -307,7 +316,7 @@ def _validate_and_resolve_paths(allowed_paths: List[Path], source_path: str, des
             destination = Path(destination_path).resolve()
         else:
             # Relative path should be resolved relative to workspace (current working directory)
-            destination = (Path.cwd() / destination_path).resolve()
+            destination = (_working_directory() / destination_path).resolve()
 
         _validate_path_access(destination, allowed_paths)
 
@@ -460,7 +469,7 @@ async def create_server() -> fastmcp.FastMCP:
 
             # Process each file pair
             for source_file, dest_file in file_pairs:
-                rel_path_str = str(source_file.relative_to(Path(source_base_path).resolve()))
+                rel_path_str = str(source_file.relative_to((_working_directory() / source_base_path).resolve()))
 
                 try:
                     # Check if destination exists
@@ -520,7 +529,7 @@ async def create_server() -> fastmcp.FastMCP:
                 target_path = Path(path).resolve()
             else:
                 # Relative path - resolve relative to workspace
-                target_path = (Path.cwd() / path).resolve()
+                target_path = (_working_directory() / path).resolve()
 
             # Validate path access
             _validate_path_access(target_path, mcp.allowed_paths)
@@ -613,7 +622,7 @@ async def create_server() -> fastmcp.FastMCP:
             if Path(base_path).is_absolute():
                 base = Path(base_path).resolve()
             else:
-                base = (Path.cwd() / base_path).resolve()
+                base = (_working_directory() / base_path).resolve()
 
             # Validate base path
             if not base.exists():
@@ -673,7 +682,7 @@ async def create_server() -> fastmcp.FastMCP:
         except Exception as e:
             return {"success": False, "operation": "delete_files_batch", "error": str(e)}
 
-    @mcp.tool()
+    @mcp.tool(annotations={"readOnlyHint": True})
     def compare_directories(dir1: str, dir2: str, show_content_diff: bool = False) -> Dict[str, Any]:
         """
         Compare two directories and show differences.
@@ -700,8 +709,8 @@ async def create_server() -> fastmcp.FastMCP:
         """
         try:
             # Resolve paths
-            path1 = Path(dir1).resolve() if Path(dir1).is_absolute() else (Path.cwd() / dir1).resolve()
-            path2 = Path(dir2).resolve() if Path(dir2).is_absolute() else (Path.cwd() / dir2).resolve()
+            path1 = Path(dir1).resolve() if Path(dir1).is_absolute() else (_working_directory() / dir1).resolve()
+            path2 = Path(dir2).resolve() if Path(dir2).is_absolute() else (_working_directory() / dir2).resolve()
 
             # Validate paths
             _validate_path_access(path1, mcp.allowed_paths)
@@ -751,7 +760,7 @@ async def create_server() -> fastmcp.FastMCP:
         except Exception as e:
             return {"success": False, "operation": "compare_directories", "error": str(e)}
 
-    @mcp.tool()
+    @mcp.tool(annotations={"readOnlyHint": True})
     def compare_files(file1: str, file2: str, context_lines: int = 3) -> Dict[str, Any]:
         """
         Compare two text files and show unified diff.
@@ -777,8 +786,8 @@ async def create_server() -> fastmcp.FastMCP:
         """
         try:
             # Resolve paths
-            path1 = Path(file1).resolve() if Path(file1).is_absolute() else (Path.cwd() / file1).resolve()
-            path2 = Path(file2).resolve() if Path(file2).is_absolute() else (Path.cwd() / file2).resolve()
+            path1 = Path(file1).resolve() if Path(file1).is_absolute() else (_working_directory() / file1).resolve()
+            path2 = Path(file2).resolve() if Path(file2).is_absolute() else (_working_directory() / file2).resolve()
 
             # Validate paths
             _validate_path_access(path1, mcp.allowed_paths)
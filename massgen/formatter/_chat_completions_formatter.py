@@ -22,41 +22,40 @@ class ChatCompletionsFormatter(FormatterBase):
         Chat Completions API expects tool call arguments as JSON strings in conversation history,
         but they may be passed as objects from other parts of the system.
         """
-        converted_messages = []
-
-        for message in messages:
-            # Create a copy to avoid modifying the original
-            converted_msg = dict(message)
-
-            # Normalize multimodal content (text/image/audio/video)
-            converted_msg = self._convert_multimodal_content(converted_msg)
-
-            # Convert tool_calls arguments from objects to JSON strings
-            if message.get("role") == "assistant" and "tool_calls" in message:
-                converted_tool_calls = []
-                for tool_call in message["tool_calls"]:
-                    converted_call = dict(tool_call)
-                    if "function" in converted_call:
-                        converted_function = dict(converted_call["function"])
-                        arguments = converted_function.get("arguments")
-
-                        # Convert arguments to JSON string if it's an object
-                        if isinstance(arguments, dict):
-                            converted_function["arguments"] = json.dumps(arguments)
-                        elif arguments is None:
-                            converted_function["arguments"] = "{}"
-                        elif not isinstance(arguments, str):
-                            # Handle other non-string types
-                            converted_function["arguments"] = self._serialize_tool_arguments(arguments)
-                        # If it's already a string, keep it as-is
-
-                        converted_call["function"] = converted_function
-                    converted_tool_calls.append(converted_call)
-                converted_msg["tool_calls"] = converted_tool_calls
-
-            converted_messages.append(converted_msg)
-
-        return converted_messages
+        return [self.cached_message("chat_completions", message, self._convert_message) for message in messages]
+
+    def _convert_message(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a single message (memoized across rounds by ``format_messages``)."""
+        # Create a copy to avoid modifying the original
+        converted_msg = dict(message)
+
+        # Normalize multimodal content (text/image/audio/video)
+        converted_msg = self._convert_multimodal_content(converted_msg)
+
+        # Convert tool_calls arguments from objects to JSON strings
+        if message.get("role") == "assistant" and "tool_calls" in message:
+            converted_tool_calls = []
+            for tool_call in message["tool_calls"]:
+                converted_call = dict(tool_call)
+                if "function" in converted_call:
+                    converted_function = dict(converted_call["function"])
+                    arguments = converted_function.get("arguments")
+
+                    # Convert arguments to JSON string if it's an object
+                    if isinstance(arguments, dict):
+                        converted_function["arguments"] = json.dumps(arguments)
+                    elif arguments is None:
+                        converted_function["arguments"] = "{}"
+                    elif not isinstance(arguments, str):
+                        # Handle other non-string types
+                        converted_function["arguments"] = self._serialize_tool_arguments(arguments)
+                    # If it's already a string, keep it as-is
+
+                    converted_call["function"] = converted_function
+                converted_tool_calls.append(converted_call)
+            converted_msg["tool_calls"] = converted_tool_calls
+
+        return converted_msg
 
     def _convert_multimodal_content(self, message: Dict[str, Any]) -> Dict[str, Any]:
         """
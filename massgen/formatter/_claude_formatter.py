@@ -6,7 +6,7 @@ Handles formatting for Anthropic Claude Messages API format.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from ._formatter_base import FormatterBase
 
@@ -40,69 +40,74 @@ class ClaudeFormatter(FormatterBase):
             if message.get("role") == "system":
                 # Extract system message for top-level parameter
                 system_message = message.get("content", "")
-            elif message.get("role") == "tool":
-                # Chat Completions tool message -> Claude tool result
-                converted_messages.append(
+                continue
+            converted_message = self.cached_message("claude", message, self._convert_message)
+            if converted_message is not None:
+                converted_messages.append(converted_message)
+
+        return converted_messages, system_message
+
+    def _convert_message(self, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Convert a single non-system message to Claude format (None if it is dropped)."""
+        if message.get("role") == "tool":
+            # Chat Completions tool message -> Claude tool result
+            return {
+                "role": "user",
+                "content": [
                     {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "tool_result",
-                                "tool_use_id": message.get("tool_call_id"),
-                                "content": message.get("content", ""),
-                            },
-                        ],
+                        "type": "tool_result",
+                        "tool_use_id": message.get("tool_call_id"),
+                        "content": message.get("content", ""),
                     },
-                )
-            elif message.get("type") == "function_call_output":
-                # Response API tool message -> Claude tool result
-                converted_messages.append(
+                ],
+            }
+        if message.get("type") == "function_call_output":
+            # Response API tool message -> Claude tool result
+            return {
+                "role": "user",
+                "content": [
                     {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "tool_result",
-                                "tool_use_id": message.get("call_id"),
-                                "content": message.get("output", ""),
-                            },
-                        ],
+                        "type": "tool_result",
+                        "tool_use_id": message.get("call_id"),
+                        "content": message.get("output", ""),
+                    },
+                ],
+            }
+        if message.get("role") == "assistant" and "tool_calls" in message:
+            # Assistant message with tool calls - convert to Claude format
+            content = []
+
+            # Add text content if present
+            if message.get("content"):
+                content.append({"type": "text", "text": message["content"]})
+
+            # Convert tool calls to Claude tool use format
+            for tool_call in message["tool_calls"]:
+                tool_name = self.extract_tool_name(tool_call)
+                tool_args = self.extract_tool_arguments(tool_call)
+                tool_id = self.extract_tool_call_id(tool_call)
+
+                content.append(
+                    {
+                        "type": "tool_use",
+                        "id": tool_id,
+                        "name": tool_name,
+                        "input": tool_args,
                     },
                 )
-            elif message.get("role") == "assistant" and "tool_calls" in message:
-                # Assistant message with tool calls - convert to Claude format
-                content = []
-
-                # Add text content if present
-                if message.get("content"):
-                    content.append({"type": "text", "text": message["content"]})
-
-                # Convert tool calls to Claude tool use format
-                for tool_call in message["tool_calls"]:
-                    tool_name = self.extract_tool_name(tool_call)
-                    tool_args = self.extract_tool_arguments(tool_call)
-                    tool_id = self.extract_tool_call_id(tool_call)
-
-                    content.append(
-                        {
-                            "type": "tool_use",
-                            "id": tool_id,
-                            "name": tool_name,
-                            "input": tool_args,
-                        },
-                    )
 
-                converted_messages.append({"role": "assistant", "content": content})
-            elif message.get("role") in ["user", "assistant"]:
-                # Keep user and assistant messages, skip system
-                converted_message = dict(message)
-                if isinstance(converted_message.get("content"), str):
-                    # Claude expects content to be text for simple messages
-                    pass
-                elif isinstance(converted_message.get("content"), list):
-                    converted_message = self._convert_multimodal_content(converted_message)
-                converted_messages.append(converted_message)
-
-        return converted_messages, system_message
+            return {"role": "assistant", "content": content}
+        if message.get("role") in ["user", "assistant"]:
+            # Keep user and assistant messages, skip system
+            converted_message = dict(message)
+            if isinstance(converted_message.get("content"), str):
+                # Claude expects content to be text for simple messages
+                pass
+            elif isinstance(converted_message.get("content"), list):
+                converted_message = self._convert_multimodal_content(converted_message)
+            return converted_message
+
+        return None
 
     def _convert_multimodal_content(self, message: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize multimodal content blocks to Claude's nested source structure."""
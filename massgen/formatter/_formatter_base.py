@@ -7,19 +7,90 @@ Provides common functionality for building API parameters across different backe
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
 
 
 class FormatterBase(ABC):
     """Abstract base class for API parameter handlers."""
 
+    # Converted messages kept per formatter (i.e. per backend) across tool rounds
+    MESSAGE_CACHE_SIZE = 2048
+
     def __init__(self) -> None:
-        """Initialize the API params handler.
+        """Initialize the conversion caches shared by all tool rounds of a backend."""
+        self._message_cache: "OrderedDict[Tuple[str, int, Hashable], Tuple[Dict[str, Any], Dict[str, Any], Any]]" = OrderedDict()
+        self._tool_cache: Dict[str, Tuple[Hashable, Tuple[Any, ...], List[Any]]] = {}
+
+    def cached_message(
+        self,
+        kind: str,
+        message: Dict[str, Any],
+        convert: Callable[[Dict[str, Any]], Any],
+        variant: Hashable = None,
+    ) -> Any:
+        """
+        Return ``convert(message)``, reusing the result of an earlier round for the same message.
+
+        Histories are shallow-copied between tool rounds, so a message keeps its identity;
+        results are keyed by identity and checked against a one-level snapshot of the message,
+        so a message edited in place is converted again. Results are shared, not copied.
+
+        Args:
+            kind: Name of the conversion (one formatter may convert a message several ways)
+            message: Message in framework format
+            convert: Conversion to memoize
+            variant: Extra input the conversion depends on besides the message
+
+        Returns:
+            The converted message
+        """
+        key = (kind, id(message), variant)
+        snapshot = self._snapshot(message)
+        cached = self._message_cache.get(key)
+        if cached is not None and cached[0] is message and cached[1] == snapshot:
+            self._message_cache.move_to_end(key)
+            return cached[2]
+
+        # The entry keeps the message alive, so its id cannot be reused while cached
+        result = convert(message)
+        self._message_cache[key] = (message, snapshot, result)
+        self._message_cache.move_to_end(key)
+        if len(self._message_cache) > self.MESSAGE_CACHE_SIZE:
+            self._message_cache.popitem(last=False)
+        return result
+
+    def cached_tools(
+        self,
+        kind: str,
+        convert: Callable[[], List[Any]],
+        members: Iterable[Any] = (),
+        version: Optional[Hashable] = None,
+    ) -> List[Any]:
+        """
+        Convert a tool set once per version.
 
         Args:
-            backend_instance: The backend instance containing necessary formatters and config
+            kind: Name of the tool set (e.g. "workflow", "custom", "mcp")
+            convert: Builds the converted tool list
+            members: Objects the conversion reads; the set changes when any of them is replaced
+            version: Version of the tool set if its owner tracks one (e.g. ``ToolManager.version``)
+
+        Returns:
+            A new list holding the (shared) converted tools
         """
-        return None
+        members = tuple(members)
+        key = (version, tuple(map(id, members)))
+        cached = self._tool_cache.get(kind)
+        if cached is None or cached[0] != key:
+            cached = (key, members, list(convert() or []))
+            self._tool_cache[kind] = cached
+        return list(cached[2])
+
+    @staticmethod
+    def _snapshot(message: Dict[str, Any]) -> Dict[str, Any]:
+        # Lists are copied one level deep so appending or replacing items counts as a change
+        return {key: tuple(value) if isinstance(value, list) else value for key, value in message.items()}
 
     @abstractmethod
     def format_messages(
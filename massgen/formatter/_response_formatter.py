@@ -28,39 +28,29 @@ class ResponseFormatter(FormatterBase):
 
         Note: Assistant messages with tool_calls should not be in input - they're generated by the backend.
         """
-        cleaned_messages = []
-        for message in messages:
-            if "status" in message and "role" not in message:
-                # Create a copy without 'status'
-                cleaned_message = {k: v for k, v in message.items() if k != "status"}
-                cleaned_messages.append(cleaned_message)
-            else:
-                cleaned_messages.append(message)
-
-        converted_messages = []
+        return [self.cached_message("response", message, self._convert_message) for message in messages]
 
-        for message in cleaned_messages:
-            if message.get("role") == "tool":
-                # Convert Chat Completions tool message to Response API format
-                converted_message = {
-                    "type": "function_call_output",
-                    "call_id": message.get("tool_call_id"),
-                    "output": message.get("content", ""),
-                }
-                converted_messages.append(converted_message)
-            elif message.get("type") == "function_call_output":
-                # Already in Response API format
-                converted_messages.append(message)
-            elif message.get("role") == "assistant" and "tool_calls" in message:
-                # Assistant message with tool_calls - remove tool_calls when sending as input
-                cleaned_message = {k: v for k, v in message.items() if k != "tool_calls"}
-                converted_messages.append(cleaned_message)
-            else:
-                # For other message types, check for multimodal content
-                converted_message = self._convert_multimodal_content(message.copy())
-                converted_messages.append(converted_message)
+    def _convert_message(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a single message to Response API format (memoized across rounds by ``format_messages``)."""
+        if "status" in message and "role" not in message:
+            # Create a copy without 'status'
+            message = {k: v for k, v in message.items() if k != "status"}
 
-        return converted_messages
+        if message.get("role") == "tool":
+            # Convert Chat Completions tool message to Response API format
+            return {
+                "type": "function_call_output",
+                "call_id": message.get("tool_call_id"),
+                "output": message.get("content", ""),
+            }
+        if message.get("type") == "function_call_output":
+            # Already in Response API format
+            return message
+        if message.get("role") == "assistant" and "tool_calls" in message:
+            # Assistant message with tool_calls - remove tool_calls when sending as input
+            return {k: v for k, v in message.items() if k != "tool_calls"}
+        # For other message types, check for multimodal content
+        return self._convert_multimodal_content(message.copy())
 
     def _convert_multimodal_content(self, message: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -15,12 +15,16 @@ Color Scheme for Debug Logging:
 - Red: Coordination steps (🔄)
 """
 
+import atexit
 import inspect
+import queue
 import subprocess
 import sys
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 from loguru import logger
@@ -47,6 +51,12 @@ _CURRENT_ATTEMPT = None  # Current attempt number for restart tracking
 _CONSOLE_HANDLER_ID = None
 _CONSOLE_SUPPRESSED = False
 
+# Stream chunk logging: text deltas are coalesced per (source, chunk type) into records of
+# at most STREAM_LOG_MAX_CHARS characters or STREAM_LOG_MAX_DELAY seconds of streaming
+STREAM_LOG_MAX_CHARS = 4096
+STREAM_LOG_MAX_DELAY = 0.5
+_COALESCED_CHUNK_TYPES = frozenset({"content", "reasoning"})
+
 
 def get_log_session_dir(turn: Optional[int] = None) -> Path:
     """Get the current log session directory, including attempt subdirectory if set.
@@ -257,7 +267,8 @@ def setup_logging(debug: bool = False, log_file: Optional[str] = None, turn: Opt
     _DEBUG_MODE = debug
     _CONSOLE_SUPPRESSED = False
 
-    # Remove all existing handlers
+    # Remove all existing handlers (flushing buffered stream records first)
+    flush_stream_logs()
     logger.remove()
 
     if debug:
@@ -312,6 +323,7 @@ def setup_logging(debug: bool = False, log_file: Optional[str] = None, turn: Opt
             colorize=False,  # Keep color codes in file
         )
 
+        _STREAM_LOG.enabled = True
         logger.info("Debug logging enabled - logging to console and file: {}", log_file)
     else:
         # Normal mode: only important messages to console, but all INFO+ to file
@@ -341,6 +353,7 @@ def setup_logging(debug: bool = False, log_file: Optional[str] = None, turn: Opt
             colorize=False,  # Keep color codes in file
         )
 
+        _STREAM_LOG.enabled = True
         logger.info("Logging enabled - logging INFO+ to file: {}", log_file)
 
 
@@ -459,6 +472,9 @@ def log_orchestrator_activity(orchestrator_id: str, activity: str, details: dict
         activity: Description of the activity
         details: Additional details as dictionary
     """
+    if not _DEBUG_MODE:
+        return
+
     # Get caller information
     func_name, line_num = _get_caller_info()
     log = logger.bind(name=f"orchestrator.{orchestrator_id}:{func_name}:{line_num}")
@@ -519,6 +535,9 @@ def log_orchestrator_agent_message(agent_id: str, direction: str, message: dict,
         message: Message content as dictionary
         backend_name: Optional name of the backend provider
     """
+    if not _DEBUG_MODE:
+        return
+
     # Get caller information
     func_name, line_num = _get_caller_info()
 
@@ -564,6 +583,9 @@ def log_backend_agent_message(agent_id: str, direction: str, message: dict, back
         message: Message content as dictionary
         backend_name: Optional name of the backend provider
     """
+    if not _DEBUG_MODE:
+        return
+
     # Get caller information
     func_name, line_num = _get_caller_info()
 
@@ -609,6 +631,9 @@ def log_backend_activity(backend_name: str, activity: str, details: dict = None,
         details: Additional details as dictionary
         agent_id: Optional ID of the agent using this backend
     """
+    if not _DEBUG_MODE:
+        return
+
     # Get caller information
     func_name, line_num = _get_caller_info()
 
@@ -705,48 +730,151 @@ def log_coordination_step(step: str, details: dict = None):
         log.opt(colors=True).debug("<red>🔄 {}: {}</red>", step, details or {})
 
 
+class _StreamLogChannel:
+    """
+    Dedicated log channel for per-token stream chunks.
+
+    Writing one loguru record per delta dominated streaming time with file logging on.
+    Text deltas are buffered per (source, chunk type) and emitted as one record once the
+    buffer reaches max_chars or has been open for max_delay seconds; other chunk types
+    flush the source's buffers first so records stay in order. Records are written by a
+    daemon thread that drains the queue in batches, keeping formatting and sink I/O off
+    the streaming path.
+    """
+
+    def __init__(self, max_chars: int, max_delay: float):
+        self.max_chars = max_chars
+        self.max_delay = max_delay
+        self.enabled = False  # Set by setup_logging(); before that chunks are logged directly
+        self._lock = threading.Lock()
+        self._buffers: Dict[Tuple[str, str], List[Any]] = {}  # (name, chunk_type) -> [parts, size, opened_at]
+        self._queue: "queue.Queue[Tuple[str, str, Any]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+
+    def write(self, name: str, chunk_type: str, content: Any) -> None:
+        """Buffer or enqueue one stream chunk."""
+        now = time.monotonic()
+        with self._lock:
+            if chunk_type in _COALESCED_CHUNK_TYPES and isinstance(content, str):
+                key = (name, chunk_type)
+                buffer = self._buffers.get(key)
+                if buffer is None:
+                    buffer = self._buffers[key] = [[], 0, now]
+                buffer[0].append(content)
+                buffer[1] += len(content)
+                if buffer[1] >= self.max_chars or now - buffer[2] >= self.max_delay:
+                    self._emit_buffer(key)
+            else:
+                for key in [key for key in self._buffers if key[0] == name]:
+                    self._emit_buffer(key)
+                self._queue.put((name, chunk_type, content))
+        self._ensure_worker()
+
+    def _emit_buffer(self, key: Tuple[str, str]) -> None:
+        """Move a buffer into the write queue (caller holds the lock)."""
+        parts = self._buffers.pop(key)[0]
+        self._queue.put((key[0], key[1], "".join(parts)))
+
+    def _flush_buffers(self, older_than: Optional[float] = None) -> None:
+        """Enqueue buffered deltas, optionally only those open for at least older_than seconds."""
+        now = time.monotonic()
+        with self._lock:
+            for key in list(self._buffers):
+                if older_than is None or now - self._buffers[key][2] >= older_than:
+                    self._emit_buffer(key)
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            with self._lock:
+                if self._worker is None or not self._worker.is_alive():
+                    self._worker = threading.Thread(target=self._run, name="massgen-stream-log", daemon=True)
+                    self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                batch = [self._queue.get(timeout=self.max_delay)]
+            except queue.Empty:
+                # Nothing arrived for a while: release deltas of streams that went quiet
+                self._flush_buffers(older_than=self.max_delay)
+                continue
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            for name, chunk_type, content in batch:
+                try:
+                    _write_stream_record(name, chunk_type, content)
+                finally:
+                    self._queue.task_done()
+
+    def flush(self) -> None:
+        """Write out everything buffered or queued so far."""
+        self._flush_buffers()
+        if self._worker is not None and self._worker.is_alive():
+            self._queue.join()
+            return
+        # No worker (e.g. at interpreter exit): write synchronously
+        while True:
+            try:
+                name, chunk_type, content = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            _write_stream_record(name, chunk_type, content)
+            self._queue.task_done()
+
+
+def _write_stream_record(name: str, chunk_type: str, content: Any) -> None:
+    """Write one stream chunk record at INFO level."""
+    log = logger.bind(name=name)
+    if content:
+        # No truncation - show full content
+        log.info("Stream chunk [{}]: {}", chunk_type, content)
+    else:
+        log.info("Stream chunk [{}]", chunk_type)
+
+
+_STREAM_LOG = _StreamLogChannel(STREAM_LOG_MAX_CHARS, STREAM_LOG_MAX_DELAY)
+atexit.register(_STREAM_LOG.flush)
+
+
+def flush_stream_logs() -> None:
+    """Write out stream chunk records that are still buffered by the stream log channel."""
+    _STREAM_LOG.flush()
+
+
 def log_stream_chunk(source: str, chunk_type: str, content: Any = None, agent_id: str = None):
     """
     Log stream chunks at INFO level (always logged to file).
 
+    Once logging is set up, text deltas ("content", "reasoning") are coalesced per source
+    and chunk type and written in the background; see _StreamLogChannel.
+
     Args:
         source: Source of the stream chunk (e.g., "orchestrator", "backend.claude_code")
         chunk_type: Type of the chunk (e.g., "content", "tool_call", "error")
         content: Content of the chunk
         agent_id: Optional agent ID for context
     """
-    # Get caller information from the actual caller (not this function)
-    frame = inspect.currentframe()
-    # Stack frames:
-    # - frame: log_stream_chunk (this function)
-    # - frame.f_back: the actual caller (e.g., _present_final_answer)
-
-    if frame and frame.f_back:
-        caller_frame = frame.f_back
-        function_name = caller_frame.f_code.co_name
-        line_number = caller_frame.f_lineno
-    else:
-        function_name = "unknown"
-        line_number = 0
-
     if agent_id:
         log_name = f"{source}.{agent_id}"
     else:
         log_name = source
 
-    # Create a custom logger that will show the source name instead of module path
-    log = logger.bind(name=f"{log_name}:{function_name}:{line_number}")
-
-    # Always log stream chunks at INFO level (will go to file)
-    # Format content based on type
-    if content:
-        if isinstance(content, dict):
-            log.info("Stream chunk [{}]: {}", chunk_type, content)
+    # Caller location is only shown by the debug format, so skip frame inspection otherwise
+    if _DEBUG_MODE:
+        frame = inspect.currentframe()
+        # - frame.f_back: the actual caller (e.g., _present_final_answer)
+        if frame and frame.f_back:
+            log_name = f"{log_name}:{frame.f_back.f_code.co_name}:{frame.f_back.f_lineno}"
         else:
-            # No truncation - show full content
-            log.info("Stream chunk [{}]: {}", chunk_type, content)
+            log_name = f"{log_name}:unknown:0"
+
+    if _STREAM_LOG.enabled:
+        _STREAM_LOG.write(log_name, chunk_type, content)
     else:
-        log.info("Stream chunk [{}]", chunk_type)
+        _write_stream_record(log_name, chunk_type, content)
 
 
 def _format_message(message: dict) -> str:
@@ -799,4 +927,5 @@ __all__ = [
     "log_tool_call",
     "log_coordination_step",
     "log_stream_chunk",
+    "flush_stream_logs",
 ]
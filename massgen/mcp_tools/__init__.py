@@ -10,6 +10,7 @@ Features:
 - Multi-server support via MCPClient
 - Enhanced security with command sanitization
 - Modern transport methods (stdio, streamable-http)
+- Shared MCP server processes across agents via MCPServerPool
 """
 
 from mcp import types as mcp_types
@@ -57,10 +58,13 @@ from .security import (
     validate_tool_arguments,
     validate_url,
 )
+from .server_pool import MCPServerPool
 
 __all__ = [
     # Core client classes
     "MCPClient",
+    # Shared server processes
+    "MCPServerPool",
     # Circuit breaker
     "MCPCircuitBreaker",
     "CircuitBreakerConfig",
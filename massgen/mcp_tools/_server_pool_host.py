@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""
+Host process for the shared MCP server pool.
+
+One host runs per MassGen MCP server script (workspace tools, planning, memory) and
+serves every agent that needs that server type. Each agent connection gets its own
+*scope*: a private copy of the server module (so module-level state such as task plans
+or memory caches is never shared), built from the agent's command line arguments and
+served over streamable HTTP at ``/scopes/<id>/mcp``.
+
+Control protocol (all requests need ``Authorization: Bearer $MASSGEN_MCP_POOL_TOKEN``):
+- ``POST /scopes`` with ``{"argv": [...], "cwd": "..."}`` -> ``{"id": "...", "path": "/scopes/<id>/mcp"}``
+- ``DELETE /scopes/<id>`` closes the scope
+
+On startup the host prints ``{"port": <port>}`` on stdout. It exits when stdin closes,
+so it never outlives the MassGen process that spawned it.
+
+Usage:
+    python -m massgen.mcp_tools._server_pool_host --script /path/to/_planning_mcp_server.py
+"""
+
+import argparse
+import asyncio
+import hmac
+import importlib.util
+import json
+import os
+import socket
+import sys
+import threading
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import uvicorn
+
+TOKEN_ENV_VAR = "MASSGEN_MCP_POOL_TOKEN"
+
+
+@dataclass
+class _Scope:
+    """One agent's isolated server instance inside the host."""
+
+    module_name: str
+    app: Any
+    task: asyncio.Task
+    stop: asyncio.Event
+
+
+async def _read_body(receive) -> bytes:
+    body = b""
+    while True:
+        message = await receive()
+        body += message.get("body", b"")
+        if not message.get("more_body"):
+            return body
+
+
+async def _respond(send, status: int, payload: Optional[Dict[str, Any]] = None) -> None:
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        },
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+class PoolHostApp:
+    """ASGI app routing control requests and per-scope MCP traffic."""
+
+    def __init__(self, script_path: str, token: str):
+        self.script_path = str(Path(script_path).resolve())
+        self.token = token
+        self.scopes: Dict[str, _Scope] = {}
+        self._create_lock = asyncio.Lock()
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        if not self._authorized(scope):
+            await _respond(send, 401, {"error": "unauthorized"})
+            return
+
+        parts = scope["path"].strip("/").split("/")
+        method = scope["method"]
+        if parts == ["scopes"] and method == "POST":
+            await self._handle_create(receive, send)
+        elif len(parts) == 2 and parts[0] == "scopes" and method == "DELETE":
+            await self.close_scope(parts[1])
+            await _respond(send, 200, {"closed": parts[1]})
+        elif len(parts) > 2 and parts[0] == "scopes" and parts[1] in self.scopes:
+            await self.scopes[parts[1]].app(scope, receive, send)
+        else:
+            await _respond(send, 404, {"error": f"unknown path {scope['path']}"})
+
+    def _authorized(self, scope) -> bool:
+        expected = f"Bearer {self.token}".encode("utf-8")
+        for name, value in scope.get("headers", []):
+            if name == b"authorization":
+                return hmac.compare_digest(value, expected)
+        return False
+
+    async def _lifespan(self, receive, send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                for scope_id in list(self.scopes):
+                    await self.close_scope(scope_id)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _handle_create(self, receive, send) -> None:
+        try:
+            request = json.loads(await _read_body(receive) or b"{}")
+            scope_id = await self.create_scope(request.get("argv", []), request.get("cwd"))
+        except (Exception, SystemExit) as e:
+            # argparse exits on invalid arguments; report it instead of stopping the host
+            await _respond(send, 400, {"error": f"{type(e).__name__}: {e}"})
+            return
+        await _respond(send, 200, {"id": scope_id, "path": f"/scopes/{scope_id}/mcp"})
+
+    def _load_module(self, module_name: str):
+        """Execute a private copy of the server script so scopes never share module state."""
+        spec = importlib.util.spec_from_file_location(module_name, self.script_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(module_name, None)
+            raise
+        return module
+
+    async def create_scope(self, argv: List[str], cwd: Optional[str] = None) -> str:
+        """Build and start a server instance for one agent connection."""
+        scope_id = uuid.uuid4().hex[:16]
+        module_name = f"massgen_pool_scope_{scope_id}"
+
+        # create_server() reads sys.argv; serialize creation so arguments never interleave
+        async with self._create_lock:
+            module = self._load_module(module_name)
+            if cwd and hasattr(module, "WORKING_DIRECTORY"):
+                module.WORKING_DIRECTORY = Path(cwd)
+            saved_argv = sys.argv
+            sys.argv = [self.script_path, *argv]
+            try:
+                server = await module.create_server()
+            except BaseException:
+                sys.modules.pop(module_name, None)
+                raise
+            finally:
+                sys.argv = saved_argv
+
+        app = server.http_app(path=f"/scopes/{scope_id}/mcp")
+        ready = asyncio.get_running_loop().create_future()
+        stop = asyncio.Event()
+        task = asyncio.create_task(self._run_scope(app, ready, stop))
+        try:
+            await ready
+        except BaseException:
+            sys.modules.pop(module_name, None)
+            raise
+        self.scopes[scope_id] = _Scope(module_name=module_name, app=app, task=task, stop=stop)
+        return scope_id
+
+    @staticmethod
+    async def _run_scope(app, ready: asyncio.Future, stop: asyncio.Event) -> None:
+        """Own the scope app's lifespan (its session task group) from a single long-lived task."""
+        try:
+            async with app.router.lifespan_context(app):
+                ready.set_result(None)
+                await stop.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+                return
+            raise
+
+    async def close_scope(self, scope_id: str) -> None:
+        scope = self.scopes.pop(scope_id, None)
+        if scope is None:
+            return
+        scope.stop.set()
+        try:
+            await scope.task
+        finally:
+            sys.modules.pop(scope.module_name, None)
+
+
+def _exit_when_stdin_closes(loop: asyncio.AbstractEventLoop, server: uvicorn.Server) -> None:
+    def watch():
+        sys.stdin.buffer.read()
+        loop.call_soon_threadsafe(setattr, server, "should_exit", True)
+
+    threading.Thread(target=watch, name="pool-host-stdin", daemon=True).start()
+
+
+async def _serve(script_path: str, token: str) -> None:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.listen(128)
+
+    app = PoolHostApp(script_path, token)
+    server = uvicorn.Server(uvicorn.Config(app, log_level="warning", lifespan="on"))
+    _exit_when_stdin_closes(asyncio.get_running_loop(), server)
+
+    print(json.dumps({"port": sock.getsockname()[1]}), flush=True)
+    await server.serve(sockets=[sock])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="MassGen shared MCP server host")
+    parser.add_argument("--script", required=True, help="MCP server script exposing create_server()")
+    args = parser.parse_args()
+
+    token = os.environ.get(TOKEN_ENV_VAR)
+    if not token:
+        raise SystemExit(f"{TOKEN_ENV_VAR} must be set")
+    os.environ.setdefault("FASTMCP_SHOW_CLI_BANNER", "false")
+    asyncio.run(_serve(args.script, token))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ MCP client implementation for connecting to MCP servers. This module provides en
 functionality to connect with MCP servers and integrate external tools into the MassGen workflow.
 """
 import asyncio
+import json
 from dataclasses import dataclass
 from datetime import timedelta
 from enum import Enum
@@ -31,6 +32,7 @@ from .security import (
     substitute_env_variables,
     validate_tool_arguments,
 )
+from .server_pool import MCPServerPool
 
 
 class ConnectionState(Enum):
@@ -144,6 +146,9 @@ class MCPClient:
         self.status_callback = status_callback
         self.hooks = hooks or {}
 
+        # ToolResultCache shared by the orchestrator's agents (see massgen/tool_result_cache.py)
+        self.result_cache = None
+
         # Initialize circuit breaker for ALL scenarios
         self._circuit_breaker = MCPCircuitBreaker()
 
@@ -410,9 +415,13 @@ class MCPClient:
         """Background task that owns the transport and session contexts for a server."""
         server_client = self._server_clients[server_name]
         connection_successful = False
+        pooled_config = None
 
         try:
-            transport_ctx = self._create_transport_context(config)
+            # MassGen's own servers are served from shared host processes when the pool is enabled
+            if MCPServerPool.is_enabled():
+                pooled_config = await MCPServerPool.acquire(config)
+            transport_ctx = self._create_transport_context(pooled_config or config)
 
             async with transport_ctx as session_params:
                 read, write = session_params[0:2]
@@ -460,6 +469,9 @@ class MCPClient:
             if not server_client.connected_event.is_set():
                 server_client.connected_event.set()
         finally:
+            if pooled_config is not None:
+                await MCPServerPool.release(pooled_config)
+
             # Clear session state
             server_client.initialized = False
             server_client.session = None
@@ -601,6 +613,31 @@ class MCPClient:
         # Extract original tool name (remove prefix - always prefixed)
         original_tool_name = tool_name[len(f"mcp__{server_name}__") :]
 
+        # Read-only tools may be answered from the result cache shared by all agents
+        cache_key = self._result_cache_key(tool_name, server_name, original_tool_name, validated_arguments)
+        if cache_key is not None:
+            return await self.result_cache.fetch(
+                cache_key,
+                lambda: self._call_server_tool(server_name, original_tool_name, validated_arguments),
+                tool_name=tool_name,
+                should_cache=lambda result: not getattr(result, "isError", False),
+            )
+        return await self._call_server_tool(server_name, original_tool_name, validated_arguments)
+
+    def _result_cache_key(self, tool_name: str, server_name: str, original_tool_name: str, arguments: Dict[str, Any]) -> Optional[str]:
+        """Cache key for a call, or None if there is no cache or the tool is not declared cacheable."""
+        if self.result_cache is None:
+            return None
+        config = next((c for c in self._server_configs if c["name"] == server_name), {})
+        annotations = getattr(self.tools[tool_name], "annotations", None)
+        if original_tool_name not in (config.get("cacheable_tools") or []) and not (annotations and annotations.readOnlyHint):
+            return None
+        # Results are only shared between identically configured servers (same allowed paths, cwd, ...)
+        scope = json.dumps({key: config.get(key) for key in ("type", "command", "args", "cwd", "url")}, sort_keys=True, default=str)
+        return self.result_cache.make_key(tool_name, arguments, scope=scope, base_dir=config.get("cwd"))
+
+    async def _call_server_tool(self, server_name: str, original_tool_name: str, validated_arguments: Dict[str, Any]) -> Any:
+        """Send a validated tool call to its server with timeout, status and circuit breaker handling."""
         session = self._get_server_session(server_name)
 
         logger.debug(f"Calling tool {original_tool_name} on {server_name} with arguments: {validated_arguments}")
@@ -617,10 +654,25 @@ class MCPClient:
                 },
             )
 
+        async def on_progress(progress: float, total: Optional[float], message: Optional[str]) -> None:
+            # Long-running tools (e.g. command execution) stream partial results as progress
+            logger.debug(f"Tool {original_tool_name} on {server_name} progress: {progress}/{total} {message or ''}")
+            if self.status_callback:
+                await self.status_callback(
+                    "tool_call_progress",
+                    {
+                        "server": server_name,
+                        "tool": original_tool_name,
+                        "message": message or f"Tool '{original_tool_name}' is running",
+                        "progress": progress,
+                        "total": total,
+                    },
+                )
+
         try:
             # Add timeout to tool calls
             result = await asyncio.wait_for(
-                session.call_tool(original_tool_name, validated_arguments),
+                session.call_tool(original_tool_name, validated_arguments, progress_callback=on_progress),
                 timeout=self.timeout_seconds,
             )
             logger.debug(f"Tool {original_tool_name} completed successfully on {server_name}")
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+"""
+Shared MCP server pool.
+
+Every agent used to launch its own stdio subprocess for each MassGen MCP server
+(workspace tools, task planning, memory), so startup time and resident memory grew
+linearly with the number of agents. When the pool is enabled, MCPClient routes those
+servers to one long-lived host process per server type instead
+(see ``_server_pool_host.py``):
+
+- Hosts are spawned lazily on the first connection that needs them and reused for
+  every later agent, restart and turn in this process
+- Each connection gets its own scope inside the host, created from the same command
+  line arguments (allowed paths, agent id, workspace) the stdio server would receive,
+  so agents stay isolated exactly as with separate processes
+- Scopes are released when the MCPClient disconnects; hosts are terminated by
+  ``aclose()`` or at interpreter exit
+
+Servers that are not MassGen's own (npx filesystem server, user-configured servers)
+and servers with per-process environment overrides keep using stdio.
+
+Example:
+    MCPServerPool.enable()
+    pooled = await MCPServerPool.acquire(stdio_config)  # streamable-http config or None
+"""
+
+import asyncio
+import atexit
+import json
+import os
+import secrets
+import subprocess
+import sys
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from ..logger_config import get_log_session_dir, logger
+from .security import substitute_env_variables
+
+_PACKAGE_DIR = Path(__file__).resolve().parent.parent
+
+# MassGen MCP server scripts that can be multiplexed (their create_server() reads all
+# per-agent settings from argv and they keep no state outside their module)
+POOLABLE_SERVER_SCRIPTS = {
+    str(_PACKAGE_DIR / "filesystem_manager" / "_workspace_tools_server.py"),
+    str(_PACKAGE_DIR / "mcp_tools" / "planning" / "_planning_mcp_server.py"),
+    str(_PACKAGE_DIR / "mcp_tools" / "memory" / "_memory_mcp_server.py"),
+}
+
+# Environment variables a pooled server may ask for; anything else needs its own process
+_SHAREABLE_ENV_VARS = {"FASTMCP_SHOW_CLI_BANNER"}
+
+HOST_START_TIMEOUT = 30.0
+CONTROL_TIMEOUT = 30.0
+
+
+@dataclass
+class _PoolHost:
+    """A running host process for one server script."""
+
+    script: str
+    process: subprocess.Popen
+    port: int
+    errlog: Any = None
+    scopes: Dict[str, str] = field(default_factory=dict)  # scope id -> server name
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def is_alive(self) -> bool:
+        return self.process.poll() is None
+
+
+class MCPServerPool:
+    """
+    Process-wide registry of shared MCP server hosts.
+
+    All state is class-level so every backend's MCPClient sees the same hosts.
+    """
+
+    _enabled: bool = False
+    _hosts: Dict[str, _PoolHost] = {}
+    _spawn_lock = threading.Lock()
+    _token: str = secrets.token_urlsafe(32)
+    _atexit_registered: bool = False
+
+    @classmethod
+    def enable(cls, enabled: bool = True) -> None:
+        """Route poolable MCP servers through shared hosts from now on."""
+        cls._enabled = enabled
+        if enabled and not cls._atexit_registered:
+            atexit.register(cls.terminate_all)
+            cls._atexit_registered = True
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls._enabled
+
+    @classmethod
+    def stats(cls) -> Dict[str, int]:
+        """Number of live host processes and open scopes."""
+        hosts = [host for host in cls._hosts.values() if host.is_alive()]
+        return {"hosts": len(hosts), "scopes": sum(len(host.scopes) for host in hosts)}
+
+    @staticmethod
+    def parse_poolable(config: Dict[str, Any]) -> Optional[Tuple[str, List[str]]]:
+        """
+        Recognize a stdio config that launches a poolable MassGen server via ``fastmcp run``.
+
+        Args:
+            config: Validated MCP server configuration
+
+        Returns:
+            Tuple of (server script path, server argv) or None if the server must use stdio
+        """
+        if config.get("type", "stdio") != "stdio":
+            return None
+        if set(config.get("env") or {}) - _SHAREABLE_ENV_VARS:
+            return None
+
+        command = config.get("command", [])
+        full_command = (list(command) if isinstance(command, list) else [command]) + list(config.get("args") or [])
+        if len(full_command) < 3 or Path(str(full_command[0])).name != "fastmcp" or full_command[1] != "run":
+            return None
+
+        script, _, factory = str(full_command[2]).rpartition(":")
+        if factory != "create_server" or str(Path(script).resolve()) not in POOLABLE_SERVER_SCRIPTS:
+            return None
+
+        argv = full_command[3:]
+        if argv and argv[0] == "--":
+            argv = argv[1:]
+        return str(Path(script).resolve()), [substitute_env_variables(arg) if isinstance(arg, str) else str(arg) for arg in argv]
+
+    @classmethod
+    async def acquire(cls, config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Open a pooled scope for a server config.
+
+        Args:
+            config: Validated stdio MCP server configuration
+
+        Returns:
+            Equivalent streamable-http config pointing at the scope (carrying
+            ``pool_scope`` for ``release``), or None if the server is not poolable
+            or the pool failed (callers then fall back to stdio)
+        """
+        if not cls._enabled:
+            return None
+        parsed = cls.parse_poolable(config)
+        if parsed is None:
+            return None
+        script, argv = parsed
+
+        try:
+            host = await asyncio.to_thread(cls._get_host, script)
+            async with httpx.AsyncClient(timeout=CONTROL_TIMEOUT) as client:
+                response = await client.post(
+                    f"{host.base_url}/scopes",
+                    json={"argv": argv, "cwd": config.get("cwd")},
+                    headers=cls._auth_headers(),
+                )
+            if response.status_code != 200:
+                raise RuntimeError(response.json().get("error", response.text))
+            scope = response.json()
+        except Exception as e:
+            logger.warning(f"[MCPServerPool] Could not pool {config['name']}, falling back to stdio: {e}")
+            return None
+
+        host.scopes[scope["id"]] = config["name"]
+        pooled = {key: value for key, value in config.items() if key not in ("command", "args", "env", "cwd")}
+        pooled.update(
+            {
+                "type": "streamable-http",
+                "url": f"{host.base_url}{scope['path']}",
+                "headers": cls._auth_headers(),
+                "pool_scope": (script, scope["id"]),
+            },
+        )
+        logger.info(f"[MCPServerPool] {config['name']} served from shared host {Path(script).stem} (scope {scope['id']})")
+        return pooled
+
+    @classmethod
+    async def release(cls, pooled_config: Dict[str, Any]) -> None:
+        """Close the scope opened by ``acquire``; the host keeps running for later agents."""
+        script, scope_id = pooled_config["pool_scope"]
+        host = cls._hosts.get(script)
+        if host is None or host.scopes.pop(scope_id, None) is None or not host.is_alive():
+            return
+        try:
+            async with httpx.AsyncClient(timeout=CONTROL_TIMEOUT) as client:
+                await client.delete(f"{host.base_url}/scopes/{scope_id}", headers=cls._auth_headers())
+        except Exception as e:
+            logger.debug(f"[MCPServerPool] Failed to release scope {scope_id}: {e}")
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Terminate every host process."""
+        await asyncio.to_thread(cls.terminate_all)
+
+    @classmethod
+    def terminate_all(cls) -> None:
+        with cls._spawn_lock:
+            hosts = list(cls._hosts.values())
+            cls._hosts.clear()
+        for host in hosts:
+            cls._terminate(host)
+
+    @classmethod
+    def _auth_headers(cls) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {cls._token}"}
+
+    @classmethod
+    def _get_host(cls, script: str) -> _PoolHost:
+        """Return the live host for a script, spawning it on first use (blocking; run in a thread)."""
+        with cls._spawn_lock:
+            host = cls._hosts.get(script)
+            if host is not None and host.is_alive():
+                return host
+            if host is not None:
+                logger.warning(f"[MCPServerPool] Host for {Path(script).stem} exited, respawning")
+                cls._terminate(host)
+            host = cls._spawn(script)
+            cls._hosts[script] = host
+            return host
+
+    @classmethod
+    def _spawn(cls, script: str) -> _PoolHost:
+        log_dir = get_log_session_dir()
+        errlog = open(log_dir / f"mcp_pool_{Path(script).stem}_stderr.log", "w", encoding="utf-8")
+        process = subprocess.Popen(
+            [sys.executable, "-m", "massgen.mcp_tools._server_pool_host", "--script", script],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=errlog,
+            env={**os.environ, "MASSGEN_MCP_POOL_TOKEN": cls._token, "FASTMCP_SHOW_CLI_BANNER": "false"},
+        )
+
+        # The host reports its port on the first stdout line once it is listening
+        result: Dict[str, Any] = {}
+        reader = threading.Thread(target=lambda: result.update(line=process.stdout.readline()), daemon=True)
+        reader.start()
+        reader.join(HOST_START_TIMEOUT)
+        try:
+            port = json.loads(result["line"])["port"]
+        except (KeyError, ValueError, TypeError):
+            process.kill()
+            errlog.close()
+            raise RuntimeError(f"Shared MCP host for {Path(script).stem} failed to start (see {errlog.name})")
+
+        logger.info(f"[MCPServerPool] Started shared host for {Path(script).stem} on port {port} (pid {process.pid})")
+        return _PoolHost(script=script, process=process, port=port, errlog=errlog)
+
+    @staticmethod
+    def _terminate(host: _PoolHost) -> None:
+        # Closing stdin asks the host to shut down gracefully
+        try:
+            host.process.stdin.close()
+            host.process.wait(timeout=5)
+        except Exception:
+            host.process.kill()
+        if host.errlog is not None:
+            host.errlog.close()
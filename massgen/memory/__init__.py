@@ -13,6 +13,14 @@ The memory system is designed to be:
 
 from ._base import MemoryBase, PersistentMemoryBase
 from ._compression import CompressionStats, ContextCompressor
+from ._compression_planner import (
+    CompressionPlan,
+    KeepStrategy,
+    RecentWindowStrategy,
+    SummaryAnchoredStrategy,
+    ToolPairPreservingStrategy,
+    plan_compression,
+)
 from ._conversation import ConversationMemory
 from ._persistent import PersistentMemory
 
@@ -23,4 +31,10 @@ __all__ = [
     "PersistentMemory",
     "ContextCompressor",
     "CompressionStats",
+    "CompressionPlan",
+    "KeepStrategy",
+    "RecentWindowStrategy",
+    "ToolPairPreservingStrategy",
+    "SummaryAnchoredStrategy",
+    "plan_compression",
 ]
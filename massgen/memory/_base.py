@@ -146,6 +146,14 @@ class PersistentMemoryBase(ABC):
             "The `retrieve` method is not implemented in this memory backend.",
         )
 
+    async def flush(self) -> None:
+        """
+        Wait until previously recorded information is stored.
+
+        Backends that record in the background override this; inline
+        backends have nothing pending.
+        """
+
     async def save_to_memory(
         self,
         thinking: str,
@@ -12,6 +12,7 @@ from typing import Any, Callable, Dict, List, Optional
 
 from ..logger_config import logger
 from ..token_manager.token_manager import TokenCostCalculator
+from ._compression_planner import CompressionPlan, KeepStrategy, plan_compression
 from ._conversation import ConversationMemory
 from ._persistent import PersistentMemoryBase
 
@@ -45,7 +46,8 @@ class ContextCompressor:
     Features:
     - Token-aware compression (not just message count)
     - Preserves system messages
-    - Keeps most recent messages
+    - Keeps most recent messages (pluggable via keep_strategy)
+    - Linear-time planning from per-message token counts
     - Detailed compression logging
 
     Example:
@@ -68,6 +70,7 @@ class ContextCompressor:
         conversation_memory: ConversationMemory,
         persistent_memory: Optional[PersistentMemoryBase] = None,
         on_compress: Optional[Callable[[CompressionStats], None]] = None,
+        keep_strategy: Optional[KeepStrategy] = None,
     ):
         """
         Initialize context compressor.
@@ -77,11 +80,13 @@ class ContextCompressor:
             conversation_memory: Conversation memory to compress
             persistent_memory: Optional persistent memory (for logging purposes)
             on_compress: Optional callback called after compression
+            keep_strategy: Which messages to keep (default: system + most recent that fit)
         """
         self.token_calculator = token_calculator
         self.conversation_memory = conversation_memory
         self.persistent_memory = persistent_memory
         self.on_compress = on_compress
+        self.keep_strategy = keep_strategy
 
         # Stats tracking
         self.total_compressions = 0
@@ -115,22 +120,26 @@ class ContextCompressor:
         if not should_compress:
             return None
 
-        # Select messages to keep
-        messages_to_keep = self._select_messages_to_keep(
-            messages=messages,
-            target_tokens=target_tokens,
-        )
+        # Plan which messages to keep from per-message token counts
+        plan = self._plan(messages, target_tokens)
 
-        if len(messages_to_keep) >= len(messages):
+        if not plan.remove_indices:
             # No compression needed (already under target)
             logger.debug("All messages fit within target, skipping compression")
             return None
 
         # Calculate stats
-        messages_removed = len(messages) - len(messages_to_keep)
-        messages_to_remove = [msg for msg in messages if msg not in messages_to_keep]
-        tokens_removed = self.token_calculator.estimate_tokens(messages_to_remove)
-        tokens_kept = self.token_calculator.estimate_tokens(messages_to_keep)
+        messages_to_keep = plan.kept(messages)
+        messages_removed = len(plan.remove_indices)
+        tokens_removed = plan.tokens_removed
+        tokens_kept = plan.tokens_kept
+
+        # Removed messages must reach persistent memory before they leave the active context
+        if self.persistent_memory:
+            try:
+                await self.persistent_memory.flush()
+            except Exception as e:
+                logger.warning(f"Failed to flush persistent memory before compression: {e}")
 
         # Update conversation memory
         try:
@@ -175,6 +184,11 @@ class ContextCompressor:
 
         return stats
 
+    def _plan(self, messages: List[Dict[str, Any]], target_tokens: int) -> CompressionPlan:
+        """Estimate every message once (batched, cached) and plan the compression."""
+        token_counts = self.token_calculator.estimate_tokens_many([[msg] for msg in messages])
+        return plan_compression(messages, token_counts, target_tokens, self.keep_strategy)
+
     def _select_messages_to_keep(
         self,
         messages: List[Dict[str, Any]],
@@ -183,7 +197,7 @@ class ContextCompressor:
         """
         Select which messages to keep in active context.
 
-        Strategy:
+        Strategy (default RecentWindowStrategy):
         1. Always keep system messages at the start
         2. Keep most recent messages that fit in target_tokens
         3. Remove everything in between
@@ -197,36 +211,7 @@ class ContextCompressor:
         """
         if not messages:
             return []
-
-        # Separate system messages from others
-        system_messages = []
-        non_system_messages = []
-
-        for msg in messages:
-            if msg.get("role") == "system":
-                system_messages.append(msg)
-            else:
-                non_system_messages.append(msg)
-
-        # Start with system messages in kept list
-        messages_to_keep = system_messages.copy()
-        tokens_so_far = self.token_calculator.estimate_tokens(system_messages)
-
-        # Work backwards from most recent, adding messages until we hit target
-        recent_messages_to_keep = []
-        for msg in reversed(non_system_messages):
-            msg_tokens = self.token_calculator.estimate_tokens([msg])
-            if tokens_so_far + msg_tokens <= target_tokens:
-                tokens_so_far += msg_tokens
-                recent_messages_to_keep.insert(0, msg)  # Maintain order
-            else:
-                # Hit token limit, stop here
-                break
-
-        # Combine: system messages + recent messages
-        messages_to_keep.extend(recent_messages_to_keep)
-
-        return messages_to_keep
+        return self._plan(messages, target_tokens).kept(messages)
 
     def get_stats(self) -> Dict[str, Any]:
         """Get compression statistics."""
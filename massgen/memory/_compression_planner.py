@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+"""
+Compression Planning
+
+Decides which messages stay in active context when the context window fills up.
+Planning works on message indices and precomputed per-message token counts, so a
+plan is a single O(n) pass over the conversation regardless of its length.
+
+The policy for what to keep is pluggable through ``KeepStrategy``:
+- ``RecentWindowStrategy``: system messages plus the most recent messages that fit
+- ``ToolPairPreservingStrategy``: same, but never separates tool calls from their results
+- ``SummaryAnchoredStrategy``: also pins anchor messages (the original task, summaries)
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass
+class CompressionPlan:
+    """Result of planning a compression: which message indices to keep or drop."""
+
+    keep_indices: List[int]
+    remove_indices: List[int]
+    tokens_kept: int
+    tokens_removed: int
+
+    def kept(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Messages to keep, in their original order."""
+        return [messages[i] for i in self.keep_indices]
+
+    def removed(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Messages to drop, in their original order."""
+        return [messages[i] for i in self.remove_indices]
+
+
+class KeepStrategy(ABC):
+    """Policy that marks which messages survive compression."""
+
+    @abstractmethod
+    def select(self, messages: List[Dict[str, Any]], token_counts: List[int], target_tokens: int) -> List[bool]:
+        """
+        Mark messages to keep.
+
+        Args:
+            messages: All messages in conversation
+            token_counts: Estimated tokens of each message (same length as messages)
+            target_tokens: Target token budget for kept messages
+
+        Returns:
+            Keep flag for each message
+        """
+
+
+def _keep_system_messages(messages: List[Dict[str, Any]], token_counts: List[int], keep: List[bool]) -> int:
+    """Mark every system message as kept and return their total tokens."""
+    tokens = 0
+    for i, msg in enumerate(messages):
+        if msg.get("role") == "system":
+            keep[i] = True
+            tokens += token_counts[i]
+    return tokens
+
+
+def _fill_recent(groups: List[List[int]], token_counts: List[int], keep: List[bool], tokens_so_far: int, target_tokens: int) -> int:
+    """Keep whole groups from the most recent backwards until the next one does not fit."""
+    for group in reversed(groups):
+        group_tokens = sum(token_counts[i] for i in group if not keep[i])
+        if tokens_so_far + group_tokens > target_tokens:
+            break
+        tokens_so_far += group_tokens
+        for i in group:
+            keep[i] = True
+    return tokens_so_far
+
+
+class RecentWindowStrategy(KeepStrategy):
+    """Keep system messages, then the most recent messages that fit in the budget."""
+
+    def select(self, messages: List[Dict[str, Any]], token_counts: List[int], target_tokens: int) -> List[bool]:
+        keep = [False] * len(messages)
+        tokens_so_far = _keep_system_messages(messages, token_counts, keep)
+        groups = [[i] for i, msg in enumerate(messages) if msg.get("role") != "system"]
+        _fill_recent(groups, token_counts, keep, tokens_so_far, target_tokens)
+        return keep
+
+
+class ToolPairPreservingStrategy(KeepStrategy):
+    """
+    Recent-window selection that keeps tool calls and their results together.
+
+    An assistant message with ``tool_calls`` and the tool result messages that follow it
+    (``role: tool``, or user messages carrying ``tool_result`` content blocks) form one
+    unit that is kept or dropped as a whole, so providers never see orphaned results.
+    """
+
+    @staticmethod
+    def _is_tool_result(msg: Dict[str, Any]) -> bool:
+        if msg.get("role") == "tool":
+            return True
+        content = msg.get("content")
+        return msg.get("role") == "user" and isinstance(content, list) and any(isinstance(item, dict) and item.get("type") == "tool_result" for item in content)
+
+    @staticmethod
+    def _has_tool_calls(msg: Dict[str, Any]) -> bool:
+        if msg.get("tool_calls"):
+            return True
+        content = msg.get("content")
+        return msg.get("role") == "assistant" and isinstance(content, list) and any(isinstance(item, dict) and item.get("type") == "tool_use" for item in content)
+
+    def select(self, messages: List[Dict[str, Any]], token_counts: List[int], target_tokens: int) -> List[bool]:
+        keep = [False] * len(messages)
+        tokens_so_far = _keep_system_messages(messages, token_counts, keep)
+
+        groups: List[List[int]] = []
+        in_tool_group = False
+        for i, msg in enumerate(messages):
+            if msg.get("role") == "system":
+                continue
+            if in_tool_group and self._is_tool_result(msg):
+                groups[-1].append(i)
+                continue
+            groups.append([i])
+            in_tool_group = self._has_tool_calls(msg)
+
+        _fill_recent(groups, token_counts, keep, tokens_so_far, target_tokens)
+        return keep
+
+
+class SummaryAnchoredStrategy(KeepStrategy):
+    """
+    Pin anchor messages, then fill the remaining budget with recent messages.
+
+    By default the anchors are the first user message (the original task) and any
+    message flagged as a summary (``{"summary": True}``). Anchors are kept only while
+    they fit in the budget, oldest first.
+    """
+
+    def __init__(
+        self,
+        is_anchor: Optional[Callable[[int, Dict[str, Any]], bool]] = None,
+        recent_strategy: Optional[KeepStrategy] = None,
+    ):
+        """
+        Args:
+            is_anchor: Optional predicate (index, message) -> bool overriding the default anchors
+            recent_strategy: Strategy used for the non-anchor budget (default: tool-pair preserving)
+        """
+        self.is_anchor = is_anchor
+        self.recent_strategy = recent_strategy or ToolPairPreservingStrategy()
+
+    def _anchor_indices(self, messages: List[Dict[str, Any]]) -> List[int]:
+        if self.is_anchor is not None:
+            return [i for i, msg in enumerate(messages) if self.is_anchor(i, msg)]
+
+        anchors = []
+        seen_first_user = False
+        for i, msg in enumerate(messages):
+            if msg.get("summary"):
+                anchors.append(i)
+            elif msg.get("role") == "user" and not seen_first_user:
+                seen_first_user = True
+                anchors.append(i)
+        return anchors
+
+    def select(self, messages: List[Dict[str, Any]], token_counts: List[int], target_tokens: int) -> List[bool]:
+        keep = [False] * len(messages)
+        tokens_so_far = _keep_system_messages(messages, token_counts, keep)
+        for i in self._anchor_indices(messages):
+            if not keep[i] and tokens_so_far + token_counts[i] <= target_tokens:
+                keep[i] = True
+                tokens_so_far += token_counts[i]
+
+        # Let the recent strategy spend what is left on the remaining messages
+        rest = [i for i in range(len(messages)) if not keep[i]]
+        rest_keep = self.recent_strategy.select(
+            [messages[i] for i in rest],
+            [token_counts[i] for i in rest],
+            target_tokens - tokens_so_far,
+        )
+        for i, kept in zip(rest, rest_keep):
+            keep[i] = kept
+        return keep
+
+
+def plan_compression(
+    messages: List[Dict[str, Any]],
+    token_counts: List[int],
+    target_tokens: int,
+    strategy: Optional[KeepStrategy] = None,
+) -> CompressionPlan:
+    """
+    Plan which messages to keep in O(n) from precomputed per-message token counts.
+
+    Args:
+        messages: All messages in conversation
+        token_counts: Estimated tokens of each message
+        target_tokens: Target token budget for kept messages
+        strategy: Keep strategy (default: RecentWindowStrategy)
+
+    Returns:
+        CompressionPlan with kept/removed indices and their token totals
+    """
+    if len(token_counts) != len(messages):
+        raise ValueError(f"Expected {len(messages)} token counts, got {len(token_counts)}")
+
+    keep = (strategy or RecentWindowStrategy()).select(messages, token_counts, target_tokens)
+
+    keep_indices: List[int] = []
+    remove_indices: List[int] = []
+    tokens_kept = 0
+    tokens_removed = 0
+    for i, kept in enumerate(keep):
+        if kept:
+            keep_indices.append(i)
+            tokens_kept += token_counts[i]
+        else:
+            remove_indices.append(i)
+            tokens_removed += token_counts[i]
+
+    return CompressionPlan(
+        keep_indices=keep_indices,
+        remove_indices=remove_indices,
+        tokens_kept=tokens_kept,
+        tokens_removed=tokens_removed,
+    )
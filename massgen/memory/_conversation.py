@@ -3,27 +3,190 @@
 Conversation memory implementation for MassGen.
 
 This module provides in-memory storage for conversation messages, optimized
-for quick access during active chat sessions.
+for quick access during active chat sessions. Long sessions can keep their
+messages in an append-only JSONL file instead, read back through a memory map.
 """
 
+import json
+import mmap
+import os
 import uuid
-from typing import Any, Dict, Iterable, List, Optional, Union
+import weakref
+from collections import Counter, OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from ._base import MemoryBase
 
+# (offset, length, id, role) of a message line in a file-backed memory
+_Record = Tuple[int, int, Any, Any]
+
+# Rewrite the file once deleted lines outweigh live ones (and exceed this many bytes)
+COMPACT_MIN_BYTES = 1024 * 1024
+
+# Key of the lines recording deletions (the offsets of deleted message lines)
+_DELETED_KEY = "__deleted__"
+
+
+class _ReadOnlyMessage(dict):
+    """
+    A stored message.
+
+    It is a plain dict to every consumer (JSON encoders, provider SDKs), but cannot be
+    modified, so the memory can hand out the stored object instead of a copy on every
+    read. ``copy()`` (and ``copy.deepcopy``) return ordinary, mutable dicts.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("Messages returned by ConversationMemory are read-only; use message.copy() to modify one")
+
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _read_only
+
+    def copy(self) -> Dict[str, Any]:
+        return dict(self)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (dict, (dict(self),))
+
+
+class _JsonlStore:
+    """Append-only JSONL file of messages, read back through a memory map."""
+
+    def __init__(self, path: Union[str, Path], cache_size: int) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_size = max(0, cache_size)
+        self.dead_bytes = 0
+        self._cache: "OrderedDict[int, _ReadOnlyMessage]" = OrderedDict()
+        self._map: Optional[mmap.mmap] = None
+        self._file = open(self.path, "a+b")
+        self._finalizer = weakref.finalize(self, self._file.close)
+
+    def index(self) -> List[_Record]:
+        """Index the messages already in the file (resuming an earlier session)."""
+        records: List[_Record] = []
+        deleted = set()
+        self._file.seek(0)
+        offset = 0
+        for line in self._file:
+            stripped = line.rstrip(b"\n")
+            if stripped:
+                message = json.loads(stripped)
+                if isinstance(message, dict) and _DELETED_KEY in message:
+                    deleted.update(message[_DELETED_KEY])
+                    self.dead_bytes += len(line)
+                elif isinstance(message, dict):
+                    records.append((offset, len(stripped), message.get("id"), message.get("role")))
+            offset += len(line)
+        live = [record for record in records if record[0] not in deleted]
+        self.dead_bytes += sum(record[1] + 1 for record in records if record[0] in deleted)
+        return live
+
+    def append(self, messages: List[_ReadOnlyMessage]) -> List[_Record]:
+        # Serialize everything first so an unserializable message adds nothing
+        lines = [json.dumps(message, ensure_ascii=False).encode("utf-8") for message in messages]
+        offset = self._file.seek(0, os.SEEK_END)
+        self._file.write(b"".join(line + b"\n" for line in lines))
+        self._file.flush()
+
+        records = []
+        for message, line in zip(messages, lines):
+            records.append((offset, len(line), message.get("id"), message.get("role")))
+            self._remember(offset, message)
+            offset += len(line) + 1
+        return records
+
+    def load(self, record: _Record) -> _ReadOnlyMessage:
+        offset, length = record[0], record[1]
+        message = self._cache.get(offset)
+        if message is not None:
+            self._cache.move_to_end(offset)
+            return message
+        if self._map is None or offset + length > len(self._map):
+            # The file grew since it was mapped
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        message = _ReadOnlyMessage(json.loads(self._map[offset : offset + length]))
+        self._remember(offset, message)
+        return message
+
+    def discard(self, records: Iterable[_Record]) -> None:
+        """Record the deletion of messages in the file (reclaimed by ``compact``)."""
+        offsets = []
+        for record in records:
+            offsets.append(record[0])
+            self.dead_bytes += record[1] + 1
+            self._cache.pop(record[0], None)
+        if offsets:
+            line = json.dumps({_DELETED_KEY: offsets}).encode("utf-8") + b"\n"
+            self._file.seek(0, os.SEEK_END)
+            self._file.write(line)
+            self._file.flush()
+            self.dead_bytes += len(line)
+
+    def needs_compaction(self) -> bool:
+        size = self._file.seek(0, os.SEEK_END)
+        return self.dead_bytes > max(size - self.dead_bytes, COMPACT_MIN_BYTES)
+
+    def compact(self, records: List[_Record]) -> List[_Record]:
+        """Rewrite the file with only the given records; returns their new locations."""
+        self._file.seek(0)
+        data = self._file.read()
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        compacted: List[_Record] = []
+        offset = 0
+        with open(temp_path, "wb") as temp:
+            for start, length, message_id, role in records:
+                temp.write(data[start : start + length] + b"\n")
+                compacted.append((offset, length, message_id, role))
+                offset += length + 1
+        self._reopen(lambda: os.replace(temp_path, self.path))
+        return compacted
+
+    def clear(self) -> None:
+        self._reopen(lambda: open(self.path, "wb").close())
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._finalizer()
+
+    def _remember(self, offset: int, message: _ReadOnlyMessage) -> None:
+        if not self.cache_size:
+            return
+        self._cache[offset] = message
+        self._cache.move_to_end(offset)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _reopen(self, replace_file: Callable[[], None]) -> None:
+        self.close()
+        replace_file()
+        self.dead_bytes = 0
+        self._cache.clear()
+        self._file = open(self.path, "a+b")
+        self._finalizer = weakref.finalize(self, self._file.close)
+
 
 class ConversationMemory(MemoryBase):
     """
     In-memory storage for conversation messages.
 
     This memory type is designed for short-term storage of ongoing conversations.
-    It keeps messages in a simple list structure for fast access and iteration.
+    Messages are kept in an append-optimized list with an index of their IDs, and
+    are stored read-only so reads return them without copying.
 
     Features:
-    - Fast in-memory access
-    - Duplicate detection based on message IDs
+    - Fast in-memory access; reads share the stored (read-only) messages
+    - O(1) duplicate detection based on message IDs
     - Index-based deletion
     - State serialization for session persistence
+    - Optional file backing (``storage_path``): messages are appended to a JSONL file
+      and read back through a memory map, so only recently used ones stay in RAM
 
     Example:
         >>> memory = ConversationMemory()
@@ -32,10 +195,25 @@ class ConversationMemory(MemoryBase):
         >>> print(len(messages))  # 1
     """
 
-    def __init__(self) -> None:
-        """Initialize an empty conversation memory."""
+    def __init__(self, storage_path: Optional[Union[str, Path]] = None, cache_size: int = 256) -> None:
+        """
+        Initialize an empty conversation memory.
+
+        Args:
+            storage_path: JSONL file to keep messages in instead of RAM. Messages already
+                in the file are loaded (resuming a session); they must be JSON-serializable.
+            cache_size: Decoded messages kept in RAM when file-backed
+        """
         super().__init__()
-        self.messages: List[Dict[str, Any]] = []
+        self._store = _JsonlStore(storage_path, cache_size) if storage_path else None
+        # Messages themselves, or their _Record locations when file-backed
+        self._records: List[Any] = self._store.index() if self._store else []
+        self._id_counts: Counter = Counter(self._record_id(record) for record in self._records if self._has_id(record))
+
+    @property
+    def messages(self) -> List[Dict[str, Any]]:
+        """All stored messages (read-only)."""
+        return self._load(self._records)
 
     def state_dict(self) -> Dict[str, Any]:
         """
@@ -68,11 +246,10 @@ class ConversationMemory(MemoryBase):
                 "State dictionary must contain 'messages' key when strict=True",
             )
 
-        self.messages = []
-        for msg_data in state_dict.get("messages", []):
-            # Ensure each message is a proper dictionary
-            if isinstance(msg_data, dict):
-                self.messages.append(msg_data.copy())
+        # Ensure each message is a proper dictionary
+        messages = [_ReadOnlyMessage(msg_data) for msg_data in state_dict.get("messages", []) if isinstance(msg_data, dict)]
+        self._reset()
+        self._append(messages)
 
     async def size(self) -> int:
         """
@@ -81,7 +258,7 @@ class ConversationMemory(MemoryBase):
         Returns:
             Count of stored messages
         """
-        return len(self.messages)
+        return len(self._records)
 
     async def retrieve(self, *args: Any, **kwargs: Any) -> None:
         """
@@ -110,19 +287,22 @@ class ConversationMemory(MemoryBase):
             >>> await memory.delete(0)  # Delete first message
             >>> await memory.delete([1, 3, 5])  # Delete multiple messages
         """
-        if isinstance(index, int):
-            index = [index]
+        index = [index] if isinstance(index, int) else list(index)
 
         # Validate all indices first
-        invalid_indices = [i for i in index if i < 0 or i >= len(self.messages)]
+        invalid_indices = [i for i in index if i < 0 or i >= len(self._records)]
 
         if invalid_indices:
             raise IndexError(
-                f"The following indices do not exist: {invalid_indices}. " f"Valid range is 0-{len(self.messages) - 1}",
+                f"The following indices do not exist: {invalid_indices}. " f"Valid range is 0-{len(self._records) - 1}",
             )
 
-        # Create new list excluding deleted indices
-        self.messages = [msg for idx, msg in enumerate(self.messages) if idx not in index]
+        # Delete in place, last index first so earlier positions stay valid
+        removed = []
+        for i in sorted(set(index), reverse=True):
+            removed.append(self._records[i])
+            del self._records[i]
+        self._forget(removed)
 
     async def add(
         self,
@@ -169,20 +349,21 @@ class ConversationMemory(MemoryBase):
                     f"Each message should be a dictionary, but got {type(msg)}",
                 )
 
-        # Add message IDs if not present (for duplicate detection)
+        # Store read-only copies with message IDs (for duplicate detection); messages
+        # read from a memory are read-only already and are stored as they are
         processed_messages = []
         for msg in messages:
-            msg_copy = msg.copy()
-            if "id" not in msg_copy:
-                msg_copy["id"] = f"msg_{uuid.uuid4().hex[:12]}"
-            processed_messages.append(msg_copy)
+            if "id" not in msg:
+                msg = _ReadOnlyMessage(msg, id=f"msg_{uuid.uuid4().hex[:12]}")
+            elif not isinstance(msg, _ReadOnlyMessage):
+                msg = _ReadOnlyMessage(msg)
+            processed_messages.append(msg)
 
         # Filter duplicates if needed
         if not allow_duplicates:
-            existing_ids = {msg.get("id") for msg in self.messages if "id" in msg}
-            processed_messages = [msg for msg in processed_messages if msg.get("id") not in existing_ids]
+            processed_messages = [msg for msg in processed_messages if msg["id"] not in self._id_counts]
 
-        self.messages.extend(processed_messages)
+        self._append(processed_messages)
 
     async def get_messages(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
@@ -192,7 +373,8 @@ class ConversationMemory(MemoryBase):
             limit: Optional limit on number of most recent messages to return
 
         Returns:
-            List of message dictionaries (copies, not references)
+            List of the stored message dictionaries. They are read-only (modifying
+            one raises TypeError); use ``message.copy()`` for a mutable copy.
 
         Example:
             >>> # Get all messages
@@ -202,8 +384,8 @@ class ConversationMemory(MemoryBase):
             >>> recent = await memory.get_messages(limit=10)
         """
         if limit is not None and limit > 0:
-            return [msg.copy() for msg in self.messages[-limit:]]
-        return [msg.copy() for msg in self.messages]
+            return self._load(self._records[-limit:])
+        return self._load(self._records)
 
     async def clear(self) -> None:
         """
@@ -213,18 +395,18 @@ class ConversationMemory(MemoryBase):
             >>> await memory.clear()
             >>> assert await memory.size() == 0
         """
-        self.messages = []
+        self._reset()
 
     async def get_last_message(self) -> Optional[Dict[str, Any]]:
         """
         Get the most recent message.
 
         Returns:
-            Last message dictionary, or None if memory is empty
+            Last message dictionary (read-only), or None if memory is empty
         """
-        if not self.messages:
+        if not self._records:
             return None
-        return self.messages[-1].copy()
+        return self._load(self._records[-1:])[0]
 
     async def get_messages_by_role(self, role: str) -> List[Dict[str, Any]]:
         """
@@ -234,9 +416,11 @@ class ConversationMemory(MemoryBase):
             role: Role to filter by (e.g., 'user', 'assistant', 'system')
 
         Returns:
-            List of messages with matching role
+            List of messages with matching role (read-only)
         """
-        return [msg.copy() for msg in self.messages if msg.get("role") == role]
+        if self._store is None:
+            return [msg for msg in self._records if msg.get("role") == role]
+        return self._load([record for record in self._records if record[3] == role])
 
     async def truncate_to_size(self, max_messages: int) -> None:
         """
@@ -251,5 +435,48 @@ class ConversationMemory(MemoryBase):
             >>> # Keep only last 100 messages
             >>> await memory.truncate_to_size(100)
         """
-        if max_messages < len(self.messages):
-            self.messages = self.messages[-max_messages:]
+        excess = len(self._records) - max(max_messages, 0)
+        if excess > 0:
+            removed = self._records[:excess]
+            del self._records[:excess]
+            self._forget(removed)
+
+    def close(self) -> None:
+        """Release the backing file of a file-backed memory (no-op otherwise)."""
+        if self._store is not None:
+            self._store.close()
+
+    def _load(self, records: List[Any]) -> List[Dict[str, Any]]:
+        if self._store is None:
+            return list(records)
+        return [self._store.load(record) for record in records]
+
+    def _record_id(self, record: Any) -> Any:
+        return record.get("id") if self._store is None else record[2]
+
+    def _has_id(self, record: Any) -> bool:
+        return "id" in record if self._store is None else record[2] is not None
+
+    def _append(self, messages: List[_ReadOnlyMessage]) -> None:
+        records = messages if self._store is None else self._store.append(messages)
+        self._records.extend(records)
+        self._id_counts.update(self._record_id(record) for record in records if self._has_id(record))
+
+    def _forget(self, records: List[Any]) -> None:
+        """Update the ID index (and the backing file) after records were removed."""
+        for record in records:
+            if self._has_id(record):
+                message_id = self._record_id(record)
+                self._id_counts[message_id] -= 1
+                if self._id_counts[message_id] <= 0:
+                    del self._id_counts[message_id]
+        if self._store is not None:
+            self._store.discard(records)
+            if self._store.needs_compaction():
+                self._records = self._store.compact(self._records)
+
+    def _reset(self) -> None:
+        self._records = []
+        self._id_counts.clear()
+        if self._store is not None:
+            self._store.clear()
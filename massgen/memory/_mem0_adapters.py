@@ -8,6 +8,9 @@ backends to work seamlessly with the mem0 memory system.
 
 import asyncio
 import concurrent.futures
+import hashlib
+import threading
+from collections import OrderedDict
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -16,6 +19,7 @@ from typing import (
     List,
     Literal,
     Optional,
+    Tuple,
     TypeVar,
     Union,
 )
@@ -32,23 +36,70 @@ else:
     BaseEmbedderConfig = Any
     BaseLlmConfig = Any
 
+# How long the first embed() of a batch waits for concurrent ones to join it (seconds)
+EMBED_BATCH_WINDOW = 0.005
+# Largest number of texts sent to the embedding backend in one call
+EMBED_MAX_BATCH_SIZE = 64
+# Embedding vectors kept per adapter, keyed by a hash of their text
+EMBED_CACHE_SIZE = 4096
 
-def _run_async_safely(coro: Coroutine[Any, Any, T]) -> T:
+
+class _BackgroundLoop:
     """
-    Run async code properly, handling both sync and nested async contexts.
+    An event loop running forever in a daemon thread.
+
+    All adapter coroutines run on this one loop, so they pay no thread or loop
+    startup per call and the HTTP clients they create keep their connections.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._thread is None or not self._thread.is_alive():
+                loop = asyncio.new_event_loop()
+                started = threading.Event()
+
+                def run() -> None:
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(started.set)
+                    loop.run_forever()
+
+                self._thread = threading.Thread(target=run, name="massgen-mem0-loop", daemon=True)
+                self._thread.start()
+                started.wait()
+                self._loop = loop
+            return self._loop
+
+    def in_loop_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the loop and block until it finishes."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
 
-    This is needed because mem0's sync adapter interface (LLMBase.generate_response,
-    EmbeddingBase.embed) can be called from async contexts when using AsyncMemory.
 
-    The problem with naive asyncio.run():
-    - If we're already in an event loop, asyncio.run() raises RuntimeError
-    - If we force a new loop, httpcore connections get confused about which loop owns them
-    - This causes "async generator ignored GeneratorExit" and lifecycle errors
+_background_loop = _BackgroundLoop()
 
-    Solution:
-    - Detect if we're in an async context (running event loop exists)
-    - If YES: Run the coroutine in a separate thread with its own event loop
-    - If NO: Use asyncio.run() normally
+
+def _run_async_safely(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run async code from mem0's synchronous adapter interface.
+
+    mem0's sync adapter interface (LLMBase.generate_response, EmbeddingBase.embed)
+    is called from worker threads by AsyncMemory and directly by Memory, so the
+    caller may or may not have a running event loop. Naive asyncio.run() fails in
+    the first case, and a fresh loop per call throws away connections (httpcore
+    connections belong to the loop that opened them).
+
+    Coroutines are therefore submitted to a long-lived background loop and the
+    caller blocks until they finish. The only exception is a call made from the
+    background loop itself, which would deadlock; it gets a loop of its own in a
+    separate thread.
 
     Args:
         coro: Coroutine to execute
@@ -61,19 +112,70 @@ def _run_async_safely(coro: Coroutine[Any, Any, T]) -> T:
         ...     return "data"
         >>> result = _run_async_safely(get_data())  # Works in both sync and async contexts
     """
-    try:
-        # Check if we're already in an event loop
-        asyncio.get_running_loop()
-
-        # We are in an async context - run in a thread pool to avoid conflicts
-        # This gives the coroutine its own event loop in a separate thread
+    if _background_loop.in_loop_thread():
         with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(asyncio.run, coro)
-            return future.result()
+            return executor.submit(asyncio.run, coro).result()
+    return _background_loop.run(coro)
+
+
+class _EmbeddingBatcher:
+    """
+    Coalesces concurrent embedding requests into batched backend calls.
 
-    except RuntimeError:
-        # No running loop - safe to use asyncio.run() directly
-        return asyncio.run(coro)
+    Lives on the background loop: the first request of a batch waits
+    ``window`` seconds (or until ``max_batch_size`` texts are pending) for others
+    to join, then all pending texts are embedded with one backend call.
+    """
+
+    def __init__(self, embed_texts: Any, window: float, max_batch_size: int) -> None:
+        self._embed_texts = embed_texts
+        self.window = window
+        self.max_batch_size = max(1, max_batch_size)
+        self._pending: "OrderedDict[str, asyncio.Future]" = OrderedDict()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._sending: set = set()
+        self.backend_calls = 0
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        loop = asyncio.get_running_loop()
+        futures = []
+        for text in texts:
+            future = self._pending.get(text)
+            if future is None:
+                future = self._pending[text] = loop.create_future()
+            futures.append(future)
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._flush)
+        return list(await asyncio.gather(*futures))
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        while self._pending:
+            batch = []
+            while self._pending and len(batch) < self.max_batch_size:
+                batch.append(self._pending.popitem(last=False))
+            task = asyncio.ensure_future(self._send(batch))
+            self._sending.add(task)
+            task.add_done_callback(self._sending.discard)
+
+    async def _send(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        self.backend_calls += 1
+        try:
+            vectors = await self._embed_texts([text for text, _ in batch])
+            if len(vectors) != len(batch):
+                raise ValueError(f"Embedding backend returned {len(vectors)} embeddings for {len(batch)} texts")
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), vector in zip(batch, vectors):
+            if not future.done():
+                future.set_result(vector)
 
 
 class MassGenLLMAdapter(LLMBase):
@@ -179,6 +281,10 @@ class MassGenEmbeddingAdapter(EmbeddingBase):
     This enables mem0 to use any MassGen-compatible embedding model for
     creating vector representations of memories.
 
+    Embeddings are cached by a hash of their text, and concurrent requests
+    (mem0 embeds extracted facts from several threads) are coalesced into
+    batched backend calls.
+
     NOTE: Currently, we do not have any MassGen embedding backends integrated,
     so this adapter serves as a template for future implementations.
     """
@@ -198,6 +304,13 @@ class MassGenEmbeddingAdapter(EmbeddingBase):
         # Store the MassGen embedding backend
         self.massgen_backend = self.config.model
 
+        # Embeddings by SHA-256 of their text (embed() runs in several threads)
+        self.cache_size = EMBED_CACHE_SIZE
+        self.cache_hits = 0
+        self._cache: "OrderedDict[bytes, List[float]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._batcher = _EmbeddingBatcher(self._embed_texts, EMBED_BATCH_WINDOW, EMBED_MAX_BATCH_SIZE)
+
     def embed(
         self,
         text: Union[str, List[str]],
@@ -217,41 +330,74 @@ class MassGenEmbeddingAdapter(EmbeddingBase):
             If text is a list, only the first element's embedding is returned,
             as mem0 typically processes one item at a time.
         """
-        try:
-            # Normalize input to list format
-            text_list = [text] if isinstance(text, str) else text
-
-            # Call the MassGen embedding backend asynchronously
-            async def _async_embed():
-                # MassGen embedding backends typically have an async call method
-                # or similar interface
-                if hasattr(self.massgen_backend, "__call__"):
-                    response = await self.massgen_backend(text_list)
-                elif hasattr(self.massgen_backend, "embed"):
-                    response = await self.massgen_backend.embed(text_list)
-                else:
-                    raise AttributeError(
-                        "MassGen backend must have __call__ or embed method",
-                    )
-
-                return response
-
-            # Run async call safely (handles both sync and async contexts)
-            response = _run_async_safely(_async_embed())
+        text_list = [text] if isinstance(text, str) else text
+        if not text_list:
+            raise RuntimeError("Error generating embedding with MassGen backend: no text to embed")
+        return self.embed_batch(text_list[:1], memory_action)[0]
 
-            # Extract embedding vector from response
-            # MassGen embedding response format: response.embeddings[0]
-            if hasattr(response, "embeddings") and response.embeddings:
-                embedding = response.embeddings[0]
+    def embed_batch(
+        self,
+        texts: List[str],
+        memory_action: Optional[Literal["add", "search", "update"]] = "add",
+    ) -> List[List[float]]:
+        """
+        Generate embeddings for several texts.
 
-                # Handle both list and numpy array formats
-                if hasattr(embedding, "tolist"):
-                    return embedding.tolist()
-                return list(embedding)
+        Cached texts are answered without a backend call; the rest are embedded
+        together, batched with any concurrent embed() calls.
 
-            raise ValueError("Could not extract embedding from backend response")
+        Args:
+            texts: Text strings to embed
+            memory_action: Type of memory operation (not currently used)
 
-        except Exception as e:
-            raise RuntimeError(
-                f"Error generating embedding with MassGen backend: {str(e)}",
-            ) from e
+        Returns:
+            One embedding vector per text
+        """
+        keys = [hashlib.sha256(text.encode("utf-8")).digest() for text in texts]
+        vectors: List[Optional[List[float]]] = []
+        with self._cache_lock:
+            for key in keys:
+                vector = self._cache.get(key)
+                if vector is not None:
+                    self._cache.move_to_end(key)
+                vectors.append(vector)
+            missing = [text for text, vector in zip(texts, vectors) if vector is None]
+            self.cache_hits += len(texts) - len(missing)
+
+        if missing:
+            try:
+                computed = iter(_run_async_safely(self._batcher.embed(missing)))
+            except Exception as e:
+                raise RuntimeError(
+                    f"Error generating embedding with MassGen backend: {str(e)}",
+                ) from e
+            with self._cache_lock:
+                for index, key in enumerate(keys):
+                    if vectors[index] is None:
+                        vectors[index] = self._cache[key] = next(computed)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        # Copies, so callers cannot alter the cached vectors
+        return [list(vector) for vector in vectors]
+
+    async def _embed_texts(self, text_list: List[str]) -> List[List[float]]:
+        """Embed texts with one backend call (runs on the background loop)."""
+        # MassGen embedding backends typically have an async call method
+        # or similar interface
+        if hasattr(self.massgen_backend, "__call__"):
+            response = await self.massgen_backend(text_list)
+        elif hasattr(self.massgen_backend, "embed"):
+            response = await self.massgen_backend.embed(text_list)
+        else:
+            raise AttributeError(
+                "MassGen backend must have __call__ or embed method",
+            )
+
+        # Extract embedding vectors from response
+        # MassGen embedding response format: response.embeddings[i]
+        if hasattr(response, "embeddings") and response.embeddings:
+            # Handle both list and numpy array formats
+            return [embedding.tolist() if hasattr(embedding, "tolist") else list(embedding) for embedding in response.embeddings]
+
+        raise ValueError("Could not extract embedding from backend response")
@@ -6,6 +6,7 @@ This module provides long-term memory storage with semantic retrieval capabiliti
 enabling agents to remember and recall information across multiple sessions.
 """
 
+import json
 from importlib import metadata
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
@@ -14,6 +15,7 @@ from pydantic import field_validator
 from ._base import PersistentMemoryBase
 from ._fact_extraction_prompts import get_fact_extraction_prompt
 from ._update_prompts import get_update_memory_prompt
+from ._write_behind import DEFAULT_MAX_QUEUE_SIZE, WriteBehindRecorder
 
 if TYPE_CHECKING:
     from mem0.configs.base import MemoryConfig
@@ -22,6 +24,11 @@ else:
     MemoryConfig = Any
     VectorStoreConfig = Any
 
+# Metadata fields summed up when queued records are merged into one mem0 add
+_MERGED_METADATA_FIELDS = ("tools_used", "has_tools", "message_count")
+# Longest combined content sent to fact extraction in one mem0 add
+MAX_MERGED_CONTENT_CHARS = 16000
+
 
 def _create_massgen_mem0_config_classes():
     """
@@ -76,6 +83,9 @@ class PersistentMemory(PersistentMemoryBase):
     - Automatic memory summarization and organization
     - Persistent storage across sessions
     - Metadata-based filtering (agent, user, session)
+    - Write-behind recording: ``record()`` queues and returns, a background
+      worker runs fact extraction (``flush()`` waits for it; ``retrieve()``
+      does not)
 
     Example:
         >>> # Initialize with MassGen backends
@@ -109,6 +119,8 @@ class PersistentMemory(PersistentMemoryBase):
         memory_type: Optional[str] = None,
         qdrant_client: Optional[Any] = None,
         debug: bool = False,
+        background_recording: bool = True,
+        max_pending_records: int = DEFAULT_MAX_QUEUE_SIZE,
         **kwargs: Any,
     ) -> None:
         """
@@ -157,6 +169,9 @@ class PersistentMemory(PersistentMemoryBase):
                 Note: Local file-based Qdrant doesn't support concurrent access.
                 Use qdrant_client from a Qdrant server for multi-agent scenarios.
             debug: Enable memory debug mode (saves messages and extracted facts to disk)
+            background_recording: Record in a background worker instead of inline. record()
+                then returns once the messages are queued; call flush() before shutdown
+            max_pending_records: Records queued before record() waits for the worker
             **kwargs: Additional options (e.g., on_disk=True for persistence)
 
         Raises:
@@ -209,6 +224,13 @@ class PersistentMemory(PersistentMemoryBase):
         self.user_id = user_name
         self.session_id = session_name
         self.debug = debug
+        self._recorder: Optional[WriteBehindRecorder] = None
+        if background_recording:
+            self._recorder = WriteBehindRecorder(
+                self._write_records,
+                max_queue_size=max_pending_records,
+                name=agent_name or user_name or session_name,
+            )
 
         # Configure mem0 instance
         if mem0_config is not None:
@@ -570,6 +592,8 @@ class PersistentMemory(PersistentMemoryBase):
         Developer interface: Record conversation messages to persistent memory.
 
         This is called automatically by the framework to save conversation history.
+        With background recording (the default) the messages are queued and fact
+        extraction runs in a background worker; use flush() to wait for it.
 
         Args:
             messages: List of message dictionaries to record
@@ -577,10 +601,40 @@ class PersistentMemory(PersistentMemoryBase):
             infer: Whether to let mem0 infer key information
             **kwargs: Additional mem0 recording options
         """
+        pending = self._prepare_record(messages, memory_type, infer, **kwargs)
+        if pending is None:
+            return
+        if self._recorder is not None:
+            await self._recorder.submit(pending)
+        else:
+            await self._write_records([pending])
+
+    async def flush(self) -> None:
+        """Wait until all queued records have been written to mem0."""
+        if self._recorder is not None:
+            await self._recorder.flush()
+
+    async def close(self) -> None:
+        """Write all queued records and stop the background worker."""
+        if self._recorder is not None:
+            await self._recorder.close()
+
+    def recording_stats(self) -> Dict[str, Any]:
+        """Background recording metrics (queue depth, batch sizes, latency); empty when recording inline."""
+        return self._recorder.stats() if self._recorder is not None else {}
+
+    def _prepare_record(
+        self,
+        messages: List[Dict[str, Any]],
+        memory_type: Optional[str],
+        infer: bool,
+        **kwargs: Any,
+    ) -> Optional[Dict[str, Any]]:
+        """Validate messages and build the mem0 add arguments for them (None if nothing to record)."""
         from ..logger_config import logger
 
         if not messages:
-            return
+            return None
 
         # Filter out None values, system messages, and messages with None/empty content
         valid_messages = []
@@ -604,7 +658,7 @@ class PersistentMemory(PersistentMemoryBase):
 
         if not valid_messages:
             logger.warning("⚠️  No valid messages to record (all were None or empty)")
-            return
+            return None
 
         # Convert to mem0 format
         # Combine all messages into a single conversation context for mem0
@@ -621,45 +675,76 @@ class PersistentMemory(PersistentMemoryBase):
         # Additional validation: Ensure combined content has substance
         if not combined_content.strip() or len(combined_content.strip()) < 10:
             logger.warning(f"⚠️  Combined content too short ({len(combined_content)} chars) - skipping mem0 recording")
-            return
+            return None
 
         # Extract structured metadata from messages
         extracted_metadata = self._extract_metadata(valid_messages)
 
         # Merge extracted metadata with user-provided metadata
-        user_metadata = kwargs.get("metadata", {})
+        user_metadata = kwargs.get("metadata") or {}
         full_metadata = {**extracted_metadata, **user_metadata}
 
-        # Log what we're about to send to mem0
-        logger.info(f"📝 [record] Combining {len(valid_messages)} message(s) for mem0 extraction")
-        logger.debug(f"   Combined content length: {len(combined_content)} chars")
-        logger.debug(f"   Extracted metadata: {extracted_metadata}")
-
-        # Show preview of what's being sent
-        preview_length = 500
-        if len(combined_content) > preview_length:
-            logger.debug(f"   Content preview (first {preview_length} chars):\n{combined_content[:preview_length]}...")
-        else:
-            logger.debug(f"   Full content:\n{combined_content}")
-
-        mem0_messages = [
-            {
-                "role": "assistant",
-                "content": combined_content,
-                "name": "conversation",
-            },
-        ]
+        logger.debug(f"📝 [record] Combining {len(valid_messages)} message(s) for mem0 extraction ({len(combined_content)} chars)")
 
         # Create new kwargs with full_metadata
         mem0_kwargs = {k: v for k, v in kwargs.items() if k != "metadata"}
         mem0_kwargs["metadata"] = full_metadata
 
-        await self._mem0_add(
-            mem0_messages,
-            memory_type=memory_type,
-            infer=infer,
-            **mem0_kwargs,
-        )
+        return {
+            "content": combined_content,
+            "memory_type": memory_type,
+            "infer": infer,
+            "kwargs": mem0_kwargs,
+        }
+
+    async def _write_records(self, pending: List[Dict[str, Any]]) -> None:
+        """
+        Write prepared records to mem0.
+
+        Consecutive records with the same options (and metadata apart from the
+        per-message counts) are merged, so a burst of records costs one fact
+        extraction instead of one each.
+        """
+        merged: List[Dict[str, Any]] = []
+        for record in pending:
+            last = merged[-1] if merged else None
+            if last is not None and self._merge_key(last) == self._merge_key(record) and len(last["content"]) + len(record["content"]) < MAX_MERGED_CONTENT_CHARS:
+                last_metadata = last["kwargs"]["metadata"]
+                metadata = record["kwargs"]["metadata"]
+                tools_used = list(dict.fromkeys([*last_metadata.get("tools_used", []), *metadata.get("tools_used", [])]))
+                last["content"] = f"{last['content']}\n{record['content']}"
+                last["kwargs"] = {
+                    **last["kwargs"],
+                    "metadata": {
+                        **last_metadata,
+                        "tools_used": tools_used,
+                        "has_tools": bool(tools_used),
+                        "message_count": last_metadata.get("message_count", 0) + metadata.get("message_count", 0),
+                    },
+                }
+            else:
+                merged.append(dict(record))
+
+        for record in merged:
+            mem0_messages = [
+                {
+                    "role": "assistant",
+                    "content": record["content"],
+                    "name": "conversation",
+                },
+            ]
+            await self._mem0_add(
+                mem0_messages,
+                memory_type=record["memory_type"],
+                infer=record["infer"],
+                **record["kwargs"],
+            )
+
+    @staticmethod
+    def _merge_key(record: Dict[str, Any]) -> str:
+        options = {k: v for k, v in record["kwargs"].items() if k != "metadata"}
+        metadata = {k: v for k, v in record["kwargs"]["metadata"].items() if k not in _MERGED_METADATA_FIELDS}
+        return json.dumps([record["memory_type"], record["infer"], options, metadata], sort_keys=True, default=str)
 
     async def _mem0_add(
         self,
@@ -698,7 +783,7 @@ class PersistentMemory(PersistentMemoryBase):
                     metadata_summary.append(f"tools={tools_used}")
                 if message_count:
                     metadata_summary.append(f"messages={message_count}")
-                logger.info(f"   📊 Metadata: {', '.join(metadata_summary)}")
+                logger.debug(f"   📊 Metadata: {', '.join(metadata_summary)}")
 
             # Debug: Show message preview
             if isinstance(messages, str):
@@ -731,11 +816,11 @@ class PersistentMemory(PersistentMemoryBase):
                 relation_count = len(results.get("relations", []))
                 result_count = len(result_list)
 
-                logger.info(f"   ✅ mem0 extracted {result_count} fact(s), {relation_count} relation(s)")
+                logger.info(f"   ✅ mem0 extracted {result_count} fact(s), {relation_count} relation(s) (agent={self.agent_id})")
 
                 # Show the actual extracted facts for verification
                 if result_count > 0:
-                    logger.info("   📋 Extracted facts:")
+                    logger.debug("   📋 Extracted facts:")
                     for i, result in enumerate(result_list[:5], 1):  # Show first 5 facts
                         if isinstance(result, dict):
                             # Result format: {"id": "...", "memory": "fact text", ...}
@@ -748,13 +833,13 @@ class PersistentMemory(PersistentMemoryBase):
                             else:
                                 fact_preview = fact_text
 
-                            logger.info(f"      [{i}] {fact_preview}")
+                            logger.debug(f"      [{i}] {fact_preview}")
                             logger.debug(f"          ID: {fact_id}")
                         else:
-                            logger.info(f"      [{i}] {str(result)[:150]}")
+                            logger.debug(f"      [{i}] {str(result)[:150]}")
 
                     if result_count > 5:
-                        logger.info(f"      ... and {result_count - 5} more fact(s)")
+                        logger.debug(f"      ... and {result_count - 5} more fact(s)")
                 else:
                     logger.warning("   ⚠️  mem0 extracted 0 facts (check fact extraction prompt or content quality)")
 
@@ -807,6 +892,11 @@ class PersistentMemory(PersistentMemoryBase):
         This is called automatically by the framework to inject relevant
         historical knowledge into the current conversation.
 
+        Retrieval never waits for background recording: it searches what has
+        been written so far, and records still queued (for this agent or a
+        previous winner) show up in later searches. Messages leave the active
+        context only through ContextCompressor, which flushes the queue first.
+
         Args:
             query: Query string or message(s) to search for
             limit: Maximum number of memories to retrieve per agent
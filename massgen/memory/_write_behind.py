@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+Write-behind queue for persistent memory recording.
+
+Recording to persistent memory runs fact extraction (an LLM call) and vector
+upserts, which can take seconds. A WriteBehindRecorder takes records from the
+agent's flow and hands them to a background worker, so ``record()`` returns as
+soon as the record is queued. The worker drains whatever accumulated while the
+previous write was running and passes it to ``write_batch`` in one call, which
+lets the caller merge records into fewer backend writes.
+
+The queue is bounded: when it is full, ``submit`` waits for the worker
+(backpressure) instead of letting pending records grow without limit.
+``flush()`` waits until every queued record is written; call it before shutdown.
+"""
+
+import asyncio
+import inspect
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from ..logger_config import logger
+
+DEFAULT_MAX_QUEUE_SIZE = 64
+DEFAULT_MAX_BATCH_SIZE = 16
+
+
+class WriteBehindRecorder:
+    """
+    Bounded queue with one background worker writing records in batches.
+
+    Args:
+        write_batch: Coroutine function writing a list of queued records. A bound method
+            is held weakly, so the recorder does not keep its owner alive
+        max_queue_size: Records queued before ``submit`` waits for the worker
+        max_batch_size: Most records passed to one ``write_batch`` call
+        name: Label for log messages
+    """
+
+    def __init__(
+        self,
+        write_batch: Callable[[List[Any]], Awaitable[None]],
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        name: str = "memory",
+    ) -> None:
+        self._write_batch = weakref.WeakMethod(write_batch) if inspect.ismethod(write_batch) else lambda: write_batch
+        self.max_queue_size = max(1, max_queue_size)
+        self.max_batch_size = max(1, max_batch_size)
+        self.name = name
+        self._queue: Optional["asyncio.Queue[Tuple[Any, float]]"] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.records = 0
+        self.batches = 0
+        self.failures = 0
+        self.backpressure_waits = 0
+        self.largest_batch = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def submit(self, record: Any) -> None:
+        """Queue a record for the worker; waits only while the queue is full."""
+        queue = self._ensure_worker()
+        if queue.full():
+            self.backpressure_waits += 1
+        await queue.put((record, time.monotonic()))
+
+    async def flush(self) -> None:
+        """Wait until every queued record has been written."""
+        if self._queue is not None and self._loop is asyncio.get_running_loop():
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Flush queued records and stop the worker."""
+        await self.flush()
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
+        self._queue = None
+        self._loop = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, batch sizes and record latency (queued to written, in seconds)."""
+        return {
+            "queue_depth": self.queue_depth,
+            "records": self.records,
+            "batches": self.batches,
+            "mean_batch_size": round(self.records / self.batches, 2) if self.batches else 0.0,
+            "largest_batch": self.largest_batch,
+            "mean_latency": round(self.total_latency / self.records, 3) if self.records else 0.0,
+            "max_latency": round(self.max_latency, 3),
+            "failures": self.failures,
+            "backpressure_waits": self.backpressure_waits,
+        }
+
+    def _ensure_worker(self) -> "asyncio.Queue[Tuple[Any, float]]":
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # First use, or the previous event loop is gone together with its worker
+            if self.queue_depth:
+                logger.warning(f"[WriteBehindRecorder:{self.name}] Dropping {self.queue_depth} record(s) queued on a closed event loop")
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._worker = None
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run(self._queue))
+        return self._queue
+
+    async def _run(self, queue: "asyncio.Queue[Tuple[Any, float]]") -> None:
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.max_batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                write_batch = self._write_batch()
+                if write_batch is None:
+                    raise RuntimeError("the memory owning this recorder no longer exists")
+                await write_batch([record for record, _ in batch])
+            except Exception as e:
+                self.failures += len(batch)
+                logger.warning(f"[WriteBehindRecorder:{self.name}] Failed to write {len(batch)} record(s): {type(e).__name__}: {e}")
+            finally:
+                now = time.monotonic()
+                self.batches += 1
+                self.records += len(batch)
+                self.largest_batch = max(self.largest_batch, len(batch))
+                for _, queued_at in batch:
+                    self.total_latency += now - queued_at
+                    self.max_latency = max(self.max_latency, now - queued_at)
+                    queue.task_done()
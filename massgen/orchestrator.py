@@ -31,6 +31,7 @@ from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, List, Optional
 
 from .agent_config import AgentConfig
 from .backend.base import StreamChunk
+from .backend.media_cache import MediaEncodingCache
 from .chat_agent import ChatAgent
 from .configs.rate_limits import get_rate_limit_config
 from .coordination_tracker import CoordinationTracker
@@ -50,11 +51,17 @@ from .logger_config import (
 )
 from .memory import ConversationMemory, PersistentMemoryBase
 from .message_templates import MessageTemplates
-from .stream_chunk import ChunkType
+from .status_feed import JsonlStatusLog, UnixSocketStatusServer
+from .stream_chunk import ChunkAccumulator, ChunkType
 from .system_message_builder import SystemMessageBuilder
 from .tool import get_post_evaluation_tools, get_workflow_tools
 from .utils import ActionType, AgentStatus, CoordinationStage
 
+# status.json refresh: checked for changes every STATUS_POLL_INTERVAL seconds, rewritten
+# unconditionally every STATUS_HEARTBEAT_INTERVAL seconds
+STATUS_POLL_INTERVAL = 0.5
+STATUS_HEARTBEAT_INTERVAL = 10.0
+
 
 @dataclass
 class AgentState:
@@ -150,7 +157,7 @@ class Orchestrator(ChatAgent):
                                    Loaded from session storage to persist across orchestrator recreations
             shared_conversation_memory: Optional shared conversation memory for all agents
             shared_persistent_memory: Optional shared persistent memory for all agents
-            enable_rate_limit: Whether to enable rate limiting and cooldown delays (default: False)
+            enable_rate_limit: Whether to enable rate limiting of agent startups and API requests (default: False)
         """
         super().__init__(session_id, shared_conversation_memory, shared_persistent_memory)
         self.orchestrator_id = orchestrator_id
@@ -159,6 +166,36 @@ class Orchestrator(ChatAgent):
         self.config = config or AgentConfig.create_openai_config()
         self.dspy_paraphraser = dspy_paraphraser
 
+        # Serve MassGen's own MCP servers from shared host processes instead of one per agent
+        if getattr(self.config.coordination_config, "share_mcp_servers", False):
+            from .mcp_tools.server_pool import MCPServerPool
+
+            MCPServerPool.enable()
+
+        # Worker pools running synchronous custom tools off the event loop
+        worker_threads = getattr(self.config.coordination_config, "tool_worker_threads", None)
+        worker_processes = getattr(self.config.coordination_config, "tool_worker_processes", None)
+        if worker_threads or worker_processes:
+            from .tool._workers import WorkerPools
+
+            WorkerPools.configure(max_threads=worker_threads, max_processes=worker_processes)
+
+        # Results of cacheable tool calls, shared by all agents and cleared at every new turn
+        self._tool_result_cache = None
+        if getattr(self.config.coordination_config, "tool_result_cache", False):
+            from .tool_result_cache import ToolResultCache
+
+            self._tool_result_cache = ToolResultCache(ttl=self.config.coordination_config.tool_result_cache_ttl)
+            for agent in agents.values():
+                backend = getattr(agent, "backend", None)
+                if hasattr(backend, "set_tool_result_cache"):
+                    backend.set_tool_result_cache(self._tool_result_cache)
+
+        # Base64-encoded upload_files media, encoded once and shared by all agents across turns
+        self._media_cache = MediaEncodingCache()
+        for agent in agents.values():
+            self._share_media_cache(agent)
+
         # Shared memory for all agents
         self.shared_conversation_memory = shared_conversation_memory
         self.shared_persistent_memory = shared_persistent_memory
@@ -216,8 +253,9 @@ class Orchestrator(ChatAgent):
         # Agent startup rate limiting (per model)
         # Load from centralized configuration file instead of hardcoding
         self._enable_rate_limit = enable_rate_limit
-        self._agent_startup_times: Dict[str, List[float]] = {}  # model -> [timestamps]
-        self._rate_limits: Dict[str, Dict[str, int]] = self._load_rate_limits_from_config() if enable_rate_limit else {}
+        self._agent_startup_times: Dict[str, List[float]] = {}  # provider/model -> [timestamps]
+        self._agent_startup_locks: Dict[str, asyncio.Lock] = {}  # provider/model -> lock
+        self._rate_limits: Dict[str, Optional[Dict[str, int]]] = {}  # provider/model -> startup limit, resolved on first start
 
         # Context sharing for agents with filesystem support
         self._snapshot_storage: Optional[str] = snapshot_storage
@@ -233,6 +271,7 @@ class Orchestrator(ChatAgent):
         # Coordination tracking - always enabled for analysis/debugging
         self.coordination_tracker = CoordinationTracker()
         self.coordination_tracker.initialize_session(list(agents.keys()))
+        self._status_feed: List[Any] = []  # Live status subscribers (JsonlStatusLog, UnixSocketStatusServer)
 
         # Create snapshot storage and workspace directories if specified
         if snapshot_storage:
@@ -688,6 +727,7 @@ class Orchestrator(ChatAgent):
             await self._prepare_paraphrases_for_agents(self.current_task)
             # Reinitialize session with user prompt now that we have it
             self.coordination_tracker.initialize_session(list(self.agents.keys()), self.current_task)
+            self._reset_tool_result_cache()
             self.workflow_phase = "coordinating"
 
             # Reset restart_pending flag at start of coordination (will be set again if restart needed)
@@ -1111,17 +1151,17 @@ Your answer:"""
 
         try:
             # Stream response from analyzer agent (but don't show to user)
-            response_text = ""
+            response_text = ChunkAccumulator()
             async for chunk in analyzer_agent.backend.stream_with_tools(
                 messages=analysis_messages,
                 tools=[],  # No tools needed for simple analysis
                 agent_id=analyzer_agent_id,
             ):
                 if chunk.type == "content" and chunk.content:
-                    response_text += chunk.content
+                    response_text.append(chunk.content)
 
             # Parse response
-            response_clean = response_text.strip()
+            response_clean = response_text.getvalue().strip()
             has_irreversible = False
             blocked_tools = set()
 
@@ -1187,18 +1227,25 @@ Your answer:"""
             return {"has_irreversible": True, "blocked_tools": set()}
 
     async def _continuous_status_updates(self):
-        """Background task to continuously update status.json during coordination.
+        """Background task keeping status.json current during coordination.
 
-        This task runs every 2 seconds to provide real-time status monitoring
-        for automation tools and LLM agents.
+        Coordination events reach status feed subscribers as they happen, so this task only
+        rewrites the status.json snapshot when the tracker's status version changed, plus a
+        slow heartbeat that keeps elapsed time and agent states fresh.
         """
+        written_version = None
+        last_write = 0.0
         try:
             while True:
-                await asyncio.sleep(2)  # Update every 2 seconds
+                await asyncio.sleep(STATUS_POLL_INTERVAL)
                 log_session_dir = get_log_session_dir()
-                if log_session_dir:
+                version = self.coordination_tracker.status_version
+                now = time.monotonic()
+                if log_session_dir and (version != written_version or now - last_write >= STATUS_HEARTBEAT_INTERVAL):
                     try:
                         self.coordination_tracker.save_status_file(log_session_dir, orchestrator=self)
+                        written_version = version
+                        last_write = now
                     except Exception as e:
                         logger.debug(f"Failed to update status file in background: {e}")
         except asyncio.CancelledError:
@@ -1207,6 +1254,37 @@ Your answer:"""
         except Exception as e:
             logger.warning(f"Background status update task encountered error: {e}")
 
+    async def _start_status_feed(self) -> None:
+        """Subscribe the status feed (JSONL event log, optional Unix socket) to the coordination tracker."""
+        self._stop_status_feed()  # Close subscribers left over from an interrupted attempt
+        tracker = self.coordination_tracker
+        tracker.status_orchestrator = self
+        log_session_dir = get_log_session_dir()
+        if log_session_dir:
+            try:
+                self._status_feed.append(JsonlStatusLog(Path(log_session_dir) / "status_events.jsonl"))
+            except OSError as e:
+                logger.warning(f"Could not open status event log: {e}")
+
+        socket_path = self.config.status_socket_path
+        if socket_path:
+            server = UnixSocketStatusServer(socket_path, snapshot=lambda: tracker.build_status(log_session_dir or ".", orchestrator=self))
+            try:
+                await server.start()
+                self._status_feed.append(server)
+            except (OSError, NotImplementedError) as e:
+                logger.warning(f"Could not serve status feed on {socket_path}: {e}")
+
+        for subscriber in self._status_feed:
+            tracker.add_status_subscriber(subscriber.publish)
+
+    def _stop_status_feed(self) -> None:
+        """Detach and close all status feed subscribers."""
+        for subscriber in self._status_feed:
+            self.coordination_tracker.remove_status_subscriber(subscriber.publish)
+            subscriber.close()
+        self._status_feed = []
+
     async def _coordinate_agents_with_timeout(self, conversation_context: Optional[Dict[str, Any]] = None) -> AsyncGenerator[StreamChunk, None]:
         """Execute coordination with orchestrator-level timeout protection.
 
@@ -1316,63 +1394,70 @@ Your answer:"""
             source=self.orchestrator_id,
         )
 
-        # Start background status update task for real-time monitoring
+        # Start live status feed and background status.json updates for real-time monitoring
+        await self._start_status_feed()
         status_update_task = asyncio.create_task(self._continuous_status_updates())
 
-        votes = {}  # Track votes: voter_id -> {"agent_id": voted_for, "reason": reason}
-
-        # Initialize all agents with has_voted = False and set restart flags
-        for agent_id in self.agents.keys():
-            self.agent_states[agent_id].has_voted = False
-            self.agent_states[agent_id].restart_pending = True
-
-        log_stream_chunk(
-            "orchestrator",
-            "content",
-            "## 📋 Agents Coordinating\n",
-            self.orchestrator_id,
-        )
-        yield StreamChunk(
-            type="content",
-            content="## 📋 Agents Coordinating\n",
-            source=self.orchestrator_id,
-        )
+        try:
+            votes = {}  # Track votes: voter_id -> {"agent_id": voted_for, "reason": reason}
 
-        # Start streaming coordination with real-time agent output
-        async for chunk in self._stream_coordination_with_agents(votes, conversation_context):
-            yield chunk
+            # Initialize all agents with has_voted = False and set restart flags
+            for agent_id in self.agents.keys():
+                self.agent_states[agent_id].has_voted = False
+                self.agent_states[agent_id].restart_pending = True
 
-        # Determine final agent based on votes
-        current_answers = {aid: state.answer for aid, state in self.agent_states.items() if state.answer}
-        self._selected_agent = self._determine_final_agent_from_votes(votes, current_answers)
-
-        # Track winning agent for memory sharing in future turns
-        self._current_turn += 1
-        if self._selected_agent:
-            winner_entry = {
-                "agent_id": self._selected_agent,
-                "turn": self._current_turn,
-            }
-            self._winning_agents_history.append(winner_entry)
-            logger.info(
-                f"🏆 Turn {self._current_turn} winner: {self._selected_agent} " f"(tracked for memory sharing)",
+            log_stream_chunk(
+                "orchestrator",
+                "content",
+                "## 📋 Agents Coordinating\n",
+                self.orchestrator_id,
+            )
+            yield StreamChunk(
+                type="content",
+                content="## 📋 Agents Coordinating\n",
+                source=self.orchestrator_id,
             )
 
-        log_coordination_step(
-            "Final agent selected",
-            {"selected_agent": self._selected_agent, "votes": votes},
-        )
+            # Start streaming coordination with real-time agent output
+            async for chunk in self._stream_coordination_with_agents(votes, conversation_context):
+                yield chunk
 
-        # Cancel background status update task
-        status_update_task.cancel()
-        try:
-            await status_update_task
-        except asyncio.CancelledError:
-            pass  # Expected
+            # Determine final agent based on votes
+            current_answers = {aid: state.answer for aid, state in self.agent_states.items() if state.answer}
+            self._selected_agent = self._determine_final_agent_from_votes(votes, current_answers)
+
+            self._log_tool_result_cache_stats()
+            self._log_media_cache_stats()
+            self._log_rate_limiter_stats()
+
+            # Track winning agent for memory sharing in future turns
+            self._current_turn += 1
+            if self._selected_agent:
+                winner_entry = {
+                    "agent_id": self._selected_agent,
+                    "turn": self._current_turn,
+                }
+                self._winning_agents_history.append(winner_entry)
+                logger.info(
+                    f"🏆 Turn {self._current_turn} winner: {self._selected_agent} " f"(tracked for memory sharing)",
+                )
 
-        # Present final answer
-        async for chunk in self._present_final_answer():
-            yield chunk
+            log_coordination_step(
+                "Final agent selected",
+                {"selected_agent": self._selected_agent, "votes": votes},
+            )
+
+            # Present final answer (subscribers still receive the final agent and final answer deltas)
+            async for chunk in self._present_final_answer():
+                yield chunk
+        finally:
+            # Cancel background status update task and close the live feed, also on timeout, cancellation or error
+            status_update_task.cancel()
+            try:
+                await status_update_task
+            except asyncio.CancelledError:
+                pass  # Expected
+            self._stop_status_feed()
 
     async def _stream_coordination_with_agents(
         self,
@@ -1411,9 +1496,8 @@ Your answer:"""
             current_answers = {aid: state.answer for aid, state in self.agent_states.items() if state.answer}
             for agent_id in self.agents.keys():
                 if agent_id not in active_streams and not self.agent_states[agent_id].has_voted and not self.agent_states[agent_id].is_killed:
-                    # Apply rate limiting before starting agent
-                    await self._apply_agent_startup_rate_limit(agent_id)
-
+                    # Startup rate limits are waited for inside each agent's stream, so agents
+                    # are brought up concurrently and a wait never blocks the other agents
                     active_streams[agent_id] = self._stream_agent_execution(
                         agent_id,
                         self.current_task,
@@ -1503,10 +1587,6 @@ Your answer:"""
                                 result_data,
                                 snapshot_timestamp=answer_timestamp,
                             )
-                            # Update status file for real-time monitoring
-                            log_session_dir = get_log_session_dir()
-                            if log_session_dir:
-                                self.coordination_tracker.save_status_file(log_session_dir, orchestrator=self)
                             restart_triggered_id = agent_id  # Last agent to provide new answer
                             reset_signal = True
                             log_stream_chunk(
@@ -1572,11 +1652,6 @@ Your answer:"""
                                     result_data,
                                     snapshot_timestamp=vote_timestamp,
                                 )
-                                # Update status file for real-time monitoring
-                                log_session_dir = get_log_session_dir()
-                                if log_session_dir:
-                                    self.coordination_tracker.save_status_file(log_session_dir, orchestrator=self)
-
                                 # Track new vote event
                                 voted_for = result_data.get("agent_id", "<unknown>")
                                 reason = result_data.get("reason", "No reason provided")
@@ -2204,30 +2279,6 @@ Your answer:"""
     #     # Implementation will check against PermissionManager
     #     pass
 
-    def _calculate_jaccard_similarity(self, text1: str, text2: str) -> float:
-        """Calculate Jaccard similarity between two texts based on word tokens.
-
-        Args:
-            text1: First text to compare
-            text2: Second text to compare
-
-        Returns:
-            Similarity score between 0.0 and 1.0
-        """
-        # Tokenize and normalize - simple word-based approach
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
-
-        if not words1 and not words2:
-            return 1.0  # Both empty, consider identical
-        if not words1 or not words2:
-            return 0.0  # One empty, one not
-
-        intersection = len(words1 & words2)
-        union = len(words1 | words2)
-
-        return intersection / union if union > 0 else 0.0
-
     def _check_answer_novelty(self, new_answer: str, existing_answers: Dict[str, str]) -> tuple[bool, Optional[str]]:
         """Check if a new answer is sufficiently different from existing answers.
 
@@ -2256,9 +2307,10 @@ Your answer:"""
                 "approaches, or tools, or vote for an existing answer."
             )
 
-        # Check similarity against all existing answers
-        for agent_id, existing_answer in existing_answers.items():
-            similarity = self._calculate_jaccard_similarity(new_answer, existing_answer)
+        # Check similarity against all existing answers in one batched comparison
+        similarities = self.coordination_tracker.score_answer_similarity(new_answer, existing_answers)
+        logger.debug(f"[Orchestrator] Answer similarity to existing answers: {similarities}")
+        for agent_id, similarity in similarities.items():
             if similarity > threshold:
                 logger.info(f"[Orchestrator] Answer rejected: {similarity:.2%} similar to {agent_id}'s answer (threshold: {threshold:.0%})")
                 return (False, error_msg)
@@ -2328,74 +2380,50 @@ Your answer:"""
 
         return enforcement_msgs
 
-    def _load_rate_limits_from_config(self) -> Dict[str, Dict[str, int]]:
+    @staticmethod
+    def _startup_limit_from_config(provider: str, model: str) -> Optional[Dict[str, int]]:
         """
-        Load rate limits from centralized configuration file.
+        Derive an agent startup limit from the RPM configured in rate_limits.yaml.
 
-        Converts RPM (Requests Per Minute) values from rate_limits.yaml
-        into agent startup rate limits for the orchestrator.
+        Args:
+            provider: Backend provider name (e.g., "Gemini", "OpenAI")
+            model: Model name
 
         Returns:
-            Dictionary mapping model names to rate limit configs:
-            {"model-name": {"max_starts": N, "time_window": 60}}
+            {"max_starts": N, "time_window": 60}, or None if no RPM is configured
         """
-        rate_limits = {}
-
         try:
             config = get_rate_limit_config()
-
-            # Load Gemini models
-            gemini_models = ["gemini-2.5-flash", "gemini-2.5-pro", "gemini"]
-            for model in gemini_models:
-                limits = config.get_limits("gemini", model, use_defaults=True)
-                rpm = limits.get("rpm")
-
-                if rpm:
-                    # Use RPM directly as max_starts for conservative limiting
-                    # For very limited models (rpm <= 2), be extra conservative
-                    if rpm <= 2:
-                        max_starts = 1  # Very conservative for Pro (actual: 2 RPM)
-                    elif rpm <= 10:
-                        max_starts = max(1, rpm - 1)  # Conservative buffer
-                    else:
-                        max_starts = rpm
-
-                    rate_limits[model] = {
-                        "max_starts": max_starts,
-                        "time_window": 60,  # Always use 60s window (1 minute)
-                    }
-                    logger.info(
-                        f"[Orchestrator] Loaded rate limit for {model}: " f"{max_starts} starts/min (from RPM: {rpm})",
-                    )
-
-            # Fallback defaults if config loading failed
-            if not rate_limits:
-                logger.warning(
-                    "[Orchestrator] No rate limits loaded from config, using fallback defaults",
-                )
-                rate_limits = {
-                    "gemini-2.5-flash": {"max_starts": 9, "time_window": 60},
-                    "gemini-2.5-pro": {"max_starts": 2, "time_window": 60},
-                    "gemini": {"max_starts": 7, "time_window": 60},
-                }
-
+            config_provider = config.resolve_provider(provider)
+            if config_provider is None:
+                return None
+            rpm = config.get_limits(config_provider, model, use_defaults=True).get("rpm")
         except Exception as e:
             logger.error(f"[Orchestrator] Failed to load rate limits from config: {e}")
-            # Fallback to safe defaults
-            rate_limits = {
-                "gemini-2.5-flash": {"max_starts": 9, "time_window": 60},
-                "gemini-2.5-pro": {"max_starts": 2, "time_window": 60},
-                "gemini": {"max_starts": 7, "time_window": 60},
-            }
+            return None
+        if not rpm:
+            return None
 
-        return rate_limits
+        # Use RPM directly as max_starts for conservative limiting
+        # For very limited models (rpm <= 2), be extra conservative
+        if rpm <= 2:
+            max_starts = 1
+        elif rpm <= 10:
+            max_starts = max(1, rpm - 1)  # Conservative buffer
+        else:
+            max_starts = rpm
+        logger.info(f"[Orchestrator] Loaded rate limit for {provider}/{model}: {max_starts} starts/min (from RPM: {rpm})")
+        return {"max_starts": max_starts, "time_window": 60}  # Always use 60s window (1 minute)
 
     async def _apply_agent_startup_rate_limit(self, agent_id: str) -> None:
         """
-        Apply rate limiting for agent startup based on model.
+        Apply rate limiting for agent startup based on provider and model.
 
-        Ensures that agents using rate-limited models (like Gemini Flash/Pro)
-        don't exceed the allowed startup rate.
+        Ensures that agents using models with a configured RPM don't exceed the
+        allowed startup rate. Limits are looked up in rate_limits.yaml by the
+        backend's provider and model the first time an agent using them starts;
+        the backends additionally adapt their request concurrency to the
+        provider's rate-limit responses.
 
         Args:
             agent_id: ID of the agent to start
@@ -2405,33 +2433,27 @@ Your answer:"""
             return
 
         agent = self.agents.get(agent_id)
-        if not agent or not hasattr(agent, "backend"):
+        if not agent or not hasattr(agent, "backend") or not hasattr(agent.backend, "get_provider_name"):
             return
 
-        # Get model name from backend config
-        model_key = None
-        if hasattr(agent.backend, "config") and isinstance(agent.backend.config, dict):
-            model_name = agent.backend.config.get("model", "")
-            # Check for specific models first
-            if "gemini-2.5-flash" in model_name.lower():
-                model_key = "gemini-2.5-flash"
-            elif "gemini-2.5-pro" in model_name.lower():
-                model_key = "gemini-2.5-pro"
-            elif "gemini" in model_name.lower():
-                model_key = "gemini"
-
-        # Fallback: try backend type
-        if not model_key:
-            if hasattr(agent.backend, "get_provider_name"):
-                backend_type = agent.backend.get_provider_name()
-                if backend_type in self._rate_limits:
-                    model_key = backend_type
+        config = getattr(agent.backend, "config", None)
+        model_name = config.get("model", "") if isinstance(config, dict) else ""
+        provider = agent.backend.get_provider_name()
+        model_key = f"{provider}/{model_name}" if model_name else provider
+        if model_key not in self._rate_limits:
+            self._rate_limits[model_key] = self._startup_limit_from_config(provider, model_name)
 
         # Check if this model has rate limits
-        if not model_key or model_key not in self._rate_limits:
+        rate_limit = self._rate_limits[model_key]
+        if rate_limit is None:
             return
 
-        rate_limit = self._rate_limits[model_key]
+        # Agents sharing a limit take startup slots one at a time; others never wait on this lock
+        async with self._agent_startup_locks.setdefault(model_key, asyncio.Lock()):
+            await self._take_agent_startup_slot(agent_id, model_key, rate_limit)
+
+    async def _take_agent_startup_slot(self, agent_id: str, model_key: str, rate_limit: Dict[str, int]) -> None:
+        """Wait until ``model_key`` has a free startup slot in its window, then record the startup."""
         max_starts = rate_limit["max_starts"]
         time_window = rate_limit["time_window"]
 
@@ -2487,21 +2509,6 @@ Your answer:"""
             },
         )
 
-        # Add mandatory cooldown after startup to prevent burst API calls
-        # This gives the backend rate limiter time to properly queue requests
-        cooldown_delays = {
-            "gemini-2.5-flash": 3.0,  # 3 second cooldown between Flash agent starts
-            "gemini-2.5-pro": 10.0,  # 10 second cooldown between Pro agent starts (very limited!)
-            "gemini": 5.0,  # 5 second default cooldown
-        }
-
-        if model_key in cooldown_delays:
-            cooldown = cooldown_delays[model_key]
-            logger.info(
-                f"[Orchestrator] Applying {cooldown}s cooldown after starting {agent_id} ({model_key})",
-            )
-            await asyncio.sleep(cooldown)
-
     async def _stream_agent_execution(
         self,
         agent_id: str,
@@ -2559,14 +2566,11 @@ Your answer:"""
         # - Inject new answers if they exist (and continue working)
         # - Clear the flag if no new answers exist (agent already has full context)
 
-        # Copy all agents' snapshots to temp workspace for context sharing
-        await self._copy_all_snapshots_to_temp_workspace(agent_id)
-
-        # Clear the agent's workspace to prepare for new execution
-        # This preserves the previous agent's output for logging while giving a clean slate
-        if agent.backend.filesystem_manager:
-            # agent.backend.filesystem_manager.clear_workspace()  # Don't clear for now.
-            agent.backend.filesystem_manager.log_current_state("before execution")
+        # Bring-up is pipelined: the startup rate-limit wait and the restore of all agents'
+        # snapshots into the temp workspace (for context sharing) run in the background while
+        # the messages are built off the loop. Only the first API request waits for the slot.
+        startup_slot = asyncio.create_task(self._apply_agent_startup_rate_limit(agent_id))
+        workspace_ready = asyncio.create_task(self._copy_all_snapshots_to_temp_workspace(agent_id))
 
         try:
             # Normalize workspace paths in agent answers for better comparison from this agent's perspective
@@ -2586,7 +2590,8 @@ Your answer:"""
 
             # Build new structured system message FIRST (before conversation building)
             logger.info(f"[Orchestrator] Building structured system message for {agent_id}")
-            system_message = self._get_system_message_builder().build_coordination_message(
+            system_message = await asyncio.to_thread(
+                self._get_system_message_builder().build_coordination_message,
                 agent=agent,
                 agent_id=agent_id,
                 answers=normalized_answers,
@@ -2681,6 +2686,14 @@ Your answer:"""
 
             enforcement_msg = self.message_templates.enforcement_message()
 
+            await workspace_ready
+            # Clear the agent's workspace to prepare for new execution
+            # This preserves the previous agent's output for logging while giving a clean slate
+            if agent.backend.filesystem_manager:
+                # agent.backend.filesystem_manager.clear_workspace()  # Don't clear for now.
+                await asyncio.to_thread(agent.backend.filesystem_manager.log_current_state, "before execution")
+            await startup_slot
+
             # Update agent status to STREAMING
             self.coordination_tracker.change_status(agent_id, AgentStatus.STREAMING)
 
@@ -2743,7 +2756,7 @@ Your answer:"""
                             orchestrator_turn=self._current_turn + 1,
                             previous_winners=self._winning_agents_history.copy(),
                         )
-                response_text = ""
+                response_text = ChunkAccumulator()
                 tool_calls = []
                 workflow_tool_found = False
 
@@ -2752,7 +2765,7 @@ Your answer:"""
                 async for chunk in chat_stream:
                     chunk_type = self._get_chunk_type_value(chunk)
                     if chunk_type == "content":
-                        response_text += chunk.content
+                        response_text.append(chunk.content)
                         # Stream agent content directly - source field handles attribution
                         yield ("content", chunk.content)
                         # Log received content
@@ -3028,7 +3041,7 @@ Your answer:"""
                         elif tool_name == "new_answer":
                             workflow_tool_found = True
                             # Agent provided new answer
-                            content = tool_args.get("content", response_text.strip())
+                            content = tool_args.get("content", response_text.getvalue().strip())
 
                             # Check answer count limit
                             can_answer, count_error = self._check_answer_count_limit(agent_id)
@@ -3171,6 +3184,15 @@ Your answer:"""
         except Exception as e:
             yield ("error", f"Agent execution failed: {str(e)}")
             yield ("done", None)
+        finally:
+            # The stream may be closed (agent killed or timed out) or fail before bring-up finished:
+            # cancel what is still running and collect both outcomes so no task is left unobserved
+            for task in (startup_slot, workspace_ready):
+                if not task.done():
+                    task.cancel()
+            for outcome in await asyncio.gather(startup_slot, workspace_ready, return_exceptions=True):
+                if isinstance(outcome, Exception):
+                    logger.debug(f"[Orchestrator] Agent {agent_id} bring-up step failed: {outcome}")
 
     async def _get_next_chunk(self, stream: AsyncGenerator[tuple, None]) -> tuple:
         """Get the next chunk from an agent stream."""
@@ -3209,10 +3231,10 @@ Your answer:"""
         yield StreamChunk(type="content", content=f"🏆 Selected Agent: {self._selected_agent}\n")
 
         # Stream the final presentation (with full tool support)
-        presentation_content = ""
+        presentation_content = ChunkAccumulator()
         async for chunk in self.get_final_presentation(self._selected_agent, vote_results):
             if chunk.type == "content" and chunk.content:
-                presentation_content += chunk.content
+                presentation_content.append(chunk.content)
             yield chunk
 
         # Check if post-evaluation should run
@@ -3222,7 +3244,7 @@ Your answer:"""
 
         if should_evaluate:
             # Run post-evaluation
-            final_answer_to_evaluate = self._final_presentation_content or presentation_content
+            final_answer_to_evaluate = self._final_presentation_content or presentation_content.getvalue()
             async for chunk in self.post_evaluate_answer(self._selected_agent, final_answer_to_evaluate):
                 yield chunk
 
@@ -3528,7 +3550,7 @@ INSTRUCTIONS FOR NEXT ATTEMPT:
         )
 
         # Use agent's chat method with proper system message (reset chat for clean presentation)
-        presentation_content = ""
+        presentation_content = ChunkAccumulator()
         final_snapshot_saved = False  # Track whether snapshot was saved during stream
 
         try:
@@ -3545,7 +3567,7 @@ INSTRUCTIONS FOR NEXT ATTEMPT:
                 self.coordination_tracker.start_new_iteration()
                 # Use the same streaming approach as regular coordination
                 if chunk_type == "content" and chunk.content:
-                    presentation_content += chunk.content
+                    presentation_content.append(chunk.content)
                     log_stream_chunk("orchestrator", "content", chunk.content, selected_agent_id)
                     yield StreamChunk(type="content", content=chunk.content, source=selected_agent_id)
                 elif chunk_type in [
@@ -3589,7 +3611,7 @@ INSTRUCTIONS FOR NEXT ATTEMPT:
                     yield StreamChunk(type="content", content=mcp_content, source=selected_agent_id)
                 elif chunk_type == "done":
                     # Save the final workspace snapshot (from final workspace directory)
-                    final_answer = presentation_content.strip() if presentation_content.strip() else self.agent_states[selected_agent_id].answer  # fallback to stored answer if no content generated
+                    final_answer = presentation_content.getvalue().strip() or self.agent_states[selected_agent_id].answer  # fallback to stored answer if no content generated
                     final_context = self.get_last_context(selected_agent_id)
                     await self._save_agent_snapshot(
                         self._selected_agent,
@@ -3641,7 +3663,7 @@ INSTRUCTIONS FOR NEXT ATTEMPT:
         finally:
             # Ensure final snapshot is always saved (even if "done" chunk wasn't yielded)
             if not final_snapshot_saved:
-                final_answer = presentation_content.strip() if presentation_content.strip() else self.agent_states[selected_agent_id].answer
+                final_answer = presentation_content.getvalue().strip() or self.agent_states[selected_agent_id].answer
                 final_context = self.get_last_context(selected_agent_id)
                 await self._save_agent_snapshot(
                     self._selected_agent,
@@ -3654,9 +3676,9 @@ INSTRUCTIONS FOR NEXT ATTEMPT:
                 self.coordination_tracker.set_final_answer(selected_agent_id, final_answer, snapshot_timestamp="final")
 
             # Store the final presentation content for logging
-            if presentation_content.strip():
+            if presentation_content.getvalue().strip():
                 # Store the synthesized final answer
-                self._final_presentation_content = presentation_content.strip()
+                self._final_presentation_content = presentation_content.getvalue().strip()
             else:
                 # If no content was generated, use the stored answer as fallback
                 stored_answer = self.agent_states[selected_agent_id].answer
@@ -3992,6 +4014,7 @@ Then call either submit(confirmed=True) if the answer is satisfactory, or restar
         """Add a new sub-agent to the orchestrator."""
         self.agents[agent_id] = agent
         self.agent_states[agent_id] = AgentState()
+        self._share_media_cache(agent)
 
     def remove_agent(self, agent_id: str) -> None:
         """Remove a sub-agent from the orchestrator."""
@@ -4140,6 +4163,53 @@ Then call either submit(confirmed=True) if the answer is satisfactory, or restar
         """
         return self._previous_turns
 
+    def _log_tool_result_cache_stats(self) -> None:
+        """Report how many tool calls this turn were answered from the shared result cache."""
+        if self._tool_result_cache is None:
+            return
+        stats = self._tool_result_cache.stats()
+        if stats["hits"] or stats["misses"]:
+            logger.info(
+                f"[Orchestrator] Tool result cache: {stats['hits']} hits, {stats['misses']} misses " f"(hit rate {stats['hit_rate']:.0%}), {stats['evictions']} evictions",
+            )
+            log_orchestrator_activity(self.orchestrator_id, "Tool result cache stats", stats)
+
+    def _share_media_cache(self, agent: ChatAgent) -> None:
+        """Let the agent's backend use the orchestrator's media encoding cache."""
+        backend = getattr(agent, "backend", None)
+        if hasattr(backend, "set_media_cache"):
+            backend.set_media_cache(self._media_cache)
+
+    def _log_media_cache_stats(self) -> None:
+        """Report how many upload_files media encodings were served from the shared cache."""
+        stats = self._media_cache.stats()
+        if stats["hits"] or stats["misses"]:
+            logger.info(
+                f"[Orchestrator] Media cache: {stats['misses']} files encoded, {stats['hits']} reused " f"({stats['memory_mb']} MB in memory, {stats['disk_mb']} MB spilled to disk)",
+            )
+            log_orchestrator_activity(self.orchestrator_id, "Media cache stats", stats)
+
+    def _log_rate_limiter_stats(self) -> None:
+        """Report how long requests waited on the shared provider rate limiters."""
+        if not self._enable_rate_limit:
+            return
+        from .backend.rate_limiter import GlobalRateLimiter
+
+        stats = GlobalRateLimiter.stats()
+        for name, limiter_stats in stats.items():
+            adaptive = f", {limiter_stats['throttles']} throttled, concurrency limit {limiter_stats['limit']}" if "limit" in limiter_stats else ""
+            logger.info(
+                f"[Orchestrator] Rate limiter {name.split(':')[0]}: {limiter_stats['requests']} requests, "
+                f"{limiter_stats['waited_requests']} waited (total {limiter_stats['total_wait']:.1f}s, max {limiter_stats['max_wait']:.1f}s){adaptive}",
+            )
+        if stats:
+            log_orchestrator_activity(self.orchestrator_id, "Rate limiter stats", stats)
+
+    def _reset_tool_result_cache(self) -> None:
+        """Start a new turn with an empty tool result cache."""
+        if self._tool_result_cache is not None:
+            self._tool_result_cache.clear()
+
     async def reset(self) -> None:
         """Reset orchestrator state for new task."""
         self.conversation_history.clear()
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+Coordination status feed for real-time monitoring.
+
+``status.json`` is a full snapshot that monitors have to poll. The feed pushes
+status deltas instead: every coordination event recorded by the CoordinationTracker
+is published, together with the updated status of the affected agent, to each
+subscriber as one JSON object per line.
+
+Subscribers:
+- ``JsonlStatusLog``: append-only ``status_events.jsonl`` next to ``status.json``
+  (``tail -f`` friendly, never rewritten)
+- ``UnixSocketStatusServer``: local Unix domain socket; each client receives the
+  current snapshot on connect, then every delta as it happens
+
+Example:
+    $ socat - UNIX-CONNECT:/tmp/massgen-status.sock
+"""
+
+import asyncio
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set
+
+from .logger_config import logger
+
+
+def encode_status_line(data: Dict[str, Any]) -> bytes:
+    """Serialize one feed record as a JSON line."""
+    return (json.dumps(data, default=str) + "\n").encode("utf-8")
+
+
+class JsonlStatusLog:
+    """Append-only JSONL log of status deltas."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "ab", buffering=0)
+
+    def publish(self, delta: Dict[str, Any]) -> None:
+        if self._file is not None:
+            self._file.write(encode_status_line(delta))
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class UnixSocketStatusServer:
+    """
+    Broadcasts status deltas to clients connected to a local Unix domain socket.
+
+    Publishing never blocks coordination: lines are queued on each client's transport
+    and clients that fall more than MAX_CLIENT_BUFFER bytes behind are disconnected.
+    """
+
+    MAX_CLIENT_BUFFER = 1024 * 1024
+
+    def __init__(self, path: str, snapshot: Optional[Callable[[], Dict[str, Any]]] = None):
+        """
+        Args:
+            path: Filesystem path of the socket
+            snapshot: Optional callable returning the current full status, sent to new clients
+        """
+        self.path = path
+        self.snapshot = snapshot
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._clients: Set[asyncio.StreamWriter] = set()
+
+    async def start(self) -> None:
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self._server = await asyncio.start_unix_server(self._handle_client, path=self.path)
+        logger.info(f"[StatusFeed] Serving coordination status on unix socket {self.path}")
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        if self.snapshot is not None:
+            writer.write(encode_status_line({"type": "snapshot", "status": self.snapshot()}))
+        self._clients.add(writer)
+        try:
+            # Clients only listen; wait for them to hang up
+            await reader.read()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self._drop(writer)
+
+    def _drop(self, writer: asyncio.StreamWriter) -> None:
+        self._clients.discard(writer)
+        if not writer.is_closing():
+            writer.close()
+
+    def publish(self, delta: Dict[str, Any]) -> None:
+        if not self._clients:
+            return
+        line = encode_status_line(delta)
+        for writer in list(self._clients):
+            if writer.is_closing() or writer.transport.get_write_buffer_size() > self.MAX_CLIENT_BUFFER:
+                self._drop(writer)
+                continue
+            writer.write(line)
+
+    def close(self) -> None:
+        for writer in list(self._clients):
+            self._drop(writer)
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        if os.path.exists(self.path):
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
@@ -9,6 +9,7 @@ multimodal content (images, audio, video, documents).
 Classes:
     BaseStreamChunk: Abstract base class for all stream chunks
     TextStreamChunk: Stream chunk for text-based content
+    ChunkAccumulator: Linear-time buffer for streamed text deltas
 
 Enums:
     ChunkType: Types of stream chunks
@@ -17,6 +18,7 @@ Data Classes:
     MediaMetadata: Metadata for media content
 """
 
+from .accumulator import ChunkAccumulator
 from .base import BaseStreamChunk, ChunkType
 from .multimodal import MediaEncoding, MediaMetadata, MediaType, MultimodalStreamChunk
 from .text import TextStreamChunk
@@ -27,6 +29,8 @@ __all__ = [
     "ChunkType",
     # Text chunks
     "TextStreamChunk",
+    # Accumulation
+    "ChunkAccumulator",
     # Multimodal classes
     "MediaType",
     "MediaEncoding",
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+Linear-time accumulation of streamed text deltas.
+
+Backends receive model output as many small deltas. Building the full text
+with ``text += delta`` copies the accumulated string on every delta, which
+turns long reasoning outputs into quadratic work. ``ChunkAccumulator`` keeps
+the deltas in a list and only joins them when the full text is requested.
+"""
+from __future__ import annotations
+
+from typing import List, Optional
+
+
+class ChunkAccumulator:
+    """
+    List-backed text buffer with lazy join.
+
+    Appending is O(1) amortized; ``getvalue()`` joins pending deltas once and
+    caches the result, so repeated reads between appends are free.
+
+    Example:
+        content = ChunkAccumulator()
+        async for delta in stream:
+            content.append(delta)
+        message = {"role": "assistant", "content": content.getvalue().strip()}
+    """
+
+    __slots__ = ("_parts", "_length")
+
+    def __init__(self, initial: Optional[str] = None):
+        self._parts: List[str] = []
+        self._length = 0
+        if initial:
+            self.append(initial)
+
+    def append(self, delta: Optional[str]) -> None:
+        """Add a delta to the buffer. Empty and None deltas are ignored."""
+        if not delta:
+            return
+        self._parts.append(delta)
+        self._length += len(delta)
+
+    def extend(self, deltas) -> None:
+        """Add several deltas to the buffer."""
+        for delta in deltas:
+            self.append(delta)
+
+    def getvalue(self) -> str:
+        """Return the accumulated text, joining pending deltas at most once."""
+        if not self._parts:
+            return ""
+        if len(self._parts) > 1:
+            self._parts = ["".join(self._parts)]
+        return self._parts[0]
+
+    def clear(self) -> None:
+        """Drop all accumulated text."""
+        self._parts = []
+        self._length = 0
+
+    def __str__(self) -> str:
+        return self.getvalue()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bool__(self) -> bool:
+        return self._length > 0
+
+    def __repr__(self) -> str:
+        return f"ChunkAccumulator(length={self._length}, parts={len(self._parts)})"
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests and benchmark for index-based compression planning.
+"""
+
+import time
+
+import pytest
+
+from massgen.memory import (
+    ContextCompressor,
+    ConversationMemory,
+    RecentWindowStrategy,
+    SummaryAnchoredStrategy,
+    ToolPairPreservingStrategy,
+    plan_compression,
+)
+from massgen.token_manager import TokenCostCalculator
+
+MESSAGE_COUNT = 10_000
+
+
+def _conversation(turns):
+    messages = [{"role": "system", "content": "You are helpful."}]
+    for i in range(turns):
+        messages.append({"role": "user", "content": f"question {i}"})
+        messages.append({"role": "assistant", "content": "", "tool_calls": [{"id": f"call_{i}", "function": {"name": "search"}}]})
+        messages.append({"role": "tool", "tool_call_id": f"call_{i}", "content": f"result {i}"})
+        messages.append({"role": "assistant", "content": f"answer {i}"})
+    return messages
+
+
+def test_recent_window_keeps_system_and_newest_suffix():
+    messages = _conversation(3)
+    counts = [5] + [10] * (len(messages) - 1)
+
+    plan = plan_compression(messages, counts, target_tokens=35, strategy=RecentWindowStrategy())
+
+    assert plan.keep_indices == [0, 10, 11, 12]
+    assert plan.tokens_kept == 35
+    assert plan.tokens_removed == sum(counts) - 35
+    assert plan.remove_indices == list(range(1, 10))
+
+
+def test_tool_pair_strategy_never_orphans_tool_results():
+    messages = _conversation(3)
+    counts = [5] + [10] * (len(messages) - 1)
+
+    # Budget fits the last answer plus a tool result, but not its tool call
+    plan = plan_compression(messages, counts, target_tokens=25, strategy=ToolPairPreservingStrategy())
+    assert plan.keep_indices == [0, 12]
+
+    plan = plan_compression(messages, counts, target_tokens=35, strategy=ToolPairPreservingStrategy())
+    assert plan.keep_indices == [0, 10, 11, 12]
+
+    plan = plan_compression(messages, counts, target_tokens=45, strategy=ToolPairPreservingStrategy())
+    assert plan.keep_indices == [0, 9, 10, 11, 12]
+
+
+def test_summary_anchored_strategy_pins_task_and_summaries():
+    messages = _conversation(3)
+    messages.insert(5, {"role": "assistant", "content": "summary so far", "summary": True})
+    counts = [5] + [10] * (len(messages) - 1)
+
+    plan = plan_compression(messages, counts, target_tokens=55, strategy=SummaryAnchoredStrategy())
+
+    assert plan.keep_indices == [0, 1, 5, 11, 12, 13]
+    assert plan.tokens_kept == 55
+
+
+def test_plan_rejects_mismatched_counts():
+    with pytest.raises(ValueError):
+        plan_compression([{"role": "user", "content": "hi"}], [], 10)
+
+
+@pytest.mark.asyncio
+async def test_compressor_uses_plan_for_duplicate_messages():
+    """Equal messages are removed by position, not by value."""
+    memory = ConversationMemory()
+    compressor = ContextCompressor(token_calculator=TokenCostCalculator(), conversation_memory=memory)
+    messages = [{"role": "user", "content": "same"} for _ in range(20)]
+
+    stats = await compressor.compress_if_needed(messages, current_tokens=1000, target_tokens=20)
+
+    assert stats.messages_kept + stats.messages_removed == 20
+    assert stats.messages_removed > 0
+    assert len(await memory.get_messages()) == stats.messages_kept
+
+
+def test_planning_benchmark_on_10k_messages():
+    """Planning must stay linear: 10k messages in well under a second per strategy."""
+    messages = _conversation(MESSAGE_COUNT // 4)
+    counts = [len(str(msg.get("content"))) for msg in messages]
+
+    for strategy in (RecentWindowStrategy(), ToolPairPreservingStrategy(), SummaryAnchoredStrategy()):
+        start = time.perf_counter()
+        plan = plan_compression(messages, counts, target_tokens=sum(counts) // 2, strategy=strategy)
+        elapsed = time.perf_counter() - start
+
+        assert len(plan.keep_indices) + len(plan.remove_indices) == len(messages)
+        assert elapsed < 1.0, f"{type(strategy).__name__} took {elapsed:.3f}s for {len(messages)} messages"
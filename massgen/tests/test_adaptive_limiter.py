@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the adaptive concurrency limiter fed by provider rate-limit feedback.
+"""
+
+import asyncio
+import email.utils
+import time
+
+import httpx
+import pytest
+
+from massgen.backend.adaptive_limiter import (
+    AdaptiveLimiter,
+    observe_response,
+    parse_rate_limit_headers,
+    parse_reset,
+    rate_limit_error,
+)
+from massgen.backend.client_pool import ClientPool
+
+
+class FakeRateLimitError(Exception):
+    status_code = 429
+
+    def __init__(self, headers=None):
+        super().__init__("rate limited")
+        self.response = httpx.Response(429, headers=headers or {})
+
+
+class FakeGeminiError(Exception):
+    code = 429
+    status = "RESOURCE_EXHAUSTED"
+    details = {"error": {"details": [{"@type": "type.googleapis.com/google.rpc.RetryInfo", "retryDelay": "37s"}]}}
+
+
+def test_parses_provider_headers_and_errors():
+    assert parse_reset("6m0s") == 360
+    assert parse_reset("20ms") == pytest.approx(0.02)
+    assert parse_reset("1.5") == 1.5
+    assert 25 < parse_reset(email.utils.formatdate(time.time() + 30, usegmt=True)) <= 30
+    assert parse_reset("soon") is None
+
+    openai = parse_rate_limit_headers({"X-RateLimit-Remaining-Requests": "0", "x-ratelimit-reset-requests": "1m30s", "x-ratelimit-remaining-tokens": "5000", "retry-after-ms": "250"})
+    assert (openai.remaining_requests, openai.remaining_tokens, openai.reset_after, openai.retry_after) == (0, 5000, 90, 0.25)
+    assert openai.exhausted
+
+    anthropic = parse_rate_limit_headers(
+        {
+            "anthropic-ratelimit-requests-remaining": "40",
+            "anthropic-ratelimit-input-tokens-remaining": "900",
+            "anthropic-ratelimit-output-tokens-remaining": "100",
+            "retry-after": "3",
+        },
+    )
+    assert (anthropic.remaining_requests, anthropic.remaining_tokens, anthropic.retry_after) == (40, 100, 3)
+    assert not anthropic.exhausted
+
+    assert rate_limit_error(FakeRateLimitError({"retry-after": "2"})) == (True, 2)
+    assert rate_limit_error(FakeGeminiError()) == (True, 37)
+    assert rate_limit_error(ValueError("boom")) == (False, None)
+
+
+@pytest.mark.asyncio
+async def test_limit_grows_while_saturated_and_halves_on_429():
+    limiter = AdaptiveLimiter("test", initial_limit=2, max_limit=4)
+    active = peak = 0
+
+    async def request():
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.02)
+        active -= 1
+        return "ok"
+
+    assert await asyncio.gather(*(limiter.run(request) for _ in range(12))) == ["ok"] * 12
+    assert peak <= 4
+    assert limiter.limit >= 3
+
+    # A 429 while four requests are in flight halves the limit and blocks new requests
+    limiter = AdaptiveLimiter("test", initial_limit=4)
+    release = asyncio.Event()
+
+    async def slow_request():
+        await release.wait()
+        return "ok"
+
+    async def throttled_request():
+        raise FakeRateLimitError({"retry-after": "0.3"})
+
+    slow = [asyncio.create_task(limiter.run(slow_request)) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    with pytest.raises(FakeRateLimitError):
+        await limiter.run(throttled_request, retries=0)
+    assert int(limiter.limit) == 2
+
+    # Requests rejected by the same burst share one decrease
+    limiter.throttled(0.3)
+    assert int(limiter.limit) == 2 and limiter.stats()["decreases"] == 1
+
+    release.set()
+    await asyncio.gather(*slow)
+    start = time.monotonic()
+    assert await limiter.run(request) == "ok"
+    assert time.monotonic() - start >= 0.25
+
+    # An exhausted budget blocks until its reset without shrinking the limit
+    limiter.observe(parse_rate_limit_headers({"x-ratelimit-remaining-tokens": "0", "x-ratelimit-reset-tokens": "200ms"}))
+    start = time.monotonic()
+    await limiter.run(request)
+    assert time.monotonic() - start >= 0.15
+    assert int(limiter.limit) == 2
+
+
+@pytest.mark.asyncio
+async def test_streams_hold_their_slot_until_consumed():
+    limiter = AdaptiveLimiter("test", initial_limit=1)
+
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield i
+
+        return chunks()
+
+    first = await limiter.run(stream)
+    second = asyncio.create_task(limiter.run(stream))
+    await asyncio.sleep(0.05)
+    assert not second.done() and limiter.in_flight == 1
+
+    assert [chunk async for chunk in first] == [0, 1, 2]
+    await (await asyncio.wait_for(second, 1)).close()
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_pooled_clients_report_sdk_retries():
+    openai = pytest.importorskip("openai")
+    assert observe_response in ClientPool.create_http_client().event_hooks["response"]
+
+    calls = []
+    completion = {
+        "id": "c",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "m",
+        "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": "hi"}}],
+    }
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) % 2:
+            return httpx.Response(429, headers={"retry-after-ms": "10"}, json={"error": {"message": "slow down"}})
+        return httpx.Response(200, headers={"x-ratelimit-remaining-requests": "99"}, json=completion)
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler), event_hooks={"response": [observe_response]})
+    client = openai.AsyncOpenAI(api_key="test", base_url="http://test", http_client=http_client, max_retries=1)
+    limiter = AdaptiveLimiter("test")
+
+    # The SDK retries the 429 itself; the limiter still sees it
+    response = await limiter.run(lambda: client.chat.completions.create(model="m", messages=[]))
+    assert response.choices[0].message.content == "hi"
+    assert limiter.throttles == 1 and limiter.in_flight == 0
+
+    # Errors that exhaust the SDK's retries are retried by the limiter, counted once each
+    client = openai.AsyncOpenAI(api_key="test", base_url="http://test", http_client=http_client, max_retries=0)
+    calls.clear()
+    await limiter.run(lambda: client.chat.completions.create(model="m", messages=[]))
+    assert len(calls) == 2 and limiter.throttles == 2
+    await http_client.aclose()
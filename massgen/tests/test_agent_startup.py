@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for concurrent agent startup under per-model startup rate limits.
+"""
+
+import asyncio
+import gc
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from massgen.orchestrator import AgentState, Orchestrator
+
+
+def _agent(provider: str, model: str):
+    backend = SimpleNamespace(config={"model": model}, get_provider_name=lambda: provider)
+    return SimpleNamespace(backend=backend)
+
+
+@pytest.mark.asyncio
+async def test_startup_waits_only_serialize_agents_sharing_a_limit(monkeypatch):
+    orchestrator = Orchestrator(agents={}, enable_rate_limit=True)
+    orchestrator.agents = {
+        "flash_a": _agent("Gemini", "gemini-2.5-flash"),
+        "flash_b": _agent("Gemini", "gemini-2.5-flash"),
+        "flash_c": _agent("Gemini", "gemini-2.5-flash"),
+        "gpt": _agent("OpenAI", "gpt-4o"),
+    }
+    lookups = []
+
+    def startup_limit(provider, model):
+        lookups.append((provider, model))
+        return {"max_starts": 2, "time_window": 0.4} if provider == "Gemini" else None
+
+    monkeypatch.setattr(orchestrator, "_startup_limit_from_config", startup_limit)
+
+    started = {}
+    start = time.monotonic()
+
+    async def bring_up(agent_id):
+        await orchestrator._apply_agent_startup_rate_limit(agent_id)
+        started[agent_id] = time.monotonic() - start
+
+    await asyncio.gather(*(bring_up(agent_id) for agent_id in orchestrator.agents))
+
+    # Limits are resolved once per provider/model
+    assert sorted(lookups) == [("Gemini", "gemini-2.5-flash"), ("OpenAI", "gpt-4o")]
+    # Two flash agents and the unlimited agent start at once; the third flash agent waits its window
+    flash = sorted(started[agent_id] for agent_id in ("flash_a", "flash_b", "flash_c"))
+    assert flash[1] < 0.1 and flash[2] >= 0.35
+    assert started["gpt"] < 0.1
+
+
+@pytest.mark.asyncio
+async def test_failed_bring_up_cancels_and_collects_background_steps(monkeypatch):
+    orchestrator = Orchestrator(agents={})
+    orchestrator.agents = {"agent_a": _agent("OpenAI", "gpt-4o")}
+    orchestrator.agent_states = {"agent_a": AgentState()}
+    restore_started, restore_cancelled = asyncio.Event(), asyncio.Event()
+
+    async def slow_restore(agent_id):
+        restore_started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            restore_cancelled.set()
+            raise
+
+    async def failing_startup_slot(agent_id):
+        raise RuntimeError("rate limit lookup failed")
+
+    def failing_build(**kwargs):
+        raise ValueError("bad system message")
+
+    monkeypatch.setattr(orchestrator, "_copy_all_snapshots_to_temp_workspace", slow_restore)
+    monkeypatch.setattr(orchestrator, "_apply_agent_startup_rate_limit", failing_startup_slot)
+    monkeypatch.setattr(orchestrator, "_get_system_message_builder", lambda: SimpleNamespace(build_coordination_message=failing_build))
+
+    unretrieved = []
+    asyncio.get_running_loop().set_exception_handler(lambda loop, context: unretrieved.append(context))
+    chunks = [chunk async for chunk in orchestrator._stream_agent_execution("agent_a", "task", {})]
+
+    # The startup slot failed and the restore was still running when message building raised
+    assert chunks[0] == ("error", "Agent execution failed: bad system message")
+    assert restore_started.is_set() and restore_cancelled.is_set()
+    gc.collect()
+    assert not unretrieved
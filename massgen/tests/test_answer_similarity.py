@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for cached answer signatures and batched novelty scoring.
+"""
+
+import json
+import random
+
+import pytest
+
+from massgen import answer_similarity
+from massgen.answer_similarity import (
+    batch_jaccard_similarity,
+    compute_answer_signature,
+    similarity_matrix,
+)
+from massgen.coordination_tracker import CoordinationTracker
+
+
+def _jaccard(text1, text2):
+    """Reference word-set Jaccard similarity (the original novelty metric)."""
+    words1 = set(text1.lower().split())
+    words2 = set(text2.lower().split())
+    if not words1 and not words2:
+        return 1.0
+    if not words1 or not words2:
+        return 0.0
+    return len(words1 & words2) / len(words1 | words2)
+
+
+def _random_answers(count, vocabulary=300, length=200):
+    rng = random.Random(42)
+    words = [f"Word{i}" for i in range(vocabulary)]
+    return [" ".join(rng.choice(words) for _ in range(rng.randrange(length))) for _ in range(count)]
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_batch_scores_match_reference(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(answer_similarity, "np", None)
+    elif answer_similarity.np is None:
+        pytest.skip("numpy not installed")
+
+    answers = _random_answers(20) + ["", "   ", "Same words SAME words"]
+    new_answer = answers[3] + " extra tokens"
+    signatures = [compute_answer_signature(a) for a in answers]
+
+    scores = batch_jaccard_similarity(compute_answer_signature(new_answer), signatures)
+
+    assert scores == pytest.approx([_jaccard(new_answer, a) for a in answers])
+    assert batch_jaccard_similarity(compute_answer_signature(""), signatures[-3:]) == [1.0, 1.0, 0.0]
+    assert batch_jaccard_similarity(signatures[0], []) == []
+
+
+def test_similarity_matrix_is_symmetric_with_unit_diagonal():
+    signatures = [compute_answer_signature(a) for a in _random_answers(6)]
+
+    matrix = similarity_matrix(signatures)
+
+    for i in range(6):
+        assert matrix[i][i] == pytest.approx(1.0)
+        for j in range(6):
+            assert matrix[i][j] == pytest.approx(matrix[j][i])
+
+
+def test_tracker_caches_signatures_and_logs_matrix(tmp_path):
+    tracker = CoordinationTracker()
+    tracker.initialize_session(["agent_a", "agent_b"])
+    tracker.add_agent_answer("agent_a", "use a hash map for lookups")
+    tracker.add_agent_answer("agent_b", "use a sorted list and binary search")
+
+    cached = tracker.answer_signatures["use a hash map for lookups"]
+    scores = tracker.score_answer_similarity(
+        "use a hash map for fast lookups",
+        {"agent_a": "use a hash map for lookups", "agent_b": "use a sorted list and binary search"},
+    )
+
+    assert tracker.get_answer_signature("use a hash map for lookups") is cached
+    assert list(scores) == ["agent_a", "agent_b"]
+    assert scores["agent_a"] == pytest.approx(_jaccard("use a hash map for fast lookups", "use a hash map for lookups"))
+
+    tracker.save_coordination_logs(tmp_path)
+    logged = json.loads((tmp_path / "answer_similarity.json").read_text())
+    assert logged["labels"] == ["agent1.1", "agent2.1"]
+    assert logged["matrix"][0][1] == pytest.approx(_jaccard("use a hash map for lookups", "use a sorted list and binary search"))
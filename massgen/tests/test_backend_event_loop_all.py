@@ -9,6 +9,9 @@ Backends covered:
 - GrokBackend (xAI via OpenAI-compatible client)
 - ClaudeBackend (Anthropic Messages API)
 
+Backends obtain clients from ClientPool, so clients stay open between streams
+and are closed when the pool is shut down.
+
 NOTE: Some tests may currently FAIL, revealing missing cleanup in backends.
 """
 
@@ -19,6 +22,7 @@ from typing import Any, List
 import pytest
 
 from massgen.backend import ClaudeBackend, GrokBackend, ResponseBackend
+from massgen.backend.client_pool import ClientPool
 
 
 # ---- Common fakes ----
@@ -90,7 +94,9 @@ async def test_response_backend_stream_closes_client(monkeypatch):
         pass
 
     assert len(created) == 1
-    # Expectation: backend should close client to avoid event-loop errors
+    # Pooled clients stay open for reuse and are closed when the pool shuts down
+    assert created[0]._closed is False
+    await ClientPool.aclose()
     assert created[0]._closed is True
 
 
@@ -132,7 +138,9 @@ async def test_grok_backend_stream_closes_client(monkeypatch):
         pass
 
     assert len(created) == 1
-    # Expectation: backend should close client to avoid event-loop errors
+    # Pooled clients stay open for reuse and are closed when the pool shuts down
+    assert created[0]._closed is False
+    await ClientPool.aclose()
     assert created[0]._closed is True
 
 
@@ -175,5 +183,7 @@ async def test_claude_backend_stream_closes_client(monkeypatch):
         pass
 
     assert len(created) == 1
-    # Expectation: backend should close client to avoid event-loop errors
+    # Pooled clients stay open for reuse and are closed when the pool shuts down
+    assert created[0]._closed is False
+    await ClientPool.aclose()
     assert created[0]._closed is True
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests and micro-benchmark for linear-time streaming content accumulation.
+"""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from massgen.chat_agent import SingleAgent
+from massgen.memory import ConversationMemory
+from massgen.stream_chunk import ChunkAccumulator
+
+DELTA_COUNT = 200_000
+
+
+def _accumulate(count: int) -> float:
+    """Return the best-of-three time to accumulate ``count`` small deltas."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        content = ChunkAccumulator()
+        for _ in range(count):
+            content.append("tok ")
+        text = content.getvalue()
+        best = min(best, time.perf_counter() - start)
+        assert len(text) == count * 4
+    return best
+
+
+def test_accumulator_joins_lazily():
+    content = ChunkAccumulator()
+    assert not content
+    assert content.getvalue() == ""
+
+    content.append("Hello")
+    content.append(None)
+    content.append("")
+    content.append(", world")
+    assert len(content) == 12
+    assert str(content) == "Hello, world"
+
+    content.append("!")
+    assert content.getvalue() == "Hello, world!"
+    assert content.getvalue() is content.getvalue()
+
+    content.clear()
+    assert not content and content.getvalue() == ""
+
+
+def test_accumulator_scales_linearly():
+    """Four times the deltas must cost roughly four times as much, not sixteen."""
+    small = _accumulate(DELTA_COUNT // 4)
+    large = _accumulate(DELTA_COUNT)
+
+    assert large / small < 8, f"accumulating {DELTA_COUNT} deltas took {large:.3f}s vs {small:.3f}s for a quarter"
+
+
+@pytest.mark.asyncio
+async def test_single_agent_records_accumulated_response():
+    async def stream():
+        for i in range(10_000):
+            yield SimpleNamespace(type="content", content=f"{i} ")
+        yield SimpleNamespace(type="done")
+
+    backend = MagicMock()
+    backend.is_stateful = MagicMock(return_value=False)
+    backend.stream_with_tools = MagicMock(return_value=stream())
+    conversation_memory = ConversationMemory()
+    agent = SingleAgent(backend=backend, agent_id="bench_agent", conversation_memory=conversation_memory)
+
+    async for _ in agent.chat([{"role": "user", "content": "count"}]):
+        pass
+
+    messages = await conversation_memory.get_messages()
+    assistant_messages = [m for m in messages if m.get("role") == "assistant"]
+    assert assistant_messages[-1]["content"] == " ".join(str(i) for i in range(10_000))
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the process-wide provider client pool.
+"""
+
+import asyncio
+
+import pytest
+
+from massgen.backend.chat_completions import ChatCompletionsBackend
+from massgen.backend.client_pool import ClientPool
+
+
+class _FakeClient:
+    def __init__(self, http_client):
+        self.http_client = http_client
+        self.closed = False
+
+    async def aclose(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def _clear_pool():
+    ClientPool.clear()
+    yield
+    ClientPool.clear()
+
+
+@pytest.mark.asyncio
+async def test_same_endpoint_reuses_client():
+    first = ClientPool.get_client("openai", "https://a.example/v1", "key-1", _FakeClient)
+    second = ClientPool.get_client("openai", "https://a.example/v1", "key-1", _FakeClient)
+    other_key = ClientPool.get_client("openai", "https://a.example/v1", "key-2", _FakeClient)
+    other_url = ClientPool.get_client("openai", "https://b.example/v1", "key-1", _FakeClient)
+
+    assert first is second
+    assert first is not other_key
+    assert first is not other_url
+    assert ClientPool.is_pooled(first)
+
+    await ClientPool.aclose()
+    assert first.closed and other_key.closed and other_url.closed
+    assert first.http_client.is_closed
+    assert not ClientPool.is_pooled(first)
+
+
+@pytest.mark.asyncio
+async def test_backend_cleanup_keeps_pooled_client_open():
+    backend = ChatCompletionsBackend(api_key="test-key", base_url="https://a.example/v1")
+
+    client = backend._create_client()
+    await backend._cleanup_client(client)
+
+    assert backend._create_client() is client
+    assert not client.is_closed()
+    await ClientPool.aclose()
+
+
+def test_clients_are_not_shared_across_event_loops():
+    async def get():
+        return ClientPool.get_client("openai", "https://a.example/v1", "key-1", _FakeClient)
+
+    first = asyncio.run(get())
+    second = asyncio.run(get())
+
+    assert first is not second
+    assert not ClientPool.is_pooled(first)
+
+
+def test_shared_http_client_per_loop():
+    async def get_twice():
+        return ClientPool.get_http_client(), ClientPool.get_http_client()
+
+    first, second = asyncio.run(get_twice())
+    assert first is second
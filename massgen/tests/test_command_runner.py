@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for asynchronous command execution in the code execution MCP server.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from massgen.filesystem_manager import _code_execution_server as ce_module
+from massgen.filesystem_manager import _command_runner as runner_module
+from massgen.filesystem_manager._command_runner import (
+    OutputBuffer,
+    container_exec_argv,
+    run_command,
+    run_container_command,
+)
+
+PY = f'"{sys.executable}"'
+
+
+def test_output_buffer_keeps_head_and_tail():
+    buffer = OutputBuffer(limit=100)
+    for i in range(1000):
+        buffer.append(f"line {i:04d}\n".encode())
+
+    text = buffer.text()
+    assert buffer.truncated
+    assert text.startswith("line 0000\nline 0001\n")
+    assert text.endswith("line 0998\nline 0999\n")
+    assert "truncated, exceeded 100 bytes" in text
+    assert buffer.last_line == "line 0999"
+
+    small = OutputBuffer(limit=100)
+    small.append(b"short output\n")
+    assert small.text() == "short output\n" and not small.truncated
+
+
+def test_container_timeout_wraps_command():
+    assert container_exec_argv("echo hi") == ["/bin/sh", "-c", "echo hi"]
+    argv = container_exec_argv("echo hi", timeout=30)
+    assert argv[-1] == "echo hi"
+    assert "timeout -k 2 30 /bin/sh" in argv[2]
+
+
+def _stalling_container(release):
+    def exec_start(exec_id, stream):
+        yield b"partial output\n"
+        release.wait(10)  # docker exec stalls, e.g. no coreutils timeout in the image
+
+    api = SimpleNamespace(
+        exec_create=lambda *args, **kwargs: {"Id": "exec-1"},
+        exec_start=exec_start,
+        exec_inspect=lambda exec_id: {"ExitCode": 0},
+    )
+    return SimpleNamespace(id="container-1", client=SimpleNamespace(api=api))
+
+
+def test_container_command_has_host_deadline(monkeypatch):
+    monkeypatch.setattr(runner_module, "container_host_deadline", lambda timeout: 0.2)
+    release = threading.Event()
+    try:
+        start = time.monotonic()
+        result = run_container_command(_stalling_container(release), "sleep 100", timeout=1)
+        assert time.monotonic() - start < 2
+        assert result.timed_out and result.exit_code == -1
+        assert result.stdout == "partial output\n"
+        assert result.execution_time >= 0.2
+    finally:
+        release.set()
+
+    # Without a stall the result of the exec is returned as is
+    release.set()
+    result = run_container_command(_stalling_container(release), "echo hi", timeout=1)
+    assert not result.timed_out and result.exit_code == 0
+
+
+@pytest.mark.asyncio
+async def test_output_is_capped_and_progress_reported(tmp_path):
+    progress = []
+
+    async def on_progress(elapsed, output_bytes, last_line):
+        progress.append((output_bytes, last_line))
+
+    script = "import sys, time\nfor i in range(5):\n    print(f'step {i}', flush=True)\n    time.sleep(0.1)\nsys.stdout.write('x' * 200000)\n"
+    (tmp_path / "steps.py").write_text(script)
+    result = await run_command(f"{PY} steps.py", cwd=str(tmp_path), max_output_size=1000, on_progress=on_progress, progress_interval=0.1)
+
+    assert result.exit_code == 0 and result.truncated
+    assert result.stdout.startswith("step 0\n")
+    assert result.stdout.endswith("x" * 100)
+    assert len(result.stdout) < 1200
+    assert any(line.startswith("step") for _, line in progress)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX process groups")
+@pytest.mark.asyncio
+async def test_timeout_kills_whole_process_group(tmp_path):
+    # The shell starts a grandchild that would outlive a plain kill of the shell
+    command = f'{PY} -c "import time; time.sleep(60)" & echo $! > child.pid; echo started; wait'
+    result = await run_command(command, cwd=str(tmp_path), timeout=1)
+
+    assert result.timed_out and result.exit_code == -1
+    assert "started" in result.stdout
+    assert result.execution_time < 10
+
+    child_pid = int((tmp_path / "child.pid").read_text())
+    for _ in range(50):
+        try:
+            os.kill(child_pid, 0)
+        except ProcessLookupError:
+            break
+        await asyncio.sleep(0.1)
+    else:
+        pytest.fail("grandchild process survived the timeout")
+
+
+@pytest.mark.asyncio
+async def test_server_runs_commands_concurrently_with_progress(tmp_path, monkeypatch):
+    fastmcp = pytest.importorskip("fastmcp")
+    monkeypatch.setattr(sys, "argv", ["_code_execution_server.py", "--allowed-paths", str(tmp_path)])
+    server = await ce_module.create_server()
+
+    messages = []
+
+    async def progress_handler(progress, total, message):
+        messages.append(message)
+
+    command = f'{PY} -c "import time; print(\\"begin\\", flush=True); time.sleep(2.5); print(\\"done\\")"'
+    async with fastmcp.Client(server, progress_handler=progress_handler) as client:
+        start = time.perf_counter()
+        results = await asyncio.gather(*(client.call_tool("execute_command", {"command": command, "work_dir": str(tmp_path)}) for _ in range(3)))
+        elapsed = time.perf_counter() - start
+
+    for result in results:
+        payload = json.loads(result.content[0].text)
+        assert payload["success"], payload
+        assert payload["stdout"].split() == ["begin", "done"]
+    # The commands overlap instead of running back to back, and report progress while running
+    assert elapsed < 5
+    assert len(messages) >= 1
@@ -10,6 +10,7 @@ including adding, retrieving, deleting, and managing messages.
 import pytest
 
 from massgen.memory import ConversationMemory
+from massgen.memory import _conversation as conversation_module
 
 
 @pytest.mark.asyncio
@@ -334,15 +335,21 @@ async def test_retrieve_not_implemented():
 
 @pytest.mark.asyncio
 async def test_message_isolation():
-    """Test that returned messages are copies, not references."""
+    """Test that stored messages are isolated from the caller's dicts and read-only."""
     memory = ConversationMemory()
 
     original = {"role": "user", "content": "Original"}
     await memory.add(original)
+    original["content"] = "Changed by caller"
 
-    # Get messages and modify
+    # Retrieved messages are shared and cannot be modified
     retrieved = await memory.get_messages()
-    retrieved[0]["content"] = "Modified"
+    with pytest.raises(TypeError):
+        retrieved[0]["content"] = "Modified"
+
+    # copy() gives a mutable dict
+    copied = retrieved[0].copy()
+    copied["content"] = "Modified"
 
     # Original in memory should be unchanged
     messages = await memory.get_messages()
@@ -350,6 +357,52 @@ async def test_message_isolation():
     print("✅ Message isolation works correctly")
 
 
+@pytest.mark.asyncio
+async def test_file_backed_memory(tmp_path):
+    """Test that a file-backed memory persists, indexes and compacts its messages."""
+    path = tmp_path / "conversation.jsonl"
+    memory = ConversationMemory(storage_path=path, cache_size=2)
+
+    await memory.add([{"role": "user", "content": f"Message {i}", "id": f"msg_{i}"} for i in range(5)])
+    await memory.add({"role": "user", "content": "Duplicate", "id": "msg_0"})
+    await memory.delete(1)
+    assert await memory.size() == 4
+    assert [m["role"] for m in await memory.get_messages_by_role("user")] == ["user"] * 4
+
+    # Reopening the file resumes the conversation; deleted records are gone
+    memory.close()
+    memory = ConversationMemory(storage_path=path, cache_size=2)
+    assert [m["content"] for m in await memory.get_messages()] == ["Message 0", "Message 2", "Message 3", "Message 4"]
+    await memory.add({"role": "assistant", "content": "Again", "id": "msg_2"})
+    assert await memory.size() == 4
+
+    # Removed IDs can be added again
+    await memory.truncate_to_size(1)
+    await memory.add({"role": "assistant", "content": "Back", "id": "msg_0"})
+    assert (await memory.get_last_message())["content"] == "Back"
+
+    state = memory.state_dict()
+    restored = ConversationMemory()
+    restored.load_state_dict(state)
+    assert await restored.get_messages() == await memory.get_messages()
+    memory.close()
+
+
+@pytest.mark.asyncio
+async def test_file_backed_memory_compacts_deleted_lines(tmp_path, monkeypatch):
+    """Test that the backing file is rewritten once deleted lines outweigh live ones."""
+    monkeypatch.setattr(conversation_module, "COMPACT_MIN_BYTES", 0)
+    path = tmp_path / "conversation.jsonl"
+    memory = ConversationMemory(storage_path=path)
+    await memory.add([{"role": "user", "content": f"Message {i}"} for i in range(6)])
+
+    await memory.truncate_to_size(2)
+    assert len(path.read_text().splitlines()) == 2
+    assert [m["content"] for m in await memory.get_messages()] == ["Message 4", "Message 5"]
+    memory.close()
+    assert [m["content"] for m in ConversationMemory(storage_path=path).messages] == ["Message 4", "Message 5"]
+
+
 if __name__ == "__main__":
     import asyncio
 
@@ -376,6 +429,7 @@ if __name__ == "__main__":
         await test_add_invalid_message_type()
         await test_retrieve_not_implemented()
         await test_message_isolation()
+        # test_file_backed_memory needs pytest's tmp_path fixture
 
         print("\n=== All ConversationMemory Tests Passed! ===\n")
 
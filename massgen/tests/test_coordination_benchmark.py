@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Smoke test for the coordination benchmark harness (runs without API keys).
+"""
+
+import pytest
+
+from massgen.benchmarks import MockStreamingBackend, run_coordination_benchmark
+
+
+@pytest.mark.asyncio
+async def test_mock_backend_scripts_answers_then_votes():
+    backend = MockStreamingBackend(tokens_per_second=0, response_tokens=6, tokens_per_chunk=4, answer_rounds=1)
+    workflow_tools = [{"type": "function", "function": {"name": name}} for name in ("new_answer", "vote")]
+
+    first = [chunk async for chunk in backend.stream_with_tools([], workflow_tools)]
+    assert [chunk.content for chunk in first if chunk.type == "content"] == ["w0 w1 w2 w3 ", "w4 w5 "]
+    assert first[-2].tool_calls[0]["function"]["name"] == "new_answer"
+
+    second = [chunk async for chunk in backend.stream_with_tools([], workflow_tools)]
+    assert second[-2].tool_calls[0]["function"] == {"name": "vote", "arguments": {"agent_id": "agent1", "reason": "Most complete answer"}}
+
+    # Without workflow tools (final presentation) it only streams content
+    final = [chunk async for chunk in backend.stream_with_tools([], [])]
+    assert {chunk.type for chunk in final} == {"content", "done"}
+
+
+@pytest.mark.asyncio
+async def test_benchmark_runs_coordination_end_to_end(tmp_path):
+    result = await run_coordination_benchmark(num_agents=3, rounds=2, tokens_per_second=0, tool_calls=1, workspace_root=str(tmp_path))
+
+    assert (result.answers, result.votes) == (6, 3)
+    assert set(result.agent_time_to_first_chunk) == {"agent_0", "agent_1", "agent_2"}
+    assert 0 < result.time_to_first_chunk < result.wall_time
+    assert result.coordination_chunks > 0 and result.chunks_per_second > 0
+    assert result.snapshot_operations >= 6 and result.snapshot_io_time > 0
+    assert result.loop_lag_max_ms >= result.loop_lag_p95_ms >= 0
+    assert result.to_dict()["settings"]["num_agents"] == 3
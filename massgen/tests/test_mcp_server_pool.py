@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests and startup benchmark for the shared MCP server pool.
+"""
+
+import asyncio
+import json
+import shutil
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("uvicorn")
+
+import massgen.filesystem_manager._workspace_tools_server as workspace_tools_module  # noqa: E402
+import massgen.mcp_tools.memory._memory_mcp_server as memory_module  # noqa: E402
+from massgen import logger_config  # noqa: E402
+from massgen.mcp_tools import MCPClient, MCPServerPool, server_pool  # noqa: E402
+
+AGENT_COUNT = 5
+
+
+def _workspace_tools_config(workspace: Path):
+    """Same shape as FilesystemManager.get_workspace_tools_mcp_config."""
+    script = Path(workspace_tools_module.__file__).resolve()
+    return {
+        "name": "workspace_tools",
+        "type": "stdio",
+        "command": "fastmcp",
+        "args": ["run", f"{script}:create_server", "--", "--allowed-paths", str(workspace)],
+        "env": {"FASTMCP_SHOW_CLI_BANNER": "false"},
+        "cwd": str(workspace),
+    }
+
+
+def _memory_config(agent_id: str, workspace: Path):
+    script = Path(memory_module.__file__).resolve()
+    return {
+        "name": f"memory_{agent_id}",
+        "type": "stdio",
+        "command": "fastmcp",
+        "args": ["run", f"{script}:create_server", "--", "--agent-id", agent_id, "--orchestrator-id", "orch", "--workspace-path", str(workspace)],
+    }
+
+
+def _workspaces(tmp_path, count):
+    workspaces = []
+    for i in range(count):
+        workspace = tmp_path / f"workspace{i}"
+        workspace.mkdir()
+        (workspace / "notes.txt").write_text(f"agent {i}\n")
+        workspaces.append(workspace)
+    return workspaces
+
+
+def _payload(result):
+    return json.loads(result.content[0].text)
+
+
+@pytest.fixture
+def pool(tmp_path, monkeypatch):
+    monkeypatch.setattr(server_pool, "get_log_session_dir", lambda: tmp_path)
+    monkeypatch.setattr(logger_config, "get_log_session_dir", lambda: tmp_path)
+    MCPServerPool.enable()
+    yield MCPServerPool
+    MCPServerPool.terminate_all()
+    MCPServerPool.enable(False)
+
+
+def test_only_massgen_servers_are_poolable(tmp_path):
+    config = _workspace_tools_config(tmp_path)
+    script, argv = MCPServerPool.parse_poolable(config)
+    assert script == str(Path(workspace_tools_module.__file__).resolve())
+    assert argv == ["--allowed-paths", str(tmp_path)]
+
+    assert MCPServerPool.parse_poolable({**config, "env": {"OPENAI_API_KEY": "x"}}) is None
+    assert MCPServerPool.parse_poolable({"name": "filesystem", "type": "stdio", "command": "npx", "args": ["-y", "@modelcontextprotocol/server-filesystem", str(tmp_path)]}) is None
+    assert MCPServerPool.parse_poolable({**config, "args": ["run", "/elsewhere/server.py:create_server"]}) is None
+    assert MCPServerPool.parse_poolable({"name": "remote", "type": "streamable-http", "url": "http://example.com/mcp"}) is None
+
+
+@pytest.mark.asyncio
+async def test_agents_share_one_host_with_isolated_scopes(pool, tmp_path):
+    workspaces = _workspaces(tmp_path, 3)
+    clients = [MCPClient([_workspace_tools_config(ws)]) for ws in workspaces]
+    await asyncio.gather(*(client.connect() for client in clients))
+    try:
+        assert pool.stats() == {"hosts": 1, "scopes": 3}
+
+        # Relative paths resolve against each agent's own workspace
+        result = await clients[1].call_tool("mcp__workspace_tools__copy_file", {"source_path": "notes.txt", "destination_path": "copy.txt"})
+        assert _payload(result)["success"]
+        assert (workspaces[1] / "copy.txt").read_text() == "agent 1\n"
+        assert not (workspaces[0] / "copy.txt").exists()
+
+        # Allowed paths are scoped per agent
+        result = await clients[0].call_tool("mcp__workspace_tools__copy_file", {"source_path": str(workspaces[2] / "notes.txt"), "destination_path": "stolen.txt"})
+        assert result.isError
+        assert not (workspaces[0] / "stolen.txt").exists()
+    finally:
+        for client in clients:
+            await client.disconnect()
+
+    assert pool.stats() == {"hosts": 1, "scopes": 0}
+
+
+@pytest.mark.asyncio
+async def test_module_state_is_not_shared_between_scopes(pool, tmp_path):
+    workspace_a, workspace_b = _workspaces(tmp_path, 2)
+    client_a = MCPClient([_memory_config("agent_a", workspace_a)])
+    client_b = MCPClient([_memory_config("agent_b", workspace_b)])
+    await client_a.connect()
+    await client_b.connect()
+    try:
+        created = await client_a.call_tool("mcp__memory_agent_a__create_memory", {"name": "plan", "description": "d", "content": "secret"})
+        assert _payload(created)["success"]
+
+        loaded = await client_b.call_tool("mcp__memory_agent_b__load_memory", {"name": "plan"})
+        assert not _payload(loaded)["success"]
+        assert (workspace_a / "memory" / "short_term" / "plan.md").exists()
+        assert not (workspace_b / "memory").exists()
+    finally:
+        await client_a.disconnect()
+        await client_b.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_terminated_host_is_respawned(pool, tmp_path):
+    (workspace,) = _workspaces(tmp_path, 1)
+    client = MCPClient([_workspace_tools_config(workspace)])
+    await client.connect()
+    await client.disconnect()
+
+    MCPServerPool.terminate_all()
+    assert pool.stats()["hosts"] == 0
+
+    client = MCPClient([_workspace_tools_config(workspace)])
+    await client.connect()
+    try:
+        assert pool.stats() == {"hosts": 1, "scopes": 1}
+    finally:
+        await client.disconnect()
+
+
+async def _connect_all(workspaces):
+    clients = [MCPClient([_workspace_tools_config(ws)]) for ws in workspaces]
+    start = time.perf_counter()
+    await asyncio.gather(*(client.connect() for client in clients))
+    elapsed = time.perf_counter() - start
+    for client in clients:
+        await client.disconnect()
+    return elapsed
+
+
+@pytest.mark.skipif(shutil.which("fastmcp") is None, reason="stdio baseline needs the fastmcp CLI")
+@pytest.mark.asyncio
+async def test_startup_benchmark(pool, tmp_path):
+    """Connecting N agents: one stdio process each vs. one shared host (cold, then reused)."""
+    workspaces = _workspaces(tmp_path, AGENT_COUNT)
+
+    MCPServerPool.enable(False)
+    stdio = await _connect_all(workspaces)
+    MCPServerPool.enable()
+    cold = await _connect_all(workspaces)
+    warm = await _connect_all(workspaces)
+
+    print(f"\n{AGENT_COUNT} agents workspace_tools connect: stdio={stdio:.2f}s pooled cold={cold:.2f}s pooled warm={warm:.2f}s")
+    assert warm < stdio
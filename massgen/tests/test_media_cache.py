@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the shared base64 encoding cache behind upload_files media.
+"""
+
+import asyncio
+import base64
+import os
+
+import pytest
+
+from massgen.backend import media_cache
+from massgen.backend.chat_completions import ChatCompletionsBackend
+from massgen.backend.media_cache import MediaEncodingCache
+
+
+@pytest.fixture
+def encodings(monkeypatch):
+    encoded = []
+    encode_file = media_cache._encode_file
+
+    def counting(path):
+        encoded.append(path)
+        return encode_file(path)
+
+    monkeypatch.setattr(media_cache, "_encode_file", counting)
+    return encoded
+
+
+@pytest.mark.asyncio
+async def test_agents_share_one_encoding_per_file_version(tmp_path, encodings):
+    image = tmp_path / "chart.png"
+    image.write_bytes(os.urandom(3 * 1024 * 1024 + 7))
+    cache = MediaEncodingCache()
+    backends = [ChatCompletionsBackend(api_key="test") for _ in range(5)]
+    for backend in backends:
+        backend.set_media_cache(cache)
+
+    async def attach(backend):
+        params = {"upload_files": [{"image_path": str(image)}]}
+        return await backend._process_upload_files([{"role": "user", "content": "Describe"}], params)
+
+    results = await asyncio.gather(*(attach(backend) for backend in backends))
+    images = [messages[-1]["content"][-1] for messages in results]
+    assert len(encodings) == 1 and cache.stats()["misses"] == 1 and cache.stats()["hits"] == 4
+    assert images[0]["base64"] == base64.b64encode(image.read_bytes()).decode("ascii")
+    assert images[0]["mime_type"] == "image/png"
+    assert all(item["base64"] is images[0]["base64"] for item in images)
+
+    # Editing the file invalidates its entry
+    image.write_bytes(b"new image")
+    os.utime(image, ns=(0, 1))
+    encoded, _ = await cache.encode(image)
+    assert encoded == base64.b64encode(b"new image").decode("ascii")
+    assert len(encodings) == 2 and cache.stats()["entries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_entries_beyond_the_memory_budget_spill_to_disk(tmp_path, encodings):
+    files = []
+    for index in range(3):
+        path = tmp_path / f"clip_{index}.wav"
+        path.write_bytes(bytes([index]) * 6000)
+        files.append(path)
+    cache = MediaEncodingCache(max_memory_mb=0.01, max_disk_mb=0.01)
+
+    for path in files:
+        await cache.encode(path)
+    stats = cache.stats()
+    assert cache.memory_bytes <= cache.max_memory_bytes and cache.disk_bytes <= cache.max_disk_bytes
+    assert stats["spills"] == 2 and stats["entries"] == 2
+
+    # The spilled file is read back from disk; the one dropped from disk is encoded again
+    encoded, mime_type = await cache.encode(files[1])
+    assert encoded == base64.b64encode(files[1].read_bytes()).decode("ascii") and mime_type in ("audio/wav", "audio/x-wav")
+    await cache.encode(files[0])
+    assert len(encodings) == 4
+
+    with pytest.raises(OSError):
+        await cache.encode(tmp_path / "missing.mp4")
+
+
+@pytest.mark.asyncio
+async def test_restoring_a_key_keeps_memory_accounting(tmp_path):
+    path = tmp_path / "photo.jpg"
+    path.write_bytes(b"jpeg bytes")
+    cache = MediaEncodingCache()
+    encoded, _ = await cache.encode(path)
+    key = next(iter(cache._entries))
+
+    # A second encode of the same version (e.g. after a failed shared encoding) stores it again
+    cache._store(key, media_cache._Entry(mime_type="image/jpeg", size=len(encoded), data=encoded))
+    assert cache.memory_bytes == len(encoded)
+    assert cache.stats()["entries"] == 1
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the mem0 adapters' background event loop and embedding batching.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("mem0")
+
+from massgen.memory._mem0_adapters import (  # noqa: E402
+    MassGenEmbeddingAdapter,
+    MassGenLLMAdapter,
+    _run_async_safely,
+)
+
+
+class FakeEmbeddingBackend:
+    """Embeds a text as [len(text), call number] and records each call."""
+
+    def __init__(self):
+        self.calls = []
+        self.loops = set()
+
+    async def __call__(self, texts):
+        self.loops.add(asyncio.get_running_loop())
+        self.calls.append(list(texts))
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(embeddings=[[float(len(text)), float(len(self.calls))] for text in texts])
+
+
+def _adapter(backend):
+    return MassGenEmbeddingAdapter(SimpleNamespace(model=backend))
+
+
+def test_calls_share_one_background_loop():
+    async def current_loop():
+        return asyncio.get_running_loop(), threading.current_thread()
+
+    first = _run_async_safely(current_loop())
+
+    async def from_async_context():
+        # A running loop in the caller's thread does not matter
+        return _run_async_safely(current_loop())
+
+    assert asyncio.run(from_async_context()) == first
+    assert first[1] is not threading.current_thread()
+
+
+def test_concurrent_embeds_are_batched_and_cached():
+    backend = FakeEmbeddingBackend()
+    adapter = _adapter(backend)
+    texts = [f"fact {index}" for index in range(8)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        vectors = list(executor.map(lambda text: adapter.embed(text, "add"), texts))
+    assert [vector[0] for vector in vectors] == [float(len(text)) for text in texts]
+    assert len(backend.calls) < len(texts) and sorted(sum(backend.calls, [])) == sorted(texts)
+
+    # Repeated texts come from the cache; embed_batch only sends the new ones
+    calls = len(backend.calls)
+    assert adapter.embed(texts[0], "search") == vectors[0]
+    batch = adapter.embed_batch([texts[1], "new fact", texts[2]])
+    assert backend.calls[calls:] == [["new fact"]]
+    assert batch[0] == vectors[1] and batch[2] == vectors[2]
+    assert adapter.cache_hits == 3 and len(backend.loops) == 1
+
+
+def test_embedding_errors_are_wrapped():
+    async def failing(texts):
+        raise ConnectionError("offline")
+
+    with pytest.raises(RuntimeError, match="offline"):
+        _adapter(failing).embed("text")
+
+
+def test_llm_adapter_collects_streamed_content():
+    class Backend:
+        async def stream_with_tools(self, messages, tools):
+            for word in ("Hello", " world"):
+                yield SimpleNamespace(type="content", content=word)
+
+    adapter = MassGenLLMAdapter(SimpleNamespace(model=Backend()))
+    assert adapter.generate_response([{"role": "user", "content": "Hi"}]) == "Hello world"
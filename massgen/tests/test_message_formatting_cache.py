@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for memoized message and tool formatting across tool rounds.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from massgen.api_params_handler import ChatCompletionsAPIParamsHandler
+from massgen.formatter import (
+    ChatCompletionsFormatter,
+    ClaudeFormatter,
+    ResponseFormatter,
+)
+from massgen.tool import ToolManager
+
+
+def _tool_round(call_id, arguments):
+    assistant = {"role": "assistant", "content": "", "tool_calls": [{"id": call_id, "type": "function", "function": {"name": "lookup", "arguments": arguments}}]}
+    result = {"role": "tool", "tool_call_id": call_id, "content": f"result {call_id}"}
+    return [assistant, result]
+
+
+def echo(text: str) -> str:
+    """Echo text."""
+    return text
+
+
+def count(items: int) -> int:
+    """Count items."""
+    return items
+
+
+def _count_conversions(monkeypatch, formatter):
+    converted = []
+    convert = formatter._convert_message
+
+    def counting(message):
+        converted.append(message)
+        return convert(message)
+
+    monkeypatch.setattr(formatter, "_convert_message", counting)
+    return converted
+
+
+@pytest.mark.parametrize("formatter_class", [ChatCompletionsFormatter, ClaudeFormatter, ResponseFormatter])
+def test_rounds_only_convert_new_or_edited_messages(monkeypatch, formatter_class):
+    formatter = formatter_class()
+    converted = _count_conversions(monkeypatch, formatter)
+    history = [{"role": "system", "content": "Be brief"}, {"role": "user", "content": [{"type": "text", "text": "hi"}]}]
+    history += _tool_round("call_1", {"q": 1})
+
+    first = formatter.format_messages(list(history))
+    converted.clear()
+
+    # Next round: the history is copied and extended, as the backends do between tool rounds
+    history = history + _tool_round("call_2", {"q": 2})
+    second = formatter.format_messages(list(history))
+    assert converted == history[-2:]
+    assert second[: len(first)] == first
+    assert formatter_class().format_messages(history) == second
+
+    # Messages edited in place are converted again
+    converted.clear()
+    history[1]["content"].append({"type": "text", "text": "more"})
+    history[-1]["content"] = "edited"
+    third = formatter.format_messages(history)
+    assert converted == [history[1], history[-1]]
+    assert third == formatter_class().format_messages(history)
+
+
+def test_sanitize_indexes_tool_results_in_one_pass():
+    formatter = ChatCompletionsFormatter()
+    handler = ChatCompletionsAPIParamsHandler(SimpleNamespace(formatter=formatter, custom_tool_manager=ToolManager()))
+    answered = _tool_round("call_1", {"q": 1})
+    early_result = {"role": "tool", "tool_call_id": "call_2", "content": "too early"}
+    pending = {
+        "role": "assistant",
+        "content": "",
+        "tool_calls": [{"id": "call_2", "function": {"name": "lookup", "arguments": {}}}, {"id": "call_3", "function": {"name": "lookup", "arguments": None}}],
+    }
+    messages = [{"role": "user", "content": "hi"}, *answered, early_result, pending, {"role": "tool", "tool_call_id": "call_3", "content": "ok"}]
+
+    sanitized = handler._sanitize_messages_for_api(messages)
+    # A result before the call does not count; arguments are serialized
+    assert [tc["id"] for tc in sanitized[4]["tool_calls"]] == ["call_3"]
+    assert sanitized[4]["tool_calls"][0]["function"]["arguments"] == "{}"
+    assert sanitized[1]["tool_calls"][0]["function"]["arguments"] == '{"q": 1}'
+    assert handler._sanitize_messages_for_api(messages)[4] is sanitized[4]
+
+    # Calls without results are dropped, and so is an assistant message left empty
+    assert handler._sanitize_messages_for_api(messages[:5]) == sanitized[:4]
+
+
+@pytest.mark.asyncio
+async def test_tool_schemas_are_converted_once_per_tool_set_version(monkeypatch):
+    formatter = ChatCompletionsFormatter()
+    manager = ToolManager()
+    handler = ChatCompletionsAPIParamsHandler(SimpleNamespace(formatter=formatter, custom_tool_manager=manager))
+    manager.add_tool_function(func=echo)
+    workflow_tools = [{"type": "function", "name": "vote", "description": "Vote", "parameters": {}}]
+
+    calls = []
+    for name in ("format_tools", "format_custom_tools"):
+        original = getattr(formatter, name)
+        monkeypatch.setattr(formatter, name, lambda tools, _original=original, _name=name: calls.append(_name) or _original(tools))
+
+    messages = [{"role": "user", "content": "hi"}]
+    first = await handler.build_api_params(messages, workflow_tools, {"model": "m"})
+    second = await handler.build_api_params(messages, workflow_tools, {"model": "m"})
+    assert calls == ["format_tools", "format_custom_tools"]
+    assert first["tools"] == second["tools"] and len(first["tools"]) == 2
+
+    # Registering another tool changes the version and the schemas are rebuilt
+    manager.add_tool_function(func=count)
+    third = await handler.build_api_params(messages, workflow_tools, {"model": "m"})
+    assert calls[2:] == ["format_custom_tools"] and len(third["tools"]) == 3
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for concurrent execution of tool calls emitted in a single model turn.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from massgen.backend.base_with_custom_tool_and_mcp import ToolExecutionConfig
+from massgen.backend.chat_completions import ChatCompletionsBackend
+
+
+def _make_mcp_config(callback) -> ToolExecutionConfig:
+    return ToolExecutionConfig(
+        tool_type="mcp",
+        chunk_type="mcp_status",
+        emoji_prefix="🔧 [MCP Tool]",
+        success_emoji="✅ [MCP Tool]",
+        error_emoji="❌ [MCP Tool Error]",
+        source_prefix="mcp_",
+        status_called="mcp_tool_called",
+        status_response="mcp_tool_response",
+        status_error="mcp_tool_error",
+        execution_callback=callback,
+    )
+
+
+def _make_calls(delays):
+    return [{"call_id": f"call_{i}", "name": f"tool_{i}", "arguments": f'{{"delay": {delay}}}'} for i, delay in enumerate(delays)]
+
+
+async def _run(backend, calls, config):
+    messages = []
+    processed = set()
+    chunks = []
+    plan = [(call, config) for call in calls]
+    async for chunk in backend._execute_tool_calls(plan, messages, processed):
+        chunks.append(chunk)
+    return messages, processed, chunks
+
+
+@pytest.mark.asyncio
+async def test_parallel_tool_calls_run_concurrently_and_keep_order():
+    """Slow first call must not reorder result messages."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_mcp(name, arguments):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.2 if name == "tool_0" else 0.05)
+        in_flight -= 1
+        return f"result of {name}", None
+
+    backend = ChatCompletionsBackend(api_key="test-key", max_parallel_tool_calls=4)
+    calls = _make_calls([0.2, 0.05, 0.05, 0.05])
+
+    start = time.monotonic()
+    messages, processed, chunks = await _run(backend, calls, _make_mcp_config(fake_mcp))
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.35
+    assert max_in_flight == 4
+    assert [m["tool_call_id"] for m in messages] == ["call_0", "call_1", "call_2", "call_3"]
+    assert [m["content"] for m in messages] == [f"result of tool_{i}" for i in range(4)]
+    assert processed == {"call_0", "call_1", "call_2", "call_3"}
+    # Status chunks are interleaved: a fast call completes before the slow first call
+    completions = [c.source for c in chunks if c.status == "mcp_tool_response"]
+    assert completions[-1] == "mcp_tool_0"
+
+
+@pytest.mark.asyncio
+async def test_parallel_tool_calls_respect_concurrency_cap():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_mcp(name, arguments):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return "ok", None
+
+    backend = ChatCompletionsBackend(api_key="test-key", max_parallel_tool_calls=2)
+    messages, _, _ = await _run(backend, _make_calls([0.01] * 6), _make_mcp_config(fake_mcp))
+
+    assert max_in_flight == 2
+    assert len(messages) == 6
+
+
+@pytest.mark.asyncio
+async def test_parallel_tool_execution_disabled_runs_sequentially():
+    order = []
+
+    async def fake_mcp(name, arguments):
+        order.append(f"start:{name}")
+        await asyncio.sleep(0.01)
+        order.append(f"end:{name}")
+        return "ok", None
+
+    backend = ChatCompletionsBackend(api_key="test-key", parallel_tool_execution=False)
+    await _run(backend, _make_calls([0.01, 0.01]), _make_mcp_config(fake_mcp))
+
+    assert order == ["start:tool_0", "end:tool_0", "start:tool_1", "end:tool_1"]
+
+
+@pytest.mark.asyncio
+async def test_parallel_tool_call_errors_are_reported_per_call():
+    async def fake_mcp(name, arguments):
+        if name == "tool_1":
+            raise RuntimeError("boom")
+        return "ok", None
+
+    backend = ChatCompletionsBackend(api_key="test-key")
+    messages, processed, chunks = await _run(backend, _make_calls([0, 0, 0]), _make_mcp_config(fake_mcp))
+
+    assert [m["tool_call_id"] for m in messages] == ["call_0", "call_1", "call_2"]
+    assert "boom" in messages[1]["content"]
+    assert any(c.status == "mcp_tool_error" for c in chunks)
+    assert len(processed) == 3
+
+
+def test_execution_plan_follows_model_call_order():
+    backend = ChatCompletionsBackend(api_key="test-key")
+    custom_config = _make_mcp_config(None)
+    mcp_config = _make_mcp_config(None)
+    custom_calls = [{"call_id": "b"}]
+    mcp_calls = [{"call_id": "a"}, {"call_id": "c"}]
+
+    plan = backend._build_tool_execution_plan(custom_calls, mcp_calls, custom_config, mcp_config, call_order=["a", "b", "c"])
+
+    assert [call["call_id"] for call, _ in plan] == ["a", "b", "c"]
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests and micro-benchmark for the compiled path permission index.
+"""
+
+import random
+import time
+
+from massgen.filesystem_manager import PathPermissionManager, Permission
+
+MANAGED_PATH_COUNT = 1_000
+LOOKUP_COUNT = 100_000
+
+
+def _reference_permission(manager, path):
+    """The original linear-scan resolution, kept here as the behavioural oracle."""
+    resolved = path.resolve()
+    in_workspace = any(mp.path_type == "workspace" and mp.contains(resolved) for mp in manager.managed_paths)
+    if not in_workspace and any(part in manager.DEFAULT_EXCLUDED_PATTERNS for part in resolved.parts):
+        return Permission.READ
+    for mp in manager.managed_paths:
+        if mp.contains(resolved) and mp.is_protected(resolved):
+            return Permission.READ
+    for mp in manager.managed_paths:
+        if mp.is_file and mp.contains(resolved):
+            return mp.permission
+    dir_paths = [mp for mp in manager.managed_paths if not mp.is_file and mp.path_type != "file_context_parent"]
+    for mp in sorted(dir_paths, key=lambda mp: len(mp.path.parts), reverse=True):
+        if mp.contains(resolved):
+            return mp.permission
+    return None
+
+
+def _build_tree(tmp_path):
+    (tmp_path / "workspace" / ".git").mkdir(parents=True)
+    (tmp_path / "project" / "src" / "deep").mkdir(parents=True)
+    (tmp_path / "project" / "tests" / "keep").mkdir(parents=True)
+    (tmp_path / "project" / "node_modules" / "pkg").mkdir(parents=True)
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "logo.png").write_text("png")
+    (tmp_path / "docs" / "readme.md").write_text("readme")
+    (tmp_path / "project" / "config.yaml").write_text("a: 1")
+
+
+def _make_manager(tmp_path, write_enabled=False):
+    manager = PathPermissionManager(context_write_access_enabled=write_enabled)
+    manager.add_path(tmp_path / "workspace", Permission.WRITE, "workspace")
+    manager.add_context_paths(
+        [
+            {"path": str(tmp_path / "project"), "permission": "write", "protected_paths": ["tests/keep", "config.yaml"]},
+            {"path": str(tmp_path / "project" / "src" / "deep"), "permission": "read"},
+            {"path": str(tmp_path / "docs" / "logo.png"), "permission": "write"},
+        ],
+    )
+    return manager
+
+
+def _probe_paths(tmp_path):
+    return [
+        tmp_path / "workspace",
+        tmp_path / "workspace" / ".git" / "config",
+        tmp_path / "project",
+        tmp_path / "project" / "src" / "main.py",
+        tmp_path / "project" / "src" / "deep" / "x.py",
+        tmp_path / "project" / "tests" / "keep" / "t.py",
+        tmp_path / "project" / "tests" / "other.py",
+        tmp_path / "project" / "config.yaml",
+        tmp_path / "project" / "node_modules" / "pkg" / "index.js",
+        tmp_path / "docs",
+        tmp_path / "docs" / "logo.png",
+        tmp_path / "docs" / "readme.md",
+        tmp_path / "elsewhere" / ".env",
+        tmp_path / "elsewhere" / "file.txt",
+    ]
+
+
+def test_index_matches_linear_scan(tmp_path):
+    _build_tree(tmp_path)
+    for write_enabled in (False, True):
+        manager = _make_manager(tmp_path, write_enabled=write_enabled)
+        for path in _probe_paths(tmp_path):
+            assert manager.get_permission(path) == _reference_permission(manager, path), path
+
+
+def test_index_rebuilds_on_configuration_changes(tmp_path):
+    _build_tree(tmp_path)
+    manager = _make_manager(tmp_path)
+    src_file = tmp_path / "project" / "src" / "main.py"
+    logo = tmp_path / "docs" / "logo.png"
+    readme = tmp_path / "docs" / "readme.md"
+
+    assert manager.get_permission(src_file) == Permission.READ
+    assert manager.get_permission(readme) is None
+    assert not manager._is_path_within_allowed_directories(readme)
+
+    manager.set_context_write_access_enabled(True)
+    assert manager.get_permission(src_file) == Permission.WRITE
+    assert manager.get_permission(logo) == Permission.WRITE
+    assert manager.get_permission(tmp_path / "project" / "config.yaml") == Permission.READ
+
+    manager.add_path(tmp_path / "docs", Permission.WRITE, "workspace")
+    assert manager.get_permission(readme) == Permission.WRITE
+    assert manager._is_path_within_allowed_directories(readme)
+
+
+def test_permission_cache_is_bounded(tmp_path):
+    _build_tree(tmp_path)
+    manager = _make_manager(tmp_path)
+    manager._permission_cache.maxsize = 8
+
+    for i in range(50):
+        manager.get_permission(tmp_path / "project" / "src" / f"file_{i}.py")
+
+    assert len(manager._permission_cache) == 8
+    assert tmp_path / "project" / "src" / "file_49.py" in manager._permission_cache
+    assert tmp_path / "project" / "src" / "file_0.py" not in manager._permission_cache
+
+
+def test_lookup_benchmark_with_many_managed_paths(tmp_path):
+    """1k managed paths and 100k lookups must stay well within interactive budgets."""
+    manager = PathPermissionManager()
+    roots = []
+    for i in range(MANAGED_PATH_COUNT):
+        root = tmp_path / f"group_{i % 10}" / f"ctx_{i}"
+        manager.add_path(root, Permission.READ if i % 2 else Permission.WRITE, "workspace" if i % 50 == 0 else "temp_workspace")
+        roots.append(root)
+
+    rng = random.Random(0)
+    probes = [roots[rng.randrange(len(roots))] / "sub" / f"file_{rng.randrange(5_000)}.py" for _ in range(LOOKUP_COUNT)]
+
+    start = time.perf_counter()
+    for path in probes:
+        manager.get_permission(path)
+    indexed = (time.perf_counter() - start) / LOOKUP_COUNT
+
+    start = time.perf_counter()
+    for path in probes[:10]:
+        assert manager.get_permission(path) == _reference_permission(manager, path)
+    linear = (time.perf_counter() - start) / 10
+
+    assert len(manager._permission_cache) <= manager.PERMISSION_CACHE_SIZE
+    assert indexed * LOOKUP_COUNT < 30, f"{LOOKUP_COUNT} lookups over {MANAGED_PATH_COUNT} managed paths took {indexed * LOOKUP_COUNT:.2f}s"
+    assert indexed * 10 < linear, f"indexed lookup {indexed * 1e6:.1f}us vs linear scan {linear * 1e6:.1f}us"
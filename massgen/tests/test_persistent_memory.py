@@ -9,6 +9,7 @@ including recording, retrieving, and managing memories across sessions.
 Note: Some tests require mem0ai to be installed and may be skipped if unavailable.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -131,6 +132,7 @@ class TestPersistentMemoryMocked:
         ]
 
         await memory.record(messages)
+        await memory.flush()
 
         # Verify mem0.add was called
         assert mock_mem0.add.called
@@ -300,6 +302,114 @@ class TestPersistentMemoryMocked:
         assert not mock_mem0.add.called
         print("✅ Recording empty messages handled gracefully")
 
+    @pytest.mark.asyncio
+    async def test_record_returns_before_extraction_and_batches(self, mock_memory):
+        """Test that record() only queues, and queued records are merged into fewer mem0 adds."""
+        memory, mock_mem0 = mock_memory
+        release = asyncio.Event()
+
+        async def slow_add(**kwargs):
+            await release.wait()
+            return {"results": []}
+
+        mock_mem0.add = AsyncMock(side_effect=slow_add)
+
+        async def record(index):
+            await memory.record(
+                [{"role": "assistant", "content": f"Answer number {index} [Tool Call: search]"}],
+                metadata={"turn": 1},
+            )
+
+        # The worker picks up the first record; the others queue up behind it
+        await record(0)
+        while not mock_mem0.add.called:
+            await asyncio.sleep(0)
+        for index in range(1, 4):
+            await record(index)
+        assert mock_mem0.add.call_count == 1
+        assert memory.recording_stats()["queue_depth"] == 3
+
+        release.set()
+        await memory.flush()
+        stats = memory.recording_stats()
+        assert stats["records"] == 4 and stats["batches"] == 2 and stats["queue_depth"] == 0
+
+        # The three records queued behind the first went out in one add
+        merged = mock_mem0.add.call_args_list[1].kwargs
+        assert mock_mem0.add.call_count == 2
+        assert merged["messages"][0]["content"].count("Answer number") == 3
+        assert merged["metadata"] == {"tools_used": ["search"], "has_tools": True, "message_count": 3, "turn": 1}
+        await memory.close()
+        print("✅ Background recording queues and batches records")
+
+    @pytest.mark.asyncio
+    async def test_inline_recording_and_failures(self, mock_memory):
+        """Test inline recording, and that background failures are counted instead of raised."""
+        memory, mock_mem0 = mock_memory
+        mock_mem0.add = AsyncMock(side_effect=ConnectionError("vector store offline"))
+
+        await memory.record([{"role": "user", "content": "Remember this fact"}])
+        await memory.flush()
+        assert memory.recording_stats()["failures"] == 1
+
+        memory._recorder = None
+        with pytest.raises(ConnectionError):
+            await memory.record([{"role": "user", "content": "Remember this fact"}])
+        assert memory.recording_stats() == {}
+        print("✅ Inline recording and background failures work")
+
+    @pytest.mark.asyncio
+    async def test_record_compress_retrieve_keeps_latest_context(self, mock_memory):
+        """Test that compression waits for queued records and retrieval never does."""
+        from massgen.memory import ContextCompressor, ConversationMemory
+        from massgen.token_manager import TokenCostCalculator
+
+        memory, mock_mem0 = mock_memory
+        written = []
+        release = asyncio.Event()
+
+        async def slow_add(**kwargs):
+            await asyncio.sleep(0.05)
+            if "Staging" in kwargs["messages"][0]["content"]:
+                await release.wait()
+            written.append(kwargs["messages"][0]["content"])
+            return {"results": []}
+
+        async def search(**kwargs):
+            return {"results": [{"memory": content} for content in written]}
+
+        mock_mem0.add = AsyncMock(side_effect=slow_add)
+        mock_mem0.search = AsyncMock(side_effect=search)
+
+        conversation = ConversationMemory()
+        messages = [{"role": "user", "content": f"question {i}"} for i in range(9)]
+        messages.append({"role": "assistant", "content": "The deploy key lives in vault"})
+        await conversation.add(messages)
+        await memory.record(messages[-1:])
+
+        compressor = ContextCompressor(
+            token_calculator=TokenCostCalculator(),
+            conversation_memory=conversation,
+            persistent_memory=memory,
+        )
+        stats = await compressor.compress_if_needed(messages, current_tokens=1000, target_tokens=5)
+        assert stats.messages_removed > 0
+        assert len(written) == 1 and "The deploy key lives in vault" in written[0]
+
+        # Retrieval does not wait for a record still being extracted; it shows up once written
+        await memory.record([{"role": "assistant", "content": "Staging uses the blue cluster"}])
+        result = await asyncio.wait_for(memory.retrieve("where are the deploy settings?"), timeout=1)
+        assert "The deploy key lives in vault" in result
+        assert "Staging uses the blue cluster" not in result
+        assert memory.recording_stats()["records"] == 1
+
+        release.set()
+        await memory.flush()
+        result = await memory.retrieve("where are the deploy settings?")
+        assert "Staging uses the blue cluster" in result
+        await memory.close()
+        print("✅ Compression waits for queued records, retrieval does not")
+
     @pytest.mark.asyncio
     async def test_retrieve_empty_query(self, mock_memory):
         """Test retrieving with empty query."""
@@ -399,7 +509,6 @@ class TestPersistentMemoryBase:
 
 
 if __name__ == "__main__":
-    import asyncio
 
     async def run_all_tests():
         """Run all tests manually."""
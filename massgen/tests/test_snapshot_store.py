@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the content-addressed snapshot store.
+"""
+
+import os
+import stat
+
+import pytest
+
+from massgen.filesystem_manager import FilesystemManager
+from massgen.filesystem_manager import _filesystem_manager as fm_module
+from massgen.filesystem_manager._snapshot_store import SnapshotStore
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def _blob_count(store):
+    return sum(1 for p in store.blobs_dir.rglob("*") if p.is_file())
+
+
+def test_put_tree_deduplicates_and_materializes_with_links(tmp_path):
+    store = SnapshotStore(tmp_path / "store")
+    _write(tmp_path / "a" / "big.bin", "x" * 10_000)
+    _write(tmp_path / "a" / "empty_dir" / ".keep", "")
+    _write(tmp_path / "b" / "copy_of_big.bin", "x" * 10_000)
+
+    manifest_a = store.put_tree(tmp_path / "a")
+    manifest_b = store.put_tree(tmp_path / "b")
+
+    assert manifest_a["big.bin"] == manifest_b["copy_of_big.bin"]
+    assert _blob_count(store) == 2
+
+    dest = tmp_path / "dest"
+    _write(dest / "stale.txt", "old")
+    stats = store.materialize(manifest_a, dest)
+
+    assert stats.linked == 2 and stats.removed == 1
+    assert not (dest / "stale.txt").exists()
+    assert os.path.samefile(dest / "big.bin", store.blob_path(manifest_a["big.bin"]))
+
+    again = store.materialize(manifest_a, dest)
+    assert again.unchanged == 2 and again.linked == 0
+
+
+def test_manifests_round_trip(tmp_path):
+    store = SnapshotStore(tmp_path / "store")
+    assert store.load_manifest("latest/agent_a") is None
+
+    store.save_manifest("latest/agent_a", {"x.txt": "abc"})
+
+    assert store.load_manifest("latest/agent_a") == {"x.txt": "abc"}
+
+
+def _make_manager(tmp_path, agent_id):
+    manager = FilesystemManager(
+        cwd=str(tmp_path / f"workspace_{agent_id}"),
+        agent_temporary_workspace_parent=str(tmp_path / "temp_workspaces"),
+    )
+    manager.setup_orchestration_paths(
+        agent_id=agent_id,
+        snapshot_storage=str(tmp_path / "snapshots"),
+        agent_temporary_workspace=str(tmp_path / "temp_workspaces"),
+    )
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_snapshots_share_blobs_across_agents_and_rounds(tmp_path, monkeypatch):
+    monkeypatch.setattr(fm_module, "get_log_session_dir", lambda: tmp_path / "logs")
+    agent_a = _make_manager(tmp_path, "agent_a")
+    agent_b = _make_manager(tmp_path, "agent_b")
+
+    dataset = "row\n" * 50_000
+    for round_number in range(3):
+        for manager in (agent_a, agent_b):
+            _write(manager.get_current_workspace() / "dataset.csv", dataset)
+            _write(manager.get_current_workspace() / "answer.md", f"{manager.agent_id} round {round_number}")
+            await manager.save_snapshot(timestamp=f"t{round_number}")
+
+    # One dataset blob plus one answer blob per agent per round
+    assert _blob_count(agent_a.snapshot_store) == 1 + 2 * 3
+
+    snapshots = {"agent_a": agent_a.snapshot_storage, "agent_b": agent_b.snapshot_storage}
+    temp = await agent_a.copy_snapshots_to_temp_workspace(snapshots, {"agent_a": "agent1", "agent_b": "agent2"})
+
+    dataset_blob = agent_a.snapshot_store.blob_path(agent_a.snapshot_store.load_manifest("latest/agent_b")["dataset.csv"])
+    assert os.path.samefile(agent_b.snapshot_storage / "dataset.csv", dataset_blob)
+    # The temporary workspace is agent-writable, so it holds copies rather than links to the blob
+    assert not os.path.samefile(temp / "agent2" / "dataset.csv", dataset_blob)
+    assert (temp / "agent2" / "dataset.csv").read_text() == dataset
+    assert (temp / "agent2" / "answer.md").read_text() == "agent_b round 2"
+    assert (tmp_path / "logs" / "agent_a" / "t0" / "workspace" / "answer.md").read_text() == "agent_a round 0"
+
+
+def test_blobs_are_read_only_and_copies_do_not_write_through(tmp_path):
+    store = SnapshotStore(tmp_path / "store")
+    _write(tmp_path / "src" / "notes.txt", "original")
+    manifest = store.put_tree(tmp_path / "src")
+    blob = store.blob_path(manifest["notes.txt"])
+    assert stat.S_IMODE(blob.stat().st_mode) == 0o444
+
+    temp = tmp_path / "temp"
+    stats = store.materialize(manifest, temp, link=False)
+    assert stats.copied == 1 and stats.linked == 0
+    assert os.access(temp / "notes.txt", os.W_OK)
+
+    # An in-place append in the writable copy leaves the blob and linked snapshots alone
+    with open(temp / "notes.txt", "a") as f:
+        f.write(" + agent edit")
+    assert blob.read_text() == "original"
+
+    # Unchanged copies are kept, edited ones restored
+    again = store.materialize(manifest, temp, link=False)
+    assert again.copied == 1 and again.unchanged == 0
+    assert (temp / "notes.txt").read_text() == "original"
+    assert store.materialize(manifest, temp, link=False).unchanged == 1
+
+
+def test_digest_cache_keeps_only_current_files(tmp_path):
+    store = SnapshotStore(tmp_path / "store")
+    source = tmp_path / "src"
+    for i in range(5):
+        _write(source / f"file_{i}.txt", f"version {i}")
+        store.put_tree(source)
+        (source / f"file_{i}.txt").unlink()
+
+    _write(source / "kept.txt", "kept")
+    store.put_tree(source)
+    assert list(store._digest_cache[str(source)]) == [("kept.txt", 4, (source / "kept.txt").stat().st_mtime_ns)]
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for incremental, off-loop workspace snapshots.
+"""
+
+import asyncio
+import os
+
+import pytest
+
+from massgen.filesystem_manager import FilesystemManager
+from massgen.filesystem_manager import _filesystem_manager as fm_module
+from massgen.filesystem_manager._snapshot_sync import sync_tree
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def test_sync_tree_mirrors_and_only_copies_changes(tmp_path):
+    source = tmp_path / "source"
+    dest = tmp_path / "dest"
+    _write(source / "a.txt", "alpha")
+    _write(source / "nested" / "b.txt", "beta")
+    _write(source / "gone.txt", "old")
+
+    first = sync_tree(source, dest)
+    assert first.copied == 3
+
+    (source / "gone.txt").unlink()
+    _write(source / "nested" / "b.txt", "BETA")
+    # Rewritten with identical content: new mtime, same bytes
+    os.utime(source / "a.txt", ns=(1, 1))
+
+    second = sync_tree(source, dest)
+
+    assert second.copied == 1
+    assert second.unchanged == 1
+    assert second.removed == 1
+    assert not (dest / "gone.txt").exists()
+    assert (dest / "nested" / "b.txt").read_text() == "BETA"
+    assert (dest / "a.txt").stat().st_mtime_ns == (source / "a.txt").stat().st_mtime_ns
+
+
+def test_sync_tree_hard_links_unchanged_files_from_previous_snapshot(tmp_path):
+    source = tmp_path / "source"
+    _write(source / "big.bin", "x" * 10_000)
+    _write(source / "notes.txt", "v1")
+
+    previous = tmp_path / "snap1"
+    sync_tree(source, previous)
+    _write(source / "notes.txt", "v2")
+
+    current = tmp_path / "snap2"
+    stats = sync_tree(source, current, link_from=previous)
+
+    assert stats.linked == 1 and stats.copied == 1
+    assert os.path.samefile(previous / "big.bin", current / "big.bin")
+    assert (previous / "notes.txt").read_text() == "v1"
+    assert (current / "notes.txt").read_text() == "v2"
+
+
+def test_sync_tree_skips_symlinks(tmp_path):
+    source = tmp_path / "source"
+    _write(source / "real.txt", "data")
+    (source / "link.txt").symlink_to(source / "real.txt")
+
+    sync_tree(source, tmp_path / "dest")
+
+    assert (tmp_path / "dest" / "real.txt").exists()
+    assert not (tmp_path / "dest" / "link.txt").exists()
+
+
+@pytest.mark.asyncio
+async def test_save_snapshot_runs_off_loop_and_links_log_snapshots(tmp_path, monkeypatch):
+    log_dir = tmp_path / "logs"
+    monkeypatch.setattr(fm_module, "get_log_session_dir", lambda: log_dir)
+
+    manager = FilesystemManager(
+        cwd=str(tmp_path / "workspace"),
+        agent_temporary_workspace_parent=str(tmp_path / "temp_workspaces"),
+    )
+    manager.setup_orchestration_paths(
+        agent_id="agent_a",
+        snapshot_storage=str(tmp_path / "snapshots"),
+        agent_temporary_workspace=str(tmp_path / "temp_workspaces"),
+    )
+    workspace = manager.get_current_workspace()
+    _write(workspace / "data.csv", "1,2,3\n" * 1000)
+    _write(workspace / "answer.md", "first")
+
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    ticker_task = asyncio.create_task(ticker())
+    try:
+        await manager.save_snapshot(timestamp="t1")
+    finally:
+        ticker_task.cancel()
+    assert ticks > 0
+
+    _write(workspace / "answer.md", "second")
+    await manager.save_snapshot(timestamp="t2")
+
+    first = log_dir / "agent_a" / "t1" / "workspace"
+    second = log_dir / "agent_a" / "t2" / "workspace"
+    assert os.path.samefile(first / "data.csv", second / "data.csv")
+    assert (first / "answer.md").read_text() == "first"
+    assert (second / "answer.md").read_text() == "second"
+    assert (manager.snapshot_storage / "answer.md").read_text() == "second"
+
+
+@pytest.mark.asyncio
+async def test_copy_snapshots_to_temp_workspace_replaces_stale_agents(tmp_path):
+    manager = FilesystemManager(
+        cwd=str(tmp_path / "workspace"),
+        agent_temporary_workspace_parent=str(tmp_path / "temp_workspaces"),
+    )
+    manager.setup_orchestration_paths(agent_id="agent_a", agent_temporary_workspace=str(tmp_path / "temp_workspaces"))
+
+    snap_a = tmp_path / "snapshots" / "agent_a"
+    snap_b = tmp_path / "snapshots" / "agent_b"
+    _write(snap_a / "a.txt", "from a")
+    _write(snap_b / "b.txt", "from b")
+    mapping = {"agent_a": "agent1", "agent_b": "agent2"}
+
+    temp = await manager.copy_snapshots_to_temp_workspace({"agent_a": snap_a, "agent_b": snap_b}, mapping)
+    assert (temp / "agent1" / "a.txt").read_text() == "from a"
+    assert (temp / "agent2" / "b.txt").read_text() == "from b"
+
+    _write(snap_a / "a.txt", "updated")
+    temp = await manager.copy_snapshots_to_temp_workspace({"agent_a": snap_a}, mapping)
+
+    assert (temp / "agent1" / "a.txt").read_text() == "updated"
+    assert not (temp / "agent2").exists()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for incremental coordination status and the live status feed.
+"""
+
+import asyncio
+import json
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from massgen import orchestrator as orchestrator_module
+from massgen.coordination_tracker import CoordinationTracker
+from massgen.orchestrator import AgentState, Orchestrator
+from massgen.status_feed import JsonlStatusLog, UnixSocketStatusServer
+from massgen.utils import AgentStatus
+
+AGENTS = ["agent_a", "agent_b", "agent_c"]
+
+
+def _orchestrator():
+    states = {aid: SimpleNamespace(answer=None, has_voted=False, restart_pending=False, is_killed=False, timeout_reason=None) for aid in AGENTS}
+    return SimpleNamespace(agent_states=states)
+
+
+def _run_round(tracker, orchestrator):
+    # Same order as the orchestrator: record, update agent state, then record the status change
+    for aid in ("agent_a", "agent_b"):
+        tracker.add_agent_answer(aid, f"answer from {aid}")
+        orchestrator.agent_states[aid].answer = f"answer from {aid}"
+        tracker.change_status(aid, AgentStatus.ANSWERED)
+    for voter in ("agent_b", "agent_c"):
+        tracker.add_agent_vote(voter, {"agent_id": "agent_a", "reason": "more complete"}, snapshot_timestamp="20250101_000000")
+        orchestrator.agent_states[voter].has_voted = True
+        tracker.change_status(voter, AgentStatus.VOTED)
+    # A second vote from the same agent: status keeps its first vote, snapshot label counts both
+    tracker.add_agent_vote("agent_c", {"agent_id": "agent_b", "reason": "changed mind"}, snapshot_timestamp="20250101_000001")
+
+
+def test_status_file_reflects_incremental_state(tmp_path):
+    tracker = CoordinationTracker()
+    tracker.initialize_session(AGENTS, user_prompt="question")
+    orchestrator = _orchestrator()
+    _run_round(tracker, orchestrator)
+
+    tracker.save_status_file(tmp_path, orchestrator=orchestrator)
+    status = json.loads((tmp_path / "status.json").read_text())
+
+    assert status["meta"]["version"] == tracker.status_version == len(tracker.events)
+    assert status["coordination"]["phase"] == "enforcement"
+    assert status["coordination"]["active_agent"] == "agent_a"
+    assert status["coordination"]["completion_percentage"] == 83
+    assert status["results"]["votes"] == {"agent1.1": 2, "agent2.1": 1}
+    assert status["agents"]["agent_c"]["status"] == "voted"
+    assert status["agents"]["agent_c"]["vote_cast"]["voted_for_label"] == "agent1.1"
+    assert status["agents"]["agent_a"]["status"] == "answered"
+    assert "agent3.vote2" in tracker.snapshot_mappings
+
+
+def test_second_turn_starts_from_fresh_status_counts(tmp_path):
+    tracker = CoordinationTracker()
+    tracker.initialize_session(AGENTS, user_prompt="first question")
+    _run_round(tracker, _orchestrator())
+
+    # The orchestrator re-initializes the same tracker for every chat turn
+    tracker.initialize_session(AGENTS, user_prompt="second question")
+    orchestrator = _orchestrator()
+    status = tracker.build_status(tmp_path, orchestrator=orchestrator)
+    assert status["results"]["votes"] == {}
+    assert status["coordination"]["phase"] == "initial_answer"
+    assert status["coordination"]["active_agent"] == "agent_a"
+    assert status["coordination"]["completion_percentage"] == 0
+    for aid in AGENTS:
+        assert status["agents"][aid]["answer_count"] == 0
+        assert status["agents"][aid]["vote_cast"] is None
+
+    tracker.add_agent_answer("agent_b", "new answer")
+    tracker.add_agent_vote("agent_c", {"agent_id": "agent_b", "reason": "only answer"}, snapshot_timestamp="20250102_000000")
+    status = tracker.build_status(tmp_path, orchestrator=orchestrator)
+    assert status["results"]["votes"] == {"agent2.1": 1}
+    assert status["agents"]["agent_c"]["vote_cast"]["voted_for_label"] == "agent2.1"
+    assert status["coordination"]["phase"] == "enforcement"
+    assert status["coordination"]["completion_percentage"] == 33
+    assert tracker._answer_total == 1
+    assert tracker._votes_per_voter == {"agent_c": 1}
+
+
+def test_subscribers_receive_deltas_that_rebuild_status(tmp_path):
+    tracker = CoordinationTracker()
+    tracker.initialize_session(AGENTS)
+    orchestrator = _orchestrator()
+    tracker.status_orchestrator = orchestrator
+    log = JsonlStatusLog(tmp_path / "status_events.jsonl")
+    tracker.add_status_subscriber(log.publish)
+
+    def broken(delta):
+        raise RuntimeError("subscriber went away")
+
+    tracker.add_status_subscriber(broken)
+    _run_round(tracker, orchestrator)
+    log.close()
+
+    deltas = [json.loads(line) for line in (tmp_path / "status_events.jsonl").read_text().splitlines()]
+    assert broken not in tracker.status_subscribers
+    assert [d["seq"] for d in deltas] == list(range(2, tracker.status_version + 1))
+    assert [d["event"]["event_type"] for d in deltas].count("vote_cast") == 3
+
+    # Folding the deltas gives the same per-agent view and vote counts as the snapshot
+    agents, votes = {}, {}
+    for delta in deltas:
+        agents.update(delta.get("agents", {}))
+        votes = delta.get("results", {}).get("votes", votes)
+    snapshot = tracker.build_status(tmp_path, orchestrator=orchestrator)
+    for aid in AGENTS:
+        for field in ("status", "answer_count", "latest_answer_label", "vote_cast"):
+            assert agents[aid][field] == snapshot["agents"][aid][field]
+    assert votes == snapshot["results"]["votes"]
+
+
+@pytest.mark.asyncio
+async def test_feed_publishes_final_answer_before_closing(tmp_path, monkeypatch):
+    monkeypatch.setattr(orchestrator_module, "get_log_session_dir", lambda: tmp_path)
+    orchestrator = Orchestrator(agents={})
+    orchestrator.agents = {aid: SimpleNamespace() for aid in AGENTS}
+    orchestrator.agent_states = {aid: AgentState() for aid in AGENTS}
+    tracker = orchestrator.coordination_tracker
+    tracker.initialize_session(AGENTS)
+
+    async def coordination(votes, conversation_context=None):
+        tracker.add_agent_answer("agent_a", "answer from agent_a")
+        orchestrator.agent_states["agent_a"].answer = "answer from agent_a"
+        return
+        yield
+
+    async def presentation():
+        tracker.set_final_agent("agent_a", "unanimous", {"agent_a": "answer from agent_a"})
+        tracker.set_final_answer("agent_a", "the final answer")
+        yield SimpleNamespace(type="done")
+
+    monkeypatch.setattr(orchestrator, "_stream_coordination_with_agents", coordination)
+    monkeypatch.setattr(orchestrator, "_determine_final_agent_from_votes", lambda votes, answers: "agent_a")
+    monkeypatch.setattr(orchestrator, "_present_final_answer", presentation)
+
+    async for _ in orchestrator._coordinate_agents():
+        pass
+
+    deltas = [json.loads(line) for line in (tmp_path / "status_events.jsonl").read_text().splitlines()]
+    final = [d for d in deltas if d["event"]["event_type"] == "final_answer"]
+    assert final and final[-1]["results"]["winner"] == "agent_a"
+    assert "final_agent_selected" in [d["event"]["event_type"] for d in deltas]
+    # The feed is closed once presentation is over
+    assert orchestrator._status_feed == [] and not tracker.status_subscribers
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix domain sockets")
+@pytest.mark.asyncio
+async def test_unix_socket_streams_snapshot_then_deltas(tmp_path):
+    tracker = CoordinationTracker()
+    tracker.initialize_session(AGENTS)
+    socket_path = str(tmp_path / "status.sock")
+    server = UnixSocketStatusServer(socket_path, snapshot=lambda: tracker.build_status(tmp_path))
+    await server.start()
+    tracker.add_status_subscriber(server.publish)
+    try:
+        reader, writer = await asyncio.open_unix_connection(socket_path)
+        snapshot = json.loads(await asyncio.wait_for(reader.readline(), 5))
+        assert snapshot["type"] == "snapshot"
+        assert snapshot["status"]["meta"]["version"] == 1
+
+        # Wait until the server registered the client before publishing
+        while not server._clients:
+            await asyncio.sleep(0.01)
+        tracker.add_agent_answer("agent_a", "hello")
+
+        delta = json.loads(await asyncio.wait_for(reader.readline(), 5))
+        assert delta["seq"] == 2
+        assert delta["agents"]["agent_a"]["latest_answer_label"] == "agent1.1"
+        writer.close()
+    finally:
+        server.close()
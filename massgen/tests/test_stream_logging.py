@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests and throughput benchmark for the coalescing stream log channel.
+"""
+
+import time
+
+import pytest
+
+from massgen import logger_config
+from massgen.logger_config import flush_stream_logs, log_stream_chunk, logger
+
+TOKEN_COUNT = 20_000
+
+
+@pytest.fixture
+def file_sink(tmp_path):
+    """A background (enqueue=True) file sink like setup_logging installs, plus its path."""
+    log_file = tmp_path / "massgen.log"
+    handler_id = logger.add(str(log_file), format="{extra[name]} | {message}", level="INFO", enqueue=True)
+    yield log_file
+    logger.remove(handler_id)
+
+
+@pytest.fixture
+def channel(monkeypatch):
+    """Enable the stream channel as setup_logging does, restoring it afterwards."""
+    monkeypatch.setattr(logger_config._STREAM_LOG, "enabled", True)
+    yield logger_config._STREAM_LOG
+    flush_stream_logs()
+
+
+def _stream(count):
+    for i in range(count):
+        log_stream_chunk("backend.test", "content", f"tok{i} ", "agent_a")
+    log_stream_chunk("backend.test", "done", None, "agent_a")
+
+
+def _records(log_file):
+    logger.complete()
+    return [line for line in log_file.read_text().splitlines() if "Stream chunk" in line]
+
+
+def test_deltas_are_coalesced_in_order(file_sink, channel, monkeypatch):
+    monkeypatch.setattr(channel, "max_chars", 50)
+
+    _stream(100)
+    log_stream_chunk("backend.test", "reasoning", "thinking", "agent_b")
+    flush_stream_logs()
+
+    records = _records(file_sink)
+    content = [r for r in records if "[content]" in r]
+    logged = "".join(r.split("Stream chunk [content]: ", 1)[1] for r in content)
+
+    assert 1 < len(content) < 100
+    assert logged.split() == [f"tok{i}" for i in range(100)]
+    assert records.index(content[-1]) < records.index(next(r for r in records if "[done]" in r))
+    assert any(r.startswith("backend.test.agent_b | ") and "thinking" in r for r in records)
+
+
+def test_quiet_stream_is_flushed_by_time(file_sink, channel, monkeypatch):
+    monkeypatch.setattr(channel, "max_delay", 0.05)
+
+    log_stream_chunk("backend.test", "content", "partial answer", "agent_a")
+    deadline = time.monotonic() + 5
+    while not _records(file_sink) and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    assert _records(file_sink) == ["backend.test.agent_a | Stream chunk [content]: partial answer"]
+
+
+def test_direct_logging_before_setup(file_sink):
+    assert not logger_config._STREAM_LOG.enabled
+
+    log_stream_chunk("orchestrator", "content", "hello")
+
+    assert _records(file_sink) == ["orchestrator | Stream chunk [content]: hello"]
+
+
+def _tokens_per_second(count):
+    start = time.perf_counter()
+    _stream(count)
+    flush_stream_logs()
+    logger.complete()
+    return count / (time.perf_counter() - start)
+
+
+def test_stream_logging_throughput(tmp_path, monkeypatch):
+    """Compare tokens/sec with file logging off, per-token records, and the coalescing channel."""
+    off = _tokens_per_second(TOKEN_COUNT)
+
+    handler_id = logger.add(str(tmp_path / "massgen.log"), level="INFO", enqueue=True)
+    try:
+        per_record = _tokens_per_second(TOKEN_COUNT)
+        monkeypatch.setattr(logger_config._STREAM_LOG, "enabled", True)
+        coalesced = _tokens_per_second(TOKEN_COUNT)
+    finally:
+        logger.remove(handler_id)
+
+    print(f"\nstream logging tokens/sec: off={off:,.0f} per-record={per_record:,.0f} coalesced={coalesced:,.0f}")
+    assert coalesced > 2 * per_record
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for cached, incremental token estimation in TokenCostCalculator.
+"""
+
+from massgen.token_manager import TokenCostCalculator
+
+
+class CountingEncoder:
+    """Stand-in for a tiktoken encoding that records how much text it encodes."""
+
+    def __init__(self):
+        self.encoded = 0
+        self.batch_calls = 0
+
+    def encode(self, text):
+        self.encoded += 1
+        return text.split()
+
+    def encode_batch(self, texts):
+        self.batch_calls += 1
+        return [self.encode(text) for text in texts]
+
+
+def _calculator():
+    calculator = TokenCostCalculator()
+    calculator.tiktoken_encoder = CountingEncoder()
+    return calculator
+
+
+def _history(count):
+    return [{"role": "user" if i % 2 else "assistant", "content": f"message number {i} " * 20} for i in range(count)]
+
+
+def test_reestimating_history_after_append_encodes_one_message():
+    calculator = _calculator()
+    encoder = calculator.tiktoken_encoder
+    messages = _history(500)
+
+    first = calculator.estimate_tokens(messages)
+    assert encoder.encoded == 500
+    assert first == sum(calculator.estimate_tokens([msg]) for msg in messages)
+
+    messages.append({"role": "user", "content": "one more question"})
+    encoder.encoded = 0
+    second = calculator.estimate_tokens(messages)
+
+    assert encoder.encoded == 1
+    assert second == first + 4
+
+
+def test_estimate_tokens_many_batches_misses():
+    calculator = _calculator()
+    encoder = calculator.tiktoken_encoder
+    messages = _history(10)
+
+    counts = calculator.estimate_tokens_many([messages[:5], messages, "plain text here"])
+
+    assert encoder.batch_calls == 1
+    assert encoder.encoded == 11
+    assert counts == [calculator.estimate_tokens(messages[:5]), calculator.estimate_tokens(messages), 3]
+
+
+def test_cache_is_bounded_and_keyed_by_method():
+    calculator = _calculator()
+    calculator.TOKEN_CACHE_SIZE = 16
+
+    for i in range(100):
+        calculator.estimate_tokens(f"text {i}")
+    assert len(calculator._token_cache) == 16
+
+    simple = calculator.estimate_tokens("a b c d e f g h", method="simple")
+    assert simple == calculator.estimate_tokens_simple("a b c d e f g h")
+    assert calculator.estimate_tokens("a b c d e f g h") == 8
+
+    calculator.clear_token_cache()
+    assert len(calculator._token_cache) == 0
+
+
+def test_batch_failure_falls_back_to_individual_encoding():
+    calculator = _calculator()
+
+    def broken_batch(texts):
+        raise ValueError("special token")
+
+    calculator.tiktoken_encoder.encode_batch = broken_batch
+
+    assert calculator.estimate_tokens_many(["one two", "three"]) == [2, 1]
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the iterative tool loop shared by custom/MCP-enabled backends.
+"""
+
+import inspect
+from types import SimpleNamespace
+
+import pytest
+
+from massgen.backend.chat_completions import ChatCompletionsBackend
+
+
+class _FakeStream:
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._chunks)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+def _tool_call_chunk(call_id: str):
+    tool_call = SimpleNamespace(index=0, id=call_id, function=SimpleNamespace(name="fetch", arguments="{}"))
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=None, tool_calls=[tool_call]), finish_reason="tool_calls")])
+
+
+def _stop_chunk():
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content="done", tool_calls=None), finish_reason="stop")])
+
+
+class _FakeClient:
+    """Chat Completions client that requests a tool for ``tool_rounds`` requests, then stops."""
+
+    def __init__(self, tool_rounds: int):
+        self.tool_rounds = tool_rounds
+        self.requests = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, **kwargs):
+        self.requests += 1
+        if self.requests <= self.tool_rounds:
+            return _FakeStream([_tool_call_chunk(f"call_{self.requests}")])
+        return _FakeStream([_stop_chunk()])
+
+
+def _make_backend(**kwargs):
+    backend = ChatCompletionsBackend(api_key="test-key", model="test-model", **kwargs)
+    backend._mcp_functions = {"fetch": object()}
+    backend.get_mcp_tools_formatted = lambda: []
+    return backend
+
+
+async def _collect(backend, client):
+    return [chunk async for chunk in backend._stream_with_custom_and_mcp_tools([{"role": "user", "content": "hi"}], [], client)]
+
+
+@pytest.mark.asyncio
+async def test_tool_loop_stack_depth_is_constant():
+    depths = []
+
+    async def fake_mcp(name, arguments):
+        depths.append(len(inspect.stack(0)))
+        return "ok", None
+
+    backend = _make_backend()
+    backend._execute_mcp_function_with_retry = fake_mcp
+    client = _FakeClient(tool_rounds=40)
+
+    chunks = await _collect(backend, client)
+
+    assert client.requests == 41
+    assert len(depths) == 40
+    assert max(depths) == min(depths)
+    assert chunks[-1].type == "done"
+
+
+@pytest.mark.asyncio
+async def test_tool_loop_stops_at_max_tool_rounds():
+    async def fake_mcp(name, arguments):
+        return "ok", None
+
+    backend = _make_backend(max_tool_rounds=3)
+    backend._execute_mcp_function_with_retry = fake_mcp
+    client = _FakeClient(tool_rounds=10)
+
+    chunks = await _collect(backend, client)
+
+    assert client.requests == 3
+    assert any(chunk.status == "max_tool_rounds_reached" for chunk in chunks)
+    assert chunks[-1].type == "done"
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the shared tool result cache.
+"""
+
+import asyncio
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from massgen.tool import ExecutionResult, ToolManager, cacheable
+from massgen.tool._result import TextContent
+from massgen.tool_result_cache import MAX_DIRECTORY_ENTRIES, ToolResultCache
+
+CALLS = []
+
+
+@cacheable
+async def read_notes(path: str, agent_cwd: str = None) -> ExecutionResult:
+    """Read a notes file."""
+    CALLS.append(path)
+    full_path = Path(agent_cwd or ".") / path
+    return ExecutionResult(output_blocks=[TextContent(data=full_path.read_text())])
+
+
+def _touch(path: Path, content: str) -> None:
+    # Bump the mtime explicitly so the change is visible on coarse-grained filesystems
+    stat = path.stat() if path.exists() else None
+    path.write_text(content)
+    if stat is not None:
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_keys_track_resolved_paths_and_file_changes(tmp_path):
+    cache = ToolResultCache()
+    notes = tmp_path / "notes.md"
+    notes.write_text("v1")
+
+    relative = cache.make_key("read", {"path": "notes.md"}, base_dir=str(tmp_path))
+    assert relative == cache.make_key("read", {"path": str(notes)})
+    assert relative != cache.make_key("read", {"path": "notes.md"}, base_dir=str(tmp_path / "elsewhere"))
+    assert relative != cache.make_key("read", {"path": "notes.md"}, scope="other-server", base_dir=str(tmp_path))
+
+    _touch(notes, "v2")
+    assert relative != cache.make_key("read", {"path": "notes.md"}, base_dir=str(tmp_path))
+
+    # Files inside directory arguments count too; directories too large to fingerprint are not cached
+    before = cache.make_key("compare", {"dir": str(tmp_path)})
+    _touch(notes, "v3")
+    assert before != cache.make_key("compare", {"dir": str(tmp_path)})
+    big = tmp_path / "big"
+    big.mkdir()
+    for i in range(MAX_DIRECTORY_ENTRIES + 1):
+        (big / str(i)).touch()
+    assert cache.make_key("compare", {"dir": str(big)}) is None
+
+
+def test_ttl_lru_and_stats(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr("massgen.tool_result_cache.time.monotonic", lambda: clock[0])
+    cache = ToolResultCache(ttl=10, max_entries=2)
+
+    cache.put("a", 1, tool_name="t")
+    cache.put("b", 2, tool_name="t")
+    assert cache.get("a", "t") == (True, 1)
+    cache.put("c", 3, tool_name="t")  # evicts "b", the least recently used
+    assert cache.get("b", "t") == (False, None)
+
+    clock[0] += 11
+    assert cache.get("a", "t") == (False, None)
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 2, 1)
+    assert stats["by_tool"]["t"] == {"hits": 1, "misses": 2}
+    cache.clear()
+    assert cache.stats()["entries"] == 0 and cache.stats()["hits"] == 0
+
+
+@pytest.mark.asyncio
+async def test_fetch_shares_inflight_calls_and_skips_errors():
+    cache = ToolResultCache()
+    calls = []
+
+    async def slow_call():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"ok": True}
+
+    results = await asyncio.gather(*(cache.fetch("k", slow_call, tool_name="t") for _ in range(5)))
+    assert results == [{"ok": True}] * 5
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 4
+
+    async def failing():
+        calls.append(1)
+        return {"isError": True}
+
+    await cache.fetch("err", failing, should_cache=lambda r: not r["isError"])
+    await cache.fetch("err", failing, should_cache=lambda r: not r["isError"])
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_waiters_retry_when_the_shared_call_returns_an_error():
+    cache = ToolResultCache()
+    outcomes = [{"isError": True}, {"isError": False, "text": "ok"}, {"isError": False, "text": "ok"}]
+    calls = []
+
+    async def flaky_call():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return outcomes[len(calls) - 1]
+
+    results = await asyncio.gather(*(cache.fetch("k", flaky_call, should_cache=lambda r: not r["isError"]) for _ in range(3)))
+    assert results[0]["isError"]
+    assert all(not result["isError"] for result in results[1:])
+    assert len(calls) == 3
+
+    # A waiter's own successful result is cached for later calls
+    assert cache.get("k") == (True, {"isError": False, "text": "ok"})
+
+
+def _agent_tools(workspace: Path, cache: ToolResultCache) -> ToolManager:
+    manager = ToolManager()
+    manager.add_tool_function(func=read_notes, preset_args={"agent_cwd": str(workspace)})
+    manager.result_cache = cache
+    return manager
+
+
+async def _read(manager: ToolManager, path: str) -> str:
+    results = [r async for r in manager.execute_tool({"name": "custom_tool__read_notes", "input": {"path": path}})]
+    return results[-1].output_blocks[0].data
+
+
+@pytest.mark.asyncio
+async def test_custom_tools_share_results_across_agents(tmp_path):
+    CALLS.clear()
+    shared = tmp_path / "context.md"
+    shared.write_text("shared context")
+    workspaces = []
+    for name in ("agent_a", "agent_b"):
+        workspace = tmp_path / name
+        workspace.mkdir()
+        (workspace / "notes.md").write_text(f"notes of {name}")
+        workspaces.append(workspace)
+
+    cache = ToolResultCache()
+    agent_a, agent_b = (_agent_tools(ws, cache) for ws in workspaces)
+
+    # The same context file read by both agents runs once
+    assert await _read(agent_a, str(shared)) == "shared context"
+    assert await _read(agent_b, str(shared)) == "shared context"
+    assert len(CALLS) == 1
+
+    # Relative paths are per-agent, so they never collide
+    assert await _read(agent_a, "notes.md") == "notes of agent_a"
+    assert await _read(agent_b, "notes.md") == "notes of agent_b"
+    assert len(CALLS) == 3
+
+    # An edit by any agent invalidates the cached read
+    _touch(shared, "edited context")
+    assert await _read(agent_b, str(shared)) == "edited context"
+    assert len(CALLS) == 4
+
+    # Without the declaration, nothing is cached
+    manager = ToolManager()
+    manager.add_tool_function(func=read_notes, preset_args={"agent_cwd": str(workspaces[0])}, cacheable=False)
+    manager.result_cache = cache
+    await _read(manager, str(shared))
+    await _read(manager, str(shared))
+    assert len(CALLS) == 6
+
+
+@pytest.mark.skipif(shutil.which("fastmcp") is None, reason="needs the fastmcp CLI")
+@pytest.mark.asyncio
+async def test_read_only_mcp_tools_are_cached(tmp_path):
+    import massgen.filesystem_manager._workspace_tools_server as workspace_tools_module
+    from massgen.mcp_tools import MCPClient
+
+    (tmp_path / "a.txt").write_text("one\n")
+    (tmp_path / "b.txt").write_text("two\n")
+    config = {
+        "name": "workspace_tools",
+        "type": "stdio",
+        "command": "fastmcp",
+        "args": ["run", f"{Path(workspace_tools_module.__file__).resolve()}:create_server", "--", "--allowed-paths", str(tmp_path)],
+        "env": {"FASTMCP_SHOW_CLI_BANNER": "false"},
+        "cwd": str(tmp_path),
+    }
+    cache = ToolResultCache()
+    client = MCPClient([config])
+    client.result_cache = cache
+    await client.connect()
+    try:
+        first = await client.call_tool("mcp__workspace_tools__compare_files", {"file1": "a.txt", "file2": "b.txt"})
+        second = await client.call_tool("mcp__workspace_tools__compare_files", {"file1": "a.txt", "file2": str(tmp_path / "b.txt")})
+        assert second is first
+
+        # Tools without readOnlyHint always run
+        await client.call_tool("mcp__workspace_tools__copy_file", {"source_path": "a.txt", "destination_path": "c.txt"})
+        assert cache.stats()["by_tool"] == {"mcp__workspace_tools__compare_files": {"hits": 1, "misses": 1}}
+    finally:
+        await client.disconnect()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for running synchronous custom tools in worker pools.
+"""
+
+import asyncio
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from massgen.tool import ExecutionResult, ToolManager, run_in
+from massgen.tool._result import TextContent
+from massgen.tool._workers import WorkerPools
+
+CLOSED = []
+
+
+def blocking_lookup(seconds: float) -> ExecutionResult:
+    """Block like a slow parser."""
+    time.sleep(seconds)
+    return ExecutionResult(output_blocks=[TextContent(data=f"slept {seconds}")])
+
+
+def stream_pages(count: int, delay: float):
+    """Produce pages one at a time."""
+    try:
+        for i in range(count):
+            time.sleep(delay)
+            yield ExecutionResult(output_blocks=[TextContent(data=f"page {i}")], is_streaming=True, is_final=False)
+    finally:
+        CLOSED.append(count)
+
+
+@run_in("process")
+def worker_pid() -> ExecutionResult:
+    """Report the process the tool runs in."""
+    return ExecutionResult(output_blocks=[TextContent(data=str(os.getpid()))])
+
+
+@run_in("process", timeout=2)
+def hang_in_process(pid_file: str) -> ExecutionResult:
+    """Record the worker pid, then never finish."""
+    Path(pid_file).write_text(str(os.getpid()))
+    time.sleep(60)
+    return ExecutionResult(output_blocks=[TextContent(data="unreachable")])
+
+
+async def _run(manager: ToolManager, name: str, **arguments):
+    return [result async for result in manager.execute_tool({"name": f"custom_tool__{name}", "input": arguments})]
+
+
+async def _count_ticks(stop: asyncio.Event) -> int:
+    ticks = 0
+    while not stop.is_set():
+        await asyncio.sleep(0.02)
+        ticks += 1
+    return ticks
+
+
+@pytest.mark.asyncio
+async def test_blocking_tools_do_not_stall_the_loop():
+    manager = ToolManager()
+    manager.add_tool_function(func=blocking_lookup)
+    manager.add_tool_function(func=stream_pages)
+
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_count_ticks(stop))
+    start = time.perf_counter()
+    results = await asyncio.gather(*(_run(manager, "blocking_lookup", seconds=0.5) for _ in range(3)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+
+    assert all(r[-1].output_blocks[0].data == "slept 0.5" for r in results)
+    assert elapsed < 1.2  # The three calls overlap
+    assert await ticker >= 10  # The loop kept running while they blocked
+
+    # Generator items arrive as they are produced, not when the generator finishes
+    arrivals = []
+    start = time.perf_counter()
+    async for result in manager.execute_tool({"name": "custom_tool__stream_pages", "input": {"count": 3, "delay": 0.2}}):
+        arrivals.append((time.perf_counter() - start, result.output_blocks[0].data))
+    assert [data for _, data in arrivals] == ["page 0", "page 1", "page 2"]
+    assert arrivals[0][0] < 0.4
+
+
+@pytest.mark.asyncio
+async def test_timeouts_stop_waiting_and_close_generators():
+    CLOSED.clear()
+    manager = ToolManager()
+    manager.add_tool_function(func=blocking_lookup, timeout=0.3)
+    manager.add_tool_function(func=stream_pages, timeout=0.5)
+
+    start = time.perf_counter()
+    (result,) = await _run(manager, "blocking_lookup", seconds=2)
+    assert time.perf_counter() - start < 1
+    assert result.was_interrupted and "timed out after 0.3 seconds" in result.output_blocks[0].data
+
+    results = await _run(manager, "stream_pages", count=100, delay=0.2)
+    final = results[-1]
+    assert final.was_interrupted and final.is_final
+    assert [block.data for block in final.output_blocks][-1] == "<system>Tool execution timed out after 0.5 seconds</system>"
+    assert 1 <= len(results) <= 3
+    for _ in range(20):
+        if CLOSED:
+            break
+        await asyncio.sleep(0.1)
+    assert CLOSED == [100]  # Closed at its next yield, so its cleanup ran
+
+
+@pytest.mark.asyncio
+async def test_process_tools_run_in_a_separate_process(tmp_path):
+    manager = ToolManager()
+    manager.add_tool_function(func=worker_pid)
+    manager.add_tool_function(func=hang_in_process)
+    assert manager.registered_tools["custom_tool__worker_pid"].executor == "process"
+
+    def local_tool() -> ExecutionResult:
+        return ExecutionResult(output_blocks=[TextContent(data="ok")])
+
+    # Spawned workers cannot import local functions, so they fall back to a thread
+    manager.add_tool_function(func=run_in("process")(local_tool))
+    assert manager.registered_tools["custom_tool__local_tool"].executor == "thread"
+
+    try:
+        (result,) = await _run(manager, "worker_pid")
+        assert int(result.output_blocks[0].data) != os.getpid()
+
+        pid_file = tmp_path / "worker.pid"
+        (result,) = await _run(manager, "hang_in_process", pid_file=str(pid_file))
+        assert result.was_interrupted
+        worker = int(pid_file.read_text())
+        for _ in range(50):
+            try:
+                os.kill(worker, 0)
+            except ProcessLookupError:
+                break
+            await asyncio.sleep(0.1)
+        else:
+            pytest.fail("timed-out worker process was not terminated")
+
+        # The retired pool is replaced for later calls
+        (result,) = await _run(manager, "worker_pid")
+        assert int(result.output_blocks[0].data) not in (os.getpid(), worker)
+    finally:
+        WorkerPools.shutdown()
@@ -6,8 +6,10 @@ Provides unified token estimation and cost calculation for all backends.
 
 from __future__ import annotations
 
+import hashlib
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from ..logger_config import logger
 
@@ -128,9 +130,14 @@ class TokenCostCalculator:
         },
     }
 
+    # Maximum number of per-text token counts kept in the estimation cache
+    TOKEN_CACHE_SIZE = 8192
+
     def __init__(self):
         """Initialize the calculator with optional tiktoken for accurate estimation."""
         self.tiktoken_encoder = None
+        # (method, content digest) -> token count, least recently used first
+        self._token_cache: OrderedDict[Tuple[str, bytes], int] = OrderedDict()
         self._try_init_tiktoken()
 
     def _try_init_tiktoken(self):
@@ -150,6 +157,10 @@ class TokenCostCalculator:
         """
         Estimate token count for text or messages.
 
+        Message lists are counted per message and summed, and each message's count is
+        cached by content, so re-estimating a growing conversation only encodes the
+        messages that were not seen before.
+
         Args:
             text: Text string or list of message dictionaries
             method: Estimation method ("tiktoken", "simple", "auto")
@@ -157,20 +168,83 @@ class TokenCostCalculator:
         Returns:
             Estimated token count
         """
-        # Convert messages to text if needed
-        if isinstance(text, list):
-            text = self._messages_to_text(text)
+        return self.estimate_tokens_many([text], method)[0]
+
+    def estimate_tokens_many(self, texts: List[Union[str, List[Dict[str, Any]]]], method: str = "auto") -> List[int]:
+        """
+        Estimate token counts for several texts or message lists at once.
+
+        Cache misses across all inputs are encoded together with tiktoken's batch encoder.
+
+        Args:
+            texts: Text strings and/or lists of message dictionaries
+            method: Estimation method ("tiktoken", "simple", "auto")
+
+        Returns:
+            Estimated token count for each input, in order
+        """
+        # Flatten every input into the texts that are counted (one per message)
+        segments: List[List[str]] = []
+        for item in texts:
+            if isinstance(item, list):
+                segments.append([self._message_to_text(msg) for msg in item])
+            else:
+                segments.append([item])
+
+        counts = iter(self._count_texts([part for parts in segments for part in parts], method))
+        return [sum(next(counts) for _ in parts) for parts in segments]
 
+    def _count_texts(self, texts: List[str], method: str) -> List[int]:
+        """Count tokens for each text, reusing cached counts and batch-encoding the misses."""
         if method == "auto":
             # Use tiktoken if available, otherwise simple
-            if self.tiktoken_encoder:
-                return self.estimate_tokens_tiktoken(text)
+            method = "tiktoken" if self.tiktoken_encoder else "simple"
+        elif method != "tiktoken":
+            method = "simple"
+
+        keys = [(method, hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()) for text in texts]
+        counts: List[Optional[int]] = []
+        misses: Dict[Tuple[str, bytes], str] = {}
+        for key, text in zip(keys, texts):
+            count = self._token_cache.get(key)
+            if count is None:
+                misses[key] = text
             else:
-                return self.estimate_tokens_simple(text)
-        elif method == "tiktoken":
-            return self.estimate_tokens_tiktoken(text)
-        else:
-            return self.estimate_tokens_simple(text)
+                self._token_cache.move_to_end(key)
+            counts.append(count)
+
+        if misses:
+            miss_texts = list(misses.values())
+            if method == "tiktoken":
+                miss_counts = self._encode_batch(miss_texts)
+            else:
+                miss_counts = [self.estimate_tokens_simple(t) for t in miss_texts]
+            for key, count in zip(misses, miss_counts):
+                self._token_cache[key] = count
+            while len(self._token_cache) > self.TOKEN_CACHE_SIZE:
+                self._token_cache.popitem(last=False)
+            resolved = dict(zip(misses, miss_counts))
+            counts = [resolved[key] if count is None else count for key, count in zip(keys, counts)]
+
+        return counts
+
+    def _encode_batch(self, texts: List[str]) -> List[int]:
+        """Count tokens for several texts with one tiktoken batch call."""
+        if not self.tiktoken_encoder:
+            return [self.estimate_tokens_tiktoken(text) for text in texts]
+        if len(texts) == 1:
+            return [self.estimate_tokens_tiktoken(texts[0])]
+
+        try:
+            return [len(tokens) for tokens in self.tiktoken_encoder.encode_batch(texts)]
+        except Exception as e:
+            # Fall back to per-text encoding so one bad text does not spoil the whole batch
+            logger.debug(f"Tiktoken batch encoding failed: {e}, encoding individually")
+            return [self.estimate_tokens_tiktoken(text) for text in texts]
+
+    def clear_token_cache(self) -> None:
+        """Drop all cached token counts."""
+        self._token_cache.clear()
 
     def estimate_tokens_tiktoken(self, text: str) -> int:
         """
@@ -219,34 +293,37 @@ class TokenCostCalculator:
 
     def _messages_to_text(self, messages: List[Dict[str, Any]]) -> str:
         """Convert message list to text for token estimation."""
+        return "\n".join(self._message_to_text(msg) for msg in messages)
+
+    def _message_to_text(self, msg: Dict[str, Any]) -> str:
+        """Convert a single message to text for token estimation."""
         text_parts = []
 
-        for msg in messages:
-            role = msg.get("role", "")
-            content = msg.get("content", "")
-
-            # Handle different content types
-            if isinstance(content, str):
-                text_parts.append(f"{role}: {content}")
-            elif isinstance(content, list):
-                # Handle structured content (like Claude's format)
-                for item in content:
-                    if isinstance(item, dict):
-                        if item.get("type") == "text":
-                            text_parts.append(f"{role}: {item.get('text', '')}")
-                        elif item.get("type") == "tool_result":
-                            text_parts.append(f"tool_result: {item.get('content', '')}")
-                    else:
-                        text_parts.append(f"{role}: {str(item)}")
-            else:
-                text_parts.append(f"{role}: {str(content)}")
-
-            # Add tool calls if present
-            if "tool_calls" in msg:
-                tool_calls = msg["tool_calls"]
-                if isinstance(tool_calls, list):
-                    for call in tool_calls:
-                        text_parts.append(f"tool_call: {str(call)}")
+        role = msg.get("role", "")
+        content = msg.get("content", "")
+
+        # Handle different content types
+        if isinstance(content, str):
+            text_parts.append(f"{role}: {content}")
+        elif isinstance(content, list):
+            # Handle structured content (like Claude's format)
+            for item in content:
+                if isinstance(item, dict):
+                    if item.get("type") == "text":
+                        text_parts.append(f"{role}: {item.get('text', '')}")
+                    elif item.get("type") == "tool_result":
+                        text_parts.append(f"tool_result: {item.get('content', '')}")
+                else:
+                    text_parts.append(f"{role}: {str(item)}")
+        else:
+            text_parts.append(f"{role}: {str(content)}")
+
+        # Add tool calls if present
+        if "tool_calls" in msg:
+            tool_calls = msg["tool_calls"]
+            if isinstance(tool_calls, list):
+                for call in tool_calls:
+                    text_parts.append(f"tool_call: {str(call)}")
 
         return "\n".join(text_parts)
 
@@ -5,7 +5,7 @@ from ._browser_automation import browser_automation, simple_browser_automation
 from ._claude_computer_use import claude_computer_use
 from ._code_executors import run_python_script, run_shell_script
 from ._computer_use import computer_use
-from ._decorators import context_params
+from ._decorators import cacheable, context_params, run_in
 from ._file_handlers import append_file_content, read_file_content, save_file_content
 from ._gemini_computer_use import gemini_computer_use
 from ._manager import ToolManager
@@ -24,6 +24,8 @@ __all__ = [
     "ToolManager",
     "ExecutionResult",
     "context_params",
+    "cacheable",
+    "run_in",
     "two_num_tool",
     "run_python_script",
     "run_shell_script",
@@ -4,7 +4,20 @@
 import asyncio
 from typing import AsyncGenerator, Callable, Generator, Optional
 
+from ._exceptions import ToolTimeoutException
 from ._result import ExecutionResult, TextContent
+from ._workers import Deadline, iterate_in_worker, wait_with_deadline
+
+
+def timed_out_result(err: ToolTimeoutException, previous_chunk: Optional[ExecutionResult] = None) -> ExecutionResult:
+    """Final result reporting a timeout, appended to the last streamed chunk if any."""
+    timeout_msg = TextContent(data=f"<system>{err}</system>")
+    if previous_chunk is None:
+        return ExecutionResult(output_blocks=[timeout_msg], was_interrupted=True, is_final=True)
+    previous_chunk.output_blocks.append(timeout_msg)
+    previous_chunk.was_interrupted = True
+    previous_chunk.is_final = True
+    return previous_chunk
 
 
 async def _apply_post_processing(
@@ -30,25 +43,47 @@ async def wrap_object_async(
 async def wrap_sync_gen_async(
     sync_gen: Generator[ExecutionResult, None, None],
     processor: Optional[Callable[[ExecutionResult], Optional[ExecutionResult]]],
+    deadline: Optional[Deadline] = None,
+    inline: bool = False,
 ) -> AsyncGenerator[ExecutionResult, None]:
-    """Convert sync generator to async generator."""
-    for chunk in sync_gen:
-        yield await _apply_post_processing(chunk, processor)
+    """Convert sync generator to async generator, advancing it in a worker thread unless inline."""
+    if inline:
+        for chunk in sync_gen:
+            yield await _apply_post_processing(chunk, processor)
+        return
+
+    previous_chunk = None
+    try:
+        async for chunk in iterate_in_worker(sync_gen, deadline):
+            processed = await _apply_post_processing(chunk, processor)
+            yield processed
+            previous_chunk = processed
+    except ToolTimeoutException as err:
+        yield await _apply_post_processing(timed_out_result(err, previous_chunk), processor)
 
 
 async def wrap_as_async_generator(
     async_gen: AsyncGenerator[ExecutionResult, None],
     processor: Optional[Callable[[ExecutionResult], Optional[ExecutionResult]]],
+    deadline: Optional[Deadline] = None,
 ) -> AsyncGenerator[ExecutionResult, None]:
-    """Wrap async generator with interruption handling."""
+    """Wrap async generator with interruption and timeout handling."""
 
     previous_chunk = None
     try:
-        async for chunk in async_gen:
+        while True:
+            try:
+                chunk = await wait_with_deadline(async_gen.__anext__(), deadline)
+            except StopAsyncIteration:
+                break
             processed = await _apply_post_processing(chunk, processor)
             yield processed
             previous_chunk = processed
 
+    except ToolTimeoutException as err:
+        await async_gen.aclose()
+        yield await _apply_post_processing(timed_out_result(err, previous_chunk), processor)
+
     except asyncio.CancelledError:
         interrupt_msg = TextContent(
             data="<system>Execution interrupted by user request</system>",
@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 """Decorators for custom tool functions."""
 
-from typing import Callable
+from typing import Callable, Optional
+
+from ._workers import EXECUTOR_KINDS
 
 
 def context_params(*param_names: str) -> Callable[[Callable], Callable]:
@@ -50,3 +52,77 @@ def context_params(*param_names: str) -> Callable[[Callable], Callable]:
         return func
 
     return decorator
+
+
+def cacheable(func: Optional[Callable] = None, *, ttl: Optional[float] = None) -> Callable:
+    """Declare a tool's results reusable by identical calls.
+
+    When the orchestrator's tool result cache is enabled (``coordination.tool_result_cache``),
+    calls with the same arguments - from any agent - are answered from the cache until the
+    TTL expires or a file or directory named in the arguments changes.
+
+    Only mark tools whose result depends solely on their arguments and the files they name:
+    no side effects, and no dependence on the calling agent's workspace or context params.
+
+    Args:
+        func: Tool function (when used as ``@cacheable`` without parentheses)
+        ttl: Seconds a result stays valid (defaults to the cache TTL)
+
+    Returns:
+        The function marked as cacheable, or a decorator doing so
+
+    Example:
+        >>> from massgen.tool import cacheable, ExecutionResult
+        >>>
+        >>> @cacheable(ttl=600)
+        >>> async def summarize_document(path: str) -> ExecutionResult:
+        ...     '''Summarize a document.'''
+        ...     ...
+    """
+
+    def decorator(f: Callable) -> Callable:
+        """Store the cache declaration in function metadata."""
+        f.__cacheable__ = True
+        f.__cache_ttl__ = ttl
+        return f
+
+    return decorator(func) if func is not None else decorator
+
+
+def run_in(executor: str = "thread", *, timeout: Optional[float] = None) -> Callable[[Callable], Callable]:
+    """Choose where a tool runs and how long it may take.
+
+    Sync tools run in a worker pool so they never block the event loop the agents stream on:
+
+    - ``"thread"`` (default for sync tools): blocking I/O and libraries that release the GIL
+    - ``"process"``: pure-Python CPU work; the function must be defined at module level and
+      its arguments and results must be picklable
+    - ``"inline"``: call directly on the event loop (only for trivial, non-blocking functions)
+
+    The executor is ignored for async tools, but the timeout applies to every tool.
+
+    Args:
+        executor: "thread", "process" or "inline"
+        timeout: Seconds before the call is abandoned and reported as timed out (None = no limit)
+
+    Returns:
+        Decorator storing the execution settings in function metadata
+
+    Example:
+        >>> from massgen.tool import run_in, ExecutionResult
+        >>>
+        >>> @run_in("process", timeout=120)
+        >>> def count_words(path: str) -> ExecutionResult:
+        ...     '''Count the words of a large text file.'''
+        ...     ...
+    """
+    if executor not in EXECUTOR_KINDS:
+        raise ValueError(f"Unknown tool executor '{executor}', expected one of {EXECUTOR_KINDS}")
+
+    def decorator(func: Callable) -> Callable:
+        """Store the execution settings in function metadata."""
+        func.__tool_executor__ = executor
+        func.__tool_timeout__ = timeout
+        return func
+
+    return decorator
@@ -37,3 +37,11 @@ class CategoryNotFoundException(ToolException):
     def __init__(self, category_name: str):
         self.category_name = category_name
         super().__init__(f"Category '{category_name}' not found")
+
+
+class ToolTimeoutException(ToolException):
+    """Raised when a tool does not finish within its timeout."""
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        super().__init__(f"Tool execution timed out after {timeout:g} seconds")
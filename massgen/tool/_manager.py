@@ -14,13 +14,23 @@ from typing import Any, AsyncGenerator, Callable, Dict, Generator, List, Optiona
 from docstring_parser import parse
 from pydantic import BaseModel, ConfigDict, Field, create_model
 
+from ..logger_config import logger
 from ._async_helpers import (
+    timed_out_result,
     wrap_as_async_generator,
     wrap_object_async,
     wrap_sync_gen_async,
 )
+from ._exceptions import ToolTimeoutException
 from ._registered_tool import RegisteredToolEntry
 from ._result import ExecutionResult, TextContent
+from ._workers import (
+    EXECUTOR_KINDS,
+    Deadline,
+    process_safe,
+    run_in_worker,
+    wait_with_deadline,
+)
 
 
 @dataclass
@@ -55,6 +65,10 @@ class ToolManager:
         """Initialize the tool manager."""
         self.registered_tools: Dict[str, RegisteredToolEntry] = {}
         self.tool_categories: Dict[str, ToolCategory] = {}
+        # Shared ToolResultCache for cacheable tools, set by the backend (see massgen/tool_result_cache.py)
+        self.result_cache = None
+        # Bumped on every change to the tool set, so formatted schemas can be reused until then
+        self.version = 0
 
     def setup_category(
         self,
@@ -82,6 +96,7 @@ class ToolManager:
             usage_hints=usage_hints,
             is_enabled=enabled,
         )
+        self.version += 1
 
     def modify_categories(self, category_list: List[str], enabled: bool) -> None:
         """Update the activation status of categories.
@@ -96,6 +111,7 @@ class ToolManager:
 
             if cat_name in self.tool_categories:
                 self.tool_categories[cat_name].is_enabled = enabled
+        self.version += 1
 
     def delete_categories(self, category_list: List[str]) -> None:
         """Remove categories and their associated tools.
@@ -117,6 +133,7 @@ class ToolManager:
         for tool_name in tool_list:
             if self.registered_tools[tool_name].category in category_list:
                 self.registered_tools.pop(tool_name)
+        self.version += 1
 
     def add_tool_function(
         self,
@@ -130,6 +147,10 @@ class ToolManager:
         allow_var_args: bool = False,
         allow_var_kwargs: bool = False,
         post_processor: Optional[Callable] = None,
+        cacheable: Optional[bool] = None,
+        cache_ttl: Optional[float] = None,
+        executor: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> None:
         """Register a tool function.
 
@@ -144,6 +165,10 @@ class ToolManager:
             allow_var_args: Include *args in schema
             allow_var_kwargs: Include **kwargs in schema
             post_processor: Optional post-processing function
+            cacheable: Allow serving results from the tool result cache (defaults to the @cacheable decorator)
+            cache_ttl: Lifetime of cached results in seconds (defaults to the decorator's or the cache's)
+            executor: Where a sync function runs: "thread", "process" or "inline" (defaults to the @run_in decorator, else "thread")
+            timeout: Seconds before a call is abandoned (defaults to the @run_in decorator, else no limit)
         """
         if category not in self.tool_categories and category != "default":
             raise ValueError(f"Category '{category}' not found.")
@@ -226,6 +251,26 @@ class ToolManager:
         # Remove preset args and context params from schema
         self._remove_params_from_schema(tool_schema, set(preset_args or {}) | context_param_names)
 
+        # Cache declaration: explicit registration argument wins over the decorator
+        if cacheable is None:
+            cacheable = getattr(base_func, "__cacheable__", False)
+        if cache_ttl is None:
+            cache_ttl = getattr(base_func, "__cache_ttl__", None)
+        if cacheable and context_param_names:
+            raise ValueError(
+                f"Tool '{tool_name}' uses context params {context_param_names} and cannot be cacheable.",
+            )
+
+        # Execution settings: explicit registration argument wins over the decorator
+        executor = executor or getattr(base_func, "__tool_executor__", "thread")
+        if timeout is None:
+            timeout = getattr(base_func, "__tool_timeout__", None)
+        if executor not in EXECUTOR_KINDS:
+            raise ValueError(f"Tool '{tool_name}' has unknown executor '{executor}', expected one of {EXECUTOR_KINDS}")
+        if executor == "process" and not inspect.iscoroutinefunction(base_func) and not process_safe(base_func):
+            logger.warning(f"Tool '{tool_name}' cannot be imported by a worker process (not a module-level function); running it in a thread")
+            executor = "thread"
+
         tool_entry = RegisteredToolEntry(
             tool_name=tool_name,
             category=category,
@@ -236,9 +281,14 @@ class ToolManager:
             context_param_names=context_param_names,
             extension_model=None,
             post_processor=post_processor,
+            cacheable=bool(cacheable),
+            cache_ttl=cache_ttl,
+            executor=executor,
+            timeout=timeout,
         )
 
         self.registered_tools[tool_name] = tool_entry
+        self.version += 1
 
     def delete_tool_function(self, tool_name: str) -> None:
         """Remove a tool function by name.
@@ -247,6 +297,7 @@ class ToolManager:
             tool_name: Name of tool to remove
         """
         self.registered_tools.pop(tool_name, None)
+        self.version += 1
 
     def fetch_tool_schemas(self) -> List[dict]:
         """Get JSON schemas for all active tools.
@@ -279,6 +330,7 @@ class ToolManager:
 
         if tool_name in self.registered_tools:
             self.registered_tools[tool_name].extension_model = model_class
+            self.version += 1
         else:
             raise ValueError(f"Tool '{tool_name}' not found.")
 
@@ -334,6 +386,15 @@ class ToolManager:
             **(tool_request.get("input", {}) or {}),
         }
 
+        # Replay an identical earlier call (from any agent) while its result is still valid
+        cache_key = self._result_cache_key(tool_entry, exec_kwargs)
+        if cache_key is not None:
+            hit, cached_results = self.result_cache.get(cache_key, tool_name)
+            if hit:
+                for item in cached_results:
+                    yield item
+                return
+
         # Prepare post-processor if exists
         if tool_entry.post_processor:
             post_proc_partial = partial(
@@ -343,47 +404,70 @@ class ToolManager:
         else:
             post_proc_partial = None
 
+        deadline = Deadline.after(tool_entry.timeout)
         try:
-            # Execute based on function type
-            if inspect.iscoroutinefunction(tool_entry.base_function):
-                try:
-                    result = await tool_entry.base_function(**exec_kwargs)
-                except asyncio.CancelledError:
-                    result = ExecutionResult(
-                        output_blocks=[
-                            TextContent(
-                                data="<system>Tool execution was interrupted</system>",
-                            ),
-                        ],
-                        is_streaming=True,
-                        is_final=True,
-                        was_interrupted=True,
-                    )
-            else:
-                result = tool_entry.base_function(**exec_kwargs)
+            # Execute based on function type; sync functions run in a worker pool
+            try:
+                if inspect.iscoroutinefunction(tool_entry.base_function):
+                    result = await wait_with_deadline(tool_entry.base_function(**exec_kwargs), deadline)
+                elif tool_entry.executor == "inline":
+                    result = tool_entry.base_function(**exec_kwargs)
+                else:
+                    result = await run_in_worker(tool_entry.base_function, exec_kwargs, tool_entry.executor, deadline)
+            except asyncio.CancelledError:
+                result = ExecutionResult(
+                    output_blocks=[
+                        TextContent(
+                            data="<system>Tool execution was interrupted</system>",
+                        ),
+                    ],
+                    is_streaming=True,
+                    is_final=True,
+                    was_interrupted=True,
+                )
+
+        except ToolTimeoutException as err:
+            logger.warning(f"[ToolManager] {tool_name}: {err}")
+            result = timed_out_result(err)
 
         except Exception as err:
+            cache_key = None  # Never cache failures
             result = ExecutionResult(
                 output_blocks=[
                     TextContent(data=f"Error: {err}"),
                 ],
             )
 
-        # Handle different return types
+        # Handle different return types (a process tool's generator is already drained)
         if isinstance(result, AsyncGenerator):
-            async for item in wrap_as_async_generator(result, post_proc_partial):
-                yield item
+            results = wrap_as_async_generator(result, post_proc_partial, deadline)
         elif isinstance(result, Generator):
-            async for item in wrap_sync_gen_async(result, post_proc_partial):
-                yield item
+            results = wrap_sync_gen_async(result, post_proc_partial, deadline, inline=tool_entry.executor != "thread")
         elif isinstance(result, ExecutionResult):
-            async for item in wrap_object_async(result, post_proc_partial):
-                yield item
+            results = wrap_object_async(result, post_proc_partial)
         else:
             raise TypeError(
                 f"Tool must return ExecutionResult or Generator, got {type(result)}",
             )
 
+        collected: List[ExecutionResult] = []
+        async for item in results:
+            if cache_key is not None:
+                collected.append(item)
+            yield item
+
+        if cache_key is not None and collected and not any(getattr(item, "was_interrupted", False) for item in collected):
+            self.result_cache.put(cache_key, collected, tool_name=tool_name, ttl=tool_entry.cache_ttl)
+
+    def _result_cache_key(self, tool_entry: RegisteredToolEntry, exec_kwargs: Dict[str, Any]) -> Optional[str]:
+        """Cache key for a call, or None if there is no cache or the tool is not cacheable."""
+        if self.result_cache is None or not tool_entry.cacheable:
+            return None
+        # The agent workspace only anchors relative paths (which the key stores resolved),
+        # so agents reading the same files share results
+        arguments = {key: value for key, value in exec_kwargs.items() if key != "agent_cwd"}
+        return self.result_cache.make_key(tool_entry.tool_name, arguments, base_dir=exec_kwargs.get("agent_cwd"))
+
     @staticmethod
     def _validate_params_match_signature(
         func: Callable,
@@ -469,6 +553,7 @@ class ToolManager:
         """Clear all registered tools and categories."""
         self.registered_tools.clear()
         self.tool_categories.clear()
+        self.version += 1
 
     def _load_builtin_function(self, func_name: str) -> Optional[Callable]:
         """Load a built-in function from the tool folder.
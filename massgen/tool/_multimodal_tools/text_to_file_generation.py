@@ -3,6 +3,7 @@
 Generate text content using OpenAI API and save it as various file formats (TXT, MD, PDF).
 """
 
+import asyncio
 import json
 import os
 from datetime import datetime
@@ -408,9 +409,9 @@ async def text_to_file_generation(
         # Save content based on format
         try:
             if file_format == "pdf":
-                _generate_pdf(generated_content, file_path)
+                await asyncio.to_thread(_generate_pdf, generated_content, file_path)
             elif file_format == "pptx":
-                _generate_pptx(generated_content, file_path)
+                await asyncio.to_thread(_generate_pptx, generated_content, file_path)
             else:
                 # For txt and md, save as plain text
                 file_path.write_text(generated_content, encoding="utf-8")
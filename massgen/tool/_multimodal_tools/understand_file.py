@@ -4,6 +4,7 @@ Understand and analyze file contents using OpenAI's gpt-4.1 API.
 Supports text files, PDF, DOCX, XLSX, and more.
 """
 
+import asyncio
 import json
 import os
 from pathlib import Path
@@ -402,7 +403,7 @@ async def understand_file(
         # PDF files
         if file_extension == ".pdf":
             extraction_method = "pdf"
-            file_content, error = _extract_text_from_pdf(f_path)
+            file_content, error = await asyncio.to_thread(_extract_text_from_pdf, f_path)
             if error:
                 result = {
                     "success": False,
@@ -416,7 +417,7 @@ async def understand_file(
         # Word documents
         elif file_extension == ".docx":
             extraction_method = "docx"
-            file_content, error = _extract_text_from_docx(f_path)
+            file_content, error = await asyncio.to_thread(_extract_text_from_docx, f_path)
             if error:
                 result = {
                     "success": False,
@@ -430,7 +431,7 @@ async def understand_file(
         # Excel spreadsheets
         elif file_extension in [".xlsx", ".xls"]:
             extraction_method = "excel"
-            file_content, error = _extract_text_from_excel(f_path)
+            file_content, error = await asyncio.to_thread(_extract_text_from_excel, f_path)
             if error:
                 result = {
                     "success": False,
@@ -444,7 +445,7 @@ async def understand_file(
         # PowerPoint presentations
         elif file_extension == ".pptx":
             extraction_method = "pptx"
-            file_content, error = _extract_text_from_pptx(f_path)
+            file_content, error = await asyncio.to_thread(_extract_text_from_pptx, f_path)
             if error:
                 result = {
                     "success": False,
@@ -3,6 +3,7 @@
 Understand and analyze videos by extracting key frames and using OpenAI's gpt-4.1 API.
 """
 
+import asyncio
 import base64
 import json
 import os
@@ -260,7 +261,7 @@ async def understand_video(
 
         # Extract key frames from video
         try:
-            frames_base64 = _extract_key_frames(vid_path, num_frames)
+            frames_base64 = await asyncio.to_thread(_extract_key_frames, vid_path, num_frames)
         except ImportError as import_error:
             result = {
                 "success": False,
@@ -44,6 +44,18 @@ class RegisteredToolEntry:
     post_processor: Optional[Callable[[dict, ExecutionResult], Optional[ExecutionResult]]] = None
     """Optional post-processing function for results."""
 
+    cacheable: bool = False
+    """Whether results may be served from the shared tool result cache."""
+
+    cache_ttl: Optional[float] = None
+    """Lifetime of cached results in seconds (None = cache default)."""
+
+    executor: Literal["thread", "process", "inline"] = "thread"
+    """Where a sync function runs: worker thread, worker process or the event loop."""
+
+    timeout: Optional[float] = None
+    """Seconds before a call is abandoned (None = no limit)."""
+
     @property
     def get_extended_schema(self) -> dict:
         """Generate the complete schema including extensions.
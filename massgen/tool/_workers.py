@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+"""
+Worker pools for synchronous custom tools.
+
+A sync tool function called on the event loop blocks every agent streaming on it, so
+ToolManager dispatches sync tools to a worker pool chosen per tool (see ``@run_in``):
+
+- ``"thread"`` (default): a shared thread pool, for blocking I/O and for C extensions that
+  release the GIL (image decoding, PDF parsing, video frame extraction)
+- ``"process"``: a shared pool of spawned processes, for pure-Python CPU work. Functions
+  are re-imported in the worker by module and qualified name, so they must be defined at
+  module level and their arguments and results must be picklable
+- ``"inline"``: called directly on the event loop (only for trivial functions)
+
+Sync generators run in the thread pool one item at a time, so each result reaches the
+loop as soon as it is produced. Process tools run their generator to completion in the
+worker and hand back all items at once.
+
+Timeouts and cancellation stop the caller from waiting immediately. Threads cannot be
+interrupted: a thread tool keeps running in the background and a sync generator is
+closed at its next yield. A process pool whose worker overran is retired, and its
+processes are terminated as soon as no other call is running in it.
+
+Example:
+    WorkerPools.configure(max_threads=16, max_processes=2)
+    result = await run_in_worker(parse_pdf, {"path": "report.pdf"}, "process", Deadline.after(60))
+"""
+
+import asyncio
+import atexit
+import contextvars
+import importlib
+import importlib.util
+import inspect
+import multiprocessing
+import sys
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generator,
+    Optional,
+    Tuple,
+)
+
+from ..logger_config import logger
+from ._exceptions import ToolTimeoutException
+
+EXECUTOR_KINDS = ("thread", "process", "inline")
+DEFAULT_EXECUTOR = "thread"
+
+_EXHAUSTED = object()
+
+
+@dataclass
+class Deadline:
+    """Point in loop time by which a tool call must have finished."""
+
+    timeout: float
+    expires_at: float
+
+    @classmethod
+    def after(cls, timeout: Optional[float]) -> Optional["Deadline"]:
+        if not timeout:
+            return None
+        return cls(timeout=timeout, expires_at=asyncio.get_running_loop().time() + timeout)
+
+    def remaining(self) -> float:
+        return max(self.expires_at - asyncio.get_running_loop().time(), 0.0)
+
+    def expired(self) -> bool:
+        return asyncio.get_running_loop().time() >= self.expires_at
+
+
+async def wait_with_deadline(awaitable: Awaitable[Any], deadline: Optional[Deadline]) -> Any:
+    """Await ``awaitable``, raising ToolTimeoutException once ``deadline`` has passed."""
+    if deadline is None:
+        return await awaitable
+    try:
+        return await asyncio.wait_for(awaitable, deadline.remaining())
+    except asyncio.TimeoutError:
+        if not deadline.expired():
+            raise  # Raised by the tool itself
+        raise ToolTimeoutException(deadline.timeout) from None
+
+
+class _ProcessPool:
+    """Process pool that is retired, and eventually terminated, when one of its calls overruns."""
+
+    def __init__(self, max_workers: Optional[int]):
+        self.executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+        self.retired = False
+        self._terminated = False
+        self._lock = threading.Lock()
+        self._inflight: set = set()
+        self._abandoned: set = set()
+
+    def submit(self, fn: Callable, *args: Any) -> Future:
+        future = self.executor.submit(fn, *args)
+        with self._lock:
+            self._inflight.add(future)
+        future.add_done_callback(self._on_done)
+        return future
+
+    def abandon(self, future: Future) -> None:
+        """Stop waiting for a call; a call that already started gets its worker terminated."""
+        if future.cancel() or future.done():
+            return
+        with self._lock:
+            self._abandoned.add(future)
+            self.retired = True
+        self._terminate_if_idle()
+
+    def terminate(self) -> None:
+        with self._lock:
+            if self._terminated:
+                return
+            self._terminated = self.retired = True
+        terminate_workers = getattr(self.executor, "terminate_workers", None)
+        if terminate_workers is not None:
+            terminate_workers()
+            return
+        for process in list((self.executor._processes or {}).values()):
+            process.terminate()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _on_done(self, future: Future) -> None:
+        with self._lock:
+            self._inflight.discard(future)
+            self._abandoned.discard(future)
+        self._terminate_if_idle()
+
+    def _terminate_if_idle(self) -> None:
+        with self._lock:
+            # Other calls still need the pool's workers; terminate once they finish
+            if not self.retired or self._terminated or self._inflight - self._abandoned:
+                return
+        self.terminate()
+
+
+class WorkerPools:
+    """Process-wide worker pools for sync tools, created on first use."""
+
+    max_threads: Optional[int] = None
+    max_processes: Optional[int] = None
+    _thread_pool: Optional[ThreadPoolExecutor] = None
+    _process_pool: Optional[_ProcessPool] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def configure(cls, max_threads: Optional[int] = None, max_processes: Optional[int] = None) -> None:
+        """
+        Set the pool sizes (None = executor defaults). Pools already running keep
+        serving their current calls and are replaced on next use.
+        """
+        with cls._lock:
+            if max_threads != cls.max_threads and cls._thread_pool is not None:
+                cls._thread_pool.shutdown(wait=False)
+                cls._thread_pool = None
+            if max_processes != cls.max_processes and cls._process_pool is not None:
+                cls._process_pool.executor.shutdown(wait=False)
+                cls._process_pool = None
+            cls.max_threads, cls.max_processes = max_threads, max_processes
+
+    @classmethod
+    def thread_pool(cls) -> ThreadPoolExecutor:
+        with cls._lock:
+            if cls._thread_pool is None:
+                cls._thread_pool = ThreadPoolExecutor(max_workers=cls.max_threads, thread_name_prefix="massgen-tool")
+            return cls._thread_pool
+
+    @classmethod
+    def process_pool(cls) -> _ProcessPool:
+        with cls._lock:
+            if cls._process_pool is None or cls._process_pool.retired:
+                cls._process_pool = _ProcessPool(cls.max_processes)
+            return cls._process_pool
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Stop both pools without waiting for running tools (called at interpreter exit)."""
+        with cls._lock:
+            thread_pool, process_pool = cls._thread_pool, cls._process_pool
+            cls._thread_pool = cls._process_pool = None
+        if thread_pool is not None:
+            thread_pool.shutdown(wait=False, cancel_futures=True)
+        if process_pool is not None:
+            process_pool.retired = True
+            process_pool.terminate()
+
+
+atexit.register(WorkerPools.shutdown)
+
+
+def process_safe(func: Callable) -> bool:
+    """Whether a spawned worker can re-import ``func`` by its module and qualified name."""
+    module = sys.modules.get(getattr(func, "__module__", None) or "")
+    if module is None or func.__module__ == "__main__" or "<locals>" in getattr(func, "__qualname__", "<locals>"):
+        return False
+    return getattr(module, "__file__", None) is not None
+
+
+# Modules imported by this worker process: module name -> module
+_worker_modules: Dict[str, Any] = {}
+
+
+def _resolve_in_worker(module_name: str, module_file: Optional[str], qualname: str) -> Callable:
+    module = _worker_modules.get(module_name)
+    if module is None:
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            # Custom tools loaded from a file path are not importable by name
+            spec = importlib.util.spec_from_file_location(module_name, module_file)
+            if spec is None or spec.loader is None:
+                raise
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[module_name] = module
+            spec.loader.exec_module(module)
+        _worker_modules[module_name] = module
+
+    target = module
+    for part in qualname.split("."):
+        target = getattr(target, part)
+    return target
+
+
+def _call_in_worker(module_name: str, module_file: Optional[str], qualname: str, kwargs: Dict[str, Any]) -> Tuple[bool, Any]:
+    """Process pool entry point; returns (is_generator, result or list of items)."""
+    result = _resolve_in_worker(module_name, module_file, qualname)(**kwargs)
+    if inspect.isgenerator(result):
+        return True, list(result)
+    return False, result
+
+
+def _replay(items: list) -> Generator[Any, None, None]:
+    yield from items
+
+
+async def run_in_worker(func: Callable, kwargs: Dict[str, Any], executor: str = DEFAULT_EXECUTOR, deadline: Optional[Deadline] = None) -> Any:
+    """
+    Call a sync tool function in a worker pool.
+
+    Args:
+        func: Sync tool function
+        kwargs: Call arguments
+        executor: "thread" or "process"
+        deadline: Optional deadline for the call
+
+    Returns:
+        The function's result. A generator returned by a thread tool is returned unstarted
+        (drain it with ``iterate_in_worker``); a process tool's generator comes back as a
+        generator over the items it produced.
+
+    Raises:
+        ToolTimeoutException: The deadline passed first
+    """
+    loop = asyncio.get_running_loop()
+    if executor != "process":
+        context = contextvars.copy_context()
+        return await wait_with_deadline(loop.run_in_executor(WorkerPools.thread_pool(), lambda: context.run(func, **kwargs)), deadline)
+
+    pool = WorkerPools.process_pool()
+    module = sys.modules[func.__module__]
+    future = pool.submit(_call_in_worker, func.__module__, getattr(module, "__file__", None), func.__qualname__, kwargs)
+    try:
+        is_generator, result = await wait_with_deadline(asyncio.wrap_future(future), deadline)
+    except BaseException:
+        pool.abandon(future)
+        raise
+    return _replay(result) if is_generator else result
+
+
+def _close_when_idle(gen: Generator, pending: Optional[asyncio.Future]) -> None:
+    """Close a generator in the thread pool once its running step (if any) has returned."""
+
+    def close(_: Any = None) -> None:
+        try:
+            WorkerPools.thread_pool().submit(gen.close)
+        except RuntimeError:
+            pass  # Pool already shut down
+
+    if pending is not None and not pending.done():
+        pending.add_done_callback(close)
+    else:
+        close()
+
+
+async def iterate_in_worker(gen: Generator, deadline: Optional[Deadline] = None) -> AsyncGenerator[Any, None]:
+    """
+    Drain a sync generator in the thread pool, yielding each item on the loop.
+
+    Items are produced one at a time as the consumer asks for them, so a slow consumer
+    applies backpressure. On timeout, cancellation or early exit, the generator is
+    closed as soon as its current step returns.
+
+    Raises:
+        ToolTimeoutException: The deadline passed before the generator was exhausted
+    """
+    loop = asyncio.get_running_loop()
+    pool = WorkerPools.thread_pool()
+    pending: Optional[asyncio.Future] = None
+    finished = False
+    try:
+        while True:
+            context = contextvars.copy_context()
+            pending = loop.run_in_executor(pool, lambda: context.run(next, gen, _EXHAUSTED))
+            item = await wait_with_deadline(asyncio.shield(pending), deadline)
+            if item is _EXHAUSTED:
+                finished = True
+                return
+            yield item
+    finally:
+        if not finished:
+            if deadline is not None and deadline.expired():
+                logger.warning(f"[ToolWorkers] Sync tool generator timed out after {deadline.timeout:g}s; closing it at its next yield")
+            _close_when_idle(gen, pending)
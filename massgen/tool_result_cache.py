@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""
+Result cache for idempotent tool calls.
+
+Agents in one coordination round often issue identical read-only calls: reading the same
+context file, fetching the same page, comparing the same directories. When
+``coordination.tool_result_cache`` is enabled, the orchestrator hands one ToolResultCache
+to every agent's backend. MCPClient.call_tool and ToolManager.execute_tool consult it for
+tools that declare themselves cacheable:
+
+- MCP tools: annotated ``readOnlyHint`` by their server, or listed in the server config's
+  ``cacheable_tools``
+- Custom tools: the ``@cacheable`` decorator or ``cacheable: true`` in the tool config
+
+Keys combine the tool name, a scope (e.g. the MCP server configuration), the canonicalized
+arguments (relative paths resolved to absolute ones) and the size and mtime of every file
+or directory the arguments name, so edits made by any agent invalidate affected entries.
+Entries expire after a TTL, the least recently used ones are evicted beyond
+``max_entries``, and error results are never stored. Identical calls that are already
+running are shared instead of executed twice.
+
+Example:
+    cache = ToolResultCache(ttl=300)
+    key = cache.make_key("mcp__filesystem__read_file", {"path": "notes.md"}, base_dir=cwd)
+    result = await cache.fetch(key, lambda: client.call_tool(...), tool_name="read_file")
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import stat
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+DEFAULT_TTL = 300.0
+DEFAULT_MAX_ENTRIES = 512
+# Directories with more entries than this are too costly to fingerprint; such calls run uncached
+MAX_DIRECTORY_ENTRIES = 2000
+MAX_PATH_LENGTH = 4096
+
+
+class _Uncacheable(Exception):
+    """Raised while building a key when the call's inputs cannot be fingerprinted."""
+
+
+@dataclass
+class _Entry:
+    value: Any
+    tool_name: str
+    expires_at: float
+
+
+def _directory_fingerprint(path: str) -> str:
+    digest = hashlib.sha1()
+    count = 0
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in sorted(entries, key=lambda e: e.name):
+                    count += 1
+                    if count > MAX_DIRECTORY_ENTRIES:
+                        raise _Uncacheable(path)
+                    info = entry.stat(follow_symlinks=False)
+                    digest.update(f"{os.path.relpath(entry.path, path)}|{info.st_mtime_ns}|{info.st_size}\n".encode("utf-8", "surrogateescape"))
+                    if stat.S_ISDIR(info.st_mode):
+                        stack.append(entry.path)
+        except OSError:
+            raise _Uncacheable(path)
+    return digest.hexdigest()
+
+
+def _path_fingerprint(value: str, base_dir: Optional[str]) -> Optional[Tuple[str, Any]]:
+    """Return (absolute path, fingerprint) if ``value`` names a path, else None."""
+    if not value or len(value) > MAX_PATH_LENGTH or "\n" in value or "://" in value:
+        return None
+    path = os.path.expanduser(value)
+    if not os.path.isabs(path):
+        path = os.path.join(base_dir or os.getcwd(), path)
+    path = os.path.abspath(path)
+
+    try:
+        info = os.stat(path)
+    except FileNotFoundError:
+        # Only strings that look like paths are recorded as missing (so creating them later misses)
+        if "/" in value or os.sep in value or os.path.splitext(value)[1]:
+            return path, "missing"
+        return None
+    except (OSError, ValueError):
+        return None
+
+    if stat.S_ISDIR(info.st_mode):
+        return path, _directory_fingerprint(path)
+    return path, (info.st_mtime_ns, info.st_size)
+
+
+def _canonicalize(value: Any, base_dir: Optional[str], fingerprints: Dict[str, Any]) -> Any:
+    if isinstance(value, dict):
+        return {str(key): _canonicalize(item, base_dir, fingerprints) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonicalize(item, base_dir, fingerprints) for item in value]
+    if isinstance(value, str):
+        found = _path_fingerprint(value, base_dir)
+        if found is None:
+            return value
+        path, fingerprint = found
+        fingerprints[path] = fingerprint
+        return path
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    raise _Uncacheable(type(value).__name__)
+
+
+class ToolResultCache:
+    """TTL + LRU cache of tool results shared by the agents of one orchestrator turn."""
+
+    def __init__(self, ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._by_tool: Dict[str, Dict[str, int]] = {}
+
+    def make_key(
+        self,
+        tool_name: str,
+        arguments: Optional[Dict[str, Any]],
+        scope: str = "",
+        base_dir: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Build the cache key for a call.
+
+        Args:
+            tool_name: Tool name
+            arguments: Tool arguments
+            scope: Anything else the result depends on (e.g. the server configuration)
+            base_dir: Directory relative path arguments resolve against
+
+        Returns:
+            Key string, or None if the call cannot be cached (e.g. a huge directory argument)
+        """
+        fingerprints: Dict[str, Any] = {}
+        try:
+            canonical = _canonicalize(arguments or {}, base_dir, fingerprints)
+        except _Uncacheable:
+            return None
+        payload = json.dumps([tool_name, scope, canonical, sorted(fingerprints.items())], sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8", "surrogateescape")).hexdigest()
+
+    def get(self, key: str, tool_name: str = "") -> Tuple[bool, Any]:
+        """Return (hit, value) and record the lookup in the stats."""
+        entry = self._lookup(key)
+        self._record(tool_name, hit=entry is not None)
+        return (True, entry.value) if entry is not None else (False, None)
+
+    def put(self, key: str, value: Any, tool_name: str = "", ttl: Optional[float] = None) -> None:
+        self._entries[key] = _Entry(value=value, tool_name=tool_name, expires_at=time.monotonic() + (ttl or self.ttl))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def fetch(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        tool_name: str = "",
+        ttl: Optional[float] = None,
+        should_cache: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """
+        Return the cached result for ``key`` or compute and store it.
+
+        Concurrent fetches of a key whose computation is already running wait for it
+        instead of repeating the call. They only share a result that may be cached; when
+        the shared call raises or returns an error result, each waiter runs its own call.
+
+        Args:
+            key: Key from ``make_key``
+            compute: Coroutine factory performing the real call
+            tool_name: Tool name for per-tool stats
+            ttl: Entry lifetime in seconds (defaults to the cache TTL)
+            should_cache: Predicate deciding whether a result may be stored (e.g. not errors)
+        """
+        entry = self._lookup(key)
+        if entry is not None:
+            self._record(tool_name, hit=True)
+            return entry.value
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            await asyncio.wait([pending])
+            if not pending.cancelled() and pending.exception() is None:
+                self._record(tool_name, hit=True)
+                return pending.result()
+            # The shared call failed or returned an error result; run our own rather than inherit it
+            self._record(tool_name, hit=False)
+            value = await compute()
+            if should_cache is None or should_cache(value):
+                self.put(key, value, tool_name=tool_name, ttl=ttl)
+            return value
+
+        self._record(tool_name, hit=False)
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await compute()
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        if should_cache is None or should_cache(value):
+            future.set_result(value)
+            self.put(key, value, tool_name=tool_name, ttl=ttl)
+        else:
+            # Waiters retry on their own instead of sharing a result that is never cached
+            future.cancel()
+        return value
+
+    def clear(self) -> None:
+        """Drop all entries and reset the stats (called at the start of every turn)."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+        self._by_tool.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters overall and per tool."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "entries": len(self._entries),
+            "evictions": self.evictions,
+            "by_tool": {name: dict(counts) for name, counts in self._by_tool.items()},
+        }
+
+    def _lookup(self, key: str) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _record(self, tool_name: str, hit: bool) -> None:
+        counts = self._by_tool.setdefault(tool_name, {"hits": 0, "misses": 0})
+        if hit:
+            self.hits += 1
+            counts["hits"] += 1
+        else:
+            self.misses += 1
+            counts["misses"] += 1